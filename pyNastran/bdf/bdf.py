@@ -24,7 +24,7 @@ from collections import defaultdict
 import traceback
 
 from typing import (
-    Sequence, Optional, Any, cast, TYPE_CHECKING)
+    Sequence, Optional, Union, Any, cast, TYPE_CHECKING)
 from pickle import load, dump, dumps  # type: ignore
 
 import numpy as np  # type: ignore
@@ -37,6 +37,10 @@ from .bdf_interface.utils import (
     fill_dmigs, _get_card_name, _parse_dynamic_syntax,
 )
 from pyNastran.bdf.bdf_interface.add_card import CARD_MAP
+from pyNastran.bdf.bdf_interface.fast_cards import get_fast_cards
+from pyNastran.bdf.bdf_interface.parallel_cards import get_parallel_cards
+from pyNastran.bdf.bdf_interface.bdf_cache import read_bdf_cache
+from pyNastran.bdf.bdf_interface.node_memo import NodeArrayMemo
 from .bdf_interface.replication import (
     to_fields_replication, get_nrepeats, int_replication, float_replication,
     _field, repeat_cards)
@@ -545,6 +549,14 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         self._remove_disabled_cards = False
         self.use_new_deck_parser = False
 
+        # parse the fixed field GRID/CQUAD4/CTRIA3/... cards with numpy
+        # (see bdf_interface/fast_cards.py)
+        self.use_fast_card_parser = False
+
+        # write the GRID/CQUAD4/CTRIA3/... cards in blocks
+        # (see bdf_interface/fast_writer.py)
+        self.use_fast_card_writer = False
+
         # file management parameters
         self.active_filenames: list[str] = []
         self.active_filename: Optional[str] = None
@@ -929,6 +941,9 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
 
         self._xref = False
 
+        #: the memoized node arrays (see get_displacement_index_xyz_cp_cd)
+        self._node_array_memo = NodeArrayMemo()
+
         #case_control_cards = {'FREQ', 'GUST', 'MPC', 'SPC', 'NLPARM', 'NSM',
                               #'TEMP', 'TSTEPNL', 'INCLUDE'}
         #self._unique_bulk_data_cards = self.cards_to_read.difference(CASE_CONTROL_CARDS)
@@ -952,6 +967,11 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
             del state['_card_parser_b']
         if hasattr(self, '_card_parser_prepare'):
             del state['_card_parser_prepare']
+        state['_node_array_memo'] = NodeArrayMemo()
+        # the lazily cross referenced cards are tracked by id
+        state['_lazy_xref_cards'] = None
+        state['_lazy_xref_done'] = None
+        state['_lazy_xref_refs'] = None
         return state
 
     def get_h5attrs(self) -> list[str]:
@@ -1092,6 +1112,11 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                 raise AttributeError(f'key={key!r} val={val}\nupdate ~line 1050 of bdf.py and '
                                      f'add the new key ({key})')
 
+        # these point to the pickled model
+        self._add_methods.model = self
+        self.zona.model = self
+        self.add_param = getattr(self, self.add_param.__name__)
+
         self.case_control_deck = CaseControlDeck(self.case_control_lines, log=self.log)
         #self.log.debug('done loading!')
         for model in self.superelement_models.values():
@@ -1295,11 +1320,13 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
 
     def read_bdf(self, bdf_filename: Optional[PathLike]=None,
                  validate: bool=True,
-                 xref: bool=True,
+                 xref: Union[bool, str]=True,
                  punch: bool=False,
                  read_includes: bool=True,
                  save_file_structure: bool=False,
-                 encoding: Optional[str]=None) -> None:
+                 encoding: Optional[str]=None,
+                 nworkers: int=1,
+                 cache_dir: Optional[PathLike]=None) -> None:
         """
         Read method for the bdf files
 
@@ -1309,8 +1336,10 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
             the input bdf (default=None; popup a dialog)
         validate : bool; default=True
             runs various checks on the BDF
-        xref :  bool; default=True
+        xref :  bool / str; default=True
             should the bdf be cross referenced
+            'lazy' : the cards are cross referenced when their ``*_ref``
+                     attributes are first accessed
         punch : bool; default=False
             indicates whether the file is a punch file
         read_includes : bool; default=True
@@ -1319,6 +1348,15 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
             enables the ``write_bdfs`` method
         encoding : str; default=None -> system default
             the unicode encoding
+        nworkers : int; default=1
+            the number of threads used to read the INCLUDE files and
+            the number of processes used to create the cards;
+            the model is the same as the serial reader
+        cache_dir : str; default=None
+            the directory to store a binary copy of the model in;
+            the copy is loaded if the main file and the INCLUDE files
+            haven't changed and only the cards from the INCLUDE files
+            that changed are reparsed (if possible)
 
         .. code-block:: python
 
@@ -1340,6 +1378,15 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         self.save_file_structure = save_file_structure
         if bdf_filename and not isinstance(bdf_filename, (StringIO, list)):
             check_path(bdf_filename, 'bdf_filename')
+            if cache_dir is not None and read_includes:
+                read_bdf_cache(self, bdf_filename, cache_dir, punch=punch,
+                               encoding=encoding, nworkers=nworkers)
+                self.save_file_structure = save_file_structure
+                if validate:
+                    self.validate()
+                self.cross_reference(xref=bool(xref), lazy=xref == 'lazy')
+                self._xref = xref
+                return
         self._read_bdf_helper(bdf_filename, encoding, punch, read_includes)
         self.log.debug(f'---starting BDF.read_bdf of {self.bdf_filename}---')
         self._parse_primary_file_header(bdf_filename)
@@ -1349,6 +1396,7 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                          consider_superelements=self.is_superelements,
                          log=self.log, debug=self.debug)
         obj.use_new_parser = self.use_new_deck_parser
+        obj.nworkers = nworkers
 
         out = obj.get_lines(bdf_filename, punch=self.punch, make_ilines=True)
         (system_lines,
@@ -1374,7 +1422,7 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         self.case_control_deck.rsolmap_to_str = self.rsolmap_to_str
 
         try:
-            self._parse_all_cards(bulk_data_lines, bulk_data_ilines)
+            self._parse_all_cards(bulk_data_lines, bulk_data_ilines, nworkers=nworkers)
         except SuperelementFlagError:
             if self.is_superelements:
                 raise
@@ -1384,7 +1432,7 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
             self.is_superelements = True
             self.read_bdf(bdf_filename=bdf_filename, validate=validate, xref=xref, punch=punch,
                           read_includes=read_includes, save_file_structure=save_file_structure,
-                          encoding=encoding)
+                          encoding=encoding, nworkers=nworkers)
             return
 
         if additional_deck_lines:
@@ -1402,12 +1450,13 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
             if union_cards:
                 raise DisabledCardError(f'the following cards have been removed: {list(union_cards)}')
 
-        self.cross_reference(xref=xref)
+        self.cross_reference(xref=bool(xref), lazy=xref == 'lazy')
         self._xref = xref
 
         self.log.debug('---finished BDF.read_bdf of %s---' % self.bdf_filename)
 
-    def _parse_all_cards(self, bulk_data_lines: list[str], bulk_data_ilines: Any) -> None:
+    def _parse_all_cards(self, bulk_data_lines: list[str], bulk_data_ilines: Any,
+                         nworkers: int=1) -> None:
         """creates and loads all the cards the bulk data section"""
         strict = True
         cards_list = []
@@ -1431,7 +1480,8 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                 #card_name = card[0]
                 #if card_name == 'CBAR':
                     #print(card)
-        self._parse_cards(cards_list, cards_dict, card_count, strict=strict)
+        self._parse_cards(cards_list, cards_dict, card_count, strict=strict,
+                          nworkers=nworkers)
 
         if self.values_to_skip:
             for key, values in self.values_to_skip.items():
@@ -3634,6 +3684,11 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         [2]
 
         """
+        node_array_memo = self._node_array_memo
+        out = node_array_memo.get_displacement_index(self, fdtype, idtype, sort_ids)
+        if out is not None:
+            return out
+
         nnodes = len(self.nodes)
         nspoints = 0
         nepoints = 0
@@ -3668,30 +3723,23 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                              idtype, fdtype)
         nid_cp_cd, xyz_cp, nids_cd_transform, nids_cp_transform = out
 
+        # the GRIDs are the first nnodes rows
+        igrid = np.arange(nnodes)
         if sort_ids:
             nids = nid_cp_cd[:, 0]
             isort = nids.argsort()
             nid_cp_cd = nid_cp_cd[isort, :]
             xyz_cp = xyz_cp[isort, :]
-
-        icp_transform = {}
-        icd_transform = {}
-        nids_all = nid_cp_cd[:, 0]
+            igrid = np.where(isort < nnodes)[0]
 
         # get the indicies of the xyz array where the nodes that
         # need to be transformed are
-        for cd, nids in sorted(nids_cd_transform.items()):
-            if cd in [0, -1]:
-                continue
-            nids = np.array(nids)
-            icd_transform[cd] = np.where(np.isin(nids_all, nids))[0]
+        icd_transform = _get_transform_index(nid_cp_cd[igrid, 2], igrid, skip_cids=[0, -1])
+        icp_transform = _get_transform_index(nid_cp_cd[igrid, 1], igrid, skip_cids=[-1])
 
-        for cp, nids in sorted(nids_cp_transform.items()):
-            if cp in [-1]:
-                continue
-            nids = np.array(nids)
-            icp_transform[cp] = np.where(np.isin(nids_all, nids))[0]
-        return icd_transform, icp_transform, xyz_cp, nid_cp_cd
+        out = (icd_transform, icp_transform, xyz_cp, nid_cp_cd)
+        node_array_memo.set_displacement_index(self, fdtype, idtype, sort_ids, out)
+        return out
 
     def get_xyz_in_coord_array(self, cid: int=0,
                                fdtype: str='float64',
@@ -3789,6 +3837,28 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                 cid=1)
 
         """
+        use_memo = not (in_place or self.is_bdf_vectorized)
+        if use_memo:
+            xyz_cid = self._node_array_memo.get_xyz_cid(
+                self, xyz_cp, nids, icp_transform, cid)
+            if xyz_cid is not None:
+                return xyz_cid
+            xyz_cp0 = xyz_cp.copy()
+
+        xyz_cid = self._transform_xyzcp_to_xyz_cid(
+            xyz_cp, nids, icp_transform, cid=cid, in_place=in_place, atol=atol)
+        if use_memo:
+            self._node_array_memo.set_xyz_cid(
+                self, xyz_cp0, nids, icp_transform, cid, xyz_cid)
+        return xyz_cid
+
+    def _transform_xyzcp_to_xyz_cid(self, xyz_cp: np.ndarray,
+                                    nids: np.ndarray,
+                                    icp_transform: dict[int, np.ndarray],
+                                    cid: int=0,
+                                    in_place: bool=False,
+                                    atol: float=1e-6) -> np.ndarray:
+        """see ``transform_xyzcp_to_xyz_cid``"""
         #F:\work\pyNastran\examples\femap_examples\Support\nast\tpl\heli112em7.dat
         if self.is_bdf_vectorized:
             # this is used when xref=False (only for vectorized=True)
@@ -4251,7 +4321,7 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
     def _parse_cards(self, cards_list: list[list[str]],
                      cards_dict: dict[str, list[str]],
                      card_count: dict[str, int],
-                     strict: bool=True) -> None:
+                     strict: bool=True, nworkers: int=1) -> None:
         """creates card objects and adds the parsed cards to the deck"""
         # we don't want replication markers in the card_count
         card_names_to_remove = (card_name for card_name in list(card_count.keys())
@@ -4265,7 +4335,7 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
 
         if cards_list:
             # this is the block that actually runs
-            self._parse_cards_list(cards_list, strict=strict)
+            self._parse_cards_list(cards_list, strict=strict, nworkers=nworkers)
 
     def _parse_cards_dict(self, cards_dict: dict[str, list[str]]) -> None:
         """parses the cards that are in dictionary format"""
@@ -4291,7 +4361,8 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                     self.add_card(card_lines, card_name, comment=comment, ifile=ifile,
                                   is_list=False, has_none=False)
 
-    def _parse_cards_list(self, cards_list: list[str], strict: bool=True):
+    def _parse_cards_list(self, cards_list: list[str], strict: bool=True,
+                          nworkers: int=1):
         """parses the cards that are in list format"""
         add_card = self.add_card if strict else self.add_card_lax
         del strict
@@ -4332,6 +4403,13 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                                         is_list=False, has_none=False)
 
         else:
+            fast_cards = {}
+            if self.use_fast_card_parser and not self._is_dynamic_syntax:
+                fast_cards = get_fast_cards(self, cards_list)
+            if nworkers > 1 and not self._is_dynamic_syntax:
+                fast_cards.update(get_parallel_cards(self, cards_list, nworkers,
+                                                     icards_to_skip=fast_cards))
+
             for icard, card in enumerate(cards_list):
                 card_name, comment, card_lines, (ifile, unused_iline) = card
                 #print(unused_iline, card_lines[0])
@@ -4340,6 +4418,16 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                     msg += f'card_lines = {card_lines}'
                     raise RuntimeError(msg)
 
+                if icard in fast_cards:
+                    card_obj, add_card_function = fast_cards[icard]
+                    try:
+                        add_card_function(card_obj)
+                        self.increase_card_count(card_name)
+                        continue
+                    except (SyntaxError, AssertionError, KeyError, ValueError):
+                        # the standard parser stores the error
+                        pass
+
                 if '=' in card_name:
                     #print(card)
                     try:
@@ -4864,13 +4952,15 @@ def _echo_card(card, card_obj):
             print(print_card_16(card_obj).rstrip())
 
 def read_bdf(bdf_filename: Optional[str]=None, validate: bool=True,
-             xref: bool=True, punch: bool=False,
+             xref: Union[bool, str]=True, punch: bool=False,
              save_file_structure: bool=False,
              skip_cards: Optional[list[str]]=None,
              read_cards: Optional[list[str]]=None,
              encoding: Optional[str]=None,
              log: Optional[SimpleLogger]=None,
-             debug: bool=True, mode: str='msc') -> BDF:
+             debug: bool=True, mode: str='msc',
+             nworkers: int=1,
+             cache_dir: Optional[str]=None) -> BDF:
     """
     Creates the BDF object
 
@@ -4888,8 +4978,10 @@ def read_bdf(bdf_filename: Optional[str]=None, validate: bool=True,
         settings the logging object has
     validate : bool; default=True
         runs various checks on the BDF
-    xref :  bool; default=True
+    xref :  bool / str; default=True
         should the bdf be cross referenced
+        'lazy' : the cards are cross referenced when their ``*_ref``
+                 attributes are first accessed
     punch : bool; default=False
         indicates whether the file is a punch file
     save_file_structure : bool; default=False
@@ -4905,6 +4997,15 @@ def read_bdf(bdf_filename: Optional[str]=None, validate: bool=True,
     mode : str; default='msc'
         the type of Nastran
         valid_modes = {'msc', 'nx'}
+    nworkers : int; default=1
+        the number of threads used to read the INCLUDE files and
+        the number of processes used to create the cards;
+        the model is the same as the serial reader
+    cache_dir : str; default=None
+        the directory to store a binary copy of the model in;
+        the copy is loaded if the main file and the INCLUDE files
+        haven't changed and only the cards from the INCLUDE files
+        that changed are reparsed (if possible)
 
     Returns
     -------
@@ -4946,7 +5047,7 @@ def read_bdf(bdf_filename: Optional[str]=None, validate: bool=True,
     model.read_bdf(bdf_filename=bdf_filename, validate=validate,
                    xref=xref, punch=punch, read_includes=True,
                    save_file_structure=save_file_structure,
-                   encoding=encoding)
+                   encoding=encoding, nworkers=nworkers, cache_dir=cache_dir)
 
     #if 0:
         ### TODO: remove all the extra methods
@@ -5072,6 +5173,40 @@ def _set_nodes(model: BDF,
             i += 1
     return nid_cp_cd, xyz_cp, nids_cd_transform, nids_cp_transform
 
+def _get_transform_index(cids: np.ndarray, igrid: np.ndarray,
+                         skip_cids: list[int]) -> dict[int, np.ndarray]:
+    """
+    helper method for ``get_displacement_index_xyz_cp_cd``
+
+    Groups the GRIDs by coordinate system with one sort instead of
+    searching the node ids once per coordinate system.
+
+    Parameters
+    ----------
+    cids : (ngrid, ) int ndarray
+        the CP/CD of the GRIDs
+    igrid : (ngrid, ) int ndarray
+        the (sorted) row of the GRIDs in nid_cp_cd
+    skip_cids : list[int]
+        coordinate systems that aren't transformed
+
+    Returns
+    -------
+    itransform : dict{int cid : (n,) int ndarray}
+        the rows in nid_cp_cd of the GRIDs that use the coordinate system
+
+    """
+    isort = np.argsort(cids, kind='stable')
+    ucids, istart = np.unique(cids[isort], return_index=True)
+    igrids = np.split(igrid[isort], istart[1:])
+    itransform = {}
+    for cid, igridi in zip(ucids.tolist(), igrids):
+        if cid in skip_cids:
+            continue
+        itransform[cid] = igridi
+    return itransform
+
+
 def _bool(value) -> bool:
     """casts a lower string to a booean"""
     return True if value == 'true' else False
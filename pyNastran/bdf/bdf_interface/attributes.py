@@ -302,6 +302,13 @@ class BDFAttributes:
         self.loads: dict[int, list[Any]] = {}
         self.load_combinations: dict[int, list[Any]] = {}
 
+        # these are created by BDF.__init__
+        self.card_count = {}
+        self.reject_count = {}
+        self.reject_lines = []
+        self.reject_cards = []
+        self.include_filenames = defaultdict(list)
+
     def reset_errors(self) -> None:
         """removes the errors from the model"""
         self._ixref_errors = 0
@@ -0,0 +1,462 @@
+"""
+Defines a binary cache of a BDF that's keyed on the content of the main
+file and the INCLUDE files (read_bdf(..., cache_dir=...)):
+ - read_bdf_cache(model, bdf_filename, cache_dir, punch=False, encoding=None,
+                  nworkers=1)
+ - get_cache_filenames(model, bdf_filename, cache_dir, punch=False, encoding=None)
+
+The model is read with save_file_structure=True, so each card knows the
+file (ifile) it came from, and is pickled (BDF.save) along with a json
+manifest that has the sha256 hash of every file in the INCLUDE tree.
+The next read:
+ - loads the pickled model if none of the files changed
+ - reparses only the cards from the INCLUDE files that changed (when the
+   changed files are at the bottom of the INCLUDE tree and don't have
+   cards that depend on the order of the deck)
+ - reads the deck if anything else changed (e.g., the main file)
+
+"""
+from __future__ import annotations
+import os
+import json
+import hashlib
+from collections import Counter
+from typing import Optional, Any, TYPE_CHECKING
+
+import pyNastran
+from pyNastran.utils import PathLike
+from pyNastran.bdf.cards.base_card import BaseCard
+from pyNastran.bdf.bdf_interface.pybdf import (
+    _lines_to_decks, _make_ilines, get_include_comment)
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+#: the version of the cache format
+CACHE_VERSION = 1
+
+#: cards that are merged with other cards, depend on the order of the
+#: deck or can't be reparsed on their own, so changing a file with one
+#: of these cards rereads the deck
+ORDER_DEPENDENT_CARDS = {
+    'ECHOON', 'ECHOOFF', 'BAROR', 'BEAMOR', 'GRDSET',
+    'SPOINT', 'EPOINT', 'SUPORT1', 'TEMPD',
+    'SET1', 'SET2', 'SET3', 'RADSET',
+    'FREQ', 'FREQ1', 'FREQ2', 'FREQ3', 'FREQ4', 'FREQ5',
+    'DMIG', 'DMIAX', 'DMI', 'DMIJ', 'DMIJI', 'DMIK', 'DTI',
+}
+
+#: attributes that aren't searched for cards
+SKIP_ATTRIBUTES = {'superelement_models', 'reject_cards', 'reject_lines',
+                   '_duplicate_nodes', '_duplicate_elements', '_duplicate_properties',
+                   '_duplicate_masses', '_duplicate_materials', '_duplicate_coords',
+                   '_duplicate_thermal_materials'}
+
+
+def read_bdf_cache(model: BDF, bdf_filename: PathLike, cache_dir: PathLike,
+                   punch: bool=False, encoding: Optional[str]=None,
+                   nworkers: int=1) -> str:
+    """
+    Loads a BDF from the cache (or reads it and updates the cache)
+
+    The model is not cross referenced or validated.
+
+    Parameters
+    ----------
+    model : BDF
+        the model to load
+    bdf_filename : str
+        the main bdf
+    cache_dir : str
+        the directory to store the cached models in
+    punch : bool; default=False
+        indicates whether the file is a punch file
+    encoding : str; default=None -> system default
+        the unicode encoding
+    nworkers : int; default=1
+        the number of workers used to read the deck
+
+    Returns
+    -------
+    status : str
+        'loaded' : nothing changed
+        'updated' : the cards from the INCLUDE files that changed were reparsed
+        'read' : the deck was read
+
+    """
+    log = model.log
+    obj_filename, manifest_filename = get_cache_filenames(
+        model, bdf_filename, cache_dir, punch=punch, encoding=encoding)
+
+    manifest = _load_manifest(manifest_filename)
+    if manifest is not None and os.path.exists(obj_filename):
+        changed_ifiles = _get_changed_ifiles(manifest)
+        if changed_ifiles is not None:
+            encoding = manifest['encoding']
+            if len(changed_ifiles) == 0:
+                log.debug(f'loading cached bdf {obj_filename}')
+                model.load(obj_filename)
+                return 'loaded'
+
+            if manifest['is_partial']:
+                model.load(obj_filename)
+                if _update_model(model, manifest, changed_ifiles):
+                    log.debug(f'reparsed ifiles={changed_ifiles}')
+                    _write_cache(model, obj_filename, manifest_filename,
+                                 manifest['is_partial'], encoding)
+                    return 'updated'
+                model.clear_attributes()
+
+    is_partial = True
+    try:
+        model.read_bdf(bdf_filename, validate=False, xref=False, punch=punch,
+                       save_file_structure=True, encoding=encoding, nworkers=nworkers)
+    except (NotImplementedError, RuntimeError):
+        # some cards (e.g., rejected cards, ACMODL) don't support
+        # save_file_structure; a real error is raised by the second read
+        model.clear_attributes()
+        model.read_bdf(bdf_filename, validate=False, xref=False, punch=punch,
+                       encoding=encoding, nworkers=nworkers)
+        is_partial = False
+
+    is_partial = is_partial and _is_partial_model(model)
+    _write_cache(model, obj_filename, manifest_filename, is_partial, model._encoding)
+    return 'read'
+
+
+def get_cache_filenames(model: BDF, bdf_filename: PathLike, cache_dir: PathLike,
+                        punch: bool=False,
+                        encoding: Optional[str]=None) -> tuple[str, str]:
+    """
+    Gets the cached model and manifest filenames, which depend on the
+    path to the main bdf and the read options
+
+    Returns
+    -------
+    obj_filename : str
+        the pickled BDF
+    manifest_filename : str
+        the json file with the file hashes
+
+    """
+    abs_filename = os.path.abspath(str(bdf_filename))
+    settings = [
+        abs_filename, pyNastran.__version__, CACHE_VERSION, punch, encoding,
+        model._nastran_format, model.is_superelements, model.use_new_deck_parser,
+        sorted(model.cards_to_read),
+    ]
+    key = hashlib.sha256(json.dumps(settings).encode('utf8')).hexdigest()[:16]
+    basename = os.path.splitext(os.path.basename(abs_filename))[0]
+    obj_filename = os.path.join(cache_dir, f'{basename}.{key}.obj')
+    manifest_filename = os.path.join(cache_dir, f'{basename}.{key}.json')
+    return obj_filename, manifest_filename
+
+
+def _write_cache(model: BDF, obj_filename: str, manifest_filename: str,
+                 is_partial: bool, encoding: str) -> None:
+    """pickles the model and writes the manifest"""
+    cache_dir = os.path.dirname(obj_filename)
+    if cache_dir and not os.path.exists(cache_dir):
+        os.makedirs(cache_dir)
+
+    files = []
+    for bdf_filename in model.active_filenames:
+        sha256, trailing_comment = _hash_file(bdf_filename, encoding)
+        files.append([bdf_filename, sha256, trailing_comment])
+    manifest = {
+        'version': CACHE_VERSION,
+        'encoding': encoding,
+        'is_partial': is_partial,
+        'files': files,
+    }
+
+    # the manifest is written last, so a partially written cache isn't used
+    if os.path.exists(manifest_filename):
+        os.remove(manifest_filename)
+    model.save(obj_filename, unxref=False)
+    with open(manifest_filename, 'w') as manifest_file:
+        json.dump(manifest, manifest_file, indent=1)
+
+
+def _load_manifest(manifest_filename: str) -> Optional[dict[str, Any]]:
+    """loads the manifest (None if there isn't a valid one)"""
+    if not os.path.exists(manifest_filename):
+        return None
+    try:
+        with open(manifest_filename, 'r') as manifest_file:
+            manifest = json.load(manifest_file)
+    except ValueError:
+        return None
+    if manifest.get('version') != CACHE_VERSION:
+        return None
+    return manifest
+
+
+def _get_changed_ifiles(manifest: dict[str, Any]) -> Optional[list[int]]:
+    """
+    Gets the files that changed
+
+    Returns
+    -------
+    changed_ifiles : list[int]
+        the ifile of the files that changed
+        None : a file is missing
+    """
+    changed_ifiles = []
+    encoding = manifest['encoding']
+    for ifile, (bdf_filename, sha256, unused_trailing_comment) in enumerate(manifest['files']):
+        if not os.path.isfile(bdf_filename):
+            return None
+        sha256i = _hash_file(bdf_filename, encoding)[0]
+        if sha256i != sha256:
+            changed_ifiles.append(ifile)
+    return changed_ifiles
+
+
+def _hash_file(bdf_filename: str, encoding: str) -> tuple[str, str]:
+    """
+    Gets the sha256 hash of a file and the trailing comment, which is
+    used by the next card in the parent file
+    """
+    sha256 = hashlib.sha256()
+    trailing_data = b''
+    with open(bdf_filename, 'rb') as bdf_file:
+        while True:
+            data = bdf_file.read(2**20)
+            if not data:
+                break
+            sha256.update(data)
+            trailing_data = data
+    text = trailing_data[-10000:].decode(encoding, errors='replace')
+
+    unused_iline, trailing_comment = _get_trailing_comment(text.splitlines())
+    return sha256.hexdigest(), trailing_comment
+
+
+def _get_trailing_comment(lines: list[str]) -> tuple[int, str]:
+    """
+    Gets the comment/blank lines at the end of a file
+
+    Returns
+    -------
+    iline : int
+        the first line of the trailing comment
+    trailing_comment : str
+        the stripped comment lines
+    """
+    iline = len(lines)
+    while iline > 0:
+        line = lines[iline - 1].strip()
+        if line and not line.startswith('$'):
+            break
+        iline -= 1
+    trailing_comment = '\n'.join(line.strip() for line in lines[iline:])
+    return iline, trailing_comment
+
+
+def _is_partial_model(model: BDF) -> bool:
+    """can the cards from a single INCLUDE file be reparsed?"""
+    if model.superelement_models or model.reject_cards or model.reject_lines:
+        return False
+    if model._is_dynamic_syntax:
+        return False
+    for unused_key, card in _iter_cards(model):
+        if not hasattr(card, 'ifile') and card is not model.coords.get(0):
+            return False
+    return True
+
+
+def _update_model(model: BDF, manifest: dict[str, Any],
+                  changed_ifiles: list[int]) -> bool:
+    """
+    Reparses the cards from the INCLUDE files that changed
+
+    Returns
+    -------
+    is_updated : bool
+        False : the model couldn't be updated and the deck must be reread;
+                the model may have been modified
+    """
+    encoding = manifest['encoding']
+    files = manifest['files']
+    parent_filenames = {}
+    for unused_ifile, include_filenames in model.include_filenames.items():
+        for bdf_filename2 in include_filenames:
+            parent_filenames[os.path.join(model.include_dir, bdf_filename2)] = bdf_filename2
+
+    include_comments = {}
+    for ifile in changed_ifiles:
+        bdf_filename = files[ifile][0]
+        if ifile == 0 or ifile in model.include_filenames:
+            # the main file or a file with INCLUDEs
+            return False
+        if bdf_filename not in parent_filenames:
+            return False
+        include_comments[ifile] = get_include_comment(parent_filenames[bdf_filename])
+    leading_comments = _get_leading_comments(model, include_comments)
+
+    cards_lists = []
+    for ifile in changed_ifiles:
+        if ifile not in leading_comments:
+            # the comment is stored on a card in the parent file
+            return False
+        bdf_filename, unused_sha256, trailing_comment = files[ifile]
+        comment_lines = leading_comments[ifile].splitlines(True) + [include_comments[ifile]]
+        cards_list = _get_include_cards(model, ifile, bdf_filename, comment_lines,
+                                        trailing_comment, encoding)
+        if cards_list is None:
+            return False
+        cards_lists.append(cards_list)
+
+    if not _remove_cards(model, set(changed_ifiles)):
+        return False
+
+    for cards_list in cards_lists:
+        model._parse_cards_list(cards_list)
+    model.pop_parse_errors()
+    return True
+
+
+def _get_leading_comments(model: BDF, include_comments: dict[int, str]) -> dict[int, str]:
+    """
+    Gets the comments before the INCLUDE lines in the parent files,
+    which are stored on the first card of the INCLUDE file
+    """
+    leading_comments = {}
+    for unused_key, card in _iter_cards(model):
+        ifile = getattr(card, 'ifile', None)
+        if ifile not in include_comments or ifile in leading_comments:
+            continue
+        comment = card.comment
+        include_comment = include_comments[ifile].lstrip('\n')
+        if include_comment in comment:
+            leading_comments[ifile] = comment[:comment.index(include_comment)]
+    return leading_comments
+
+
+def _get_include_cards(model: BDF, ifile: int, bdf_filename: str, comment_lines: list[str],
+                       trailing_comment: str, encoding: str) -> Optional[list[Any]]:
+    """
+    Gets the cards from an INCLUDE file that doesn't have INCLUDEs,
+    Executive/Case Control Decks or superelements
+    """
+    with open(bdf_filename, 'r', encoding=encoding) as bdf_file:
+        lines = bdf_file.readlines()
+
+    for line in lines:
+        line_upper = line.lstrip().upper()
+        if line_upper.startswith(('INCLUDE', 'BEGIN', 'CEND', 'ENDDATA')):
+            return None
+    iline, trailing_comment2 = _get_trailing_comment(lines)
+    if trailing_comment2 != trailing_comment:
+        # the comment is stored on a card in the parent file
+        return None
+
+    # the lines are split the same way as the main deck
+    lines = comment_lines + lines[:iline]
+    header_lines = [] if model.punch else ['CEND\n', 'BEGIN BULK\n']
+    lines = header_lines + lines
+    ilines = _make_ilines(len(lines), ifile)
+    ilines[:, 1] -= len(header_lines)
+    out = _lines_to_decks(lines, ilines, model.punch, model.log, keep_enddata=True,
+                          consider_superelements=model.is_superelements,
+                          nastran_format=model._nastran_format)
+    (system_lines, executive_control_lines, case_control_lines,
+     bulk_data_lines, bulk_data_ilines,
+     superelement_lines, unused_superelement_ilines) = out
+    if system_lines or case_control_lines or superelement_lines:
+        return None
+    if executive_control_lines != [line.strip() for line in header_lines[:1]]:
+        return None
+
+    cards_list = model.get_bdf_cards(bulk_data_lines, bulk_data_ilines)[0]
+    for card in cards_list:
+        card_name = card[0]
+        if card_name in ORDER_DEPENDENT_CARDS or card_name not in model.cards_to_read:
+            return None
+    return cards_list
+
+
+def _remove_cards(model: BDF, ifiles: set[int]) -> bool:
+    """removes the cards from a set of files"""
+    removed_cards = []
+    for name, value in list(model.__dict__.items()):
+        if name in SKIP_ATTRIBUTES:
+            continue
+        if isinstance(value, BaseCard):
+            if getattr(value, 'ifile', None) in ifiles:
+                removed_cards.append((None, value))
+                setattr(model, name, None)
+        elif isinstance(value, dict):
+            _remove_dict_cards(value, ifiles, removed_cards)
+        elif isinstance(value, list):
+            _remove_list_cards(value, ifiles, None, removed_cards)
+
+    removed_ids = Counter()
+    for key, card in removed_cards:
+        card_type = card.type
+        if card_type in ORDER_DEPENDENT_CARDS or card_type not in model.card_count:
+            return False
+        model.card_count[card_type] -= 1
+        if model.card_count[card_type] == 0:
+            del model.card_count[card_type]
+        removed_ids[(card_type, key)] += 1
+
+    type_to_id_map = model._type_to_id_map
+    for (card_type, key), nremoved in removed_ids.items():
+        ids = type_to_id_map.get(card_type)
+        if ids is None:
+            continue
+        for unused_i in range(nremoved):
+            if key in ids:
+                ids.remove(key)
+    return True
+
+
+def _remove_dict_cards(cards: dict[Any, Any], ifiles: set[int],
+                       removed_cards: list[tuple[Any, BaseCard]]) -> None:
+    """removes the cards from a dict/dict of lists"""
+    for key, value in list(cards.items()):
+        if isinstance(value, BaseCard):
+            if getattr(value, 'ifile', None) in ifiles:
+                removed_cards.append((key, value))
+                del cards[key]
+        elif isinstance(value, list):
+            nremoved = _remove_list_cards(value, ifiles, key, removed_cards)
+            if nremoved and len(value) == 0:
+                del cards[key]
+
+
+def _remove_list_cards(cards: list[Any], ifiles: set[int], key: Any,
+                       removed_cards: list[tuple[Any, BaseCard]]) -> int:
+    """removes the cards from a list"""
+    cards_to_keep = []
+    for card in cards:
+        if isinstance(card, BaseCard) and getattr(card, 'ifile', None) in ifiles:
+            removed_cards.append((key, card))
+        else:
+            cards_to_keep.append(card)
+    nremoved = len(cards) - len(cards_to_keep)
+    if nremoved:
+        cards[:] = cards_to_keep
+    return nremoved
+
+
+def _iter_cards(model: BDF):
+    """iterates over the cards in the model"""
+    for name, value in model.__dict__.items():
+        if name in SKIP_ATTRIBUTES:
+            continue
+        if isinstance(value, BaseCard):
+            yield None, value
+        elif isinstance(value, dict):
+            for key, valuei in value.items():
+                if isinstance(valuei, BaseCard):
+                    yield key, valuei
+                elif isinstance(valuei, list):
+                    for card in valuei:
+                        if isinstance(card, BaseCard):
+                            yield key, card
+        elif isinstance(value, list):
+            for card in value:
+                if isinstance(card, BaseCard):
+                    yield None, card
@@ -69,11 +69,23 @@ around the idea of cross-referencing, so it's recommended that you use it.
 """
 # pylint: disable=R0902,R0904,R0914
 from collections import defaultdict
+from functools import partial
+from itertools import chain, compress
 import traceback
+import weakref
 from typing import Any
 
 from numpy import zeros, argsort, arange, array_equal, array
 from pyNastran.bdf.bdf_interface.attributes import BDFAttributes
+from pyNastran.bdf.cards.coordinate_systems import setup_coords
+
+#: cards that set more than their ``*_ref`` attributes when they're cross
+#: referenced (e.g., FORCE1.xyz, MAT8.matt8, DRESP2.func), so they're always
+#: cross referenced when ``lazy=True``
+EAGER_XREF_TYPES = {
+    'FORCE1', 'FORCE2', 'MOMENT1', 'MOMENT2', 'MAT8',
+    'DEQATN', 'DRESP2', 'DRESP3', 'DVPREL2', 'DVMREL2', 'DVCREL2',
+}
 
 class XrefMesh(BDFAttributes):
     """Links up the various cards in the BDF."""
@@ -83,6 +95,13 @@ class XrefMesh(BDFAttributes):
         self._nxref_errors = 100
         self._stop_on_xref_error = True
 
+        # the cards that haven't been lazily cross referenced yet (by id)
+        # and the cards that have been (None if lazy=False)
+        self._lazy_xref_cards = None
+        self._lazy_xref_done = None
+        # the model weakref and the _LazyRef descriptors it's registered with
+        self._lazy_xref_refs = None
+
     # def geom_check(self):
         # """
         # Performs various geometry checks
@@ -104,7 +123,8 @@ class XrefMesh(BDFAttributes):
                         xref_aero: bool=True,
                         xref_sets: bool=True,
                         xref_optimization: bool=True,
-                        word: str='') -> None:
+                        word: str='',
+                        lazy: bool=False) -> None:
         """
         Links up all the cards to the cards they reference
 
@@ -132,6 +152,12 @@ class XrefMesh(BDFAttributes):
             set cross referencing of SETx
         word : str; default=''
             model flag
+        lazy : bool; default=False
+            delays the cross referencing of the nodes, elements, properties,
+            masses, materials, constraints, loads, sets and optimization
+            cards until one of their ``*_ref`` attributes is accessed
+            (e.g., ``elem.nodes_ref``).  The coordinate systems, aero,
+            contact and superelement cards are always cross referenced.
 
         To only cross-reference nodes:
 
@@ -149,31 +175,41 @@ class XrefMesh(BDFAttributes):
         if not xref:
             return
         self.log.debug("Cross Referencing%s..." % word)
-        if xref_nodes:
-            self._cross_reference_nodes()
-            self._cross_reference_coordinates()
-
-        if xref_elements:
-            self._cross_reference_bolts()
-            self._cross_reference_elements()
-            self._cross_reference_rigid_elements()
-        if xref_properties:
-            self._cross_reference_properties()
-        if xref_masses:
-            self._cross_reference_masses()
-        if xref_materials:
-            self._cross_reference_materials()
+        self._clear_lazy_cross_reference()
+        if lazy:
+            self._lazy_cross_reference(
+                xref_nodes=xref_nodes, xref_elements=xref_elements,
+                xref_properties=xref_properties, xref_masses=xref_masses,
+                xref_materials=xref_materials, xref_loads=xref_loads,
+                xref_constraints=xref_constraints, xref_sets=xref_sets,
+                xref_optimization=xref_optimization)
+        else:
+            if xref_nodes:
+                self._cross_reference_nodes()
+                self._cross_reference_coordinates()
+
+            if xref_elements:
+                self._cross_reference_bolts()
+                self._cross_reference_elements()
+                self._cross_reference_rigid_elements()
+            if xref_properties:
+                self._cross_reference_properties()
+            if xref_masses:
+                self._cross_reference_masses()
+            if xref_materials:
+                self._cross_reference_materials()
 
         if xref_aero:
             self._cross_reference_aero()
-        if xref_constraints:
-            self._cross_reference_constraints()
-        if xref_loads:
-            self._cross_reference_loads()
-        if xref_sets:
-            self._cross_reference_sets()
-        if xref_optimization:
-            self._cross_reference_optimization()
+        if not lazy:
+            if xref_constraints:
+                self._cross_reference_constraints()
+            if xref_loads:
+                self._cross_reference_loads()
+            if xref_sets:
+                self._cross_reference_sets()
+            if xref_optimization:
+                self._cross_reference_optimization()
         if xref_nodes_with_elements:
             self._cross_reference_nodes_with_elements()
         self._cross_reference_contact()
@@ -195,7 +231,211 @@ class XrefMesh(BDFAttributes):
                 xref_materials=xref_materials, xref_loads=xref_loads,
                 xref_constraints=xref_constraints, xref_aero=xref_aero,
                 xref_sets=xref_sets, xref_optimization=xref_optimization,
-                word=word)
+                word=word, lazy=lazy)
+
+    def _lazy_cross_reference(self,
+                              xref_nodes: bool=True,
+                              xref_elements: bool=True,
+                              xref_properties: bool=True,
+                              xref_masses: bool=True,
+                              xref_materials: bool=True,
+                              xref_loads: bool=True,
+                              xref_constraints: bool=True,
+                              xref_sets: bool=True,
+                              xref_optimization: bool=True) -> None:
+        """
+        Sets up the cards, so they're cross referenced when one of their
+        ``*_ref`` attributes is first accessed.
+
+        The cards aren't modified.  The ``*_ref`` attributes of each card
+        class are replaced by a ``_LazyRef`` descriptor, which cross
+        references the card with ``_cross_reference_lazy_card``.
+        """
+        self._lazy_xref_cards = {}
+        self._lazy_xref_done = []
+        descriptors = []
+        model_ref = weakref.ref(self, partial(_remove_lazy_refs, descriptors))
+        self._lazy_xref_refs = (model_ref, descriptors)
+
+        card_groups = []
+        if xref_nodes:
+            if self.grdset is None:
+                card_groups.append(self.nodes.values())
+            else:
+                # the GRDSET defaults are applied when the GRID is cross referenced
+                self._set_eager_cross_reference(self.nodes.values())
+            card_groups.append(self.points.values())
+            self._cross_reference_coordinates()
+
+        if xref_elements:
+            for bolt_dict in (self.bolt, self.boltfor, self.boltseq, self.boltld, self.boltfrc):
+                card_groups.append(bolt_dict.values())
+            card_groups.append(self.elements.values())
+            card_groups.append(self.rigid_elements.values())
+            card_groups.append(self.plotels.values())
+        if xref_properties:
+            card_groups.append(self.properties.values())
+        if xref_elements or xref_masses:
+            card_groups.append(self.masses.values())
+        if xref_masses:
+            card_groups.append(self.properties_mass.values())
+        if xref_materials:
+            material_dicts = [
+                self.materials, self.creep_materials,
+                self.MATS1, self.MATS3, self.MATS8,
+                self.MATT1, self.MATT2, self.MATT3, self.MATT4, self.MATT5,
+                self.MATT8, self.MATT9, self.MATT11]
+            for material_dict in material_dicts:
+                card_groups.append(material_dict.values())
+
+        if xref_constraints:
+            for card_dict in (self.spcadds, self.spcs, self.spcoffs, self.mpcadds, self.mpcs):
+                card_groups.extend(card_dict.values())
+            card_groups.append(self.suport)
+            card_groups.append(self.suport1.values())
+            card_groups.append(self.se_suport)
+        if xref_loads:
+            for card_dict in (self.load_combinations, self.loads, self.dloads, self.dload_entries):
+                card_groups.extend(card_dict.values())
+            for card_dict in (self.dareas, self.tics, self.dphases):
+                card_groups.append(card_dict.values())
+        if xref_sets:
+            card_groups.extend((self.asets, self.omits, self.bsets, self.csets, self.qsets))
+            card_groups.extend(self.usets.values())
+            card_groups.append(self.se_sets.values())
+            card_groups.extend((self.se_bsets, self.se_csets, self.se_qsets, self.se_usets))
+        if xref_optimization:
+            card_groups.append(self.dequations.values())
+            card_groups.append(self.dresps.values())
+            # the DCONSTRs that can't be cross referenced are removed,
+            # which requires cross referencing them now
+            self._cross_reference_dconstrs()
+            self._lazy_xref_done.extend(chain.from_iterable(self.dconstrs.values()))
+            for card_dict in (self.dvcrels, self.dvmrels, self.dvprels, self.desvars):
+                card_groups.append(card_dict.values())
+        self._set_lazy_cross_reference(list(chain.from_iterable(card_groups)))
+
+    def _set_lazy_cross_reference(self, cards: list[Any]) -> None:
+        """
+        Sets up the cards to be cross referenced on first access.
+
+        The cards are only looped over by ``map``, so the setup is cheap
+        compared to cross referencing them.  The descriptors are set up
+        once per card class from one of its cards.
+        """
+        lazy_xref_cards = self._lazy_xref_cards
+        lazy_xref_cards.update(zip(map(id, cards), cards))
+
+        # one card of each class
+        card_classes = dict(zip(map(type, cards), cards))
+        eager_classes = set()
+        g0_classes = set()
+        for card_class, card in card_classes.items():
+            # the cards without a *_ref attribute can't be lazily cross referenced
+            if card.type in EAGER_XREF_TYPES or not self._add_lazy_refs(card_class, card):
+                eager_classes.add(card_class)
+            elif card.type in {'CBAR', 'CBEAM'}:
+                # the orientation vector is calculated from G0
+                g0_classes.add(card_class)
+
+        if eager_classes or g0_classes:
+            is_eager = map((eager_classes | g0_classes).__contains__, map(type, cards))
+            eager_cards = [card for card in compress(cards, is_eager)
+                           if card.__class__ in eager_classes or card.g0 is not None]
+            for card in eager_cards:
+                del lazy_xref_cards[id(card)]
+            self._set_eager_cross_reference(eager_cards)
+
+        if not lazy_xref_cards:
+            self._remove_lazy_refs()
+
+    def _set_eager_cross_reference(self, cards) -> None:
+        """
+        Cross references the cards now, but still tracks them, so they're
+        uncross referenced
+        """
+        lazy_xref_done = self._lazy_xref_done
+        for card in cards:
+            lazy_xref_done.append(card)
+            try:
+                self._cross_reference_card(card)
+            except (SyntaxError, RuntimeError, AssertionError, KeyError, ValueError) as error:
+                self._store_xref_error(error, card)
+
+    def _add_lazy_refs(self, card_class: type, card) -> bool:
+        """
+        Registers the model with the ``_LazyRef`` descriptors of a card class
+
+        Returns
+        -------
+        is_lazy : bool
+            the card class has a ``_LazyRef`` descriptor
+        """
+        model_ref, descriptors = self._lazy_xref_refs
+        is_lazy = False
+        for name in card.__dict__:
+            if not name.endswith('_ref'):
+                continue
+            descriptor = _get_lazy_ref(card_class, name)
+            if descriptor is None:
+                continue
+            is_lazy = True
+            if descriptor not in descriptors:
+                descriptor.model_refs += (model_ref, )
+                descriptors.append(descriptor)
+        return is_lazy
+
+    def _remove_lazy_refs(self) -> None:
+        """unregisters the model, so the descriptors can be removed"""
+        model_ref, descriptors = self._lazy_xref_refs
+        _remove_lazy_refs(descriptors, model_ref)
+
+    def _cross_reference_card(self, card) -> None:
+        """cross references a single card"""
+        if card.type == 'GRID':
+            card.cross_reference(self, self.grdset)
+        else:
+            card.cross_reference(self)
+
+    def _cross_reference_lazy_card(self, card) -> bool:
+        """
+        Cross references a card that was set up by ``_lazy_cross_reference``.
+        If the cross referencing fails, the card is reset, so the error is
+        raised again on the next access.
+
+        Returns
+        -------
+        is_xref : bool
+            the card was cross referenced
+        """
+        lazy_xref_cards = self._lazy_xref_cards
+        if lazy_xref_cards is None or lazy_xref_cards.pop(id(card), None) is None:
+            return False
+
+        # the card is cross referenced like it normally would be, so the
+        # unset references are None (e.g., CTRIA3.node_ids uses nodes_ref)
+        try:
+            self._cross_reference_card(card)
+        except Exception:
+            lazy_xref_cards[id(card)] = card
+            raise
+        self._lazy_xref_done.append(card)
+        if not lazy_xref_cards:
+            # everything has been accessed, so the descriptors aren't needed
+            self._remove_lazy_refs()
+        return True
+
+    def _clear_lazy_cross_reference(self) -> None:
+        """
+        Drops the cards that haven't been lazily cross referenced yet, so
+        the model can be cross referenced again
+        """
+        if self._lazy_xref_cards is None:
+            return
+        self._remove_lazy_refs()
+        self._lazy_xref_cards = None
+        self._lazy_xref_done = None
+        self._lazy_xref_refs = None
 
     def _cross_reference_constraints(self) -> None:
         """
@@ -239,8 +479,7 @@ class XrefMesh(BDFAttributes):
         for coord in self.coords.values():
             coord.cross_reference(self)
 
-        for coord in self.coords.values():
-            coord.setup()
+        setup_coords(self.coords)
 
     def _cross_reference_aero(self, check_caero_element_ids: bool=False) -> None:
         """
@@ -549,22 +788,12 @@ class XrefMesh(BDFAttributes):
 
     def _cross_reference_optimization(self) -> None:
         """cross references the optimization objects"""
-        remove_missing_optimization = True
-        dconstrs_to_remove = []
-
         for unused_key, deqatn in self.dequations.items():
             deqatn.cross_reference(self)
         for unused_key, dresp in self.dresps.items():
             dresp.cross_reference(self)
 
-        for key, dconstrs in self.dconstrs.items():
-            for i, dconstr in enumerate(dconstrs):
-                try:
-                    dconstr.cross_reference(self)
-                except:
-                    if not remove_missing_optimization:
-                        raise
-                    dconstrs_to_remove.append((key, i))
+        self._cross_reference_dconstrs()
 
         for unused_key, dvcrel in self.dvcrels.items():
             dvcrel.cross_reference(self)
@@ -575,6 +804,19 @@ class XrefMesh(BDFAttributes):
         for unused_key, desvar in self.desvars.items():
             desvar.cross_reference(self)
 
+    def _cross_reference_dconstrs(self) -> None:
+        """cross references the DCONSTRs and removes the invalid ones"""
+        remove_missing_optimization = True
+        dconstrs_to_remove = []
+        for key, dconstrs in self.dconstrs.items():
+            for i, dconstr in enumerate(dconstrs):
+                try:
+                    dconstr.cross_reference(self)
+                except:
+                    if not remove_missing_optimization:
+                        raise
+                    dconstrs_to_remove.append((key, i))
+
         for key, i in dconstrs_to_remove:
             del self.dconstrs[key][i]
 
@@ -839,3 +1081,71 @@ class XrefMesh(BDFAttributes):
             # pyram elpr <= 0.5
             # pyram detj <= 0.
             # pyram warp <= 0.707
+
+
+class _LazyRef:
+    """
+    A ``*_ref`` attribute of a card class, which cross references the card
+    on first access when the model was cross referenced with ``lazy=True``.
+    It's a data descriptor, so it's used instead of the card's ``__dict__``
+    entry.  It's removed from the class when no model needs it.
+    """
+    def __init__(self, card_class: type, name: str):
+        self.card_class = card_class
+        self.name = name
+        #: weakrefs to the models with cards that haven't been cross referenced
+        self.model_refs = ()
+
+    def __get__(self, card, card_class=None):
+        if card is None:
+            return self
+        card_dict = card.__dict__
+        try:
+            value = card_dict[self.name]
+        except KeyError:
+            raise AttributeError(
+                f'{type(card).__name__!r} object has no attribute {self.name!r}') from None
+        if value is None:
+            for model_ref in self.model_refs:
+                model = model_ref()
+                if model is not None and model._cross_reference_lazy_card(card):
+                    return card_dict[self.name]
+        return value
+
+    def __set__(self, card, value) -> None:
+        card.__dict__[self.name] = value
+
+    def __delete__(self, card) -> None:
+        try:
+            del card.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+
+
+def _get_lazy_ref(card_class: type, name: str):
+    """
+    Gets the ``_LazyRef`` descriptor of a card class, which is added if
+    it doesn't exist.  None is returned if the class defines the attribute.
+    """
+    for base_class in card_class.__mro__:
+        if name in base_class.__dict__:
+            descriptor = base_class.__dict__[name]
+            return descriptor if isinstance(descriptor, _LazyRef) else None
+    descriptor = _LazyRef(card_class, name)
+    setattr(card_class, name, descriptor)
+    return descriptor
+
+
+def _remove_lazy_refs(descriptors: list[_LazyRef], model_ref: weakref.ref) -> None:
+    """
+    Unregisters a model from the ``_LazyRef`` descriptors.  The unused
+    descriptors are removed from the card classes, so the ``*_ref``
+    attributes are regular attributes again.  This is also called when
+    the model is deleted.
+    """
+    for descriptor in descriptors:
+        descriptor.model_refs = tuple([ref for ref in descriptor.model_refs
+                                       if ref is not model_ref])
+        if not descriptor.model_refs:
+            delattr(descriptor.card_class, descriptor.name)
+    descriptors.clear()
@@ -0,0 +1,427 @@
+"""
+Defines a vectorized parser for the high-volume bulk data cards
+(BDF.use_fast_card_parser):
+ - get_fast_cards(model, cards_list)
+
+The common fixed (small) field forms of the GRID, CQUAD4, CTRIA3, CTETRA,
+CPENTA, CHEXA, CBAR, CBUSH, CONM2 and RBE2 cards are sliced into fields
+with numpy, so the fields of every card of a type are cast at once
+instead of building a BDFCard and calling the assign_type functions for
+each field of each card.  The usual card objects are then created from
+the columns.
+
+Cards that aren't in that form (e.g., large field, CSV, tabs,
+continuations, alternate forms) or that have a field that isn't cleanly
+an integer/float/blank are left for the standard parser, so any error
+message is the same.
+
+"""
+from __future__ import annotations
+from collections import defaultdict
+from itertools import permutations
+from typing import Callable, Optional, Any, TYPE_CHECKING
+
+import numpy as np
+
+from pyNastran.bdf.bdf_interface.assign_type import double_from_str
+from pyNastran.bdf.cards.nodes import GRID
+from pyNastran.bdf.cards.elements.shell import CTRIA3, CQUAD4
+from pyNastran.bdf.cards.elements.solid import CTETRA4, CPENTA6, CHEXA8
+from pyNastran.bdf.cards.elements.bars import CBAR
+from pyNastran.bdf.cards.elements.bush import CBUSH
+from pyNastran.bdf.cards.elements.mass import CONM2
+from pyNastran.bdf.cards.elements.rigid import RBE2
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+#: the errors that send a card back to the standard parser
+PARSE_ERRORS = (SyntaxError, AssertionError, KeyError, ValueError, RuntimeError)
+
+#: the component strings (e.g., '321') and the sorted value (e.g., '123')
+COMPONENTS = {'0': '0'}
+for _ncomponents in range(1, 7):
+    for _components in permutations('123456', _ncomponents):
+        COMPONENTS[''.join(_components)] = ''.join(sorted(_components))
+
+
+def get_fast_cards(model: BDF, cards_list: list[Any]) -> dict[int, tuple[Any, Callable]]:
+    """
+    Parses the fixed field forms of the high-volume cards
+
+    Parameters
+    ----------
+    model : BDF
+        the model (used for the card parsers)
+    cards_list : list[(card_name, comment, card_lines, (ifile, iline))]
+        the cards from ``get_bdf_cards``
+
+    Returns
+    -------
+    fast_cards : dict[icard] = (card_object, add_method)
+        the cards that were parsed; everything else needs the standard parser
+
+    """
+    parsers = _get_parsers(model, cards_list)
+    icards_by_name = defaultdict(list)
+    for icard, (card_name, unused_comment, card_lines, unused_ifile_iline) in enumerate(cards_list):
+        parser = parsers.get(card_name)
+        if parser is None or len(card_lines) != parser[0]:
+            continue
+        for line in card_lines:
+            if ',' in line or '\t' in line or '*' in line or '=' in line:
+                break
+        else:
+            icards_by_name[card_name].append(icard)
+
+    fast_cards = {}
+    for card_name, icards in icards_by_name.items():
+        nlines, build, add_method = parsers[card_name]
+        cards = [cards_list[icard] for icard in icards]
+        fields = _get_fields(cards, nlines)
+        comments = [card[1] for card in cards]
+        for icard, obj in zip(icards, build(fields, comments)):
+            if obj is not None:
+                fast_cards[icard] = (obj, add_method)
+    return fast_cards
+
+
+def _get_parsers(model: BDF, cards_list: list[Any]) -> dict[str, tuple[int, Callable, Callable]]:
+    """
+    Gets the number of lines, the build function and the add method for
+    the cards that use the standard card class (e.g., not nasa95)
+    """
+    card_parser = model._card_parser
+    card_parser_prepare = model._card_parser_prepare
+    add_element = model._add_methods._add_element_object
+    card_names = {card[0] for card in cards_list}
+    parsers = {}
+    if 'ECHOON' in card_names:
+        # the cards are echoed in order
+        return parsers
+
+    for card_name, (nlines, build, card_class) in BUILDERS.items():
+        if card_name not in model.cards_to_read:
+            continue
+        if card_name in card_parser:
+            card_classi, add_method = card_parser[card_name]
+            if card_classi is not card_class:
+                continue
+        elif card_name in card_parser_prepare:
+            prepare_method = card_parser_prepare[card_name]
+            if prepare_method != getattr(model, f'_prepare_{card_name.lower()}', None):
+                continue
+            add_method = add_element
+        else:
+            continue
+        parsers[card_name] = (nlines, build, add_method)
+
+    if 'CBAR' in parsers:
+        # the BAROR defaults depend on the order of the cards
+        if model.baror is not None or 'BAROR' in card_names:
+            del parsers['CBAR']
+    return parsers
+
+
+def _get_fields(cards: list[Any], nlines: int) -> np.ndarray:
+    """
+    Slices the small field lines of the cards into stripped fields
+
+    Returns
+    -------
+    fields : (ncards, 8*nlines+1) str ndarray
+        the fields (field 0 is the card name)
+
+    """
+    ncards = len(cards)
+    fields = np.full((ncards, 8 * nlines + 1), '', dtype='U8')
+    for iline in range(nlines):
+        # the continuation marker in columns 73-80 is dropped
+        lines = np.array([card[2][iline] for card in cards], dtype='U72')
+        line_fields = lines.view('U8').reshape(ncards, 9)
+        if iline == 0:
+            fields[:, :9] = line_fields
+        else:
+            fields[:, 8*iline+1:8*iline+9] = line_fields[:, 1:]
+    return np.char.strip(fields)
+
+
+class Columns:
+    """casts the fields of a set of cards and tracks the invalid cards"""
+    def __init__(self, fields: np.ndarray):
+        self.fields = fields
+        self.is_valid = np.ones(fields.shape[0], dtype='bool')
+
+    def integer(self, ifield: int) -> list[int]:
+        """an integer field (e.g., an element id)"""
+        svalues = self.fields[:, ifield]
+        is_int = np.char.isdigit(svalues)
+        self.is_valid &= is_int
+        return _cast_int(svalues, is_int)
+
+    def integer_or_blank(self, ifield: int) -> list[Optional[int]]:
+        """an integer field with a default (None)"""
+        svalues = self.fields[:, ifield]
+        is_int = np.char.isdigit(svalues)
+        self.is_valid &= is_int | (svalues == '')
+        return _cast_int(svalues, is_int)
+
+    def double_or_blank(self, ifield: int) -> list[Optional[float]]:
+        """a float field with a default (None)"""
+        svalues = self.fields[:, ifield]
+        is_float = (svalues != '') & ~np.char.isdigit(svalues)
+        self.is_valid &= is_float | (svalues == '')
+        return self._cast_double(svalues, is_float)
+
+    def integer_double_or_blank(self, ifield: int) -> list[Optional[int | float]]:
+        """an integer/float field with a default (None); floats must have a '.'"""
+        svalues = self.fields[:, ifield]
+        is_int = np.char.isdigit(svalues)
+        is_float = np.char.find(svalues, '.') >= 0
+        self.is_valid &= is_int | is_float | (svalues == '')
+        values = self._cast_double(svalues, is_float)
+        for i, value in zip(np.flatnonzero(is_int).tolist(), map(int, svalues[is_int].tolist())):
+            values[i] = value
+        return values
+
+    def components_or_blank(self, ifield: int) -> list[Optional[str]]:
+        """a component field (e.g., '123') with a default (None)"""
+        svalues = self.fields[:, ifield]
+        is_blank = svalues == ''
+        self.is_valid &= is_blank | np.isin(svalues, list(COMPONENTS))
+        return [None if svalue == '' else COMPONENTS.get(svalue)
+                for svalue in svalues.tolist()]
+
+    def blank(self, ifield: int) -> None:
+        """a field that must be blank"""
+        self.is_valid &= self.fields[:, ifield] == ''
+
+    def _cast_double(self, svalues: np.ndarray, is_float: np.ndarray) -> list[Optional[float]]:
+        """casts the float fields, including the Nastran 1.0-3/1.0D-3 forms"""
+        values: list[Optional[float]] = [None] * len(svalues)
+        ifloat = np.flatnonzero(is_float)
+        sfloats = svalues[ifloat]
+        try:
+            floats = list(map(float, sfloats.tolist()))
+        except ValueError:
+            floats = []
+            for i, svalue in zip(ifloat, sfloats.tolist()):
+                try:
+                    floats.append(double_from_str(svalue))
+                except SyntaxError:
+                    floats.append(None)
+                    self.is_valid[i] = False
+        for i, value in zip(ifloat.tolist(), floats):
+            values[i] = value
+        return values
+
+
+def _cast_int(svalues: np.ndarray, is_int: np.ndarray) -> list[Optional[int]]:
+    """casts the integer fields; everything else is None"""
+    if is_int.all():
+        return list(map(int, svalues.tolist()))
+    values = [None] * len(svalues)
+    for i, value in zip(np.flatnonzero(is_int).tolist(),
+                        map(int, svalues[is_int].tolist())):
+        values[i] = value
+    return values
+
+
+def _create_cards(columns: Columns, create: Callable, rows) -> list[Any]:
+    """creates the card objects for the valid cards"""
+    objs = []
+    for is_valid, row in zip(columns.is_valid.tolist(), rows):
+        obj = None
+        if is_valid:
+            try:
+                obj = create(*row)
+            except PARSE_ERRORS:
+                pass
+        objs.append(obj)
+    return objs
+
+
+def _build_grid(fields: np.ndarray, comments: list[str]) -> list[Optional[GRID]]:
+    """GRID, nid, cp, x1, x2, x3, cd, ps, seid"""
+    columns = Columns(fields)
+    nid = columns.integer(1)
+    cp = columns.integer_or_blank(2)
+    x1 = columns.double_or_blank(3)
+    x2 = columns.double_or_blank(4)
+    x3 = columns.double_or_blank(5)
+    cd = columns.integer_or_blank(6)
+    ps = columns.components_or_blank(7)
+    seid = columns.integer_or_blank(8)
+
+    def create(nid, cp, x1, x2, x3, cd, ps, seid, comment):
+        xyz = [0. if x1 is None else x1,
+               0. if x2 is None else x2,
+               0. if x3 is None else x3]
+        return GRID(nid, xyz,
+                    0 if cp is None else cp,
+                    0 if cd is None else cd,
+                    '' if ps is None else ps,
+                    0 if seid is None else seid, comment=comment)
+    return _create_cards(columns, create, zip(nid, cp, x1, x2, x3, cd, ps, seid, comments))
+
+
+def _build_cquad4(fields: np.ndarray, comments: list[str]) -> list[Optional[CQUAD4]]:
+    """CQUAD4, eid, pid, n1, n2, n3, n4, theta_mcid, zoffset"""
+    columns = Columns(fields)
+    eid = columns.integer(1)
+    pid = columns.integer_or_blank(2)
+    nids = list(zip(*[columns.integer(ifield) for ifield in range(3, 7)]))
+    theta_mcid = columns.integer_double_or_blank(7)
+    zoffset = columns.double_or_blank(8)
+
+    def create(eid, pid, nids, theta_mcid, zoffset, comment):
+        return CQUAD4(eid, eid if pid is None else pid, list(nids),
+                      0.0 if theta_mcid is None else theta_mcid,
+                      0.0 if zoffset is None else zoffset,
+                      0, None, None, None, None, comment=comment)
+    return _create_cards(columns, create, zip(eid, pid, nids, theta_mcid, zoffset, comments))
+
+
+def _build_ctria3(fields: np.ndarray, comments: list[str]) -> list[Optional[CTRIA3]]:
+    """CTRIA3, eid, pid, n1, n2, n3, theta_mcid, zoffset"""
+    columns = Columns(fields)
+    eid = columns.integer(1)
+    pid = columns.integer_or_blank(2)
+    nids = list(zip(*[columns.integer(ifield) for ifield in range(3, 6)]))
+    theta_mcid = columns.integer_double_or_blank(6)
+    zoffset = columns.double_or_blank(7)
+    columns.blank(8)
+
+    def create(eid, pid, nids, theta_mcid, zoffset, comment):
+        return CTRIA3(eid, eid if pid is None else pid, list(nids),
+                      zoffset=0.0 if zoffset is None else zoffset,
+                      theta_mcid=0.0 if theta_mcid is None else theta_mcid,
+                      tflag=0, T1=None, T2=None, T3=None, comment=comment)
+    return _create_cards(columns, create, zip(eid, pid, nids, theta_mcid, zoffset, comments))
+
+
+def _build_solid(card_class: type, nnodes: int, nfields: int) -> Callable:
+    """CTETRA4/CPENTA6/CHEXA8, eid, pid, n1, ..."""
+    def build(fields: np.ndarray, comments: list[str]) -> list[Any]:
+        columns = Columns(fields)
+        eid = columns.integer(1)
+        pid = columns.integer(2)
+        nids = list(zip(*[columns.integer(ifield) for ifield in range(3, 3 + nnodes)]))
+        for ifield in range(3 + nnodes, nfields):
+            columns.blank(ifield)
+
+        def create(eid, pid, nids, comment):
+            return card_class(eid, pid, list(nids), comment=comment)
+        return _create_cards(columns, create, zip(eid, pid, nids, comments))
+    return build
+
+
+def _build_cbar(fields: np.ndarray, comments: list[str]) -> list[Optional[CBAR]]:
+    """CBAR, eid, pid, ga, gb, x1/g0, x2, x3 (no BAROR)"""
+    columns = Columns(fields)
+    eid = columns.integer(1)
+    pid = columns.integer_or_blank(2)
+    ga = columns.integer(3)
+    gb = columns.integer(4)
+    x1_g0 = columns.integer_double_or_blank(5)
+    x2 = columns.double_or_blank(6)
+    x3 = columns.double_or_blank(7)
+    columns.blank(8)
+
+    def create(eid, pid, ga, gb, x1_g0, x2, x3, comment):
+        if isinstance(x1_g0, int):
+            x = None
+            g0 = x1_g0
+        else:
+            x = np.array([0. if x1_g0 is None else x1_g0,
+                          0. if x2 is None else x2,
+                          0. if x3 is None else x3], dtype='float64')
+            g0 = None
+            if not x.any():
+                # the standard parser raises the error
+                return None
+        return CBAR(eid, eid if pid is None else pid, [ga, gb], x, g0,
+                    'GGG', 0, 0, np.zeros(3), np.zeros(3), comment=comment)
+    return _create_cards(columns, create, zip(eid, pid, ga, gb, x1_g0, x2, x3, comments))
+
+
+def _build_cbush(fields: np.ndarray, comments: list[str]) -> list[Optional[CBUSH]]:
+    """CBUSH, eid, pid, ga, gb, x1/g0, x2, x3, cid"""
+    columns = Columns(fields)
+    eid = columns.integer(1)
+    pid = columns.integer_or_blank(2)
+    ga = columns.integer(3)
+    gb = columns.integer_or_blank(4)
+    x1_g0 = columns.integer_double_or_blank(5)
+    x2 = columns.double_or_blank(6)
+    x3 = columns.double_or_blank(7)
+    cid = columns.integer_or_blank(8)
+
+    def create(eid, pid, ga, gb, x1_g0, x2, x3, cid, comment):
+        if isinstance(x1_g0, int):
+            g0 = x1_g0
+            x = None
+        elif isinstance(x1_g0, float):
+            g0 = None
+            x = [x1_g0,
+                 0.0 if x2 is None else x2,
+                 0.0 if x3 is None else x3]
+            if cid is None and not any(x):
+                return None
+        else:
+            g0 = None
+            x = [None, None, None]
+        return CBUSH(eid, eid if pid is None else pid, [ga, gb], x, g0, cid=cid,
+                     s=0.5, ocid=-1, si=[None, None, None], comment=comment)
+    return _create_cards(columns, create, zip(eid, pid, ga, gb, x1_g0, x2, x3, cid, comments))
+
+
+def _build_conm2(fields: np.ndarray, comments: list[str]) -> list[Optional[CONM2]]:
+    """CONM2, eid, nid, cid, mass, x1, x2, x3"""
+    columns = Columns(fields)
+    eid = columns.integer(1)
+    nid = columns.integer(2)
+    cid = columns.integer_or_blank(3)
+    mass = columns.double_or_blank(4)
+    xyz = list(zip(*[columns.double_or_blank(ifield) for ifield in range(5, 8)]))
+
+    def create(eid, nid, cid, mass, xyz, comment):
+        return CONM2(eid, nid, 0. if mass is None else mass,
+                     cid=0 if cid is None else cid,
+                     X=[0.0 if xi is None else xi for xi in xyz],
+                     I=[0.0] * 6, comment=comment)
+    return _create_cards(columns, create, zip(eid, nid, cid, mass, xyz, comments))
+
+
+def _build_rbe2(fields: np.ndarray, comments: list[str]) -> list[Optional[RBE2]]:
+    """RBE2, eid, gn, cm, gm1, ..., gm5 (no alpha)"""
+    columns = Columns(fields)
+    eid = columns.integer(1)
+    gn = columns.integer(2)
+    cm = columns.components_or_blank(3)
+    gms = list(zip(*[columns.integer_or_blank(ifield) for ifield in range(4, 9)]))
+    columns.integer(4)
+
+    def create(eid, gn, cm, gms, comment):
+        if cm is None:
+            return None
+        nids = [gm for gm in gms if gm is not None]
+        if None in gms[:len(nids)]:
+            # a blank between the nodes
+            return None
+        return RBE2(eid, gn, cm, nids, alpha=0.0, tref=0.0, comment=comment)
+    return _create_cards(columns, create, zip(eid, gn, cm, gms, comments))
+
+
+#: card_name -> (nlines, build, card_class)
+BUILDERS = {
+    'GRID': (1, _build_grid, GRID),
+    'CQUAD4': (1, _build_cquad4, CQUAD4),
+    'CTRIA3': (1, _build_ctria3, CTRIA3),
+    'CTETRA': (1, _build_solid(CTETRA4, 4, 9), CTETRA4),
+    'CPENTA': (1, _build_solid(CPENTA6, 6, 9), CPENTA6),
+    'CHEXA': (2, _build_solid(CHEXA8, 8, 17), CHEXA8),
+    'CBAR': (1, _build_cbar, CBAR),
+    'CBUSH': (1, _build_cbush, CBUSH),
+    'CONM2': (1, _build_conm2, CONM2),
+    'RBE2': (1, _build_rbe2, RBE2),
+}
@@ -0,0 +1,228 @@
+"""
+Defines a vectorized writer for the high-volume bulk data cards
+(BDF.use_fast_card_writer):
+ - write_grids(bdf_file, nodes, size, is_double)
+ - write_elements_8(bdf_file, elements)
+
+The ids/coordinates of the GRID cards are gathered into arrays, so the
+floats are formatted at once with the field_writer_array functions
+instead of calling print_float_8 for each value.  The default forms of
+the GRID, CQUAD4, CTRIA3, CTETRA, CPENTA and CHEXA cards are then
+written as blocks of rows with a single format string.
+
+Cards that aren't in the default form (e.g., a CD/PS/SEID on a GRID,
+a ZOFFS on a CQUAD4) and values that need scientific notation are
+written with the standard card.write_card/print_float_8 methods, so the
+output is the same as the standard writer.
+
+"""
+from __future__ import annotations
+from typing import Callable, Optional, Any
+
+import numpy as np
+
+from pyNastran.bdf.field_writer_array import (
+    print_float_8_array, print_float_16_array, print_scientific_double_array)
+from pyNastran.bdf.cards.nodes import GRID
+from pyNastran.bdf.cards.elements.shell import CTRIA3, CQUAD4
+from pyNastran.bdf.cards.elements.solid import CTETRA4, CPENTA6, CHEXA8
+
+#: the buffer size of the output file (BDF.write_bdf)
+BUFFER_SIZE = 1024 * 1024
+
+#: the number of rows that are written as one block
+NROWS_BLOCK = 10000
+
+
+def write_grids(bdf_file: Any, nodes: dict[int, GRID], size: int=8,
+                is_double: bool=False) -> None:
+    """
+    Writes the GRID cards in a sorted order
+
+    Parameters
+    ----------
+    bdf_file : file
+        the file object
+    nodes : dict[nid] = GRID
+        the nodes
+    size : int; default=8
+        the field size (8/16)
+    is_double : bool; default=False
+        should the 16-character fields be written with double precision
+
+    """
+    nids = sorted(nodes)
+    xyz = np.array([nodes[nid].xyz for nid in nids], dtype='float64')
+
+    if size == 8:
+        template = '%sGRID    %8i%8s%s%s%s\n'
+        fields = print_float_8_array(xyz)
+        blank = '        '
+    else:
+        template = ('%sGRID*   %16i%16s%16s%16s\n'
+                    '*       %16s%48s\n')
+        if is_double:
+            fields = print_scientific_double_array(xyz)
+        else:
+            fields = print_float_16_array(xyz)
+        blank = '                '
+
+    blocks: list[Any] = []
+    for i, nid in enumerate(nids):
+        node = nodes[nid]
+        if not (type(node) is GRID and node.Cd() == 0 and
+                node.ps == '' and node.seid == 0):
+            blocks.append(node.write_card(size, is_double))
+            continue
+        cp = node.Cp()
+        cps = blank if cp == 0 else '%*s' % (size, cp)
+        j = 3 * i
+        row = (node.comment, nid, cps, fields[j], fields[j+1], fields[j+2])
+        if size == 16:
+            row += ('', )
+        blocks.append((template, row))
+    _write_blocks(bdf_file, blocks)
+
+
+def write_elements_8(bdf_file: Any, elements: dict[int, Any]) -> None:
+    """
+    Writes the elements in a sorted order in 8-character width syntax
+
+    Parameters
+    ----------
+    bdf_file : file
+        the file object
+    elements : dict[eid] = element
+        the elements
+
+    """
+    blocks: list[Any] = []
+    for eid, element in sorted(elements.items()):
+        get_row = ELEMENT_ROWS.get(type(element))
+        row = None if get_row is None else get_row(element)
+        if row is None:
+            try:
+                blocks.append(element.write_card(8, False))
+            except Exception:
+                print(f'failed printing element...type={element.type} eid={eid}')
+                raise
+            continue
+        template = ELEMENT_TEMPLATES[type(element)]
+        blocks.append((template, (element.comment, eid, element.Pid()) + row))
+    _write_blocks(bdf_file, blocks)
+
+
+def _write_blocks(bdf_file: Any, blocks: list[Any]) -> None:
+    """
+    Writes the cards
+
+    Parameters
+    ----------
+    bdf_file : file
+        the file object
+    blocks : list[str | tuple[str, tuple]]
+        str : a card that was already written
+        (template, row) : a card that will be written with template % row
+
+    """
+    msg = []
+    template0 = None
+    rows: list[Any] = []
+    nrows = 0
+    for block in blocks:
+        if isinstance(block, str):
+            if nrows:
+                msg.append((template0 * nrows) % tuple(rows))
+                rows = []
+                nrows = 0
+            msg.append(block)
+            continue
+
+        template, row = block
+        if template is not template0 or nrows == NROWS_BLOCK:
+            if nrows:
+                msg.append((template0 * nrows) % tuple(rows))
+                rows = []
+                nrows = 0
+            template0 = template
+        rows.extend(row)
+        nrows += 1
+
+        if len(msg) >= NROWS_BLOCK:
+            bdf_file.write(''.join(msg))
+            msg = []
+    if nrows:
+        msg.append((template0 * nrows) % tuple(rows))
+    bdf_file.write(''.join(msg))
+
+
+def _get_node_ids(element: Any) -> Optional[tuple[int, ...]]:
+    """gets the node ids of an element; None if there is a blank node"""
+    if element.nodes_ref is None:
+        nids = element.nodes
+    else:
+        nids = [node.nid for node in element.nodes_ref]
+    if None in nids:
+        return None
+    return tuple(nids)
+
+
+def _is_blank_shell_row2(element: CTRIA3 | CQUAD4, thicknesses: list[Any]) -> bool:
+    """
+    Is the second row (theta_mcid, zoffset, tflag, T1, T2, ...) of a
+    CTRIA3/CQUAD4 blank?
+
+    The default values are [0.0, 0.0, 0, 1.0, 1.0, ...], so an integer
+    theta_mcid (an MCID) of 0 is only blank if the other fields are the
+    exact default values.
+
+    """
+    theta_mcid = element.theta_mcid
+    zoffset = element.zoffset
+    tflag = element.tflag
+    if isinstance(theta_mcid, float):
+        if theta_mcid != 0.0:
+            return False
+    elif not (theta_mcid == 0 and zoffset == 0.0 and tflag == 0 and
+              all(thickness == 1.0 for thickness in thicknesses)):
+        return False
+
+    is_blank = (
+        (zoffset is None or zoffset == 0.0) and
+        (tflag is None or tflag == 0) and
+        all(thickness is None or thickness == 1.0 for thickness in thicknesses))
+    return is_blank
+
+
+def _get_ctria3_row(element: CTRIA3) -> Optional[tuple[int, ...]]:
+    """gets the node ids of a default CTRIA3"""
+    if not _is_blank_shell_row2(element, [element.T1, element.T2, element.T3]):
+        return None
+    return _get_node_ids(element)
+
+
+def _get_cquad4_row(element: CQUAD4) -> Optional[tuple[int, ...]]:
+    """gets the node ids of a default CQUAD4"""
+    if not _is_blank_shell_row2(element, [element.T1, element.T2, element.T3, element.T4]):
+        return None
+    return _get_node_ids(element)
+
+
+#: the row getter of the elements that have a fast form
+ELEMENT_ROWS: dict[type, Callable[[Any], Optional[tuple[int, ...]]]] = {
+    CTRIA3: _get_ctria3_row,
+    CQUAD4: _get_cquad4_row,
+    CTETRA4: _get_node_ids,
+    CPENTA6: _get_node_ids,
+    CHEXA8: _get_node_ids,
+}
+
+#: the template of the elements that have a fast form (comment, eid, pid, nids)
+ELEMENT_TEMPLATES = {
+    CTRIA3: '%sCTRIA3  %8d%8d%8d%8d%8d\n',
+    CQUAD4: '%sCQUAD4  %8d%8d%8d%8d%8d%8d\n',
+    CTETRA4: '%sCTETRA  %8d%8d%8d%8d%8d%8d\n',
+    CPENTA6: '%sCPENTA  %8d%8d%8d%8d%8d%8d%8d%8d\n',
+    CHEXA8: ('%sCHEXA   %8d%8d%8d%8d%8d%8d%8d%8d\n'
+             '        %8d%8d\n'),
+}
@@ -0,0 +1,193 @@
+"""
+Defines the memo of the node arrays that is shared by:
+ - BDF.get_displacement_index_xyz_cp_cd(...)
+ - BDF.transform_xyzcp_to_xyz_cid(...)
+ - BDF.get_xyz_in_coord_array(...)
+ - the mesh_utils that use them (e.g., mass_properties, cut_model_by_plane)
+
+The memo stores the sorted nid_cp_cd/xyz_cp arrays, the CP/CD transform
+indices and the transformed xyz_cid arrays.  They're keyed on the
+(nid, cp, cd, xyz_cp) arrays of the GRIDs and the coordinate system
+vectors, which are gathered from the model on every call.  That's an
+O(nnodes) walk over ``model.nodes``, so this isn't an invalidating
+cache; it skips the sort, the transform indices and the coordinate
+transforms when the gathered arrays are unchanged.  Gathering the key
+means that an in place edit (e.g., ``node.xyz[0] += 1.``) is picked up
+without needing to tell the model.
+
+"""
+from __future__ import annotations
+from typing import Any, Optional, TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+
+class NodeArrayMemo:
+    """memoizes the node arrays of a BDF"""
+    def __init__(self):
+        self.clear()
+
+    def clear(self) -> None:
+        """clears the memo"""
+        self._node_key: Optional[tuple[Any, ...]] = None
+        self._coord_key: Optional[list[tuple[Any, ...]]] = None
+        self._displacement_index: dict[tuple[str, str, bool], Any] = {}
+        self._xyz_cid: dict[int, tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+
+    def get_displacement_index(self, model: BDF, fdtype: str, idtype: str,
+                               sort_ids: bool) -> Optional[tuple[Any, ...]]:
+        """
+        Gets the memoized BDF.get_displacement_index_xyz_cp_cd output
+
+        Returns
+        -------
+        out : tuple[icd_transform, icp_transform, xyz_cp, nid_cp_cd] / None
+            None : the node arrays have changed
+
+        """
+        if not self._check_nodes(model):
+            return None
+        out = self._displacement_index.get((fdtype, idtype, sort_ids))
+        if out is None:
+            return None
+        icd_transform, icp_transform, xyz_cp, nid_cp_cd = out
+        return (_copy_dict(icd_transform), _copy_dict(icp_transform),
+                xyz_cp.copy(), nid_cp_cd.copy())
+
+    def set_displacement_index(self, model: BDF, fdtype: str, idtype: str,
+                               sort_ids: bool, out: tuple[Any, ...]) -> None:
+        """memoizes the BDF.get_displacement_index_xyz_cp_cd output"""
+        if not self._check_nodes(model):
+            return
+        icd_transform, icp_transform, xyz_cp, nid_cp_cd = out
+        self._displacement_index[(fdtype, idtype, sort_ids)] = (
+            _copy_dict(icd_transform), _copy_dict(icp_transform),
+            xyz_cp.copy(), nid_cp_cd.copy())
+
+    def get_xyz_cid(self, model: BDF, xyz_cp: np.ndarray, nids: np.ndarray,
+                    icp_transform: dict[int, np.ndarray],
+                    cid: int) -> Optional[np.ndarray]:
+        """
+        Gets the memoized BDF.transform_xyzcp_to_xyz_cid output
+
+        The xyz_cid array is only used if the xyz_cp/nids/icp_transform
+        arrays are the same as the ones that were transformed.
+
+        Returns
+        -------
+        xyz_cid : (n, 3) float ndarray / None
+            None : the node arrays have changed
+
+        """
+        self._check_coords(model)
+        out = self._xyz_cid.get(cid)
+        if out is None:
+            return None
+        xyz_cp0, nids0, icp_transform0, xyz_cid = out
+        if (xyz_cp.dtype != xyz_cp0.dtype or
+                not np.array_equal(nids, nids0) or
+                not np.array_equal(xyz_cp, xyz_cp0, equal_nan=True) or
+                not _is_equal_key(_get_transform_key(icp_transform), icp_transform0)):
+            return None
+        return xyz_cid.copy()
+
+    def set_xyz_cid(self, model: BDF, xyz_cp: np.ndarray, nids: np.ndarray,
+                    icp_transform: dict[int, np.ndarray],
+                    cid: int, xyz_cid: np.ndarray) -> None:
+        """memoizes the BDF.transform_xyzcp_to_xyz_cid output"""
+        self._check_coords(model)
+        self._xyz_cid[cid] = (xyz_cp.copy(), np.array(nids),
+                              _get_transform_key(icp_transform), xyz_cid.copy())
+
+    def _check_nodes(self, model: BDF) -> bool:
+        """
+        Gathers the node arrays and resets the memo if they're not the
+        ones that were memoized
+
+        Returns
+        -------
+        is_memoized : bool
+            can the memo be used (i.e., there are no GRIDB cards)
+
+        """
+        if model.gridb:
+            # the GRIDB locations depend on the RINGFL/AXIF cards
+            self.clear()
+            return False
+        node_key = _get_node_key(model)
+        if self._node_key is None or not _is_equal_key(node_key, self._node_key):
+            self._node_key = node_key
+            self._displacement_index = {}
+        return True
+
+    def _check_coords(self, model: BDF) -> None:
+        """
+        Gathers the coordinate systems and resets the xyz_cid arrays if
+        they're not the ones that were memoized
+        """
+        coord_key = _get_coord_key(model)
+        if self._coord_key is None or not _is_equal_key(coord_key, self._coord_key):
+            self._coord_key = coord_key
+            self._xyz_cid = {}
+
+
+def _get_node_key(model: BDF) -> tuple[Any, ...]:
+    """gets the nid, cp, cd, xyz_cp arrays of the GRIDs and the SPOINT/EPOINT ids"""
+    nodes = model.nodes
+    nnodes = len(nodes)
+    nids = np.fromiter(nodes.keys(), dtype='int64', count=nnodes)
+    cp = np.array([node.cp for node in nodes.values()], dtype='int64')
+    cd = np.array([node.cd for node in nodes.values()], dtype='int64')
+    if nnodes:
+        xyz_cp = np.concatenate([node.xyz for node in nodes.values()]).astype('float64')
+    else:
+        xyz_cp = np.zeros(0, dtype='float64')
+    spoints = np.array(list(model.spoints), dtype='int64')
+    epoints = np.array(list(model.epoints), dtype='int64')
+    return nids, cp, cd, xyz_cp, spoints, epoints
+
+
+def _get_coord_key(model: BDF) -> tuple[Any, ...]:
+    """gets the values that define the coordinate systems"""
+    coords = model.coords
+    cids = np.fromiter(coords.keys(), dtype='int64', count=len(coords))
+    coord_types = [coord.type for coord in coords.values()]
+    rids = [getattr(coord, 'rid', 0) for coord in coords.values()]
+
+    # the origin, i, j, k, e1, e2, e3 vectors (nan if they don't exist)
+    nan = np.full(3, np.nan)
+    vectors = []
+    for coord in coords.values():
+        for array in (coord.origin, coord.i, coord.j, coord.k,
+                      coord.e1, coord.e2, coord.e3):
+            vectors.append(nan if array is None else array)
+    if vectors:
+        values = np.array(vectors, dtype='float64')
+    else:
+        values = np.zeros((0, 3), dtype='float64')
+    return cids, coord_types, rids, values
+
+
+def _get_transform_key(transform: dict[int, np.ndarray]) -> list[tuple[int, np.ndarray]]:
+    """gets a comparable version of the icp_transform/icd_transform"""
+    return [(key, np.array(value)) for key, value in sorted(transform.items())]
+
+
+def _is_equal_key(key1: Any, key2: Any) -> bool:
+    """are two keys the same"""
+    if isinstance(key1, np.ndarray) or isinstance(key2, np.ndarray):
+        return (isinstance(key1, np.ndarray) and isinstance(key2, np.ndarray) and
+                key1.shape == key2.shape and
+                np.array_equal(key1, key2, equal_nan=key1.dtype.kind == 'f'))
+    if isinstance(key1, (list, tuple)):
+        return (isinstance(key2, (list, tuple)) and len(key1) == len(key2) and
+                all(_is_equal_key(value1, value2) for value1, value2 in zip(key1, key2)))
+    return key1 == key2
+
+
+def _copy_dict(transform: dict[int, np.ndarray]) -> dict[int, np.ndarray]:
+    """copies a dict of index arrays"""
+    return {key: value.copy() for key, value in transform.items()}
@@ -0,0 +1,131 @@
+"""
+Defines methods to create the bulk data cards on worker processes
+(read_bdf(..., nworkers=N)):
+ - get_parallel_cards(model, cards_list, nworkers, icards_to_skip=None)
+
+Creating a card that uses a card class (e.g., GRID.add_card) doesn't
+depend on the other cards, so the cards are split into chunks that are
+created on separate processes.  The card objects are then added to the
+model in the original card order by the main process, so duplicate ids
+are handled the same way as the serial reader.
+
+A card that fails on a worker is left for the standard parser, so the
+error is stored (or raised) based on ``BDF.set_error_storage`` the same
+way as the serial reader.
+
+"""
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Optional, Any, TYPE_CHECKING
+
+from pyNastran.bdf.bdf_interface.utils import to_fields
+from pyNastran.bdf.bdf_interface.bdf_card import BDFCard
+from pyNastran.bdf.cards.utils import wipe_empty_fields
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+#: the minimum number of cards to start the worker processes
+MIN_PARALLEL_CARDS = 1000
+
+#: the number of chunks per process (for load balancing)
+NCHUNKS_PER_WORKER = 4
+
+
+def get_parallel_cards(model: BDF, cards_list: list[Any], nworkers: int,
+                       icards_to_skip: Optional[dict[int, Any]]=None,
+                       ) -> dict[int, tuple[Any, Callable]]:
+    """
+    Creates the cards that use a card class on a process pool
+
+    Parameters
+    ----------
+    model : BDF
+        the model (used for the card parsers)
+    cards_list : list[(card_name, comment, card_lines, (ifile, iline))]
+        the cards from ``get_bdf_cards``
+    nworkers : int
+        the number of processes
+    icards_to_skip : dict[icard, Any]; default=None
+        cards that were already parsed (e.g., by ``get_fast_cards``)
+
+    Returns
+    -------
+    parallel_cards : dict[icard] = (card_object, add_method)
+        the cards that were created; everything else needs the standard parser
+
+    """
+    if icards_to_skip is None:
+        icards_to_skip = {}
+    parsers = _get_parsers(model, cards_list)
+    icards = [icard for icard, card in enumerate(cards_list)
+              if card[0] in parsers and icard not in icards_to_skip]
+    ncards = len(icards)
+    if nworkers < 2 or ncards < MIN_PARALLEL_CARDS:
+        return {}
+
+    card_classes = {card_name: card_class
+                    for card_name, (card_class, unused_add_method) in parsers.items()}
+    nchunks = min(nworkers * NCHUNKS_PER_WORKER, ncards)
+    chunk_size = -(-ncards // nchunks)
+    chunks = [icards[i:i+chunk_size] for i in range(0, ncards, chunk_size)]
+
+    parallel_cards = {}
+    with ProcessPoolExecutor(max_workers=nworkers) as executor:
+        futures = []
+        for chunk in chunks:
+            cards = [cards_list[icard][:3] for icard in chunk]
+            futures.append(executor.submit(_create_cards, cards, card_classes))
+
+        # the futures are merged in order, so the result is deterministic
+        for chunk, future in zip(chunks, futures):
+            for icard, obj in zip(chunk, future.result()):
+                if obj is not None:
+                    card_name = cards_list[icard][0]
+                    parallel_cards[icard] = (obj, parsers[card_name][1])
+    return parallel_cards
+
+
+def _get_parsers(model: BDF, cards_list: list[Any]) -> dict[str, tuple[Any, Callable]]:
+    """
+    Gets the card class and the add method for the cards that don't
+    depend on the model (e.g., the BAROR or the dynamic syntax)
+    """
+    card_names = {card[0] for card in cards_list}
+    parsers = {}
+    if 'ECHOON' in card_names:
+        # the cards are echoed in order
+        return parsers
+
+    card_parser = model._card_parser
+    for card_name in card_names:
+        if card_name not in card_parser or card_name not in model.cards_to_read:
+            continue
+        if card_name in model.special_cards:
+            continue
+        parsers[card_name] = card_parser[card_name]
+    return parsers
+
+
+def _create_cards(cards: list[tuple[str, str, list[str]]],
+                  card_classes: dict[str, Any]) -> list[Any]:
+    """
+    Creates a chunk of cards on a worker process
+
+    Returns
+    -------
+    objs : list[card_object]
+        the card objects (None if the card failed)
+
+    """
+    objs = []
+    for card_name, comment, card_lines in cards:
+        card_class = card_classes[card_name]
+        try:
+            fields = to_fields(card_lines, card_name)
+            card_obj = BDFCard(wipe_empty_fields(fields), has_none=False)
+            obj = card_class.add_card(card_obj, comment=comment)
+        except Exception:
+            # the standard parser raises/stores the error
+            obj = None
+        objs.append(obj)
+    return objs
@@ -0,0 +1,102 @@
+"""
+Defines methods to write the bulk data cards on worker processes
+(write_bdf(..., nworkers=N)):
+ - write_cards(bdf_file, cards, size, is_double, is_long_ids, nworkers=1)
+
+Writing a card doesn't depend on the other cards, so the large card
+groups (e.g., the GRIDs, elements, properties) are split into chunks
+that are formatted on separate processes.  The chunks are written to
+the file in the original (sorted) order by the main process, so the
+deck is the same as the serial writer.
+
+The worker processes are forked and get the cards from the pool
+initializer, so the cards (and the cross-referenced cards they point
+to) aren't pickled.  When the fork start method isn't
+available (e.g., on Windows), the cards are written serially.
+
+"""
+from __future__ import annotations
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+#: the minimum number of cards to start the worker processes
+MIN_PARALLEL_CARDS = 1000
+
+#: the number of chunks per process (for load balancing)
+NCHUNKS_PER_WORKER = 4
+
+#: the cards that are being written on a worker process (see _init_worker)
+_WORKER_CARDS: list[Any] = []
+
+
+def write_cards(bdf_file: Any, cards: list[Any], size: int, is_double: bool,
+                is_long_ids: bool, nworkers: int=1) -> None:
+    """
+    Writes a list of cards in order
+
+    Parameters
+    ----------
+    bdf_file : file
+        the file object
+    cards : list[card]
+        the cards to write
+    size : int; {8, 16}
+        the field size
+    is_double : bool
+        is this double precision
+    is_long_ids : bool
+        write the cards with write_card_16
+    nworkers : int; default=1
+        the number of processes to use
+
+    """
+    ncards = len(cards)
+    if (nworkers < 2 or ncards < MIN_PARALLEL_CARDS or
+            'fork' not in multiprocessing.get_all_start_methods()):
+        bdf_file.write(_write_cards(cards, size, is_double, is_long_ids))
+        return
+
+    nchunks = min(nworkers * NCHUNKS_PER_WORKER, ncards)
+    chunk_size = -(-ncards // nchunks)
+
+    # the initargs are inherited by the forked workers (not pickled)
+    context = multiprocessing.get_context('fork')
+    with ProcessPoolExecutor(max_workers=nworkers, mp_context=context,
+                             initializer=_init_worker, initargs=(cards,)) as executor:
+        futures = [
+            executor.submit(_write_chunk, istart, istart + chunk_size,
+                            size, is_double, is_long_ids)
+            for istart in range(0, ncards, chunk_size)]
+
+        # the futures are written in order, so the deck is deterministic
+        for future in futures:
+            bdf_file.write(future.result())
+
+
+def _init_worker(cards: list[Any]) -> None:
+    """Stores the cards on a worker process"""
+    global _WORKER_CARDS
+    _WORKER_CARDS = cards
+
+
+def _write_chunk(istart: int, istop: int, size: int, is_double: bool,
+                 is_long_ids: bool) -> str:
+    """Writes a chunk of the cards on a worker process"""
+    return _write_cards(_WORKER_CARDS[istart:istop], size, is_double, is_long_ids)
+
+
+def _write_cards(cards: list[Any], size: int, is_double: bool,
+                 is_long_ids: bool) -> str:
+    """Writes a list of cards to a string"""
+    msg = []
+    for card in cards:
+        try:
+            if is_long_ids:
+                msg.append(card.write_card_16(is_double))
+            else:
+                msg.append(card.write_card(size, is_double))
+        except Exception:
+            print(f'failed printing card...type={card.type!r}')
+            raise
+    return ''.join(msg)
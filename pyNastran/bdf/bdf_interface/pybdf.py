@@ -23,6 +23,7 @@ BEGIN TRMC=102
 import os
 import shlex
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from io import StringIO
 from itertools import count
 from collections import defaultdict
@@ -186,6 +187,12 @@ class BDFInputPy:
         self.log = get_logger2(log, debug)
         self.use_new_parser = False
 
+        #: the number of threads used to read the INCLUDE files
+        self.nworkers = 1
+        #: the INCLUDE files that were read ahead of time
+        #: {bdf_filename_inc: lines}
+        self.include_file_lines: dict[str, list[str]] = {}
+
     def get_lines(self, bdf_filename: Union[str, StringIO],
                   punch: Optional[bool]=False,
                   make_ilines: bool=True) -> tuple[list[str], list[str], list[str],
@@ -392,6 +399,9 @@ class BDFInputPy:
         if make_ilines:
             ilines = _make_ilines(nlines, ifile=0)
 
+        if self.read_includes and self.nworkers > 1:
+            self._prefetch_include_files(lines)
+
         i = 0
         ifile = 1
         while i < nlines:
@@ -438,6 +448,54 @@ class BDFInputPy:
             #assert nlines == ilines.shape[0], 'nlines=%s nilines=%s' % (nlines, nilines)
         return lines, ilines
 
+    def _prefetch_include_files(self, lines: list[str]) -> None:
+        """
+        Reads the INCLUDE files (and the INCLUDE files they reference)
+        on a thread pool, so ``_update_include`` doesn't wait on each file.
+
+        The files are still merged (and checked) in order by
+        ``lines_to_deck_lines``.  A file that can't be read here
+        (e.g., a bad encoding) is read again there, so the error is the
+        same as the serial reader.
+        """
+        read_filenames = set()
+        with ThreadPoolExecutor(max_workers=self.nworkers) as executor:
+            while lines:
+                bdf_filenames = []
+                for bdf_filename_inc in self._get_include_filenames(lines):
+                    if bdf_filename_inc not in read_filenames:
+                        read_filenames.add(bdf_filename_inc)
+                        bdf_filenames.append(bdf_filename_inc)
+
+                # the nested INCLUDE files are read on the next pass
+                lines = []
+                all_lines2 = executor.map(_read_lines, bdf_filenames,
+                                          [self.encoding] * len(bdf_filenames))
+                for bdf_filename_inc, lines2 in zip(bdf_filenames, all_lines2):
+                    if lines2 is None:
+                        continue
+                    self.include_file_lines[bdf_filename_inc] = lines2
+                    lines.extend(lines2)
+
+    def _get_include_filenames(self, lines: list[str]) -> list[str]:
+        """gets the INCLUDE filenames that are referenced by a set of lines"""
+        bdf_filenames = []
+        nlines = len(lines)
+        for i, line in enumerate(lines):
+            line = line.rstrip('\r\n\t')
+            if not line.upper().startswith('INCLUDE'):
+                continue
+            try:
+                unused_j, include_lines = self._get_include_lines(lines, line, i, nlines)
+                bdf_filename2 = get_include_filename(include_lines, include_dir=self.include_dir)
+            except Exception:
+                # the error is raised by lines_to_deck_lines
+                continue
+            bdf_filename_inc = os.path.join(self.include_dir, bdf_filename2)
+            if not bdf_filename_inc.endswith('.op2'):
+                bdf_filenames.append(bdf_filename_inc)
+        return bdf_filenames
+
     def _update_include(self, lines: list[str], nlines: int, ilines,
                         include_lines: list[str], bdf_filename2: str, i: int, j: int, ifile: int,
                         make_ilines: bool=False):
@@ -457,46 +515,14 @@ class BDFInputPy:
             raise
             #raise IOError(msg)
 
-        read_again = False
-        with self._open_file(bdf_filename2, basename=False) as bdf_file:
-            #print('bdf_file.name = %s' % bdf_file.name)
-            try:
-                lines2 = bdf_file.readlines()
-            except UnicodeDecodeError:
-                #try:
-                bdf_file.seek(0)
-                try:
-                    encoding2 = _check_pynastran_encoding(bdf_filename2, encoding=self.encoding)
-                except UnicodeDecodeError:
-                    encoding2 = self.encoding
-
-                #print('***encoding=%s encoding2=%s' % (self.encoding, encoding2))
-                if self.encoding != encoding2:
-                    read_again = True
-                else:
-                    msg = (
-                        'Invalid Encoding: encoding=%r.  Fix it by:\n'
-                        '  1.  try a different encoding (e.g., latin1, cp1252, utf8)\n'
-                        "  2.  call read_bdf(...) with `encoding`'\n"
-                        "  3.  Add '$ pyNastran : encoding=latin1"
-                        ' (or other encoding) to the top of the main/INCLUDE file\n' % (
-                            self.encoding))
-                    raise RuntimeError(msg)
-
-        if read_again:
-            self.active_filenames.pop()
-            with self._open_file(bdf_filename2, basename=False, encoding=encoding2) as bdf_file:
-                #print('bdf_file.name = %s' % bdf_file.name)
-                try:
-                    lines2 = bdf_file.readlines()
-                except UnicodeDecodeError:
-                    msg = (
-                        'Incorrect Encoding: encoding=%r.  Fix it by:\n'
-                        '  1.  try a different encoding (e.g., latin1, cp1252, utf8)\n'
-                        "  2.  call read_bdf(...) with `encoding`'\n"
-                        "  3.  Add '$ pyNastran : encoding=latin1"
-                        ' (or other encoding) to the top of the main/INCLUDE file\n' % encoding2)
-                    raise RuntimeError(msg)
+        bdf_filename_inc = os.path.join(self.include_dir, bdf_filename2)
+        lines2 = self.include_file_lines.pop(bdf_filename_inc, None)
+        if lines2 is None:
+            lines2 = self._read_include_file(bdf_filename2)
+        else:
+            # the file was read by _prefetch_include_files
+            self.log.debug('opening %r' % bdf_filename_inc)
+            self.active_filenames.append(bdf_filename_inc)
 
         #print('lines2 = %s' % lines2)
 
@@ -504,7 +530,7 @@ class BDFInputPy:
         #if not line2[0].isalpha():
             #print('** %s' % line2)
 
-        include_comment = '\n$ INCLUDE processed:  %s\n' % bdf_filename2
+        include_comment = get_include_comment(bdf_filename2)
         #for line in lines2:
             #print("  ?%s" % line.rstrip())
 
@@ -564,6 +590,50 @@ class BDFInputPy:
             #print("  *%s" % line.rstrip())
         return lines, nlines, ilines
 
+    def _read_include_file(self, bdf_filename2: str) -> list[str]:
+        """reads the lines of an include file with the proper encoding"""
+        read_again = False
+        with self._open_file(bdf_filename2, basename=False) as bdf_file:
+            #print('bdf_file.name = %s' % bdf_file.name)
+            try:
+                lines2 = bdf_file.readlines()
+            except UnicodeDecodeError:
+                #try:
+                bdf_file.seek(0)
+                try:
+                    encoding2 = _check_pynastran_encoding(bdf_filename2, encoding=self.encoding)
+                except UnicodeDecodeError:
+                    encoding2 = self.encoding
+
+                #print('***encoding=%s encoding2=%s' % (self.encoding, encoding2))
+                if self.encoding != encoding2:
+                    read_again = True
+                else:
+                    msg = (
+                        'Invalid Encoding: encoding=%r.  Fix it by:\n'
+                        '  1.  try a different encoding (e.g., latin1, cp1252, utf8)\n'
+                        "  2.  call read_bdf(...) with `encoding`'\n"
+                        "  3.  Add '$ pyNastran : encoding=latin1"
+                        ' (or other encoding) to the top of the main/INCLUDE file\n' % (
+                            self.encoding))
+                    raise RuntimeError(msg)
+
+        if read_again:
+            self.active_filenames.pop()
+            with self._open_file(bdf_filename2, basename=False, encoding=encoding2) as bdf_file:
+                #print('bdf_file.name = %s' % bdf_file.name)
+                try:
+                    lines2 = bdf_file.readlines()
+                except UnicodeDecodeError:
+                    msg = (
+                        'Incorrect Encoding: encoding=%r.  Fix it by:\n'
+                        '  1.  try a different encoding (e.g., latin1, cp1252, utf8)\n'
+                        "  2.  call read_bdf(...) with `encoding`'\n"
+                        "  3.  Add '$ pyNastran : encoding=latin1"
+                        ' (or other encoding) to the top of the main/INCLUDE file\n' % encoding2)
+                    raise RuntimeError(msg)
+        return lines2
+
     def _get_include_lines(self, lines: list[str], line: str,
                            i: int, nlines: int) -> tuple[int, list[str]]:
         """
@@ -765,6 +835,15 @@ class BDFInputPy:
                 raise IOError('Not a file: bdf_filename=%r' % bdf_filename)
 
 
+def _read_lines(bdf_filename: str, encoding: str) -> Optional[list[str]]:
+    """reads a file for _prefetch_include_files; None if it can't be read"""
+    try:
+        with open(_filename(bdf_filename), 'r', encoding=encoding) as bdf_file:
+            return bdf_file.readlines()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
 def _is_bulk_data_line(text: str) -> bool:
     """
     Returns True if there is a Bulk Data Deck
@@ -1862,6 +1941,10 @@ def _clean_comment_bulk(comment: str) -> str:
         #print(comment)
     return comment
 
+def get_include_comment(bdf_filename2: str) -> str:
+    """gets the comment that replaces an INCLUDE line"""
+    return '\n$ INCLUDE processed:  %s\n' % bdf_filename2
+
 def _make_ilines(nlines: int, ifile: int) -> NDArrayN2int:
     """helper method"""
     ilines = np.empty((nlines, 2), dtype='int32')
@@ -2266,6 +2349,10 @@ def add_superelements_from_deck_lines(self,
 
         superelement_ilines = np.zeros((nlines, 2), dtype='int32')  ## TODO: calculate this
         model._parse_all_cards(superelement_lines[iminus:], superelement_ilines)
+
+        # the ENDDATA after the last 'BEGIN SUPER' ends the main deck
+        if 'ENDDATA' in model.card_count:
+            self.card_count['ENDDATA'] = 1
         self.superelement_models[superelement_key] = model
         self.initial_superelement_models.append(superelement_key)
 
@@ -51,6 +51,7 @@ class SafeXrefMesh(XrefMesh):
         if not xref:
             return
         self.log.debug("Safe Cross Referencing%s..." % word)
+        self._clear_lazy_cross_reference()
         if xref_nodes:
             self._cross_reference_nodes()
             self._cross_reference_coordinates()
@@ -0,0 +1,140 @@
+"""tests reading a BDF with read_bdf(..., cache_dir=...)"""
+import os
+import shutil
+import unittest
+from io import StringIO
+
+from cpylog import SimpleLogger
+
+from pyNastran.bdf.bdf import BDF, read_bdf
+from pyNastran.bdf.bdf_interface.bdf_cache import read_bdf_cache, get_cache_filenames
+
+CACHE_DIR = 'bdf_cache'
+MAIN_LINES = [
+    'SOL 101',
+    'CEND',
+    'BEGIN BULK',
+    '$ node 1',
+    'GRID,1,,0.,0.,0.',
+    '$ nodes',
+    "INCLUDE 'cache_nodes.inc'",
+    "INCLUDE 'cache_elements.inc'",
+    'PSHELL,1,1,0.1',
+    'MAT1,1,3.0e7,,0.3',
+    'ENDDATA',
+]
+NODES_LINES = [
+    'GRID,2,,1.,0.,0.',
+    'GRID,3,,1.,1.,0.',
+    'GRID,4,,0.,1.,0.',
+    '$ material',
+]
+ELEMENTS_LINES = [
+    'CQUAD4,1,1,1,2,3,4',
+    'SPC1,1,123456,1',
+]
+
+
+def _write_file(bdf_filename: str, lines: list[str]) -> None:
+    """writes a deck"""
+    with open(bdf_filename, 'w') as bdf_file:
+        bdf_file.write('\n'.join(lines) + '\n')
+
+
+def _read_bdf_cache(bdf_filename: str) -> tuple[BDF, str]:
+    """reads a deck from the cache"""
+    model = BDF(log=SimpleLogger(level='error'))
+    status = read_bdf_cache(model, bdf_filename, CACHE_DIR)
+    return model, status
+
+
+def _write_bdf(model: BDF) -> str:
+    """writes a deck to a string"""
+    bdf_file = StringIO()
+    model.write_bdf(bdf_file, close=False)
+    return bdf_file.getvalue()
+
+
+class TestBdfCache(unittest.TestCase):
+    """tests reading a BDF with read_bdf(..., cache_dir=...)"""
+
+    def setUp(self):
+        _write_file('cache_main.bdf', MAIN_LINES)
+        _write_file('cache_nodes.inc', NODES_LINES)
+        _write_file('cache_elements.inc', ELEMENTS_LINES)
+
+    def tearDown(self):
+        for bdf_filename in ['cache_main.bdf', 'cache_nodes.inc', 'cache_elements.inc']:
+            os.remove(bdf_filename)
+        if os.path.exists(CACHE_DIR):
+            shutil.rmtree(CACHE_DIR)
+
+    def _check_model(self, model: BDF) -> None:
+        """the cached model is the same as the read model"""
+        model2 = read_bdf('cache_main.bdf', xref=False, validate=False,
+                          log=SimpleLogger(level='error'))
+        assert _write_bdf(model) == _write_bdf(model2)
+        assert model.card_count == model2.card_count, (model.card_count, model2.card_count)
+        assert model.get_card_ids_by_card_types() == model2.get_card_ids_by_card_types()
+
+    def test_bdf_cache(self):
+        """the cache is loaded/updated/reread"""
+        model, status = _read_bdf_cache('cache_main.bdf')
+        assert status == 'read', status
+        obj_filename, manifest_filename = get_cache_filenames(model, 'cache_main.bdf', CACHE_DIR)
+        assert os.path.exists(obj_filename)
+        assert os.path.exists(manifest_filename)
+
+        model, status = _read_bdf_cache('cache_main.bdf')
+        assert status == 'loaded', status
+        self._check_model(model)
+
+        # only the cards from the INCLUDE file are reparsed
+        _write_file('cache_nodes.inc', ['$ new node'] + NODES_LINES[:-1] +
+                    ['GRID,5,,2.,0.,0.'] + NODES_LINES[-1:])
+        model, status = _read_bdf_cache('cache_main.bdf')
+        assert status == 'updated', status
+        assert model.nodes[2].comment == '$ nodes\n$ INCLUDE processed:  %s\n$ new node\n' % (
+            os.path.abspath('cache_nodes.inc')), repr(model.nodes[2].comment)
+        self._check_model(model)
+
+        _write_file('cache_elements.inc', ELEMENTS_LINES[:1])
+        model, status = _read_bdf_cache('cache_main.bdf')
+        assert status == 'updated', status
+        assert 'SPC1' not in model.card_count
+        self._check_model(model)
+
+        model, status = _read_bdf_cache('cache_main.bdf')
+        assert status == 'loaded', status
+
+        # the main file changed
+        _write_file('cache_main.bdf', MAIN_LINES[:-1] + ['GRID,6,,3.,0.,0.', 'ENDDATA'])
+        model, status = _read_bdf_cache('cache_main.bdf')
+        assert status == 'read', status
+        self._check_model(model)
+
+    def test_bdf_cache_reread(self):
+        """the cards that can't be reparsed reread the deck"""
+        model, status = _read_bdf_cache('cache_main.bdf')
+        assert status == 'read', status
+
+        # the trailing comment is stored on the PSHELL
+        _write_file('cache_nodes.inc', NODES_LINES[:-1])
+        model, status = _read_bdf_cache('cache_main.bdf')
+        assert status == 'read', status
+        self._check_model(model)
+
+        # SPOINTs are merged
+        _write_file('cache_elements.inc', ELEMENTS_LINES + ['SPOINT,10'])
+        model, status = _read_bdf_cache('cache_main.bdf')
+        assert status == 'read', status
+        self._check_model(model)
+
+        model = BDF(log=SimpleLogger(level='error'))
+        model.read_bdf('cache_main.bdf', cache_dir=CACHE_DIR)
+        assert model.nodes[1].xyz[0] == 0.
+        assert model.elements[1].nodes_ref[0].nid == 1
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
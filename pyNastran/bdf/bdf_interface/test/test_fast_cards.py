@@ -0,0 +1,117 @@
+"""tests the vectorized card parser"""
+import unittest
+from io import StringIO
+from pathlib import Path
+
+from cpylog import SimpleLogger
+
+import pyNastran
+from pyNastran.bdf.bdf import BDF, read_bdf
+from pyNastran.bdf.bdf_interface.fast_cards import get_fast_cards
+
+PKG_PATH = Path(pyNastran.__path__[0])
+MODEL_PATH = (PKG_PATH / '..' / 'models').resolve()
+
+
+def _read_bdf(bdf_file, use_fast_card_parser: bool) -> BDF:
+    """reads a deck without cross referencing"""
+    model = BDF(log=SimpleLogger(level='error'))
+    model.use_fast_card_parser = use_fast_card_parser
+    model.read_bdf(bdf_file, xref=False, validate=False, punch=True)
+    return model
+
+
+def _write_bdf(model: BDF) -> str:
+    """writes a deck to a string"""
+    bdf_file = StringIO()
+    model.write_bdf(bdf_file, close=False)
+    return bdf_file.getvalue()
+
+
+class TestFastCards(unittest.TestCase):
+    """tests the vectorized card parser"""
+
+    def test_fast_cards(self):
+        """the fast and standard parsers create the same cards"""
+        lines = [
+            '$ node 1',
+            'GRID           1       0      0.      0.      0.',
+            'GRID           2             1.0     0.0     0.0       0     123',
+            'GRID           3            1.-3 1.5D+2     -2.       1     321       0',
+            'GRID           4              2.      1.      0.',
+            'CQUAD4         1       1       1       2       3       4',
+            'CQUAD4         2               1       2       3       4       2    0.01',
+            'CQUAD4         3       1       1       2       3       4     30.',
+            'CTRIA3        10       1       1       2       3',
+            'CTRIA3        11       1       1       2       3     10.   -0.01',
+            'CTETRA       100       2       1       2       3       4',
+            'CPENTA       101       2       1       2       3       4       5       6',
+            'CHEXA        102       2       1       2       3       4       5       6',
+            '               7       8',
+            'CBAR         200       3       1       2      0.      0.      1.',
+            'CBAR         201       3       1       2       4',
+            'CBUSH        300       4       1       2       4',
+            'CBUSH        301       4       1       2                               0',
+            'CONM2        400       1           100.0      0.      0.     0.1',
+            'RBE2         500       1  123456       2       3       4',
+            # these go through the standard parser
+            'GRID*                 5               0             1.0             2.0',
+            '*                   3.0               0',
+            'GRID,6,,1.0,2.0,3.0',
+            'CQUAD4         4       1       1       2       3       4',
+            '                       1     1.0     1.0     1.0     1.0',
+            'CTETRA       103       2       1       2       3       4       5       6',
+            '               7       8       9      10',
+            'CBAR         202       3       1       2      0.      0.      1.',
+            '                                              1.      0.      0.',
+            'RBE2         501       1  123456       2       3     1.0',
+        ]
+        bdf_text = '\n'.join(lines) + '\n'
+        model1 = _read_bdf(StringIO(bdf_text), use_fast_card_parser=False)
+        model2 = _read_bdf(StringIO(bdf_text), use_fast_card_parser=True)
+        assert _write_bdf(model1) == _write_bdf(model2)
+        assert model1.card_count == model2.card_count
+        assert model2.nodes[1].comment == '$ node 1\n', repr(model2.nodes[1].comment)
+        assert model2.nodes[3].ps == '123', model2.nodes[3].ps
+        assert model2.nodes[3].xyz[0] == 1e-3, model2.nodes[3].xyz
+        assert model2.elements[2].pid == 2, model2.elements[2].pid
+        assert model2.elements[201].g0 == 4, model2.elements[201].g0
+        assert model2.rigid_elements[501].alpha == 1.0
+
+        model3 = BDF(log=SimpleLogger(level='error'))
+        cards_list = model3.get_bdf_cards(bdf_text.splitlines())[0]
+        fast_cards = get_fast_cards(model3, cards_list)
+        card_names = [cards_list[icard][0] for icard in fast_cards]
+        assert len(card_names) == 18, card_names
+
+    def test_fast_cards_errors(self):
+        """an invalid card gets the standard parser's error"""
+        lines = [
+            'GRID           1       0      0.      0.      0.',
+            'GRID           2       0       1      0.      0.',
+        ]
+        bdf_text = '\n'.join(lines) + '\n'
+        with self.assertRaises(Exception) as error1:
+            _read_bdf(StringIO(bdf_text), use_fast_card_parser=False)
+        with self.assertRaises(Exception) as error2:
+            _read_bdf(StringIO(bdf_text), use_fast_card_parser=True)
+        assert type(error1.exception) is type(error2.exception)
+        assert str(error1.exception) == str(error2.exception)
+
+    def test_fast_cards_models(self):
+        """the fast and standard parsers read the same decks"""
+        bdf_filenames = [
+            MODEL_PATH / 'sol_101_elements' / 'static_solid_shell_bar.bdf',
+            MODEL_PATH / 'bwb' / 'bwb_saero.bdf',
+        ]
+        for bdf_filename in bdf_filenames:
+            model1 = read_bdf(bdf_filename, xref=False, validate=False,
+                              log=SimpleLogger(level='error'))
+            model2 = BDF(log=SimpleLogger(level='error'))
+            model2.use_fast_card_parser = True
+            model2.read_bdf(bdf_filename, xref=False, validate=False)
+            assert _write_bdf(model1) == _write_bdf(model2)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
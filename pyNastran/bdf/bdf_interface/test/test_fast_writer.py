@@ -0,0 +1,78 @@
+"""tests the vectorized card writer"""
+import unittest
+from io import StringIO
+from pathlib import Path
+
+import numpy as np
+from cpylog import SimpleLogger
+
+import pyNastran
+from pyNastran.bdf.bdf import BDF, read_bdf
+
+PKG_PATH = Path(pyNastran.__path__[0])
+MODEL_PATH = (PKG_PATH / '..' / 'models').resolve()
+
+
+def _write_bdf(model: BDF, use_fast_card_writer: bool,
+               size: int=8, is_double: bool=False) -> str:
+    """writes a deck to a string"""
+    model.use_fast_card_writer = use_fast_card_writer
+    bdf_file = StringIO()
+    model.write_bdf(bdf_file, size=size, is_double=is_double, close=False)
+    return bdf_file.getvalue()
+
+
+class TestFastWriter(unittest.TestCase):
+    """tests the vectorized card writer"""
+
+    def test_fast_writer(self):
+        """the fast and standard writers write the same deck"""
+        model = BDF(log=SimpleLogger(level='error'))
+        model.add_grid(1, [0., 0., 0.], comment='node 1')
+        model.add_grid(2, [1.2345678, -0.5, 1e-9])
+        model.add_grid(3, [123456.7, -12345.6, 0.001], cp=1)
+        model.add_grid(4, [0., 1., 0.], cd=1, ps='123')
+        model.add_grid(5, [0., 1., 1.], seid=1)
+        model.add_grid(6, [np.nan, 2., 1.])
+        model.add_cord2r(1, [0., 0., 0.], [0., 0., 1.], [1., 0., 0.])
+        model.add_cquad4(1, 1, [1, 2, 3, 4], comment='quad')
+        model.add_cquad4(2, 1, [1, 2, 3, 4], zoffset=0.1)
+        model.add_cquad4(3, 1, [1, 2, 3, 4], theta_mcid=1)
+        model.add_cquad4(4, 1, [1, 2, 3, 4], theta_mcid=0)
+        model.add_ctria3(5, 1, [1, 2, 3])
+        model.add_ctria3(6, 1, [1, 2, 3], T1=2.0)
+        model.add_ctetra(10, 2, [1, 2, 3, 4])
+        model.add_cpenta(11, 2, [1, 2, 3, 4, 5, 6])
+        model.add_chexa(12, 2, [1, 2, 3, 4, 5, 6, 1, 2])
+        model.add_ctetra(13, 2, [1, 2, 3, 4, 5, 6, None, 2, 3, 4])
+        model.add_conm2(20, 1, 1.0)
+        model.add_pshell(1, mid1=1, t=0.1)
+        model.add_psolid(2, mid=1)
+        model.add_mat1(1, 3.0e7, None, 0.3)
+
+        for size, is_double in [(8, False), (16, False), (16, True)]:
+            msg1 = _write_bdf(model, False, size=size, is_double=is_double)
+            msg2 = _write_bdf(model, True, size=size, is_double=is_double)
+            assert msg1 == msg2, (size, is_double)
+
+        model.cross_reference()
+        for size, is_double in [(8, False), (16, False), (16, True)]:
+            msg1 = _write_bdf(model, False, size=size, is_double=is_double)
+            msg2 = _write_bdf(model, True, size=size, is_double=is_double)
+            assert msg1 == msg2, (size, is_double)
+
+    def test_fast_writer_models(self):
+        """the fast and standard writers write the same decks"""
+        bdf_filenames = [
+            MODEL_PATH / 'sol_101_elements' / 'static_solid_shell_bar.bdf',
+            MODEL_PATH / 'bwb' / 'bwb_saero.bdf',
+        ]
+        for bdf_filename in bdf_filenames:
+            model = read_bdf(bdf_filename, xref=False, validate=False,
+                             log=SimpleLogger(level='error'))
+            assert _write_bdf(model, False) == _write_bdf(model, True)
+            assert _write_bdf(model, False, size=16) == _write_bdf(model, True, size=16)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,202 @@
+"""tests cross referencing with lazy=True"""
+import os
+import gc
+import copy
+import time
+import pickle
+import weakref
+import unittest
+
+import numpy as np
+from cpylog import SimpleLogger
+
+import pyNastran
+from pyNastran.bdf.bdf import BDF, read_bdf, CQUAD4
+from pyNastran.bdf.mesh_utils.mass_properties import mass_properties
+from pyNastran.bdf.mesh_utils.loads import sum_forces_moments
+from pyNastran.bdf.bdf_interface.cross_reference import _LazyRef
+
+PKG_PATH = pyNastran.__path__[0]
+MODEL_PATH = os.path.join(PKG_PATH, '..', 'models')
+
+
+class TestLazyXref(unittest.TestCase):
+    """tests cross referencing with lazy=True"""
+
+    def test_lazy_xref_model(self):
+        """a lazily cross referenced model matches a cross referenced model"""
+        log = SimpleLogger(level='error')
+        bdf_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.bdf')
+        model = read_bdf(bdf_filename, log=log)
+        model_lazy = read_bdf(bdf_filename, xref='lazy', log=log)
+
+        # nothing has been cross referenced
+        for card_dict in (model_lazy.elements, model_lazy.properties, model_lazy.materials):
+            for card in card_dict.values():
+                assert _is_lazy(model_lazy, card), card.get_stats()
+        for loads in model_lazy.loads.values():
+            for load in loads:
+                assert _is_lazy(model_lazy, load), load.get_stats()
+
+        mass, cg, inertia = mass_properties(model)
+        mass_lazy, cg_lazy, inertia_lazy = mass_properties(model_lazy)
+        assert np.allclose(mass, mass_lazy)
+        assert np.allclose(cg, cg_lazy)
+        assert np.allclose(inertia, inertia_lazy)
+
+        # the loads are only cross referenced when they're used
+        for loads in model_lazy.loads.values():
+            for load in loads:
+                assert _is_lazy(model_lazy, load), load.get_stats()
+
+        p0 = np.zeros(3)
+        for load_id in model.loads:
+            forces, moments = sum_forces_moments(model, p0, load_id)
+            forces_lazy, moments_lazy = sum_forces_moments(model_lazy, p0, load_id)
+            assert np.allclose(forces, forces_lazy), load_id
+            assert np.allclose(moments, moments_lazy), load_id
+
+        # only the cards that were used are uncross referenced
+        model_lazy.uncross_reference()
+        assert model_lazy._lazy_xref_cards is None
+        assert 'nodes_ref' not in CQUAD4.__dict__
+        for eid, elem in model_lazy.elements.items():
+            if 'pid_ref' in model.elements[eid].__dict__:
+                assert elem.pid_ref is None, elem.get_stats()
+        model_lazy.cross_reference()
+        mass_lazy = mass_properties(model_lazy)[0]
+        assert np.allclose(mass, mass_lazy)
+
+    def test_lazy_xref_cards(self):
+        """the *_ref attributes are resolved on first access"""
+        log = SimpleLogger(level='error')
+        model = BDF(log=log)
+        model.add_grid(1, [0., 0., 0.])
+        model.add_grid(2, [1., 0., 0.])
+        model.add_grid(3, [1., 1., 0.])
+        model.add_grid(4, [0., 1., 0.])
+        model.add_cquad4(1, 1, [1, 2, 3, 4])
+        model.add_ctria3(2, 2, [1, 2, 3])
+        model.add_pshell(1, mid1=1, t=0.1)
+        model.add_pshell(2, mid1=1, t=0.2)
+        model.add_mat1(1, 3.0e7, None, 0.3)
+        model.add_force(10, 3, 1.0, [0., 0., 1.])
+        model.cross_reference(lazy=True)
+
+        elem = model.elements[1]
+        assert isinstance(CQUAD4.__dict__['nodes_ref'], _LazyRef)
+        assert elem.__dict__['nodes_ref'] is None
+        assert elem.nodes_ref[2] is model.nodes[3]
+        assert elem.pid_ref is model.properties[1]
+        assert not _is_lazy(model, elem)
+        assert _is_lazy(model, model.elements[2])
+        assert _is_lazy(model, model.properties[1])
+        assert np.allclose(elem.Mass(), 0.1 * model.materials[1].rho)
+
+        # a card from another model isn't cross referenced
+        model2 = BDF(log=log)
+        elem2 = model2.add_cquad4(1, 1, [1, 2, 3, 4])
+        assert elem2.pid_ref is None
+
+        # the other attributes aren't affected
+        with self.assertRaises(AttributeError):
+            elem.missing_ref
+        with self.assertRaises(AttributeError):
+            elem.missing
+        assert not hasattr(elem, 'missing_ref')
+
+        # a missing card is raised on every access
+        model.properties[2].mid1 = 100
+        prop = model.properties[2]
+        with self.assertRaises(KeyError):
+            prop.mid1_ref
+        with self.assertRaises(KeyError):
+            prop.mid1_ref
+        model.properties[2].mid1 = 1
+        assert prop.mid1_ref is model.materials[1]
+
+        # an eager cross reference removes the descriptors
+        model.cross_reference()
+        assert 'nodes_ref' not in CQUAD4.__dict__
+        assert model.elements[2].pid_ref is model.properties[2]
+        model.uncross_reference()
+        assert model.elements[2].pid_ref is None
+
+    def test_lazy_xref_pickle(self):
+        """a card doesn't keep the model alive or pickle it"""
+        log = SimpleLogger(level='error')
+        bdf_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.bdf')
+        model = read_bdf(bdf_filename, xref='lazy', log=log)
+        elem = model.elements[6]
+        assert _is_lazy(model, elem)
+
+        # the unused references are None
+        elem2 = pickle.loads(pickle.dumps(elem))
+        assert elem2.pid_ref is None
+        assert elem2.nodes_ref is None
+        elem2 = copy.copy(elem)
+        assert elem2.pid_ref is None
+        assert len(pickle.dumps(elem)) < 1000
+        assert _is_lazy(model, elem)
+
+        # the card isn't cross referenced once the model is deleted
+        model_ref = weakref.ref(model)
+        del model
+        gc.collect()
+        assert model_ref() is None
+        assert 'pid_ref' not in CQUAD4.__dict__
+        assert elem.pid_ref is None
+
+    def test_lazy_xref_setup(self):
+        """the lazy setup doesn't loop over the cards in python"""
+        log = SimpleLogger(level='error')
+        model = BDF(log=log)
+        nx = 100
+        for i in range(nx + 1):
+            for j in range(nx + 1):
+                model.add_grid(i * (nx + 1) + j + 1, [float(i), float(j), 0.])
+        for i in range(nx):
+            for j in range(nx):
+                n1 = i * (nx + 1) + j + 1
+                model.add_cquad4(i * nx + j + 1, 1, [n1, n1 + nx + 1, n1 + nx + 2, n1 + 1])
+        model.add_pshell(1, mid1=1, t=0.1)
+        model.add_mat1(1, 3.0e7, None, 0.3, rho=0.1)
+        elem = model.elements[1]
+        card_dict = elem.__dict__.copy()
+
+        eager_times = []
+        lazy_times = []
+        for unused_i in range(3):
+            t0 = time.perf_counter()
+            model.cross_reference()
+            eager_times.append(time.perf_counter() - t0)
+            model.uncross_reference()
+
+            t0 = time.perf_counter()
+            model.cross_reference(lazy=True)
+            lazy_times.append(time.perf_counter() - t0)
+            assert elem.__dict__ == card_dict
+            model.uncross_reference()
+        assert min(lazy_times) < 0.5 * min(eager_times), (lazy_times, eager_times)
+
+        # the descriptors are removed once every card has been accessed
+        model.cross_reference(lazy=True)
+        mass = mass_properties(model)[0]
+        assert np.allclose(mass, 100. * 100. * 0.1 * 0.1)
+        assert 'nodes_ref' in CQUAD4.__dict__
+        for elem in model.elements.values():
+            elem.pid_ref
+        for node in model.nodes.values():
+            node.cp_ref
+        assert model.materials[1].mats1_ref is None
+        assert 'nodes_ref' not in CQUAD4.__dict__
+        assert model.elements[1].nodes_ref[0] is model.nodes[1]
+
+
+def _is_lazy(model: BDF, card) -> bool:
+    """the card hasn't been lazily cross referenced yet"""
+    return id(card) in model._lazy_xref_cards
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,89 @@
+"""tests the memoized node arrays"""
+import unittest
+
+import numpy as np
+from cpylog import SimpleLogger
+
+from pyNastran.bdf.bdf import BDF
+
+
+def _get_xyz_cid(model: BDF, cid: int=0) -> tuple[np.ndarray, np.ndarray]:
+    """gets the nids/xyz_cid without the memo"""
+    model._node_array_memo.clear()
+    nid_cp_cd, xyz_cid = model.get_xyz_in_coord_array(cid=cid)[:2]
+    model._node_array_memo.clear()
+    return nid_cp_cd, xyz_cid
+
+
+class TestNodeMemo(unittest.TestCase):
+    """tests the memoized node arrays"""
+
+    def test_node_memo(self):
+        """the memo is reset when the GRIDs/coordinate systems change"""
+        model = BDF(log=SimpleLogger(level='error'))
+        model.add_cord2r(1, [1., 0., 0.], [1., 0., 1.], [2., 1., 0.])
+        model.add_grid(1, [0., 0., 0.])
+        model.add_grid(2, [1., 0., 0.], cp=1)
+        model.add_grid(3, [0., 1., 0.], cp=1, cd=1)
+        model.cross_reference()
+        memo = model._node_array_memo
+
+        for cid in [0, 1]:
+            nid_cp_cd1, xyz_cid1 = model.get_xyz_in_coord_array(cid=cid)[:2]
+            nid_cp_cd2, xyz_cid2 = model.get_xyz_in_coord_array(cid=cid)[:2]
+            assert len(memo._displacement_index) == 1
+            assert cid in memo._xyz_cid
+            assert np.array_equal(nid_cp_cd1, nid_cp_cd2)
+            assert np.array_equal(xyz_cid1, xyz_cid2)
+
+        # the memoized arrays are copies
+        xyz_cid2[:, :] = 0.
+        nid_cp_cd2[:, :] = 0
+        nid_cp_cd3, xyz_cid3 = model.get_xyz_in_coord_array(cid=1)[:2]
+        assert np.array_equal(nid_cp_cd1, nid_cp_cd3)
+        assert np.array_equal(xyz_cid1, xyz_cid3)
+
+        # modify a GRID in place
+        xyz_cid0_old = model.get_xyz_in_coord_array(cid=0)[1]
+        model.nodes[2].xyz[0] += 1.
+        xyz_cid0 = model.get_xyz_in_coord_array(cid=0)[1]
+        assert np.allclose(xyz_cid0, _get_xyz_cid(model)[1])
+        assert not np.allclose(xyz_cid0[1, :], xyz_cid0_old[1, :])
+
+        # change the CD of a GRID
+        node = model.nodes[1]
+        node.uncross_reference()
+        node.cd = 1
+        node.cross_reference(model)
+        icd_transform = model.get_displacement_index_xyz_cp_cd()[0]
+        assert np.array_equal(icd_transform[1], [0, 2]), icd_transform
+
+        # add a GRID
+        model.add_grid(4, [0., 0., 1.], cp=1)
+        model.nodes[4].cross_reference(model)
+        nid_cp_cd, xyz_cid0 = model.get_xyz_in_coord_array(cid=0)[:2]
+        assert np.array_equal(nid_cp_cd[:, 0], [1, 2, 3, 4])
+        assert np.allclose(xyz_cid0, _get_xyz_cid(model)[1])
+
+        # replace the coordinate system
+        del model.coords[1]
+        model.add_cord2r(1, [0., 0., 1.], [0., 0., 2.], [1., 0., 1.])
+        model.uncross_reference()
+        model.cross_reference()
+        xyz_cid0 = model.get_xyz_in_coord_array(cid=0)[1]
+        assert np.allclose(xyz_cid0, _get_xyz_cid(model)[1])
+        assert np.allclose(xyz_cid0[1, :], [2., 0., 1.]), xyz_cid0[1, :]
+
+        # remove a GRID
+        del model.nodes[4]
+        nid_cp_cd, xyz_cid1 = model.get_xyz_in_coord_array(cid=1)[:2]
+        assert np.array_equal(nid_cp_cd[:, 0], [1, 2, 3])
+        assert np.allclose(xyz_cid1, _get_xyz_cid(model, cid=1)[1])
+
+        # the memo isn't pickled
+        state = model.__getstate__()
+        assert state['_node_array_memo']._node_key is None
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
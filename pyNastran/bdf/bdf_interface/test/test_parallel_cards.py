@@ -0,0 +1,137 @@
+"""tests reading a BDF with read_bdf(..., nworkers=N)"""
+import os
+import unittest
+from io import StringIO
+
+from cpylog import SimpleLogger
+
+from pyNastran.bdf.bdf import BDF
+from pyNastran.bdf.bdf_interface.pybdf import BDFInputPy
+from pyNastran.bdf.bdf_interface.parallel_cards import get_parallel_cards, MIN_PARALLEL_CARDS
+
+
+def _get_lines(nnodes: int, nid0: int=0, eid0: int=1) -> list[str]:
+    """makes a strip of CQUAD4s"""
+    lines = []
+    for i in range(nnodes):
+        nid = nid0 + i + 1
+        lines.append(f'GRID,{nid},,{i}.,0.,0.')
+        lines.append(f'GRID,{nid+nnodes},,{i}.,1.,0.')
+    for i in range(nnodes - 1):
+        nid = nid0 + i + 1
+        lines.append(f'CQUAD4,{eid0+i},1,{nid},{nid+1},{nid+nnodes+1},{nid+nnodes}')
+    return lines
+
+
+def _read_bdf(bdf_file, nworkers: int, nparse_errors: int=100,
+              stop_on_parsing_error: bool=True) -> BDF:
+    """reads a deck without cross referencing"""
+    model = BDF(log=SimpleLogger(level='error'))
+    model.set_error_storage(nparse_errors=nparse_errors,
+                            stop_on_parsing_error=stop_on_parsing_error)
+    model.read_bdf(bdf_file, xref=False, validate=False, punch=True, nworkers=nworkers)
+    return model
+
+
+def _write_bdf(model: BDF) -> str:
+    """writes a deck to a string"""
+    bdf_file = StringIO()
+    model.write_bdf(bdf_file, close=False)
+    return bdf_file.getvalue()
+
+
+class TestParallelCards(unittest.TestCase):
+    """tests reading a BDF with read_bdf(..., nworkers=N)"""
+
+    def test_parallel_cards(self):
+        """the parallel and serial readers create the same model"""
+        lines = ['$ node 1'] + _get_lines(MIN_PARALLEL_CARDS // 2) + [
+            'PSHELL,1,1,0.1',
+            'MAT1,1,3.0e7,,0.3',
+            'CQUAD4,100000,1,1,2,3,4',
+            'RBE2,100001,1,123456,2,3',
+        ]
+        bdf_text = '\n'.join(lines) + '\n'
+        model1 = _read_bdf(StringIO(bdf_text), nworkers=1)
+        model2 = _read_bdf(StringIO(bdf_text), nworkers=2)
+        assert _write_bdf(model1) == _write_bdf(model2)
+        assert model1.card_count == model2.card_count
+        assert model2.nodes[1].comment == '$ node 1\n', repr(model2.nodes[1].comment)
+
+        model3 = BDF(log=SimpleLogger(level='error'))
+        cards_list = model3.get_bdf_cards(lines)[0]
+        assert get_parallel_cards(model3, cards_list, nworkers=1) == {}
+        assert get_parallel_cards(model3, cards_list[:10], nworkers=2) == {}
+
+    def test_parallel_cards_errors(self):
+        """the parse errors and duplicate ids are the same as the serial reader"""
+        lines = _get_lines(MIN_PARALLEL_CARDS // 2) + [
+            'GRID,1,,0.,0.,0.',
+            'GRID,2,,0.,0.,0.',
+            'CQUAD4,1,1,1,2,3,4',
+        ]
+        bdf_text = '\n'.join(lines) + '\n'
+        with self.assertRaises(Exception) as error1:
+            _read_bdf(StringIO(bdf_text), nworkers=1)
+        with self.assertRaises(Exception) as error2:
+            _read_bdf(StringIO(bdf_text), nworkers=2)
+        assert type(error1.exception) is type(error2.exception)
+        assert str(error1.exception) == str(error2.exception)
+
+        lines = _get_lines(MIN_PARALLEL_CARDS // 2) + [
+            'GRID,b,,0.,0.,0.',
+            'CQUAD4,100000,1,1,2,3,4.0',
+            'PSHELL,1,1,0.1',
+        ]
+        bdf_text = '\n'.join(lines) + '\n'
+        model1 = _read_bdf(StringIO(bdf_text), nworkers=1, stop_on_parsing_error=False)
+        model2 = _read_bdf(StringIO(bdf_text), nworkers=2, stop_on_parsing_error=False)
+        assert model1._stored_parse_errors == model2._stored_parse_errors
+        assert len(model2._stored_parse_errors) == 2, model2._stored_parse_errors
+        assert _write_bdf(model1) == _write_bdf(model2)
+
+    def test_parallel_includes(self):
+        """the INCLUDE files are read on a thread pool in the same order"""
+        nfiles = 4
+        nnodes = MIN_PARALLEL_CARDS // (2 * nfiles) + 1
+        bdf_filenames = ['parallel_main.bdf']
+        with open('parallel_main.bdf', 'w') as bdf_file:
+            for ifile in range(nfiles):
+                bdf_file.write(f"INCLUDE 'parallel_{ifile}.inc'\n")
+            bdf_file.write('ENDDATA\n')
+
+        for ifile in range(nfiles):
+            inc_filename = f'parallel_{ifile}.inc'
+            nested_filename = f'parallel_{ifile}_nested.inc'
+            bdf_filenames.extend([inc_filename, nested_filename])
+            lines = _get_lines(nnodes, nid0=2*nnodes*ifile, eid0=nnodes*ifile+1)
+            with open(inc_filename, 'w') as bdf_file:
+                bdf_file.write('\n'.join(lines) + '\n')
+                bdf_file.write(f"INCLUDE '{nested_filename}'\n")
+            with open(nested_filename, 'w') as bdf_file:
+                bdf_file.write(f'PSHELL,{ifile+1},1,0.1\n')
+
+        obj = BDFInputPy(read_includes=True, dumplines=False, encoding='utf8',
+                         log=SimpleLogger(level='error'))
+        obj.nworkers = 2
+        lines1 = obj.get_main_lines('parallel_main.bdf')
+        lines1, unused_ilines = obj.lines_to_deck_lines(lines1)
+        assert obj.include_file_lines == {}, list(obj.include_file_lines)
+
+        obj = BDFInputPy(read_includes=True, dumplines=False, encoding='utf8',
+                         log=SimpleLogger(level='error'))
+        lines2 = obj.get_main_lines('parallel_main.bdf')
+        lines2, unused_ilines = obj.lines_to_deck_lines(lines2)
+        assert lines1 == lines2
+
+        model1 = _read_bdf('parallel_main.bdf', nworkers=1)
+        model2 = _read_bdf('parallel_main.bdf', nworkers=2)
+        assert _write_bdf(model1) == _write_bdf(model2)
+        assert len(model2.properties) == nfiles, model2.properties
+
+        for bdf_filename in bdf_filenames:
+            os.remove(bdf_filename)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,104 @@
+"""tests write_bdf(..., nworkers=N, split_by_ifile=True)"""
+import os
+import shutil
+import tempfile
+import unittest
+from io import StringIO
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from cpylog import SimpleLogger
+
+import pyNastran
+from pyNastran.bdf.bdf import BDF, read_bdf
+from pyNastran.bdf.bdf_interface.parallel_writer import MIN_PARALLEL_CARDS, write_cards
+
+PKG_PATH = Path(pyNastran.__path__[0])
+TEST_PATH = PKG_PATH / 'bdf' / 'test'
+
+
+def _write_bdf(model: BDF, nworkers: int, size: int=8) -> str:
+    """writes a deck to a string"""
+    bdf_file = StringIO()
+    model.write_bdf(bdf_file, size=size, close=False, nworkers=nworkers)
+    return bdf_file.getvalue()
+
+
+class TestParallelWriter(unittest.TestCase):
+    """tests write_bdf(..., nworkers=N, split_by_ifile=True)"""
+
+    def test_parallel_writer(self):
+        """the parallel and serial writers write the same deck"""
+        model = BDF(log=SimpleLogger(level='error'))
+        nx = 40
+        ny = MIN_PARALLEL_CARDS // nx + 1
+        nid = 1
+        for j in range(ny + 1):
+            for i in range(nx + 1):
+                model.add_grid(nid, [i * 0.1, j * 0.3, 0.])
+                nid += 1
+
+        eid = 1
+        for j in range(ny):
+            for i in range(nx):
+                n1 = j * (nx + 1) + i + 1
+                n2 = n1 + nx + 1
+                model.add_cquad4(eid, 1 + eid % 3, [n1, n1 + 1, n2 + 1, n2])
+                eid += 1
+        model.add_pshell(1, mid1=1, t=0.1)
+        model.add_pshell(2, mid1=1, t=0.2)
+        model.add_pshell(3, mid1=1, t=0.3)
+        model.add_mat1(1, 3.0e7, None, 0.3)
+        assert len(model.elements) > MIN_PARALLEL_CARDS
+
+        for size in [8, 16]:
+            msg1 = _write_bdf(model, 1, size=size)
+            msg2 = _write_bdf(model, 2, size=size)
+            assert msg1 == msg2, size
+
+    def test_parallel_writer_threads(self):
+        """write_cards doesn't share the cards between threads"""
+        model = BDF(log=SimpleLogger(level='error'))
+        for nid in range(1, 2 * MIN_PARALLEL_CARDS + 1):
+            model.add_grid(nid, [nid * 0.1, 0., 0.])
+        cards = list(model.nodes.values())
+        groups = [cards[:MIN_PARALLEL_CARDS], cards[MIN_PARALLEL_CARDS:]]
+
+        def _write(cardsi):
+            bdf_file = StringIO()
+            write_cards(bdf_file, cardsi, 8, False, False, nworkers=2)
+            return bdf_file.getvalue()
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            msgs = list(executor.map(_write, groups * 2))
+        for cardsi, msg in zip(groups * 2, msgs):
+            assert msg == ''.join(card.write_card(8, False) for card in cardsi)
+
+    def test_split_by_ifile(self):
+        """writes the cards back to their INCLUDE files"""
+        log = SimpleLogger(level='error')
+        bdf_filename = TEST_PATH / 'unit' / 'include_bug' / 'main_input.bdf'
+        model = read_bdf(bdf_filename, save_file_structure=True, log=log)
+        nnodes = len(model.nodes)
+        assert nnodes == 20, nnodes
+
+        dirname = tempfile.mkdtemp()
+        try:
+            out_filename = os.path.join(dirname, 'main_input.bdf')
+            model.write_bdf(out_filename, split_by_ifile=True, nworkers=2)
+            assert len(os.listdir(dirname)) > 1, os.listdir(dirname)
+
+            model2 = read_bdf(out_filename, log=log)
+            assert len(model2.nodes) == nnodes
+            for nid, node in model.nodes.items():
+                assert np.allclose(node.xyz, model2.nodes[nid].xyz), nid
+        finally:
+            shutil.rmtree(dirname)
+
+        with self.assertRaises(TypeError):
+            model.write_bdf(StringIO(), split_by_ifile=True)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -15,19 +15,22 @@ class UnXrefMesh(SafeXrefMesh):
     def uncross_reference(self, word: str='') -> None:
         """uncross references the model"""
         self.log.debug("Uncross Referencing%s..." % word)
-        self._uncross_reference_nodes()
-        self._uncross_reference_coords()
-        self._uncross_reference_elements()
-        self._uncross_reference_properties()
-        self._uncross_reference_materials()
-        self._uncross_reference_masses()
-        self._uncross_reference_aero()
-        self._uncross_reference_constraints()
-        self._uncross_reference_loads()
-        self._uncross_reference_sets()
-        self._uncross_reference_optimization()
-        self._uncross_reference_contact()
-        self._uncross_reference_superelements()
+        if self._lazy_xref_cards is not None:
+            self._uncross_reference_lazy()
+        else:
+            self._uncross_reference_nodes()
+            self._uncross_reference_coords()
+            self._uncross_reference_elements()
+            self._uncross_reference_properties()
+            self._uncross_reference_materials()
+            self._uncross_reference_masses()
+            self._uncross_reference_aero()
+            self._uncross_reference_constraints()
+            self._uncross_reference_loads()
+            self._uncross_reference_sets()
+            self._uncross_reference_optimization()
+            self._uncross_reference_contact()
+            self._uncross_reference_superelements()
 
         for super_tuple, superelement in sorted(self.superelement_models.items()):
             if isinstance(super_tuple, int):
@@ -40,6 +43,20 @@ class UnXrefMesh(SafeXrefMesh):
                     word = f'BEGIN {wordi}={value:d}\n'
             superelement.uncross_reference(word=word)
 
+    def _uncross_reference_lazy(self) -> None:
+        """
+        Uncross references a model that was cross referenced with lazy=True.
+        Only the cards that were accessed need to be uncross referenced.
+        """
+        lazy_xref_done = self._lazy_xref_done
+        self._clear_lazy_cross_reference()
+        for card in lazy_xref_done:
+            card.uncross_reference()
+        self._uncross_reference_coords()
+        self._uncross_reference_aero()
+        self._uncross_reference_contact()
+        self._uncross_reference_superelements()
+
     def _uncross_reference_nodes(self) -> None:
         """uncross references the GRID objects"""
         for node in self.nodes.values():
@@ -5,6 +5,7 @@ This file defines:
 
 """
 from __future__ import annotations
+import os
 import sys
 from io import IOBase
 from pathlib import PurePath
@@ -13,6 +14,8 @@ from typing import Union, Optional, Any, cast, TYPE_CHECKING
 from pyNastran.bdf.field_writer_8 import print_card_8
 from pyNastran.bdf.field_writer_16 import print_card_16
 from pyNastran.bdf.bdf_interface.attributes import BDFAttributes
+from pyNastran.bdf.bdf_interface.fast_writer import (
+    write_grids, write_elements_8, BUFFER_SIZE)
 from pyNastran.bdf.bdf_interface.write_mesh_utils import (
     find_aero_location, write_dict, get_properties_by_element_type)
 from pyNastran.bdf.cards.nodes import write_xpoints
@@ -91,7 +94,8 @@ class WriteMesh(BDFAttributes):
                   loads_size: Optional[int]=None,
                   is_double: bool=False,
                   interspersed: bool=False, enddata: Optional[bool]=None,
-                  write_header: bool=True, close: bool=True) -> None:
+                  write_header: bool=True, close: bool=True,
+                  nworkers: int=1, split_by_ifile: bool=False) -> None:
         """
         Writes the BDF.
 
@@ -123,8 +127,23 @@ class WriteMesh(BDFAttributes):
             flag for writing the pyNastran header
         close : bool; default=True
             should the output file be closed
+        nworkers : int; default=1
+            the number of processes used to write the large card groups
+            (e.g., nodes, elements, properties); the deck is the same as
+            with nworkers=1
+        split_by_ifile : bool; default=False
+            write each card to the INCLUDE file that it was read from;
+            requires read_bdf(..., save_file_structure=True).
+            out_filename is the main file and the INCLUDE files are
+            written relative to it.
 
         """
+        if split_by_ifile:
+            self._write_bdf_by_ifile(
+                out_filename, encoding=encoding, size=size, is_double=is_double,
+                enddata=enddata, close=close, nworkers=nworkers)
+            return
+
         if self.is_bdf_vectorized:
             is_long_ids = False
         else:
@@ -141,7 +160,8 @@ class WriteMesh(BDFAttributes):
         else:
             self.log.debug(f'---starting BDF.write_bdf of {out_filename}---')
             assert isinstance(encoding, str), encoding
-            bdf_file = open(out_filename, 'w', encoding=encoding)
+            buffering = BUFFER_SIZE if self.use_fast_card_writer else -1
+            bdf_file = open(out_filename, 'w', encoding=encoding, buffering=buffering)
         self._write_header(bdf_file, encoding, write_header=write_header)
 
 
@@ -166,8 +186,51 @@ class WriteMesh(BDFAttributes):
         self.write_bulk_data(bdf_file, size=size, is_double=is_double,
                              interspersed=interspersed,
                              enddata=enddata, close=close,
-                             nodes_size=nodes_size, elements_size=elements_size, loads_size=loads_size,
-                             is_long_ids=is_long_ids)
+                             nodes_size=nodes_size, elements_size=elements_size,
+                             loads_size=loads_size, is_long_ids=is_long_ids,
+                             nworkers=nworkers)
+
+    def _write_bdf_by_ifile(self, out_filename: str,
+                            encoding: Optional[str]=None,
+                            size: int=8, is_double: bool=False,
+                            enddata: Optional[bool]=None, close: bool=True,
+                            nworkers: int=1) -> None:
+        """
+        Writes the cards back to the INCLUDE files they came from
+        (see write_bdf(..., split_by_ifile=True)).
+
+        The main file is written to out_filename and the INCLUDE files
+        are written to the same relative path from the output directory.
+        """
+        if not isinstance(out_filename, (str, PurePath)):
+            raise TypeError('split_by_ifile=True requires an output filename; '
+                            f'out_filename={out_filename!r}')
+        if not self.active_filenames:
+            raise RuntimeError('split_by_ifile=True requires '
+                               'read_bdf(..., save_file_structure=True)')
+
+        out_filename = os.path.abspath(out_filename)
+        main_filename = os.path.abspath(self.active_filenames[0])
+        main_dirname = os.path.dirname(main_filename)
+        out_dirname = os.path.dirname(out_filename)
+
+        # the keys are the filenames as they were read, so the INCLUDE
+        # cards can be mapped to the new files
+        out_files_map = {self.active_filenames[0]: out_filename}
+        include_filenames = [filename for filenames in self.include_filenames.values()
+                             for filename in filenames]
+        for filename in self.active_filenames[1:] + include_filenames:
+            abs_filename = os.path.abspath(filename)
+            if filename in out_files_map or abs_filename == main_filename:
+                continue
+            out_filenamei = os.path.join(
+                out_dirname, os.path.relpath(abs_filename, main_dirname))
+            os.makedirs(os.path.dirname(out_filenamei), exist_ok=True)
+            out_files_map[filename] = out_filenamei
+
+        self.write_bdfs(out_files_map, relative_dirname=out_dirname,
+                        encoding=encoding, size=size, is_double=is_double,
+                        enddata=enddata, close=close, nworkers=nworkers)
 
     def write_bulk_data(self, bdf_file,
                         size: int=8, is_double: bool=False,
@@ -176,7 +239,7 @@ class WriteMesh(BDFAttributes):
                         nodes_size: Optional[int]=None,
                         elements_size: Optional[int]=None,
                         loads_size: Optional[int]=None,
-                        is_long_ids: bool=False) -> None:
+                        is_long_ids: bool=False, nworkers: int=1) -> None:
         """
         Writes the BDF.
 
@@ -201,6 +264,8 @@ class WriteMesh(BDFAttributes):
             None - depends on input BDF
         close : bool; default=True
             should the output file be closed
+        nworkers : int; default=1
+            the number of processes used to write the large card groups
 
         .. note:: is_long_ids is only needed if you have ids longer
                   than 8 characters. It's an internal parameter, but if
@@ -212,25 +277,30 @@ class WriteMesh(BDFAttributes):
 
         self._write_params(bdf_file, size, is_double, is_long_ids=is_long_ids)
         self._write_model_groups(bdf_file)
-        self._write_nodes(bdf_file, nodes_size, is_double, is_long_ids=is_long_ids)
+        self._write_nodes(bdf_file, nodes_size, is_double, is_long_ids=is_long_ids,
+                          nworkers=nworkers)
 
         if interspersed:
             self._write_elements_interspersed(bdf_file, elements_size, is_double, is_long_ids=is_long_ids)
         else:
-            self._write_elements(bdf_file, elements_size, is_double, is_long_ids=is_long_ids)
-            self._write_properties(bdf_file, size, is_double, is_long_ids=is_long_ids)
+            self._write_elements(bdf_file, elements_size, is_double, is_long_ids=is_long_ids,
+                                 nworkers=nworkers)
+            self._write_properties(bdf_file, size, is_double, is_long_ids=is_long_ids,
+                                   nworkers=nworkers)
             #self._write_properties_by_element_type(bdf_file, size, is_double, is_long_ids)
 
         for cards in (self.bolt, self.boltseq, self.boltfor, self.boltfrc, self.boltld):
             for key, card in cards.items():
                 bdf_file.write(card.write_card(size, is_double))
 
-        self._write_materials(bdf_file, size, is_double, is_long_ids=is_long_ids)
+        self._write_materials(bdf_file, size, is_double, is_long_ids=is_long_ids,
+                              nworkers=nworkers)
 
         self._write_masses(bdf_file, size, is_double, is_long_ids=is_long_ids)
 
         # split out for write_bdf_symmetric
-        self._write_rigid_elements(bdf_file, size, is_double, is_long_ids=is_long_ids)
+        self._write_rigid_elements(bdf_file, size, is_double, is_long_ids=is_long_ids,
+                                   nworkers=nworkers)
         self._write_aero(bdf_file, size, is_double, is_long_ids=is_long_ids)
 
         self._write_common(bdf_file, loads_size, is_double, is_long_ids=is_long_ids)
@@ -288,21 +358,16 @@ class WriteMesh(BDFAttributes):
             bdf_file.write(''.join(msg))
 
     def _write_elements(self, bdf_file: Any, size: int=8, is_double: bool=False,
-                        is_long_ids: Optional[bool]=None) -> None:
+                        is_long_ids: Optional[bool]=None, nworkers: int=1) -> None:
         """Writes the elements in a sorted order"""
         size, is_long_ids = self._write_mesh_long_ids_size(size, is_long_ids)
         if self.elements:
             bdf_file.write('$ELEMENTS\n')
-            if is_long_ids:
-                for (eid, element) in sorted(self.elements.items()):
-                    bdf_file.write(element.write_card_16(is_double))
+            if self.use_fast_card_writer and size == 8 and not is_long_ids:
+                write_elements_8(bdf_file, self.elements)
             else:
-                for (eid, element) in sorted(self.elements.items()):
-                    try:
-                        bdf_file.write(element.write_card(size, is_double))
-                    except Exception:
-                        print(f'failed printing element...type={element.type} eid={eid}')
-                        raise
+                write_dict(bdf_file, self.elements, size, is_double, is_long_ids,
+                           nworkers=nworkers)
         if self.ao_element_flags:
             for (eid, element) in sorted(self.ao_element_flags.items()):
                 bdf_file.write(element.write_card(size, is_double))
@@ -788,7 +853,7 @@ class WriteMesh(BDFAttributes):
                     raise
 
     def _write_materials(self, bdf_file: Any, size: int=8, is_double: bool=False,
-                         is_long_ids: Optional[bool]=None) -> None:
+                         is_long_ids: Optional[bool]=None, nworkers: int=1) -> None:
         """Writes the materials in a sorted order"""
         size, is_long_ids = self._write_mesh_long_ids_size(size, is_long_ids)
         is_big_materials = hasattr(self, 'big_materials') and self.big_materials
@@ -798,8 +863,7 @@ class WriteMesh(BDFAttributes):
                         self.MATT8 or self.MATT9 or self.nxstrats or is_big_materials)
         if is_materials:
             bdf_file.write('$MATERIALS\n')
-            for (unused_mid, material) in sorted(self.materials.items()):
-                bdf_file.write(material.write_card(size, is_double))
+            write_dict(bdf_file, self.materials, size, is_double, False, nworkers=nworkers)
             for (unused_mid, material) in sorted(self.hyperelastic_materials.items()):
                 bdf_file.write(material.write_card(size, is_double))
             for (unused_mid, material) in sorted(self.creep_materials.items()):
@@ -844,7 +908,7 @@ class WriteMesh(BDFAttributes):
             #x = 1
 
     def _write_nodes(self, bdf_file: Any, size: int=8, is_double: bool=False,
-                     is_long_ids: Optional[bool]=None) -> None:
+                     is_long_ids: Optional[bool]=None, nworkers: int=1) -> None:
         """Writes the NODE-type cards"""
         if self.spoints:
             bdf_file.write('$SPOINTS\n')
@@ -871,7 +935,7 @@ class WriteMesh(BDFAttributes):
         if self.cyax:
             bdf_file.write(self.cyax.write_card(size, is_double))
 
-        self._write_grids(bdf_file, size=size, is_double=is_double)
+        self._write_grids(bdf_file, size=size, is_double=is_double, nworkers=nworkers)
         if self.seqgp:
             bdf_file.write(self.seqgp.write_card(size, is_double))
 
@@ -879,14 +943,18 @@ class WriteMesh(BDFAttributes):
             #self._write_nodes_associated(bdf_file, size, is_double)
 
     def _write_grids(self, bdf_file: Any, size: int=8, is_double: bool=False,
-                     is_long_ids: Optional[bool]=None) -> None:
+                     is_long_ids: Optional[bool]=None, nworkers: int=1) -> None:
         """Writes the GRID-type cards"""
         size, is_long_ids = self._write_mesh_long_ids_size(size, is_long_ids)
         if self.nodes:
             bdf_file.write('$NODES\n')
             if self.grdset:
                 bdf_file.write(self.grdset.write_card(size))
-            write_dict(bdf_file, self.nodes, size, is_double, is_long_ids)
+            if self.use_fast_card_writer:
+                write_grids(bdf_file, self.nodes, 16 if is_long_ids else size, is_double)
+            else:
+                write_dict(bdf_file, self.nodes, size, is_double, is_long_ids,
+                           nworkers=nworkers)
 
     #def _write_nodes_associated(self, bdf_file, size=8, is_double=False):
         #"""
@@ -1022,7 +1090,7 @@ class WriteMesh(BDFAttributes):
                 bdf_file.write(self.mdlprm.write_card(size, is_double))
 
     def _write_properties(self, bdf_file: Any, size: int=8, is_double: bool=False,
-                          is_long_ids: Optional[bool]=None) -> None:
+                          is_long_ids: Optional[bool]=None, nworkers: int=1) -> None:
         """Writes the properties in a sorted order"""
         size, is_long_ids = self._write_mesh_long_ids_size(size, is_long_ids)
         is_big_properties = hasattr(self, 'big_properties') and self.big_properties
@@ -1031,17 +1099,9 @@ class WriteMesh(BDFAttributes):
         if is_properties:
             bdf_file.write('$PROPERTIES\n')
             prop_groups = (self.properties, self.pelast, self.pdampt, self.pbusht)
-            if is_long_ids:
-                for prop_group in prop_groups:
-                    for unused_pid, prop in sorted(prop_group.items()):
-                        bdf_file.write(prop.write_card_16(is_double))
-                #except Exception:
-                    #print('failed printing property type=%s' % prop.type)
-                    #raise
-            else:
-                for prop_group in prop_groups:
-                    for unused_pid, prop in sorted(prop_group.items()):
-                        bdf_file.write(prop.write_card(size, is_double))
+            for prop_group in prop_groups:
+                write_dict(bdf_file, prop_group, size, is_double, is_long_ids,
+                           nworkers=nworkers)
 
             if is_big_properties:
                 for unused_pid, prop in sorted(self.big_properties.items()):
@@ -1126,28 +1186,17 @@ class WriteMesh(BDFAttributes):
                     raise TypeError(reject_lines)
 
     def _write_rigid_elements(self, bdf_file: Any, size: int=8, is_double: bool=False,
-                              is_long_ids: Optional[bool]=None) -> None:
+                              is_long_ids: Optional[bool]=None, nworkers: int=1) -> None:
         """Writes the rigid elements in a sorted order"""
         size, is_long_ids = self._write_mesh_long_ids_size(size, is_long_ids)
         if self.rigid_elements:
             bdf_file.write('$RIGID ELEMENTS\n')
-            if is_long_ids:
-                for (eid, element) in sorted(self.rigid_elements.items()):
-                    try:
-                        bdf_file.write(element.write_card_16(is_double))
-                    except Exception:
-                        print(f'failed printing element...type={element.type} eid={eid}')
-                        raise
-            else:
-                for (eid, element) in sorted(self.rigid_elements.items()):
-                    try:
-                        bdf_file.write(element.write_card(size, is_double))
-                    except Exception:
-                        print(f'failed printing element...type={element.type} eid={eid}')
-                        raise
+            write_dict(bdf_file, self.rigid_elements, size, is_double, is_long_ids,
+                       nworkers=nworkers)
         if self.plotels:
             bdf_file.write('$PLOT ELEMENTS\n')
-            write_dict(bdf_file, self.plotels, size, is_double, is_long_ids)
+            write_dict(bdf_file, self.plotels, size, is_double, is_long_ids,
+                       nworkers=nworkers)
 
     def _write_sets(self, bdf_file: Any, size: int=8, is_double: bool=False,
                     is_long_ids: Optional[bool]=None) -> None:
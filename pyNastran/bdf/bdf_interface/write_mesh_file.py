@@ -14,6 +14,7 @@ from pyNastran.bdf.field_writer_8 import print_card_8
 from pyNastran.bdf.field_writer_16 import print_card_16
 from pyNastran.bdf.bdf_interface.write_mesh import WriteMesh, _output_helper
 from pyNastran.bdf.bdf_interface.write_mesh_utils import find_aero_location
+from pyNastran.bdf.bdf_interface.parallel_writer import write_cards
 from pyNastran.bdf.write_path import write_include
 from pyNastran.utils import PathLike
 if TYPE_CHECKING:  # pragma: no cover
@@ -39,7 +40,7 @@ class WriteMeshs(WriteMesh):
                    encoding: Optional[str]=None,
                    size: int=8, is_double: bool=False,
                    enddata: Optional[bool]=None, close: bool=True,
-                   is_windows: Optional[bool]=None) -> None:
+                   is_windows: Optional[bool]=None, nworkers: int=1) -> None:
         """
         Writes the BDF.
 
@@ -72,6 +73,8 @@ class WriteMeshs(WriteMesh):
                 files, so the format for a BDF that will run on Linux and
                 Windows is different.
             None : Check the platform
+        nworkers : int; default=1
+            the number of processes used to write the large card groups
 
         out_files_map[fem.active_filenames[0]] = bdf_filename[:-4] + "_NEW" + bdf_filename[-4:]
         for ifile, include_filenames in model.include_filenames.items():
@@ -119,14 +122,19 @@ class WriteMeshs(WriteMesh):
                                  is_windows=is_windows)
 
         self._write_params_file(bdf_files, size, is_double, is_long_ids=is_long_ids)
-        self._write_nodes_file(bdf_files, size, is_double, is_long_ids=is_long_ids)
+        self._write_nodes_file(bdf_files, size, is_double, is_long_ids=is_long_ids,
+                               nworkers=nworkers)
 
-        self._write_elements_file(bdf_files, size, is_double, is_long_ids=is_long_ids)
-        self._write_properties_file(bdf_files, size, is_double, is_long_ids=is_long_ids)
-        self._write_materials_file(bdf_files, size, is_double, is_long_ids=is_long_ids)
+        self._write_elements_file(bdf_files, size, is_double, is_long_ids=is_long_ids,
+                                  nworkers=nworkers)
+        self._write_properties_file(bdf_files, size, is_double, is_long_ids=is_long_ids,
+                                    nworkers=nworkers)
+        self._write_materials_file(bdf_files, size, is_double, is_long_ids=is_long_ids,
+                                   nworkers=nworkers)
 
         self._write_masses_file(bdf_files, size, is_double, is_long_ids=is_long_ids)
-        self._write_rigid_elements_file(bdf_files, size, is_double, is_long_ids=is_long_ids)
+        self._write_rigid_elements_file(bdf_files, size, is_double, is_long_ids=is_long_ids,
+                                        nworkers=nworkers)
         self._write_aero_file(bdf_files, size, is_double, is_long_ids=is_long_ids)
 
         self._write_common_file(bdf_files, size, is_double, is_long_ids=is_long_ids)
@@ -199,14 +207,15 @@ class WriteMeshs(WriteMesh):
             #bdf_file.write(msg)
 
     def _write_elements_file(self, bdf_files: Any, size: int=8, is_double: bool=False,
-                             is_long_ids: Optional[bool]=None) -> None:
+                             is_long_ids: Optional[bool]=None, nworkers: int=1) -> None:
         """
         Writes the elements in a sorted order
         """
         size, is_long_ids = self._write_mesh_long_ids_size(size, is_long_ids)
 
         if self.elements:
-            write_bdfs_dict(bdf_files, self.elements, size, is_double, is_long_ids)
+            write_bdfs_dict(bdf_files, self.elements, size, is_double, is_long_ids,
+                            nworkers=nworkers)
 
         if self.ao_element_flags:
             write_bdfs_dict(bdf_files, self.ao_element_flags, size, is_double, is_long_ids)
@@ -452,7 +461,7 @@ class WriteMeshs(WriteMesh):
             write_bdfs_dict(bdf_files, self.masses, size, is_double, is_long_ids)
 
     def _write_materials_file(self, bdf_files: Any, size: int=8, is_double: bool=False,
-                              is_long_ids: Optional[bool]=None) -> None:
+                              is_long_ids: Optional[bool]=None, nworkers: int=1) -> None:
         """Writes the materials in a sorted order"""
         size, is_long_ids = self._write_mesh_long_ids_size(size, is_long_ids)
         is_materials = (self.materials or self.hyperelastic_materials or self.creep_materials or
@@ -460,7 +469,8 @@ class WriteMeshs(WriteMesh):
                         self.MATT2 or self.MATT3 or self.MATT4 or self.MATT5 or
                         self.MATT8 or self.MATT9 or self.nxstrats)
         if is_materials:
-            write_bdfs_dict(bdf_files, self.materials, size, is_double, is_long_ids)
+            write_bdfs_dict(bdf_files, self.materials, size, is_double, is_long_ids,
+                            nworkers=nworkers)
             write_bdfs_dict(bdf_files, self.hyperelastic_materials, size, is_double, is_long_ids)
             write_bdfs_dict(bdf_files, self.creep_materials, size, is_double, is_long_ids)
             write_bdfs_dict(bdf_files, self.MATS1, size, is_double, is_long_ids)
@@ -476,7 +486,7 @@ class WriteMeshs(WriteMesh):
             write_bdfs_dict(bdf_files, self.nxstrats, size, is_double, is_long_ids)
 
     def _write_nodes_file(self, bdf_files: Any, size: int=8, is_double: bool=False,
-                          is_long_ids: Optional[bool]=None) -> None:
+                          is_long_ids: Optional[bool]=None, nworkers: int=1) -> None:
         """Writes the NODE-type cards"""
         if self.spoints:
             write_xpoints_file(bdf_files, 'SPOINT', self.spoints)
@@ -494,7 +504,7 @@ class WriteMeshs(WriteMesh):
             write_bdfs_dict(bdf_files, self.ringfl, size, is_double, is_long_ids)
             write_bdfs_dict(bdf_files, self.gridb, size, is_double, is_long_ids)
 
-        self._write_grids_file(bdf_files, size=size, is_double=is_double)
+        self._write_grids_file(bdf_files, size=size, is_double=is_double, nworkers=nworkers)
         if self.seqgp:
             bdf_files[self.seqgp.ifile].write(self.seqgp.write_card(size, is_double))
 
@@ -502,13 +512,14 @@ class WriteMeshs(WriteMesh):
             #self._write_nodes_associated(bdf_file, size, is_double)
 
     def _write_grids_file(self, bdf_files: Any, size: int=8, is_double: bool=False,
-                          is_long_ids: Optional[bool]=None) -> None:
+                          is_long_ids: Optional[bool]=None, nworkers: int=1) -> None:
         """Writes the GRID-type cards"""
         size, is_long_ids = self._write_mesh_long_ids_size(size, is_long_ids)
         if self.nodes:
             if self.grdset:
                 bdf_files[self.grdset.ifile].write(self.grdset.write_card(size))
-            write_bdfs_dict(bdf_files, self.nodes, size, is_double, is_long_ids)
+            write_bdfs_dict(bdf_files, self.nodes, size, is_double, is_long_ids,
+                            nworkers=nworkers)
 
     def _write_optimization_file(self, bdf_files: Any, size: int=8, is_double: bool=False,
                                  is_long_ids: Optional[bool]=None) -> None:
@@ -557,12 +568,13 @@ class WriteMeshs(WriteMesh):
             write_bdfs_dict(bdf_files, self.dti, size, is_double, is_long_ids)
 
     def _write_properties_file(self, bdf_files: Any, size: int=8, is_double: bool=False,
-                               is_long_ids: Optional[bool]=None) -> None:
+                               is_long_ids: Optional[bool]=None, nworkers: int=1) -> None:
         """Writes the properties in a sorted order"""
         size, is_long_ids = self._write_mesh_long_ids_size(size, is_long_ids)
         is_properties = self.properties or self.pelast or self.pdampt or self.pbusht
         if is_properties:
-            write_bdfs_dict(bdf_files, self.properties, size, is_double, is_long_ids)
+            write_bdfs_dict(bdf_files, self.properties, size, is_double, is_long_ids,
+                            nworkers=nworkers)
             write_bdfs_dict(bdf_files, self.pelast, size, is_double, is_long_ids)
             write_bdfs_dict(bdf_files, self.pdampt, size, is_double, is_long_ids)
             write_bdfs_dict(bdf_files, self.pbusht, size, is_double, is_long_ids)
@@ -605,14 +617,16 @@ class WriteMeshs(WriteMesh):
                     raise TypeError(reject_lines)
 
     def _write_rigid_elements_file(self, bdf_files: Any, size: int=8, is_double: bool=False,
-                                   is_long_ids: Optional[bool]=None) -> None:
+                                   is_long_ids: Optional[bool]=None, nworkers: int=1) -> None:
         """Writes the rigid elements in a sorted order"""
         size, is_long_ids = self._write_mesh_long_ids_size(size, is_long_ids)
         if self.rigid_elements:
-            write_bdfs_dict(bdf_files, self.rigid_elements, size, is_double, is_long_ids)
+            write_bdfs_dict(bdf_files, self.rigid_elements, size, is_double, is_long_ids,
+                            nworkers=nworkers)
 
         if self.plotels:
-            write_bdfs_dict(bdf_files, self.plotels, size, is_double, is_long_ids)
+            write_bdfs_dict(bdf_files, self.plotels, size, is_double, is_long_ids,
+                            nworkers=nworkers)
 
     def _write_sets_file(self, bdf_files: Any, size: int=8, is_double: bool=False,
                          is_long_ids: Optional[bool]=None) -> None:
@@ -713,7 +727,8 @@ def _get_ifiles_dict(cards_dict):
     assert isinstance(cards_dict, dict), cards_dict
     ifiles_dict = defaultdict(list)
     for unused_id, card in sorted(cards_dict.items()):
-        ifiles_dict[card.ifile].append(card)
+        # cards that weren't read (e.g., add_grid) are in the main file
+        ifiles_dict[getattr(card, 'ifile', 0)].append(card)
     return ifiles_dict
 
 def write_bdf_dict_ids(bdf_file, cards, ids, size, is_double, is_long_ids):
@@ -729,24 +744,20 @@ def write_bdf_dict_ids(bdf_file, cards, ids, size, is_double, is_long_ids):
         for idi in ids:
             bdf_file.write(cards[idi].write_card(size, is_double))
 
-def write_bdfs_dict(bdf_files, cards, size, is_double, is_long_ids):
+def write_bdfs_dict(bdf_files, cards, size, is_double, is_long_ids, nworkers=1):
     """writes a dictionary by ifile"""
     assert isinstance(cards, dict), cards
     ifiles_dict = _get_ifiles_dict(cards)
     for file_id, file_cards in ifiles_dict.items():
         bdf_file = bdf_files[file_id]
-        _write_bdf_dict_cards(bdf_file, file_cards, size, is_double, is_long_ids)
+        _write_bdf_dict_cards(bdf_file, file_cards, size, is_double, is_long_ids,
+                              nworkers=nworkers)
 
-def _write_bdf_dict_cards(bdf_file, cards, size, is_double, is_long_ids):
+def _write_bdf_dict_cards(bdf_file, cards, size, is_double, is_long_ids, nworkers=1):
     """writes a dictionary"""
     if bdf_file is None:
         return
-    if is_long_ids:
-        for card in cards:
-            bdf_file.write(card.write_card_16(is_double))
-    else:
-        for card in cards:
-            bdf_file.write(card.write_card(size, is_double))
+    write_cards(bdf_file, cards, size, is_double, is_long_ids, nworkers=nworkers)
 
 def _get_ifiles_dict_list(cards):
     """gets the ids for a dictionary of lists by file number"""
@@ -755,7 +766,8 @@ def _get_ifiles_dict_list(cards):
     for (unused_id, cardsi) in sorted(cards.items()):
         assert isinstance(cardsi, list), cardsi
         for card in cardsi:
-            ifiles_dict_list[card.ifile].append(card)
+            # cards that weren't read (e.g., add_grid) are in the main file
+            ifiles_dict_list[getattr(card, 'ifile', 0)].append(card)
     return ifiles_dict_list
 
 def write_bdfs_dict_list(bdf_files, cards, size, is_double, is_long_ids):
@@ -770,10 +782,10 @@ def write_bdfs_list(bdf_files, cards, size, is_double, is_long_ids):
     assert isinstance(cards, list), cards
     if is_long_ids:
         for card in cards:
-            bdf_files[card.ifile].write_card_16(size, is_double)
+            bdf_files[card.ifile].write(card.write_card_16(is_double))
     else:
         for card in cards:
-            bdf_files[card.ifile].write_card(size, is_double)
+            bdf_files[card.ifile].write(card.write_card(size, is_double))
 
 def _map_filenames_to_ifile_filname_dict(out_filenames: dict[str, str],
                                          active_filenames: list[str]) -> dict[int, str]:
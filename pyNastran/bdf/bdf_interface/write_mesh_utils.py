@@ -1,7 +1,7 @@
 # coding: utf-8
 """
 This file defines:
-  - write_dict(bdf_file, my_dict, size, is_double, is_long_ids)
+  - write_dict(bdf_file, my_dict, size, is_double, is_long_ids, nworkers=1)
   - write_aero_in_flutter, write_aero_in_gust = find_aero_location(model)
   - ptype_to_pid, property_type_to_property_class, ...
         properties_by_class = get_properties_by_element_type(model)
@@ -11,19 +11,17 @@ from __future__ import annotations
 from collections import defaultdict
 from typing import Any, TYPE_CHECKING
 
+from pyNastran.bdf.bdf_interface.parallel_writer import write_cards
+
 if TYPE_CHECKING:  # pragma: no cover
     from pyNastran.bdf.bdf import BDF
 
 
 def write_dict(bdf_file, my_dict: dict[int, Any], size: int,
-               is_double: bool, is_long_ids: bool) -> None:
+               is_double: bool, is_long_ids: bool, nworkers: int=1) -> None:
     """writes a dictionary that may require long format"""
-    if is_long_ids:
-        for (unused_nid, node) in sorted(my_dict.items()):
-            bdf_file.write(node.write_card_16(is_double))
-    else:
-        for (unused_nid, node) in sorted(my_dict.items()):
-            bdf_file.write(node.write_card(size, is_double))
+    cards = [card for (unused_id, card) in sorted(my_dict.items())]
+    write_cards(bdf_file, cards, size, is_double, is_long_ids, nworkers=nworkers)
 
 
 def find_aero_location(model: BDF) -> tuple[bool, bool]:
@@ -3117,64 +3117,40 @@ def transform_coords_vectorized(cps_to_check0, icp_transform,
     cps_to_check = []
     cps_checked = []
     nids_checked = []
+    cps_to_transform = []
     assert len(cps_to_check0) > 0, cps_to_check0
     for cp in cps_to_check0:
         if cp == 0:
             if 0 in icp_transform:
                 inode = icp_transform[cp]
                 nids_checked.append(nids[inode])
-                #print("  cp=%s used in a transform (CORD2R)...done" % (cp))
-            #else:
-                #print("  cp=%s not used in a transform (CORD2R)...done" % (cp))
-            #print('***nids_checked=%s' % nids[inode])
-            #xyz_cid0[inode, :] = xyz_cp[inode, :]
             continue
 
         coord = coords[cp]
-        origin = coord.origin
-
-        if origin is None:
+        if coord.origin is None:
             # the coord has not been xref'd, so add it to cps_to_check
-            #if self.is_bdf_vectorized:
-                #assert in_place is False, 'in_place=%r must be False for vectorized' % in_place
-            #else:
-                #raise RuntimeError('you must cross-reference the nodes')
-
             cps_to_check.append(cp)
             if cp in icp_transform:
                 inode = icp_transform[cp]
                 xyz_cid0[inode, :] = np.nan
-            #print("  cp=%s used, but not done (%s)..." % (cp, coord.type))
             continue
 
         cps_checked.append(cp)
-        #is_beta = np.diagonal(beta).min() != 1.
-        #is_origin = np.abs(coord.origin).max() != 0.
-
         if cp not in icp_transform:
             # we may need coordinate system, but it's not explicitly used
             # in the list of GRID CP coordinate systems
-            #print("  cp=%s not used in a transform (%s)...done" % (cp, coord.type))
             continue
-
-        beta = coord.beta()
-        inode = icp_transform[cp]
-        nids_checked.append(nids[inode])
-        #print('***nids_checked=%s' % nids[inode])
-        xyzi = coord.coord_to_xyz_array(xyz_cp[inode, :])
-        #try:
-        new = xyzi @ beta + origin
-        #except TypeError:
-            #msg = 'Bad Math...\n'
-            #msg += '%s\n' % coord.rstrip()
-            #msg += '  origin = %s\n' % origin
-            #msg += '  i = %s\n' % coord.i
-            #msg += '  j = %s\n' % coord.j
-            #msg += '  k = %s\n' % coord.k
-            #msg += '  beta = \n%s' % beta
-            #self.log.error(msg)
-            #raise
-
+        cps_to_transform.append(cp)
+        nids_checked.append(nids[icp_transform[cp]])
+
+    if cps_to_transform:
+        # transform the nodes of all the coordinate systems at once
+        inodes = [icp_transform[cp] for cp in cps_to_transform]
+        inode = np.hstack(inodes)
+        icoord = np.repeat(np.arange(len(inodes)),
+                           [len(inodei) for inodei in inodes])
+        new = transform_coords_to_global_array(
+            [coords[cp] for cp in cps_to_transform], xyz_cp[inode, :], icoord)
         xyz_cid0[inode, :] = new
         if do_checks and not np.array_equal(xyz_cid0_correct[inode, :], new):
             msg = ('xyz_cid0:\n%s\n'
@@ -3183,10 +3159,6 @@ def transform_coords_vectorized(cps_to_check0, icp_transform,
                                  inode))
             raise ValueError(msg)
 
-        #elif is_beta:
-            #xyz_cid0[inode, :] = xyzi @ beta
-        #else:
-            #xyz_cid0[inode, :] = xyzi + coord.origin
     #print('nids_checkedA =', nids_checked)
     if len(nids_checked) == 0:
         pass
@@ -3200,6 +3172,162 @@ def transform_coords_vectorized(cps_to_check0, icp_transform,
     cps_to_check.sort()
     return nids_checked, cps_checked, cps_to_check
 
+
+def get_coord_arrays(coords: list[Coord]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Stacks the coordinate systems for the batched transforms
+
+    Parameters
+    ----------
+    coords : list[Coord]
+        the coordinate systems; must be setup
+
+    Returns
+    -------
+    origins : (ncoords, 3) float ndarray
+        the origins in the global frame
+    betas : (ncoords, 3, 3) float ndarray
+        the local to global transforms (see Coord.beta)
+    coord_types : (ncoords, ) str ndarray
+        the type of the coordinate system ('R', 'C', 'S')
+
+    """
+    ncoords = len(coords)
+    origins = np.zeros((ncoords, 3), dtype='float64')
+    betas = np.zeros((ncoords, 3, 3), dtype='float64')
+    coord_types = np.full(ncoords, 'R')
+    for icoord, coord in enumerate(coords):
+        if isinstance(coord, CylindricalCoord):
+            coord_types[icoord] = 'C'
+        elif isinstance(coord, SphericalCoord):
+            coord_types[icoord] = 'S'
+        elif not isinstance(coord, RectangularCoord):
+            raise NotImplementedError(f'coord_type={coord.type}\n{coord}')
+
+        if coord.cid == 0:
+            betas[icoord, :, :] = np.eye(3)
+        else:
+            origins[icoord, :] = coord.origin
+            betas[icoord, 0, :] = coord.i
+            betas[icoord, 1, :] = coord.j
+            betas[icoord, 2, :] = coord.k
+    return origins, betas, coord_types
+
+
+def transform_coords_to_global_array(coords: list[Coord], xyz: np.ndarray,
+                                     icoord: np.ndarray) -> np.ndarray:
+    r"""
+    Transforms points that are defined in many coordinate systems to
+    the global frame (see Coord.transform_node_to_global_array).
+
+    The coordinate systems are stacked, so there is one transform per
+    type (R/C/S) instead of one per coordinate system.
+
+    .. math:: p_{global} = (p_{coord})[\beta] + p_{origin}
+
+    Parameters
+    ----------
+    coords : list[Coord]
+        the coordinate systems; must be setup
+    xyz : (n, 3) float ndarray
+        the points in their local frame (e.g., R-theta-z)
+    icoord : (n, ) int ndarray
+        the index of the coordinate system in coords for each point
+
+    Returns
+    -------
+    xyz_global : (n, 3) float ndarray
+        the points in the global frame
+
+    """
+    origins, betas, coord_types = get_coord_arrays(coords)
+    xyz_coord = np.array(xyz, dtype='float64').reshape(len(icoord), 3)
+    point_types = coord_types[icoord]
+    for coord_type, coord_to_xyz_array in (('C', rtz_to_xyz_array),
+                                           ('S', rtp_to_xyz_array)):
+        ipoint = np.where(point_types == coord_type)[0]
+        if len(ipoint):
+            xyz_coord[ipoint, :] = coord_to_xyz_array(xyz_coord[ipoint, :])
+    xyz_global = np.einsum('ni,nij->nj', xyz_coord, betas[icoord, :, :]) + origins[icoord, :]
+    return xyz_global
+
+
+def setup_coords(coords: dict[int, Coord]) -> None:
+    """
+    Sets up the coordinate systems (see Coord.setup)
+
+    The CORD2x coordinate systems are set up in order of their
+    reference coordinate systems (RID), so the coordinate systems of
+    each level are set up at once with transform_coords_to_global_array.
+    The other coordinate systems (e.g., CORD1x, a CORD2x that references
+    a CORD1x) are set up one at a time after the CORD2x.
+
+    Parameters
+    ----------
+    coords : dict[cid] = Coord
+        the cross-referenced coordinate systems
+
+    """
+    if 0 in coords:
+        coords[0].setup()
+    resolved_cids = {0}
+    cord2s = {cid: coord for cid, coord in coords.items()
+              if cid != 0 and coord.type in {'CORD2R', 'CORD2C', 'CORD2S'}}
+    while cord2s:
+        level = [coord for coord in cord2s.values() if coord.rid in resolved_cids]
+        if not level:
+            break
+        _setup_cord2x_level(level)
+        for coord in level:
+            resolved_cids.add(coord.cid)
+            del cord2s[coord.cid]
+
+    # circular references are caught by Coord.setup
+    for cid, coord in coords.items():
+        if cid not in resolved_cids:
+            coord.setup()
+
+
+def _setup_cord2x_level(coords: list[Coord]) -> None:
+    """sets up CORD2x coordinate systems with set up reference coordinate systems"""
+    e123 = np.array([(coord.e1, coord.e2, coord.e3) for coord in coords],
+                    dtype='float64')
+    rids = np.array([coord.rid for coord in coords])
+    ilocal = np.where(rids != 0)[0]
+    if len(ilocal):
+        rid_refs = [coords[i].rid_ref for i in ilocal]
+        e123[ilocal, :, :] = transform_coords_to_global_array(
+            rid_refs, e123[ilocal, :, :].reshape(len(ilocal) * 3, 3),
+            np.repeat(np.arange(len(ilocal)), 3)).reshape(len(ilocal), 3, 3)
+
+    e1 = e123[:, 0, :]
+    e12 = e123[:, 1, :] - e1
+    e13 = e123[:, 2, :] - e1
+    norm_k = np.linalg.norm(e12, axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        k = e12 / norm_k[:, np.newaxis]
+        j = np.cross(k, e13)
+        norm_j = np.linalg.norm(j, axis=1)
+        j /= norm_j[:, np.newaxis]
+    i = np.cross(j, k)
+
+    is_valid = (norm_k > 0.) & (norm_j > 0.)
+    for icoord, coord in enumerate(coords):
+        if not is_valid[icoord]:
+            # raises the InvalidUnitVectorError
+            coord.setup()
+            continue
+        if not coord.is_resolved:
+            rid_trace = list(coord.rid_ref.rid_trace)
+            if coord.rid not in rid_trace:
+                rid_trace.append(coord.rid)
+            coord.rid_trace = rid_trace
+        coord.origin = e1[icoord, :].copy()
+        coord.i = i[icoord, :]
+        coord.j = j[icoord, :]
+        coord.k = k[icoord, :]
+
+
 def setup_add_axes(cid: int, coord_type: str, rid: int=0, origin=None,
                    xaxis=None, yaxis=None, zaxis=None,
                    xyplane=None, yzplane=None, xzplane=None,) -> tuple[np.ndarray, np.ndarray,
@@ -7,7 +7,7 @@ The capitalization of the sub-functions is important.
 """
 from __future__ import annotations
 import re
-from typing import Any, Optional, TYPE_CHECKING
+from typing import Any, Callable, Optional, TYPE_CHECKING
 import numpy as np
 from numpy import (
     cos, sin, tan, log, log10, mean, exp, sqrt, square, mod, abs, sum,
@@ -138,6 +138,96 @@ def _get_ta(f: float) -> float:
     ta2 = k1 * f**4 / ((f**2 + p1**2)**2 * (f**2 + p4**2)**2)
     return ta1, ta2
 
+def _stack_args(args) -> np.ndarray:
+    """broadcasts the arguments of an array function to (nargs, ...)"""
+    return np.stack(np.broadcast_arrays(*args))
+
+def max_array(*args) -> np.ndarray:
+    """maximum of the arguments for every entry of the arrays"""
+    return _stack_args(args).max(axis=0)
+
+def min_array(*args) -> np.ndarray:
+    """minimum of the arguments for every entry of the arrays"""
+    return _stack_args(args).min(axis=0)
+
+def sum_array(*args) -> np.ndarray:
+    """sum of the arguments for every entry of the arrays"""
+    return _stack_args(args).sum(axis=0)
+
+def rss_array(*args) -> np.ndarray:
+    """2-norm of the arguments for every entry of the arrays"""
+    return np.sqrt(ssq_array(*args))
+
+def avg_array(*args) -> np.ndarray:
+    """average of the arguments for every entry of the arrays"""
+    return _stack_args(args).mean(axis=0)
+
+def ssq_array(*args) -> np.ndarray:
+    """sum of squares of the arguments for every entry of the arrays"""
+    return np.square(_stack_args(args)).sum(axis=0)
+
+def dim_array(x, y) -> np.ndarray:
+    """positive difference for every entry of the arrays"""
+    return x - np.minimum(x, y)
+
+def db_array(p, pref) -> np.ndarray:
+    """sound pressure in decibels for every entry of the arrays"""
+    return db(np.asarray(p), pref)
+
+def dba_array(p, pref, f) -> np.ndarray:
+    """sound pressure in decibels (perceived) for every entry of the arrays"""
+    return dba(np.asarray(p), pref, np.asarray(f))
+
+# the functions that reduce over their arguments (e.g., rss(a, b, c))
+# must be replaced to evaluate a DEQATN on arrays; the other functions
+# are numpy ufuncs
+ARRAY_FUNCTIONS = {
+    'max': max_array,
+    'min': min_array,
+    'sum': sum_array,
+    'rss': rss_array,
+    'avg': avg_array,
+    'ssq': ssq_array,
+    'dim': dim_array,
+    'db': db_array,
+    'dba': dba_array,
+}
+
+# the DEQATN functions for evaluate_array, which are only compiled
+# once per process; the key is the python function (so the equation
+# and the DTABLE defaults)
+_ARRAY_FUNCTION_CACHE: dict[str, Callable[..., np.ndarray]] = {}
+
+def get_array_function(func_name: str, func_str: str) -> Callable[..., np.ndarray]:
+    """
+    Compiles a DEQATN function from ``fortran_to_python`` with the
+    array versions of the functions (e.g., max, rss), so it can be
+    evaluated on arrays.
+
+    Parameters
+    ----------
+    func_name : str
+        the name of the function
+    func_str : str
+        the python function
+
+    Returns
+    -------
+    func : Callable
+        the function; the arguments may be floats or arrays
+
+    """
+    try:
+        return _ARRAY_FUNCTION_CACHE[func_str]
+    except KeyError:
+        pass
+    namespace = dict(globals())
+    namespace.update(ARRAY_FUNCTIONS)
+    exec(func_str, namespace)
+    func = namespace[func_name]
+    _ARRAY_FUNCTION_CACHE[func_str] = func
+    return func
+
 # we'll add _ to the beginning of these variables
 BUILTINS = ['del', 'eval', 'yield', 'async', 'await', 'property',
             'slice', 'filter', 'map']
@@ -199,6 +289,7 @@ class DEQATN(BaseCard):  # needs work...
         self.func_str = ''
         self.func_name = ''
         self.nargs = 0
+        self._array_func = None
 
     @classmethod
     def _init_from_empty(cls):
@@ -286,6 +377,7 @@ class DEQATN(BaseCard):  # needs work...
         #print(func)
         self.func = func
         self.nargs = nargs
+        self._array_func = None
 
     def cross_reference(self, model: BDF) -> None:
         """
@@ -315,6 +407,7 @@ class DEQATN(BaseCard):  # needs work...
         del self.func_name
         del self.nargs
         del self.dtable, self.dtable_ref
+        self._array_func = None
 
     def _verify(self, xref: bool) -> None:
         pass
@@ -331,6 +424,62 @@ class DEQATN(BaseCard):  # needs work...
         return self.func(*args)
         #self.func(*args)
 
+    def evaluate_array(self, *args, **arrays) -> np.ndarray:
+        """
+        Evaluates the equation on arrays (e.g., a response for every
+        element) instead of calling ``evaluate`` for every value.
+
+        Parameters
+        ----------
+        args : float / ndarray
+            the arguments in the order of the function header
+        arrays : dict[str, float / ndarray]
+            the arguments by name (e.g., t1=array([1., 2.]))
+
+        Returns
+        -------
+        value : ndarray
+            the value of the equation, which has the broadcast shape
+            of the arguments
+
+        .. code-block:: python
+
+           >>> deqatn = DEQATN(1000, ['maxdiff(t1,t2)=abs(t2-t1)/t1'])
+           >>> deqatn.cross_reference(model)
+           >>> deqatn.evaluate_array(t1=np.array([1., 2.]), t2=4.)
+           array([3., 1.])
+
+        The equation is compiled the first time it's evaluated and is
+        shared with any other DEQATN with the same equation.
+
+        """
+        if self._array_func is None:
+            dtable_ref = self.dtable_ref if 'dtable_ref' in self.__dict__ else None
+            func_name, unused_nargs, func_str = _setup_deqatn(
+                self.equation_id, self.eqs, dtable_ref, '')
+            self._array_func = get_array_function(func_name, func_str)
+
+        args = [np.asarray(arg, dtype='float64') for arg in args]
+        kwargs = {}
+        for name, value in arrays.items():
+            name = name.lower()
+            if name in BUILTINS:
+                name = '_' + name
+            kwargs[name] = np.asarray(value, dtype='float64')
+
+        try:
+            value = np.asarray(self._array_func(*args, **kwargs))
+        except TypeError:
+            # the equation can't be broadcast (e.g., int(x) only takes a
+            # scalar), so it's evaluated one value at a time
+            func = np.vectorize(self._array_func, otypes=['float64'])
+            value = func(*args, **kwargs)
+        shape = np.broadcast_shapes(*[arg.shape for arg in args + list(kwargs.values())])
+        if value.shape != shape:
+            # a constant (e.g., f(x)=1.)
+            value = np.broadcast_to(value, shape).copy()
+        return value
+
     def raw_fields(self) -> list[str]:
         return [self.write_card()]
 
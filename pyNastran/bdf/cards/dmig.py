@@ -1,7 +1,7 @@
 # pylint: disable=R0902,R0904,R0914
 from __future__ import annotations
 from copy import deepcopy
-from math import sin, cos, radians, atan2, sqrt, degrees
+from math import atan2, sqrt, degrees
 from itertools import count
 import warnings
 from typing import Any, TYPE_CHECKING
@@ -12,9 +12,11 @@ from scipy.sparse import coo_matrix  # type: ignore
 from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.femutils.utils import unique2d
 from pyNastran.bdf.cards.base_card import BaseCard
-from pyNastran.bdf.field_writer_8 import print_card_8
-from pyNastran.bdf.field_writer_16 import print_card_16
+from pyNastran.bdf.field_writer_8 import print_card_8, print_field_8
+from pyNastran.bdf.field_writer_16 import print_card_16, print_field_16
 from pyNastran.bdf.field_writer_double import print_card_double
+from pyNastran.bdf.field_writer_array import (
+    print_float_8_array, print_float_16_array, print_scientific_double_array)
 
 from pyNastran.bdf.bdf_interface.assign_type import (
     integer, integer_or_blank, double, string, string_or_blank,
@@ -452,6 +454,10 @@ class NastranMatrix(BaseCard):
             assert self.tout in [0, 3, 4], f'tin={self.tout!r} and must 0, 3 or 4 to be complex'
         assert isinstance(matrix_form, integer_types), 'matrix_form=%r type=%s' % (matrix_form, type(matrix_form))
         assert not isinstance(matrix_form, bool), 'matrix_form=%r type=%s' % (matrix_form, type(matrix_form))
+
+        # the (GCj, GCi, Real, Complex) arrays of the columns from
+        # ``_add_column``; they're stacked by ``finalize``
+        self._column_blocks = []
         if finalize:
             self.finalize()
 
@@ -551,12 +557,29 @@ class NastranMatrix(BaseCard):
 
     def finalize(self):
         """converts the lists into numpy arrays"""
+        if self._column_blocks:
+            self._stack_column_blocks()
         self.GCi = np.asarray(self.GCi)
         self.GCj = np.asarray(self.GCj)
         self.Real = np.asarray(self.Real)
         if self.is_complex:
             self.Complex = np.asarray(self.Complex)
 
+    def _stack_column_blocks(self) -> None:
+        """appends the columns from ``_add_column`` to the arrays"""
+        GCj, GCi, reals, complexs = (list(arrays) for arrays in zip(*self._column_blocks))
+        if len(self.Real):
+            GCj.insert(0, np.asarray(self.GCj))
+            GCi.insert(0, np.asarray(self.GCi))
+            reals.insert(0, np.asarray(self.Real))
+            complexs.insert(0, np.asarray(self.Complex) if self.is_complex else None)
+        self.GCj = np.vstack(GCj)
+        self.GCi = np.vstack(GCi)
+        self.Real = np.hstack(reals)
+        if self.is_complex:
+            self.Complex = np.hstack(complexs)
+        self._column_blocks = []
+
     @property
     def shape(self):
         """gets the matrix shape"""
@@ -605,38 +628,43 @@ class NastranMatrix(BaseCard):
         #print("nloops = %i" % nloops)
         assert nloops > 0, 'nloops=%s' % nloops
 
-        for i in range(nloops):
-            self.GCj.append((Gj, Cj))
+        terms = _get_column_terms(card, nloops, self.is_complex)
+        if terms is None:
+            terms = self._read_column_terms(card, nloops)
+        GCi, reals, complexs = terms
+        if self.is_complex and self.is_polar:
+            magnitudes = reals
+            phases = np.radians(complexs)
+            reals = magnitudes * np.cos(phases)
+            complexs = magnitudes * np.sin(phases)
+
+        GCj = np.full((len(reals), 2), (Gj, Cj), dtype=GCi.dtype)
+        self._column_blocks.append((GCj, GCi, reals, complexs))
+
+    def _read_column_terms(self, card: BDFCard,
+                           nloops: int) -> tuple[np.ndarray, np.ndarray, np.ndarray | None]:
+        """
+        Reads the (Gi, Ci, Ai, Bi) terms of a column field by field
 
+        This is the slow form of ``_get_column_terms``, which checks
+        the fields.
+        """
+        GCi = []
+        reals = []
+        complexs = []
         if self.is_complex:
-            if self.is_polar:
-                for i in range(nloops):
-                    n = 5 + 4 * i
-                    Gi = integer(card, n, 'Gi')
-                    # Ci = integer(card, n + 1, 'Ci')
-                    Ci = integer_or_blank(card, n + 1, 'Ci', 0)
-                    #Ci = parse_components(card, n + 1, 'Ci')
-                    assert 0 <= Ci <= 6, 'C%i must be between [0, 6]; Ci=%s' % (i + 1, Ci)
-                    self.GCi.append((Gi, Ci))
-                    magi = double(card, n + 2, 'ai')
-                    phasei = double(card, n + 3, 'bi')
-                    reali = magi * cos(radians(phasei))
-                    complexi = magi * sin(radians(phasei))
-                    self.Real.append(reali)
-                    self.Complex.append(complexi)
-            else:
-                for i in range(nloops):
-                    n = 5 + 4 * i
-                    Gi = integer(card, n, 'Gi')
-                    # Ci = integer(card, n + 1, 'Ci')
-                    Ci = integer_or_blank(card, n + 1, 'Ci', 0)
-                    #Ci = parse_components(card, n + 1, 'Ci')
-                    assert 0 <= Ci <= 6, 'C%i must be between [0, 6]; Ci=%s' % (i + 1, Ci)
-                    self.GCi.append((Gi, Ci))
-                    reali = double(card, n + 2, 'real')
-                    complexi = double(card, n + 3, 'complex')
-                    self.Real.append(reali)
-                    self.Complex.append(complexi)
+            # the magnitude/phase is converted by _add_column
+            real_name, complex_name = ('ai', 'bi') if self.is_polar else ('real', 'complex')
+            for i in range(nloops):
+                n = 5 + 4 * i
+                Gi = integer(card, n, 'Gi')
+                # Ci = integer(card, n + 1, 'Ci')
+                Ci = integer_or_blank(card, n + 1, 'Ci', 0)
+                #Ci = parse_components(card, n + 1, 'Ci')
+                assert 0 <= Ci <= 6, 'C%i must be between [0, 6]; Ci=%s' % (i + 1, Ci)
+                GCi.append((Gi, Ci))
+                reals.append(double(card, n + 2, real_name))
+                complexs.append(double(card, n + 3, complex_name))
         else:
             # real
             for i in range(nloops):
@@ -647,14 +675,13 @@ class NastranMatrix(BaseCard):
                 #Ci = parse_components(card, n + 1, 'Ci')
                 assert 0 <= Ci <= 6, 'C%i must be between [0, 6]; Ci=%s' % (i + 1, Ci)
                 reali = double(card, n + 2, 'real')
-                self.GCi.append((Gi, Ci))
-                self.Real.append(reali)
+                GCi.append((Gi, Ci))
+                reals.append(reali)
                 #print("GC=%s,%s real=%s" % (Gi, Ci, reali))
 
-        msg = '(len(GCj)=%s len(GCi)=%s' % (len(self.GCj), len(self.GCi))
-        assert len(self.GCj) == len(self.GCi), msg
-        #if self.is_complex:
-            #self.Complex(double(card, v, 'complex')
+        complex_array = np.array(complexs, dtype='float64') if self.is_complex else None
+        return (np.array(GCi, dtype='int64'), np.array(reals, dtype='float64'),
+                complex_array)
 
     def get_matrix(self, is_sparse: bool=False,
                    apply_symmetry: bool=True) -> tuple[np.ndarray | scipy.coomatrix,
@@ -801,6 +828,23 @@ class NastranMatrix(BaseCard):
                 size = 16
             del Gi, Gj
 
+        GCi = np.asarray(self.GCi)
+        GCj = np.asarray(self.GCj)
+        values = [np.asarray(self.Real)]
+        if self.is_complex:
+            values.append(np.asarray(self.Complex))
+        if (GCi.ndim == 2 and GCi.dtype.kind in 'iu' and GCj.dtype.kind in 'iu' and
+                all(value.dtype.name == 'float64' for value in values)):
+            if self.is_polar:
+                reals, complexs = values
+                magnitudes = np.sqrt(reals ** 2 + complexs ** 2)
+                with np.errstate(invalid='ignore'):
+                    phases = np.where(reals == 0.0, 0.0, np.degrees(np.arctan2(complexs, reals)))
+                values = [magnitudes, phases]
+            msg += _write_matrix_terms(self.type, self.name, GCj, GCi, values,
+                                       size, is_double)
+            return msg
+
         if self.is_complex:
             if self.is_polar:
                 for (GCi, GCj, reali, complexi) in zip(self.GCi, self.GCj, self.Real, self.Complex):
@@ -846,6 +890,77 @@ class NastranMatrix(BaseCard):
         #assert isinstance(self.Real[0], (list, np.ndarray)), msg
         return msg
 
+def _get_column_terms(card: BDFCard, nterms: int,
+                      is_complex: bool) -> tuple[np.ndarray, np.ndarray, np.ndarray | None] | None:
+    """
+    Parses the (Gi, Ci, Ai, Bi) terms of a DMIG, DMIJ, DMIJI or DMIK
+    column with array operations.
+
+    Returns None if a field isn't a plain integer/float string (e.g.,
+    a blank Gi or an integer value), so ``_read_column_terms`` can
+    check the card.
+    """
+    fields = card[5:5 + 4 * nterms]
+    fields.extend([None] * (4 * nterms - len(fields)))
+    sgi = np.array(fields[0::4])
+    sci = np.array([field if field is not None else '0' for field in fields[1::4]])
+    sreal = np.array(fields[2::4])
+    svalues = [sreal]
+    if is_complex:
+        svalues.append(np.array(fields[3::4]))
+    if any(array.dtype.kind != 'U' for array in [sgi, sci] + svalues):
+        return None
+
+    try:
+        GCi = np.column_stack([sgi.astype('int64'), sci.astype('int64')])
+    except ValueError:
+        return None
+    Ci = GCi[:, 1]
+    if Ci.min() < 0 or Ci.max() > 6:
+        return None
+
+    values = []
+    for ifield0, fieldname, svaluesi in zip([7, 8], ['real', 'complex'], svalues):
+        if np.char.isdigit(svaluesi).any():
+            # an integer
+            return None
+        try:
+            valuesi = svaluesi.astype('float64')
+        except ValueError:
+            # 1.0-3, 1.0D+3
+            valuesi = np.array([double(card, ifield0 + 4 * i, fieldname)
+                                for i in range(nterms)])
+        values.append(valuesi)
+
+    complexs = values[1] if is_complex else None
+    return GCi, values[0], complexs
+
+
+def _write_matrix_terms(card_type: str, name: str,
+                        GCj: np.ndarray, GCi: np.ndarray, values: list[np.ndarray],
+                        size: int, is_double: bool) -> str:
+    """
+    Writes the terms of a DMIG, DMIJ, DMIJI or DMIK with one card per
+    term, which is the same as print_card_8/16/double on each term.
+    The floats are written with the array field writers.
+    """
+    if size == 8:
+        fmt = '%-8s%s' % (card_type, print_field_8(name)) + '%8d%8d        %8d%8d%s%s\n'
+        print_float_array = print_float_8_array
+    else:
+        fmt = '%-8s%s' % (card_type + '*', print_field_16(name)) + '%16d%16d\n*       %16d%16d%s%s\n'
+        print_float_array = print_scientific_double_array if is_double else print_float_16_array
+
+    real_fields = print_float_array(values[0])
+    if len(values) == 2:
+        complex_fields = print_float_array(values[1])
+    else:
+        complex_fields = [''] * len(real_fields)
+    terms = zip(GCj[:, 0].tolist(), GCj[:, 1].tolist(), GCi[:, 0].tolist(), GCi[:, 1].tolist(),
+                real_fields, complex_fields)
+    return ''.join([fmt % term for term in terms])
+
+
 def _determine_size_double_from_tin(tin: int,
                                     size: int, is_double: bool) -> tuple[int, bool]:
     """
@@ -2327,6 +2442,24 @@ def _get_row_col_map_1d(matrix, GCi, GCj, ifo: int):
 
 def _get_row_col_map_2d(matrix, GCi, GCj, ifo):
     """helper for ``get_row_col_map``"""
+    if GCi.dtype.kind in 'iu' and GCj.dtype.kind in 'iu':
+        if ifo == 6:
+            # symmetric
+            unused_index, rows_array = _unique_gc(np.vstack([GCi, GCj]))
+            cols_array = rows_array
+        else:
+            unused_index, rows_array = _unique_gc(GCi)
+            unused_index, cols_array = _unique_gc(GCj)
+        rows_reversed = dict(enumerate(map(tuple, rows_array.tolist())))
+        rows = {gc: i for i, gc in rows_reversed.items()}
+        if ifo == 6:
+            cols = rows
+            cols_reversed = rows_reversed
+        else:
+            cols_reversed = dict(enumerate(map(tuple, cols_array.tolist())))
+            cols = {gc: j for j, gc in cols_reversed.items()}
+        return rows, cols, rows_reversed, cols_reversed
+
     rows = {}
     rows_reversed = {}
 
@@ -2460,8 +2593,39 @@ def _build_gc_map(GC: np.ndarray) -> dict[tuple[int, int], int]:
         i += 1
     return gc_map
 
+def _unique_gc(GC: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Gets the unique (grid, component) pairs in the order they first
+    appear, which is the order of the rows/columns of the matrix
+
+    Returns
+    -------
+    index : (n, ) int ndarray
+        the index of each GC into unique_gc
+    unique_gc : (nunique, 2) int ndarray
+        the unique (grid, component) pairs
+
+    """
+    if len(GC) and GC[:, 0].min() >= 0 and GC[:, 1].min() >= 0 and GC[:, 1].max() < 8:
+        # sorting an int is faster than sorting the rows
+        key = GC[:, 0].astype('int64') * 8 + GC[:, 1]
+        unused_key, ifirst, inverse = np.unique(key, return_index=True, return_inverse=True)
+    else:
+        unused_gc, ifirst, inverse = np.unique(
+            GC, axis=0, return_index=True, return_inverse=True)
+    iorder = np.argsort(ifirst)
+    nunique = len(iorder)
+    rank = np.empty(nunique, dtype='int32')
+    rank[iorder] = np.arange(nunique, dtype='int32')
+    index = rank[inverse.ravel()]
+    return index, GC[ifirst[iorder], :]
+
 def gc_to_index(GC: np.ndarray) -> tuple[np.ndarray, int]:
     """helper method for ``_fill_sparse_matrix``"""
+    if GC.dtype.kind in 'iu':
+        index, unique_gc = _unique_gc(GC)
+        return index, len(unique_gc)
+
     gc_map = _build_gc_map(GC)
     ngrid_map = len(gc_map)
     ngrid = GC.shape[0]
@@ -2785,24 +2949,37 @@ def get_matrix(self: DMIG,
         dictionary of keys=columnID, values=(Grid,Component) for the matrix
 
     """
-    nrows, ncols, ndim, rows, cols, rows_reversed, cols_reversed = get_row_col_map(
-        self, self.GCi, self.GCj, self.matrix_form)
-
-    #is_sparse = False
     if is_sparse:
         #assert isinstance(self, (DMIG, DMIK, DMIJI)), type(self)
-        M = _fill_sparse_matrix(self, nrows, ncols, apply_symmetry)
+        return _get_sparse_matrix(self, apply_symmetry)
+
+    nrows, ncols, ndim, rows, cols, rows_reversed, cols_reversed = get_row_col_map(
+        self, self.GCi, self.GCj, self.matrix_form)
+    if ndim == 1:
+        #assert isinstance(self, int), type(self)
+        M = _fill_dense_column_matrix(self, nrows, ncols, ndim, rows, cols, apply_symmetry)
+        assert isinstance(M, np.ndarray), type(M)
     else:
-        if ndim == 1:
-            #assert isinstance(self, int), type(self)
-            M = _fill_dense_column_matrix(self, nrows, ncols, ndim, rows, cols, apply_symmetry)
-            assert isinstance(M, np.ndarray), type(M)
-        else:
-            #assert isinstance(self, (DMIG, DMIK, DMIJ, DMIJI)), type(self)
-            M = _fill_dense_rectangular_matrix(self, nrows, ncols, ndim, rows, cols, apply_symmetry)
-            assert isinstance(M, np.ndarray), type(M)
+        #assert isinstance(self, (DMIG, DMIK, DMIJ, DMIJI)), type(self)
+        M = _fill_dense_rectangular_matrix(self, nrows, ncols, ndim, rows, cols, apply_symmetry)
+        assert isinstance(M, np.ndarray), type(M)
     return M, rows_reversed, cols_reversed
 
+def _get_sparse_matrix(matrix: DMIG,
+                       apply_symmetry: bool) -> tuple[coo_matrix,
+                                                      dict[int, Any],
+                                                      dict[int, Any]]:
+    """
+    Builds the sparse matrix for ``get_matrix``
+
+    The matrix isn't cached, so modifying GCi, GCj, Real or Complex
+    in place is picked up by the next call.
+    """
+    nrows, ncols, unused_ndim, unused_rows, unused_cols, rows_reversed, cols_reversed = get_row_col_map(
+        matrix, matrix.GCi, matrix.GCj, matrix.matrix_form)
+    sparse_matrix = _fill_sparse_matrix(matrix, nrows, ncols, apply_symmetry)
+    return sparse_matrix, rows_reversed, cols_reversed
+
 
 def _export_dmig_to_hdf5(h5_file, model: BDF, dict_obj, encoding: str) -> None:
     """export dmigs, dmij, dmiji, dmik, dmi"""
@@ -8,11 +8,12 @@ from io import StringIO
 from copy import deepcopy
 import unittest
 import numpy as np
+from cpylog import SimpleLogger
 from numpy import array, allclose, array_equal, cross
 
 from pyNastran.bdf.cards.coordinate_systems import (
     create_coords_along_line, get_nodes_along_axis_in_coords,
-    define_coord_e123,
+    define_coord_e123, setup_coords, transform_coords_to_global_array,
     CORD1R, CORD1C, CORD1S,
     CORD2R, CORD2C, #CORD2S,
     CORD3G)
@@ -1032,6 +1033,63 @@ class TestCoords(unittest.TestCase):
         make_monpnt1s_from_cids(model, nids, cids, cid_to_inids)
         #model.write_bdf('spike.bdf')
 
+    def test_setup_coords_batched(self):
+        """the batched coordinate system setup/transforms match Coord.setup"""
+        log = SimpleLogger(level='error')
+        model = BDF(log=log)
+        np.random.seed(42)
+        ncoords = 60
+        for cid in range(1, ncoords + 1):
+            # chain some of the coordinate systems to the earlier ones
+            rid = 0 if cid < 4 else int(np.random.randint(0, cid - 1))
+            origin = np.random.uniform(-10., 10., size=3)
+            zaxis = origin + np.random.uniform(-1., 1., size=3)
+            xzplane = origin + np.random.uniform(-1., 1., size=3)
+            add_cord2 = [model.add_cord2r, model.add_cord2c, model.add_cord2s][cid % 3]
+            add_cord2(cid, origin, zaxis, xzplane, rid=rid)
+        model.add_grid(1, [1., 2., 3.])
+        model.add_grid(2, [1., 2., 4.])
+        model.add_grid(3, [2., 2., 3.], cp=5)
+        model.add_cord1r(ncoords + 1, 1, 2, 3)
+        model.cross_reference()
+
+        # compare against the per-coordinate system setup
+        model2 = BDF(log=log)
+        add_cord2s = {'CORD2R': model2.add_cord2r, 'CORD2C': model2.add_cord2c,
+                      'CORD2S': model2.add_cord2s}
+        for cid, coord in model.coords.items():
+            if cid != 0 and coord.type in add_cord2s:
+                add_cord2s[coord.type](cid, coord.e1, coord.e2, coord.e3, rid=coord.rid)
+        for cid, coord in model2.coords.items():
+            if cid:
+                coord.rid_ref = model2.coords[coord.rid]
+        for cid in sorted(model2.coords):
+            model2.coords[cid].setup()
+
+        for cid, coord2 in model2.coords.items():
+            coord = model.coords[cid]
+            assert coord.rid_trace == coord2.rid_trace, (cid, coord.rid_trace, coord2.rid_trace)
+            assert allclose(coord.origin, coord2.origin), cid
+            assert allclose(coord.beta(), coord2.beta()), cid
+
+        coords = [model.coords[cid] for cid in range(ncoords + 1)]
+        xyz = np.random.uniform(1., 2., size=(3 * len(coords), 3))
+        icoord = np.repeat(np.arange(len(coords)), 3)
+        xyz_global = transform_coords_to_global_array(coords, xyz, icoord)
+        for i, xyzi in enumerate(xyz):
+            xyz_expected = coords[icoord[i]].transform_node_to_global(xyzi)
+            assert allclose(xyz_global[i, :], xyz_expected), i
+
+        # circular references are still found
+        model3 = BDF(log=log)
+        model3.add_cord2r(1, [0., 0., 0.], [0., 0., 1.], [1., 0., 0.], rid=2)
+        model3.add_cord2r(2, [0., 0., 0.], [0., 0., 1.], [1., 0., 0.], rid=1)
+        for coord in model3.coords.values():
+            if coord.cid:
+                coord.rid_ref = model3.coords[coord.rid]
+        with self.assertRaises(RuntimeError):
+            setup_coords(model3.coords)
+
     def test_matcid(self):
         """
         Tests whether the correct card format is specified, and whether the fields are correctly read and assigned
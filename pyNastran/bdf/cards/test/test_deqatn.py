@@ -510,6 +510,53 @@ class TestDEQATN(unittest.TestCase):
         ]
         model.add_card(deqatn_card, 'DEQATN', is_list=False)
 
+    def test_deqatn_evaluate_array(self):
+        """evaluate_array matches evaluate"""
+        model = BDF(debug=None)
+        model.add_deqatn(1, ['f(a,b,c)=max(a,b,c)-min(a,b)+rss(a,b,c)+avg(a,c)+ssq(b,c)+dim(a,b)'])
+        model.add_deqatn(2, [
+            'f1(A,B,C,D,R) = A+B *C-(D**3 + 10.0) + sin(PI(1) * R) + A**2 / (B - C)',
+            'F = A + B - F1 * D',
+        ])
+        model.add_deqatn(3, ['g(p,pref,f)=db(p,pref)+dba(p,pref,f)'])
+        model.add_deqatn(4, ['h(x,yield)=1.'])
+        model.add_deqatn(5, ['f(a,b,c)=max(a,b,c)-min(a,b)+rss(a,b,c)+avg(a,c)+ssq(b,c)+dim(a,b)'])
+        model.cross_reference()
+
+        rng = np.random.default_rng(42)
+        for deqatn in model.dequations.values():
+            args = [rng.random(20) + 1. for i in range(deqatn.nargs)]
+            values = deqatn.evaluate_array(*args)
+            values_expected = [deqatn.evaluate(*argsi) for argsi in zip(*args)]
+            assert values.shape == (20, ), values.shape
+            assert np.allclose(values, values_expected), deqatn.equation_id
+
+        # the arguments are broadcast and may be passed by name
+        deqatn = model.dequations[1]
+        values = deqatn.evaluate_array(a=np.ones((3, 1)), b=np.arange(4.), c=2.)
+        assert values.shape == (3, 4), values.shape
+        assert np.isclose(values[0, 0], deqatn.evaluate(1., 0., 2.))
+        values = model.dequations[4].evaluate_array(x=np.ones(3), YIELD=2.)
+        assert np.array_equal(values, [1., 1., 1.])
+
+        # the same equation is only compiled once
+        assert model.dequations[1]._array_func is model.dequations[5]._array_func
+
+    def test_deqatn_evaluate_array_scalar(self):
+        """an equation that can't be broadcast is evaluated one value at a time"""
+        model = BDF(debug=None)
+        model.add_deqatn(1, ['f(x)=int(x)'])
+        model.add_deqatn(2, ['f(x,y)=float(x)*2.+int(y)+max(x,y)'])
+        model.cross_reference()
+
+        x = np.array([-1.5, 0.5, 2.7])
+        values = model.dequations[1].evaluate_array(x)
+        assert np.array_equal(values, [-1., 0., 2.]), values
+        deqatn = model.dequations[2]
+        values = deqatn.evaluate_array(x, y=np.array([[1.2], [3.5]]))
+        assert values.shape == (2, 3), values.shape
+        assert np.isclose(values[1, 2], deqatn.evaluate(2.7, 3.5))
+
     def test_deqatn_bad_1(self):
         """checks that a function name is not an argument"""
         model = BDF(debug=None)
@@ -1,11 +1,16 @@
 import unittest
 import os
 import copy
+from math import sqrt, atan2, degrees
 import numpy as np
 
 import pyNastran
 from pyNastran.bdf.bdf import BDF, BDFCard, read_bdf, DMI, DMIG, fill_dmigs
 from pyNastran.bdf.cards.test.utils import save_load_deck, get_matrices
+from pyNastran.bdf.field_writer_8 import print_card_8
+from pyNastran.bdf.field_writer_16 import print_card_16
+from pyNastran.bdf.field_writer_double import print_card_double
+from pyNastran.bdf.cards.dmig import _determine_size_double_from_tin
 
 PKG_PATH = pyNastran.__path__[0]
 TEST_PATH = os.path.join(PKG_PATH, 'bdf', 'cards', 'test')
@@ -695,6 +700,79 @@ class TestDMIGReal(unittest.TestCase):
         get_matrices(model)
         #kaax = model.dmigs['KAAX'].get_matrix(is_sparse=True)
 
+    def test_dmig_arrays(self):
+        """tests the array based DMIG columns, sparse matrix and writer"""
+        model = BDF(debug=None, log=None, mode='msc')
+        model.add_card(['DMIG', 'REAL', '0', '6', '2', '0', None, None, '3'], 'DMIG')
+        model.add_card(['DMIG', 'REAL', '1', '1', None,
+                        '1', '1', '4.', None,
+                        '2', None, '2.0-3', None,
+                        '1', '3', '1.5D+1'], 'DMIG')
+        model.add_card(['DMIG', 'REAL', '1', '3', None,
+                        '1', '3', '-.5', None], 'DMIG')
+        model.add_card(['DMIG', 'POLE', '0', '2', '3', '0', '1', None, '1'], 'DMIG')
+        model.add_card(['DMIG', 'POLE', '1', '1', None,
+                        '1', '1', '2.', '90.',
+                        '2', None, '1.', '180.'], 'DMIG')
+        fill_dmigs(model)
+
+        real = model.dmig['REAL']
+        assert real.GCj.tolist() == [[1, 1], [1, 1], [1, 1], [1, 3]]
+        assert real.GCi.tolist() == [[1, 1], [2, 0], [1, 3], [1, 3]]
+        assert np.array_equal(real.Real, [4., 2e-3, 15., -0.5])
+        pole = model.dmig['POLE']
+        assert np.allclose(pole.Real, [0., -1.])
+        assert np.allclose(pole.Complex, [2., 0.])
+
+        A1, rows, cols = real.get_matrix(is_sparse=True, apply_symmetry=True)
+        assert rows == {0: (1, 1), 1: (2, 0), 2: (1, 3)}
+        A_expected = [
+            [4., 2e-3, 15.],
+            [2e-3, 0., 0.],
+            [15., 0., -0.5],
+        ]
+        assert np.allclose(A1.toarray(), A_expected)
+
+        # modifying the returned matrix/dicts doesn't change the next call
+        A1.data[:] = 0.
+        rows[0] = (100, 1)
+        A2, rows2, cols2 = real.get_matrix(is_sparse=True, apply_symmetry=True)
+        assert rows2 == {0: (1, 1), 1: (2, 0), 2: (1, 3)}
+        assert rows2 == cols2
+        assert np.allclose(A2.toarray(), A_expected)
+
+        # modifying or replacing the arrays is picked up
+        real.Real[0] = 1000.
+        A3 = real.get_matrix(is_sparse=True, apply_symmetry=True)[0]
+        assert A3.toarray()[0, 0] == 1000.
+        real.Real = 2 * real.Real
+        A4 = real.get_matrix(is_sparse=True, apply_symmetry=True)[0]
+        assert A4.toarray()[0, 0] == 2000.
+        assert np.allclose(A4.toarray()[1:, :], 2 * np.array(A_expected)[1:, :])
+        real.Real[0] = 0.
+        real.finalize()
+        A5 = real.get_matrix(is_sparse=True, apply_symmetry=True)[0]
+        assert A5.toarray()[0, 0] == 0.
+
+        # the writer matches writing each term with print_card
+        for matrix in [real, pole]:
+            for tin in [1, 2, 3, 4]:
+                if matrix.polar and tin < 3:
+                    continue
+                matrix.tin = tin
+                if tin > 2 and not hasattr(matrix, 'Complex'):
+                    matrix.Complex = -matrix.Real
+                for size, is_double in [(8, False), (16, False), (16, True)]:
+                    msg = matrix.write_card(size=size, is_double=is_double)
+                    msg_expected = _write_dmig_terms(matrix, size, is_double)
+                    assert msg == msg_expected, f'tin={tin} size={size}\n{msg}\n{msg_expected}'
+
+        # an integer value is checked by the field by field reader
+        model.add_card(['DMIG', 'BAD', '0', '2', '1', '0', None, None, '1'], 'DMIG')
+        model.add_card(['DMIG', 'BAD', '1', '1', None, '1', '1', '4'], 'DMIG')
+        with self.assertRaises(SyntaxError):
+            fill_dmigs(model)
+
     def test_dmig_uaccel(self):
         """tests DMIG,UACCEL"""
         model = BDF(debug=None)
@@ -728,6 +806,31 @@ class TestDMIGReal(unittest.TestCase):
 
 
 
+def _write_dmig_terms(matrix: DMIG, size: int, is_double: bool) -> str:
+    """writes a DMIG by calling print_card on each term"""
+    size, is_double = _determine_size_double_from_tin(matrix.tin, size, is_double)
+    list_fields = [matrix.type, matrix.name, 0, matrix.matrix_form, matrix.tin,
+                   matrix.tout, matrix.polar, None, matrix.ncols]
+    msg = '\n$' + '-' * 80 + '\n$ %s Matrix %s\n' % (matrix.type, matrix.name)
+    msg += print_card_8(list_fields) if size == 8 else print_card_16(list_fields)
+    complexs = matrix.Complex if matrix.is_complex else [None] * len(matrix.Real)
+    for GCi, GCj, reali, complexi in zip(matrix.GCi.tolist(), matrix.GCj.tolist(),
+                                         matrix.Real.tolist(), complexs):
+        if matrix.is_complex and matrix.is_polar:
+            magi = sqrt(reali**2 + complexi**2)
+            phasei = 0.0 if reali == 0.0 else degrees(atan2(complexi, reali))
+            reali, complexi = magi, phasei
+        list_fields = [matrix.type, matrix.name, GCj[0], GCj[1],
+                       None, GCi[0], GCi[1], reali, complexi]
+        if size == 8:
+            msg += print_card_8(list_fields)
+        elif is_double:
+            msg += print_card_double(list_fields)
+        else:
+            msg += print_card_16(list_fields)
+    return msg
+
+
 class TestDMIGImag(unittest.TestCase):
     def test_dmig_1(self):
         model = BDF(debug=False)
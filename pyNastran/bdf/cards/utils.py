@@ -78,20 +78,11 @@ def wipe_empty_fields(card: list[Union[str, int, float, None]]) -> list[Union[st
         the card with no trailing blank fields
 
     """
-    short_card = []  # type: list[Union[str, int, float, None]]
-    for field in card:
-        if isinstance(field, str):
-            field = field.strip()
-            if field == '':
-                short_card.append(None)
-            else:
-                short_card.append(field)
-        else:
-            short_card.append(field)
-
-    imax = 0
-    for i, field in enumerate(card):
-        if short_card[i] is not None:
-            imax = i
+    short_card = [(field.strip() or None) if isinstance(field, str) else field
+                  for field in card]  # type: list[Union[str, int, float, None]]
+
+    imax = len(short_card) - 1
+    while imax > 0 and short_card[imax] is None:
+        imax -= 1
     out = short_card[:imax + 1]
     return out
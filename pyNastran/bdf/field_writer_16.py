@@ -3,12 +3,13 @@ Defines functions for single precision 16 character field writing.
 """
 import sys
 import warnings
+from functools import lru_cache
 from typing import Optional, Any
 from numpy import float32, isnan  # type: ignore
 
 from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.bdf.cards.utils import wipe_empty_fields
-from pyNastran.bdf.field_writer_8 import set_blank_if_default
+from pyNastran.bdf.field_writer_8 import set_blank_if_default, FLOAT_CACHE_SIZE
 
 
 def set_string16_blank_if_default(value: Any, default: Any) -> str:
@@ -196,6 +197,15 @@ def print_float_16(value: float) -> str:
     return field
 
 
+@lru_cache(maxsize=FLOAT_CACHE_SIZE, typed=True)
+def print_float_16_cached(value: float) -> str:
+    """
+    print_float_16 for values that are written many times
+    (e.g., thicknesses, material constants)
+    """
+    return print_float_16(value)
+
+
 def print_field_16(value: Optional[int | float | str]) -> str:
     """
     Prints a 16-character width field
@@ -213,7 +223,7 @@ def print_field_16(value: Optional[int | float | str]) -> str:
     if isinstance(value, integer_types):
         field = "%16s" % value
     elif isinstance(value, (float, float32)):
-        field = print_float_16(value)
+        field = print_float_16_cached(value)
     elif value is None:
         field = "                "
     else:
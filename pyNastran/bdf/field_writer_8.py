@@ -1,6 +1,7 @@
 """Defines functions for single precision 8 character field writing."""
 import sys
 import warnings
+from functools import lru_cache
 from typing import Optional, Any
 from numpy import float32, float64, isnan
 
@@ -221,6 +222,19 @@ def print_float_8(value: float) -> str:
     #return field
 
 
+#: the number of floats that print_field_8/16/double remember
+FLOAT_CACHE_SIZE = 65536
+
+
+@lru_cache(maxsize=FLOAT_CACHE_SIZE, typed=True)
+def print_float_8_cached(value: float) -> str:
+    """
+    print_float_8 for values that are written many times
+    (e.g., thicknesses, material constants)
+    """
+    return print_float_8(value)
+
+
 def print_field_8(value: Optional[int | float | str]) -> str:
     """
     Prints an 8-character width field
@@ -239,7 +253,7 @@ def print_field_8(value: Optional[int | float | str]) -> str:
     if isinstance(value, int):
         field = '%8i' % value
     elif isinstance(value, (float, float32, float64)):
-        field = print_float_8(value)
+        field = print_float_8_cached(value)
     elif value is None:
         field = '        '
     else:
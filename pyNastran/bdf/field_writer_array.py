@@ -0,0 +1,204 @@
+"""
+Defines functions for writing arrays of floats as 8/16 character fields:
+ - print_float_8_array(values)
+ - print_float_16_array(values)
+ - print_scientific_double_array(values)
+
+The output is the same as calling print_float_8, print_float_16 and
+print_scientific_double on each value.  Repeated values (e.g.,
+thicknesses, material constants, 0.0/1.0) are only formatted once.
+The unique values are then formatted by precision group (e.g., every
+value in [1, 10) uses '%8.6f') instead of walking the print_float_8
+if-chain for each value.  Values that may use scientific notation are
+written with the scalar function.
+
+"""
+from typing import Callable, Optional
+
+import numpy as np
+
+from pyNastran.bdf.field_writer_8 import print_float_8
+from pyNastran.bdf.field_writer_16 import print_float_16
+
+# the edges of the %8.Nf/%16.Nf precision groups
+#  - positive: 0.001 <= value < 1, 1 <= value < 10, ...
+#  - negative: -1 < value <= -0.01, -10 < value <= -1, ...
+_POSITIVE_EDGES_8 = 10. ** np.arange(0, 6)     # 1, ..., 1e5
+_NEGATIVE_EDGES_8 = -10. ** np.arange(0, 5)    # -1, ..., -1e4
+_POSITIVE_EDGES_16 = 10. ** np.arange(0, 14)   # 1, ..., 1e13
+_NEGATIVE_EDGES_16 = -10. ** np.arange(0, 13)  # -1, ..., -1e12
+
+# the values that print_float_8/print_float_16 compare to; numpy may
+# compare a float32 to these in float32, so a float32 value that's equal
+# to float32(threshold) is written with the scalar function
+_THRESHOLDS = np.hstack([
+    [5e-16, 5e-15, 5e-8, 5e-7, 0.001, 0.01, 999999.5],
+    10. ** np.arange(0, 15),
+])
+_THRESHOLDS_32 = np.hstack([_THRESHOLDS, -_THRESHOLDS]).astype('float32')
+
+
+def print_float_8_array(values: np.ndarray) -> list[str]:
+    """
+    Prints an array of floats in nastran 8-character width syntax
+    with the same precision as print_float_8.
+
+    Parameters
+    ----------
+    values : (n, ) float ndarray
+        the values to print
+
+    Returns
+    -------
+    fields : list[str]
+        the 8-character fields
+
+    """
+    return _print_unique_float_array(values, _print_float_8_array)
+
+
+def print_float_16_array(values: np.ndarray) -> list[str]:
+    """
+    Prints an array of floats in nastran 16-character width syntax
+    with the same precision as print_float_16.
+
+    Parameters
+    ----------
+    values : (n, ) float ndarray
+        the values to print
+
+    Returns
+    -------
+    fields : list[str]
+        the 16-character fields
+
+    """
+    return _print_unique_float_array(values, _print_float_16_array)
+
+
+def print_scientific_double_array(values: np.ndarray) -> list[str]:
+    """
+    Prints an array of floats in 16-character scientific double
+    precision (e.g., 5.0000000000D+01) in the same way as
+    print_scientific_double.
+
+    Parameters
+    ----------
+    values : (n, ) float ndarray
+        the values to print
+
+    Returns
+    -------
+    fields : list[str]
+        the 16-character fields
+
+    """
+    return _print_unique_float_array(values, _print_scientific_double_array)
+
+
+def _print_unique_float_array(values: np.ndarray,
+                              print_float_array: Callable[[np.ndarray], list[str]]) -> list[str]:
+    """formats the unique values and maps them back to the original order"""
+    values = np.asarray(values).ravel()
+    if values.dtype.name != 'float32':
+        values = values.astype('float64')
+    if len(values) == 0:
+        return []
+    unique_values, inverse = np.unique(values, return_inverse=True)
+    unique_fields = print_float_array(unique_values)
+    return [unique_fields[i] for i in inverse.ravel().tolist()]
+
+
+def _print_float_8_array(values: np.ndarray) -> list[str]:
+    """see print_float_8_array"""
+    return _print_float_array(values, 8, print_float_8,
+                              0.001, 1e6, _POSITIVE_EDGES_8,
+                              -1e5, -0.01, _NEGATIVE_EDGES_8)
+
+
+def _print_float_16_array(values: np.ndarray) -> list[str]:
+    """see print_float_16_array"""
+    return _print_float_array(values, 16, print_float_16,
+                              0.001, 1e14, _POSITIVE_EDGES_16,
+                              -1e13, -0.01, _NEGATIVE_EDGES_16)
+
+
+def _print_float_array(values: np.ndarray, size: int,
+                       print_float: Callable[[float], str],
+                       min_positive: float, max_positive: float,
+                       positive_edges: np.ndarray,
+                       min_negative: float, max_negative: float,
+                       negative_edges: np.ndarray) -> list[str]:
+    """
+    Prints an array of floats by precision group.
+
+    Values in [min_positive, max_positive) and (min_negative, max_negative]
+    are written with the '%{size}.{decimals}f' format, which is what
+    print_float_8/print_float_16 does for those ranges.  The other values
+    (e.g., 0.0, nan, small/large values that may use scientific notation)
+    use print_float.
+
+    """
+    nvalues = len(values)
+    fields: list[Optional[str]] = [None] * nvalues
+
+    # the number of decimal places; -1 is the scalar method
+    decimals = np.full(nvalues, -1, dtype='int32')
+    with np.errstate(invalid='ignore'):
+        ipositive = (values >= min_positive) & (values < max_positive)
+        inegative = (values > min_negative) & (values <= max_negative)
+
+    # 0.001 <= value < 1  -> size - 1 decimal places
+    # 1     <= value < 10 -> size - 2 decimal places
+    decimals[ipositive] = (size - 1) - np.searchsorted(
+        positive_edges, values[ipositive], side='right')
+
+    # -1  < value <= -0.01 -> size - 2 decimal places
+    # -10 < value <= -1    -> size - 3 decimal places
+    negative_values = values[inegative]
+    decimals[inegative] = (size - 2) - (
+        negative_values[:, np.newaxis] <= negative_edges[np.newaxis, :]).sum(axis=1)
+
+    is_float32 = values.dtype.name == 'float32'
+    if is_float32:
+        decimals[np.isin(values, _THRESHOLDS_32)] = -1
+
+    values_list = values.tolist()
+    for decimal in np.unique(decimals).tolist():
+        if decimal == -1:
+            continue
+        igroup = np.where(decimals == decimal)[0].tolist()
+        group_values = [values_list[i] for i in igroup]
+        fmt = '%%%d.%df|' % (size, decimal)
+        group_fields = ((fmt * len(igroup)) % tuple(group_values)).split('|')[:-1]
+        if decimal == size - 2:
+            # -0.123 -> -.123
+            group_fields = [field.replace('-0.', '-.') for field in group_fields]
+        for i, field in zip(igroup, group_fields):
+            fields[i] = field.strip(' 0').rjust(size)
+
+    for i, field in enumerate(fields):
+        if field is None or len(field) != size:
+            # keep the float32 type for the scalar function
+            fields[i] = print_float(values[i] if is_float32 else values_list[i])
+    return fields
+
+
+def _print_scientific_double_array(values: np.ndarray) -> list[str]:
+    """see print_scientific_double_array"""
+    fields: list[Optional[str]] = [None] * len(values)
+    values_list = values.tolist()
+    with np.errstate(invalid='ignore'):
+        inegative = values < 0
+    for fmt, igroup in [('%16.9e|', np.where(inegative)[0]),
+                        ('%16.10e|', np.where(~inegative)[0])]:
+        igroup = igroup.tolist()
+        group_values = [values_list[i] for i in igroup]
+        group_fields = ((fmt * len(igroup)) % tuple(group_values)).split('|')[:-1]
+        for i, field in zip(igroup, group_fields):
+            fields[i] = field.replace('e', 'D')
+
+    for i, field in enumerate(fields):
+        if field == '-0.0000000000D+00':
+            fields[i] = '0.0000000000D+00'
+    return fields
@@ -3,9 +3,11 @@ Defines functions for double precision 16 character field writing.
 """
 import sys
 import warnings
+from functools import lru_cache
 from typing import Optional
 from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.bdf.cards.utils import wipe_empty_fields
+from pyNastran.bdf.field_writer_8 import FLOAT_CACHE_SIZE
 
 
 def print_scientific_double(value: float) -> str:
@@ -30,6 +32,15 @@ def print_scientific_double(value: float) -> str:
     return field
 
 
+@lru_cache(maxsize=FLOAT_CACHE_SIZE, typed=True)
+def print_scientific_double_cached(value: float) -> str:
+    """
+    print_scientific_double for values that are written many times
+    (e.g., thicknesses, material constants)
+    """
+    return print_scientific_double(value)
+
+
 def print_field_double(value: Optional[int | float | str]) -> str:
     """
     Prints a 16-character width field
@@ -40,7 +51,7 @@ def print_field_double(value: Optional[int | float | str]) -> str:
     if isinstance(value, integer_types):
         field = "%16s" % value
     elif isinstance(value, float):
-        field = print_scientific_double(value)
+        field = print_scientific_double_cached(value)
     elif value is None:
         field = "                "
     else:
@@ -249,15 +249,10 @@ def _eq_nodes_setup(bdf_filename,
 def _get_xyz_cid0(model: BDF, nids: NDArrayNint,
                   fdtype: str='float32') -> NDArrayN3float:
     """gets xyz_cid0"""
-    coord_ids = model.coord_ids
-    needs_get_position = (coord_ids == [0])
-
-    if needs_get_position:
-        nodes_xyz = np.array([model.nodes[nid].get_position()
-                              for nid in nids], dtype=fdtype)
-    else:
-        nodes_xyz = np.array([model.nodes[nid].xyz
-                              for nid in nids], dtype=fdtype)
+    out = model.get_xyz_in_coord_array(cid=0, fdtype='float64', idtype='int32')
+    nid_cp_cd, xyz_cid0 = out[:2]
+    inids = np.searchsorted(nid_cp_cd[:, 0], nids)
+    nodes_xyz = xyz_cid0[inids, :].astype(fdtype)
     return nodes_xyz
 
 def _eq_nodes_setup_node_set(model: BDF,
@@ -0,0 +1,552 @@
+"""
+defines:
+ - bvh = ShellBVH(triangles, eids, leaf_size=8)
+ - bvh = ShellBVH.from_model(model, eids=None)
+ - bvh = ShellBVH.from_solid_skin(model)
+ - eids, xyz, t = bvh.intersect(origins, directions, tmin=0., tmax=np.inf)
+ - eids, xyz, distance = bvh.closest_element(points)
+ - is_inside = bvh.is_inside(points)
+
+The bounding volume hierarchy (BVH) is stored as arrays.  The triangles
+are sorted by the Morton code of their centroid, grouped into leaves of
+``leaf_size`` triangles and the leaves are the bottom level of a
+complete binary tree (node i has children 2*i+1 and 2*i+2).
+
+The queries are batched.  All the (point, node) pairs of a tree level
+are tested at once, so the cost of the Python loop is the depth of the
+tree, not the number of points.  Quads are split into 2 triangles.
+
+"""
+from __future__ import annotations
+from typing import Optional, TYPE_CHECKING
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+SHELL_TRIAS = {'CTRIA3', 'CTRIA6', 'CTRIAR'}
+SHELL_QUADS = {'CQUAD4', 'CQUAD8', 'CQUADR', 'CQUAD', 'CSHEAR'}
+
+#: the number of points per batch; limits the memory of the traversal
+NPOINTS_PER_BATCH = 100_000
+
+#: a direction that is unlikely to be aligned with a mesh (see is_inside)
+_INSIDE_DIRECTION = np.array([0.5773, 0.5776, 0.5770]) / np.linalg.norm([0.5773, 0.5776, 0.5770])
+
+
+class ShellBVH:
+    """
+    Bounding volume hierarchy of the triangles of a shell model
+
+    Attributes
+    ----------
+    triangles : (ntri, 3, 3) float ndarray
+        the xyz of the triangles (sorted by Morton code)
+    eids : (ntri, ) int ndarray
+        the element id of each triangle
+    itriangle : (ntri, ) int ndarray
+        the index of each triangle in the input triangles
+    bbox_min / bbox_max : (nnodes, 3) float ndarray
+        the bounding boxes of the tree nodes
+
+    """
+    def __init__(self, triangles: np.ndarray, eids: np.ndarray,
+                 leaf_size: int=8):
+        """
+        Builds the BVH
+
+        Parameters
+        ----------
+        triangles : (ntri, 3, 3) float ndarray
+            the xyz of the triangles
+        eids : (ntri, ) int ndarray
+            the element id of each triangle
+        leaf_size : int; default=8
+            the number of triangles per leaf
+
+        """
+        triangles = np.asarray(triangles, dtype='float64')
+        eids = np.asarray(eids)
+        ntri = len(triangles)
+        assert triangles.shape == (ntri, 3, 3), triangles.shape
+        assert eids.shape == (ntri, ), eids.shape
+        assert ntri > 0, 'there are no triangles'
+
+        isort = np.argsort(_get_morton_codes(triangles.mean(axis=1)), kind='stable')
+        self.triangles = triangles[isort, :, :]
+        self.eids = eids[isort]
+        self.itriangle = isort
+        self.leaf_size = leaf_size
+
+        # the leaves are the bottom level of a complete binary tree
+        nleaves = -(-ntri // leaf_size)
+        nleaves_tree = 1
+        while nleaves_tree < nleaves:
+            nleaves_tree *= 2
+        nnodes = 2 * nleaves_tree - 1
+        self.ileaf0 = nleaves_tree - 1
+
+        istart = np.arange(0, ntri, leaf_size)
+        self.leaf_start = np.zeros(nleaves_tree, dtype='int64')
+        self.leaf_count = np.zeros(nleaves_tree, dtype='int64')
+        self.leaf_start[:nleaves] = istart
+        self.leaf_count[:nleaves] = np.diff(np.append(istart, ntri))
+
+        # empty nodes have an inverted box
+        self.bbox_min = np.full((nnodes, 3), np.inf)
+        self.bbox_max = np.full((nnodes, 3), -np.inf)
+        ileaf = self.ileaf0 + np.arange(nleaves)
+        self.bbox_min[ileaf, :] = np.minimum.reduceat(self.triangles.min(axis=1), istart, axis=0)
+        self.bbox_max[ileaf, :] = np.maximum.reduceat(self.triangles.max(axis=1), istart, axis=0)
+        nlevel = nleaves_tree // 2
+        while nlevel:
+            inode = np.arange(nlevel - 1, 2 * nlevel - 1)
+            self.bbox_min[inode, :] = np.minimum(self.bbox_min[2 * inode + 1, :],
+                                                 self.bbox_min[2 * inode + 2, :])
+            self.bbox_max[inode, :] = np.maximum(self.bbox_max[2 * inode + 1, :],
+                                                 self.bbox_max[2 * inode + 2, :])
+            nlevel //= 2
+        self.is_empty = (self.bbox_min > self.bbox_max).any(axis=1)
+        self._centroid_tree: Optional[cKDTree] = None
+
+    @classmethod
+    def from_model(cls, model: BDF, eids: Optional[list[int]]=None,
+                   leaf_size: int=8) -> ShellBVH:
+        """
+        Builds a BVH of the shell elements of a model
+
+        Parameters
+        ----------
+        model : BDF()
+            the BDF model
+        eids : list[int]; default=None -> all
+            the elements to consider; only CTRIA3, CTRIA6, CTRIAR,
+            CQUAD4, CQUAD8, CQUADR, CQUAD and CSHEAR elements are used
+        leaf_size : int; default=8
+            the number of triangles per leaf
+
+        """
+        if eids is None:
+            eids = model.elements.keys()
+        tri_eids = []
+        tri_nodes = []
+        quad_eids = []
+        quad_nodes = []
+        for eid in eids:
+            elem = model.elements[eid]
+            if elem.type in SHELL_TRIAS:
+                tri_eids.append(eid)
+                tri_nodes.append(elem.nodes[:3])
+            elif elem.type in SHELL_QUADS:
+                quad_eids.append(eid)
+                quad_nodes.append(elem.nodes[:4])
+
+        nid_cp_cd, xyz_cid0 = model.get_xyz_in_coord_array(cid=0, fdtype='float64')[:2]
+        nids = nid_cp_cd[:, 0]
+        triangles = [np.zeros((0, 3, 3))]
+        tri_eids_all = [np.zeros(0, dtype='int64')]
+        if tri_eids:
+            triangles.append(xyz_cid0[np.searchsorted(nids, tri_nodes), :])
+            tri_eids_all.append(np.array(tri_eids, dtype='int64'))
+        if quad_eids:
+            xyz = xyz_cid0[np.searchsorted(nids, quad_nodes), :]
+            triangles.append(xyz[:, [0, 1, 2], :])
+            triangles.append(xyz[:, [0, 2, 3], :])
+            tri_eids_all.extend([np.array(quad_eids, dtype='int64')] * 2)
+        return cls(np.vstack(triangles), np.hstack(tri_eids_all), leaf_size=leaf_size)
+
+    @classmethod
+    def from_solid_skin(cls, model: BDF, leaf_size: int=8) -> ShellBVH:
+        """
+        Builds a BVH of the free faces of the solid elements of a model
+        (see ``get_solid_skin_faces``), so is_inside finds the points
+        inside the solid
+
+        The element id of a face is the solid element.
+        """
+        from pyNastran.bdf.mesh_utils.topology import ElementTopology
+        topology = ElementTopology(model, consider_2d=False, consider_3d=True)
+        iskin = topology.get_skin_faces()
+        faces = topology.face_raw[iskin, :]
+        face_nnodes = topology.face_nnodes[iskin]
+        eids = topology.eids[topology.face_ielement[topology.face_ptr[iskin]]]
+
+        nid_cp_cd, xyz_cid0 = model.get_xyz_in_coord_array(cid=0, fdtype='float64')[:2]
+        nids = nid_cp_cd[:, 0]
+        is_tri = np.isin(face_nnodes, [3, 6])
+        tris = faces[is_tri, :3]
+        quads = faces[~is_tri, :4]
+        triangles = np.vstack([
+            xyz_cid0[np.searchsorted(nids, tris), :],
+            xyz_cid0[np.searchsorted(nids, quads[:, [0, 1, 2]]), :],
+            xyz_cid0[np.searchsorted(nids, quads[:, [0, 2, 3]]), :],
+        ])
+        tri_eids = np.hstack([eids[is_tri], eids[~is_tri], eids[~is_tri]])
+        return cls(triangles, tri_eids, leaf_size=leaf_size)
+
+    def intersect(self, origins: np.ndarray, directions: np.ndarray,
+                  tmin: float=0., tmax: float=np.inf,
+                  closest: bool=True) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Intersects rays with the triangles
+
+        Parameters
+        ----------
+        origins : (npoints, 3) float ndarray
+            the start of the rays
+        directions : (npoints, 3) or (3, ) float ndarray
+            the direction of the rays; the ray is origin + t * direction
+        tmin / tmax : float; default=0. / inf
+            the range of t; use tmin=-np.inf to intersect a line
+        closest : bool; default=True
+            True : returns the hit with the smallest t
+            False : returns the hit with the largest t
+
+        Returns
+        -------
+        eids : (npoints, ) int ndarray
+            the element that is hit; -1 for a miss
+        xyz : (npoints, 3) float ndarray
+            the hit location; nan for a miss
+        t : (npoints, ) float ndarray
+            the ray parameter of the hit; nan for a miss
+
+        """
+        origins, directions = _get_rays(origins, directions)
+        mode = 'closest' if closest else 'farthest'
+        itri, t = self._intersect(origins, directions, tmin, tmax, mode)
+
+        is_hit = itri >= 0
+        eids = np.full(len(origins), -1, dtype=self.eids.dtype)
+        eids[is_hit] = self.eids[itri[is_hit]]
+        t[~is_hit] = np.nan
+        xyz = origins + directions * t[:, np.newaxis]
+        return eids, xyz, t
+
+    def count_intersections(self, origins: np.ndarray, directions: np.ndarray,
+                            tmin: float=0., tmax: float=np.inf) -> np.ndarray:
+        """gets the number of triangles hit by each ray"""
+        origins, directions = _get_rays(origins, directions)
+        count = self._intersect(origins, directions, tmin, tmax, 'count')[1]
+        return count.astype('int64')
+
+    def is_inside(self, points: np.ndarray) -> np.ndarray:
+        """
+        Finds the points that are inside a closed surface (e.g., the
+        BVH from from_solid_skin) by counting the intersections of a ray
+
+        Parameters
+        ----------
+        points : (npoints, 3) float ndarray
+            the points to check
+
+        Returns
+        -------
+        is_inside : (npoints, ) bool ndarray
+            is the point inside
+
+        """
+        points = np.atleast_2d(np.asarray(points, dtype='float64'))
+        count = self.count_intersections(points, _INSIDE_DIRECTION)
+        return count % 2 == 1
+
+    def closest_element(self, points: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Finds the closest element to each point
+
+        Parameters
+        ----------
+        points : (npoints, 3) float ndarray
+            the points
+
+        Returns
+        -------
+        eids : (npoints, ) int ndarray
+            the closest element
+        xyz : (npoints, 3) float ndarray
+            the closest location on the element
+        distance : (npoints, ) float ndarray
+            the distance to the element
+
+        """
+        points = np.atleast_2d(np.asarray(points, dtype='float64'))
+        npoints = len(points)
+        if self._centroid_tree is None:
+            self._centroid_tree = cKDTree(self.triangles.mean(axis=1))
+
+        itri = np.zeros(npoints, dtype='int64')
+        xyz = np.zeros((npoints, 3), dtype='float64')
+        for istart in range(0, npoints, NPOINTS_PER_BATCH):
+            istop = istart + NPOINTS_PER_BATCH
+            itri[istart:istop], xyz[istart:istop, :] = self._closest_element(
+                points[istart:istop, :])
+        distance = np.linalg.norm(xyz - points, axis=1)
+        return self.eids[itri], xyz, distance
+
+    def _closest_element(self, points: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """helper for ``closest_element``"""
+        npoints = len(points)
+
+        # the triangle with the closest centroid bounds the distance
+        itri = self._centroid_tree.query(points)[1]
+        xyz = _closest_point_on_triangles(points, self.triangles[itri, :, :])
+        best_distance2 = ((xyz - points) ** 2).sum(axis=1)
+
+        ipoint = np.arange(npoints)
+        inode = np.zeros(npoints, dtype='int64')
+        while len(ipoint):
+            # the distance from the point to the box
+            pointsi = points[ipoint, :]
+            delta = np.maximum(self.bbox_min[inode, :] - pointsi, 0.)
+            delta = np.maximum(delta, pointsi - self.bbox_max[inode, :])
+            distance2 = (delta ** 2).sum(axis=1)
+            is_active = ~self.is_empty[inode] & (distance2 <= best_distance2[ipoint])
+            ipoint = ipoint[is_active]
+            inode = inode[is_active]
+
+            is_leaf = inode >= self.ileaf0
+            ipoint_leaf, itri_leaf = self._get_leaf_triangles(ipoint[is_leaf], inode[is_leaf])
+            if len(ipoint_leaf):
+                xyz_leaf = _closest_point_on_triangles(points[ipoint_leaf, :],
+                                                       self.triangles[itri_leaf, :, :])
+                distance2 = ((xyz_leaf - points[ipoint_leaf, :]) ** 2).sum(axis=1)
+                ipoint_best, ibest = _get_best(ipoint_leaf, distance2)
+                is_better = distance2[ibest] < best_distance2[ipoint_best]
+                ipoint_best = ipoint_best[is_better]
+                ibest = ibest[is_better]
+                best_distance2[ipoint_best] = distance2[ibest]
+                itri[ipoint_best] = itri_leaf[ibest]
+                xyz[ipoint_best, :] = xyz_leaf[ibest, :]
+
+            ipoint, inode = _get_children(ipoint[~is_leaf], inode[~is_leaf])
+        return itri, xyz
+
+    def _intersect(self, origins: np.ndarray, directions: np.ndarray,
+                   tmin: float, tmax: float, mode: str) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Intersects the rays with the triangles in batches
+
+        Returns
+        -------
+        itri : (npoints, ) int ndarray
+            the triangle that was hit; -1 for a miss
+        t : (npoints, ) float ndarray
+            the hit (closest/farthest) or the number of hits (count)
+
+        """
+        npoints = len(origins)
+        itri = np.full(npoints, -1, dtype='int64')
+        if mode == 'closest':
+            t = np.full(npoints, np.inf)
+        elif mode == 'farthest':
+            t = np.full(npoints, -np.inf)
+        else:
+            assert mode == 'count', mode
+            t = np.zeros(npoints)
+
+        for istart in range(0, npoints, NPOINTS_PER_BATCH):
+            istop = istart + NPOINTS_PER_BATCH
+            self._intersect_batch(origins[istart:istop, :], directions[istart:istop, :],
+                                  tmin, tmax, mode,
+                                  itri[istart:istop], t[istart:istop])
+        return itri, t
+
+    def _intersect_batch(self, origins: np.ndarray, directions: np.ndarray,
+                         tmin: float, tmax: float, mode: str,
+                         itri: np.ndarray, best_t: np.ndarray) -> None:
+        """helper for ``_intersect``; updates itri/best_t in place"""
+        npoints = len(origins)
+        with np.errstate(divide='ignore'):
+            inv_directions = 1. / directions
+
+        ipoint = np.arange(npoints)
+        inode = np.zeros(npoints, dtype='int64')
+        while len(ipoint):
+            # slab test; nan (a ray on the face of a box) is ignored
+            with np.errstate(invalid='ignore'):
+                inv_direction = inv_directions[ipoint, :]
+                t1 = (self.bbox_min[inode, :] - origins[ipoint, :]) * inv_direction
+                t2 = (self.bbox_max[inode, :] - origins[ipoint, :]) * inv_direction
+            tnear = np.fmax(np.fmin(t1, t2).max(axis=1, initial=-np.inf), tmin)
+            tfar = np.fmin(np.fmax(t1, t2).min(axis=1, initial=np.inf), tmax)
+            is_active = ~self.is_empty[inode] & (tnear <= tfar)
+            if mode == 'closest':
+                is_active &= tnear <= best_t[ipoint]
+            elif mode == 'farthest':
+                is_active &= tfar >= best_t[ipoint]
+            ipoint = ipoint[is_active]
+            inode = inode[is_active]
+
+            is_leaf = inode >= self.ileaf0
+            ipoint_leaf, itri_leaf = self._get_leaf_triangles(ipoint[is_leaf], inode[is_leaf])
+            if len(ipoint_leaf):
+                t, is_hit = _intersect_triangles(
+                    origins[ipoint_leaf, :], directions[ipoint_leaf, :],
+                    self.triangles[itri_leaf, :, :], tmin, tmax)
+                ipoint_leaf = ipoint_leaf[is_hit]
+                itri_leaf = itri_leaf[is_hit]
+                t = t[is_hit]
+                if mode == 'count':
+                    best_t += np.bincount(ipoint_leaf, minlength=npoints)
+                else:
+                    sign = 1. if mode == 'closest' else -1.
+                    ipoint_best, ibest = _get_best(ipoint_leaf, sign * t)
+                    is_better = sign * t[ibest] < sign * best_t[ipoint_best]
+                    ipoint_best = ipoint_best[is_better]
+                    ibest = ibest[is_better]
+                    best_t[ipoint_best] = t[ibest]
+                    itri[ipoint_best] = itri_leaf[ibest]
+
+            ipoint, inode = _get_children(ipoint[~is_leaf], inode[~is_leaf])
+
+    def _get_leaf_triangles(self, ipoint: np.ndarray,
+                            inode: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """expands the (point, leaf) pairs to (point, triangle) pairs"""
+        ileaf = inode - self.ileaf0
+        count = self.leaf_count[ileaf]
+        ipoint_tri = np.repeat(ipoint, count)
+        offset = np.arange(count.sum()) - np.repeat(np.cumsum(count) - count, count)
+        itri = np.repeat(self.leaf_start[ileaf], count) + offset
+        return ipoint_tri, itri
+
+
+def _get_rays(origins: np.ndarray, directions: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """broadcasts the ray origins/directions to (npoints, 3)"""
+    origins = np.atleast_2d(np.asarray(origins, dtype='float64'))
+    directions = np.asarray(directions, dtype='float64')
+    directions = np.broadcast_to(directions, origins.shape)
+    assert origins.shape[1] == 3, origins.shape
+    return origins, directions
+
+
+def _get_children(ipoint: np.ndarray, inode: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """gets the (point, child node) pairs"""
+    ipoint = np.repeat(ipoint, 2)
+    inode = 2 * np.repeat(inode, 2) + np.tile([1, 2], len(inode))
+    return ipoint, inode
+
+
+def _get_best(ipoint: np.ndarray, value: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """gets the index of the smallest value for each point"""
+    best_value = np.full(ipoint.max(initial=-1) + 1, np.inf)
+    np.minimum.at(best_value, ipoint, value)
+    ibest = np.flatnonzero(value == best_value[ipoint])
+    return ipoint[ibest], ibest
+
+
+def _intersect_triangles(origins: np.ndarray, directions: np.ndarray,
+                         triangles: np.ndarray, tmin: float,
+                         tmax: float) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized version of ``pierce_shells.triangle_intersection``
+    (Moller-Trumbore)
+
+    Returns
+    -------
+    t : (n, ) float ndarray
+        the ray parameter
+    is_hit : (n, ) bool ndarray
+        is the triangle hit
+
+    """
+    v0 = triangles[:, 0, :]
+    e1 = triangles[:, 1, :] - v0
+    e2 = triangles[:, 2, :] - v0
+    pvec = np.cross(directions, e2)
+    det = (e1 * pvec).sum(axis=1)
+
+    # the ray is parallel to the plane
+    is_hit = np.abs(det) >= 1e-8
+    with np.errstate(divide='ignore', invalid='ignore'):
+        inv_det = 1. / det
+        tvec = origins - v0
+        u = (tvec * pvec).sum(axis=1) * inv_det
+        qvec = np.cross(tvec, e1)
+        v = (directions * qvec).sum(axis=1) * inv_det
+        t = (e2 * qvec).sum(axis=1) * inv_det
+        is_hit &= (u >= 0.) & (u <= 1.) & (v >= 0.) & (u + v <= 1.)
+        is_hit &= (t >= tmin) & (t <= tmax)
+    return t, is_hit
+
+
+def _closest_point_on_triangles(points: np.ndarray, triangles: np.ndarray) -> np.ndarray:
+    """
+    Gets the closest point on each triangle to each point
+    (vectorized version of Ericson's ClosestPtPointTriangle)
+    """
+    def dot(vector1, vector2):
+        return (vector1 * vector2).sum(axis=1)
+
+    a = triangles[:, 0, :]
+    b = triangles[:, 1, :]
+    c = triangles[:, 2, :]
+    ab = b - a
+    ac = c - a
+    ap = points - a
+    bp = points - b
+    cp = points - c
+    d1 = dot(ab, ap)
+    d2 = dot(ac, ap)
+    d3 = dot(ab, bp)
+    d4 = dot(ac, bp)
+    d5 = dot(ab, cp)
+    d6 = dot(ac, cp)
+    va = d3 * d6 - d5 * d4
+    vb = d5 * d2 - d1 * d6
+    vc = d1 * d4 - d3 * d2
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # inside the face
+        denom = 1. / (va + vb + vc)
+        xyz = a + ab * (vb * denom)[:, np.newaxis] + ac * (vc * denom)[:, np.newaxis]
+
+        # the regions are checked in order, so the first region wins
+        regions = [
+            # vertex region a
+            ((d1 <= 0.) & (d2 <= 0.), a),
+            # vertex region b
+            ((d3 >= 0.) & (d4 <= d3), b),
+            # edge region ab
+            ((vc <= 0.) & (d1 >= 0.) & (d3 <= 0.),
+             a + ab * (d1 / (d1 - d3))[:, np.newaxis]),
+            # vertex region c
+            ((d6 >= 0.) & (d5 <= d6), c),
+            # edge region ac
+            ((vb <= 0.) & (d2 >= 0.) & (d6 <= 0.),
+             a + ac * (d2 / (d2 - d6))[:, np.newaxis]),
+            # edge region bc
+            ((va <= 0.) & (d4 - d3 >= 0.) & (d5 - d6 >= 0.),
+             b + (c - b) * ((d4 - d3) / ((d4 - d3) + (d5 - d6)))[:, np.newaxis]),
+        ]
+    is_set = np.zeros(len(points), dtype='bool')
+    for is_region, xyz_region in regions:
+        is_region = is_region & ~is_set
+        xyz[is_region, :] = xyz_region[is_region, :]
+        is_set |= is_region
+    return xyz
+
+
+def _get_morton_codes(xyz: np.ndarray) -> np.ndarray:
+    """gets the 63-bit Morton code of each point"""
+    xyz_min = xyz.min(axis=0)
+    dxyz = xyz.max(axis=0) - xyz_min
+    dxyz[dxyz == 0.] = 1.
+    ixyz = ((xyz - xyz_min) / dxyz * (2 ** 21 - 1)).astype('uint64')
+
+    codes = np.zeros(len(xyz), dtype='uint64')
+    for iaxis in range(3):
+        codes |= _spread_bits(ixyz[:, iaxis]) << np.uint64(iaxis)
+    return codes
+
+
+def _spread_bits(value: np.ndarray) -> np.ndarray:
+    """puts 2 zero bits between each of the 21 bits of the value"""
+    value = value & np.uint64(0x1fffff)
+    value = (value | value << np.uint64(32)) & np.uint64(0x1f00000000ffff)
+    value = (value | value << np.uint64(16)) & np.uint64(0x1f0000ff0000ff)
+    value = (value | value << np.uint64(8)) & np.uint64(0x100f00f00f00f00f)
+    value = (value | value << np.uint64(4)) & np.uint64(0x10c30c30c30c30c3)
+    value = (value | value << np.uint64(2)) & np.uint64(0x1249249249249249)
+    return value
@@ -0,0 +1,420 @@
+"""
+defines:
+ - responses = DesignResponses(model, dresp_ids=None)
+ - response_values = responses.evaluate(op2_model, subcase_id, itime=0,
+                                        desvar_values=None)
+ - response_values = evaluate_design_responses(model, op2_model, subcase_id,
+                                               dresp_ids=None, itime=0,
+                                               desvar_values=None)
+
+The DRESP1s are grouped by the OP2 table they read from (e.g., the
+displacements or the CQUAD4 stresses), so the ids of every DRESP1 that
+uses a table are found with a single ``searchsorted``.  The grouping
+only depends on the BDF, so a ``DesignResponses`` object may be reused
+for every design cycle.  The DRESP2s are then evaluated from the DRESP1
+values using the compiled DEQATNs (see ``DEQATN.evaluate_array``).
+
+The supported DRESP1 response types are:
+ - DISP : ATTA=component; ATTi=node ids
+ - STRESS/STRAIN/FORCE : ATTA=item code; ATTi=element ids (PTYPE=ELEM)
+   or property ids for the CROD, CONROD, CTUBE, CBAR and shell elements.
+   Composite (PCOMP) responses and the other elements (e.g., PSOLID,
+   PBEAM) raise a NotImplementedError.
+ - FREQ/EIGN : ATTA=mode number
+ - WEIGHT : the total mass of the model (not scaled by WTMASS);
+   ATTA=ATTB=3 (or blank) and ATTi=ALL (or blank)
+
+"""
+from __future__ import annotations
+from typing import Optional, Any, TYPE_CHECKING
+
+import numpy as np
+
+from pyNastran.bdf.cards.deqatn import ARRAY_FUNCTIONS
+from pyNastran.bdf.mesh_utils.mass_properties import mass_properties
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+    from pyNastran.op2.op2 import OP2
+
+# the element types that have a result table with the Nastran item codes
+# for the columns (e.g., item code 2 is the first column); the item codes
+# of the second layer of shells continue after the last column
+ELEMENT_RESULT_TYPES = {
+    'CROD', 'CONROD', 'CTUBE', 'CBAR',
+    'CTRIA3', 'CTRIA6', 'CTRIAR',
+    'CQUAD4', 'CQUAD8', 'CQUADR',
+}
+ELEMENT_RESPONSE_TYPES = ('STRESS', 'STRAIN', 'FORCE')
+
+
+class DesignResponses:
+    """
+    Evaluates the DRESP1s and DRESP2s of a model against the OP2 results
+
+    .. code-block:: python
+
+       >>> model = read_bdf(bdf_filename)
+       >>> responses = DesignResponses(model)
+       >>> op2_model = read_op2(op2_filename)
+       >>> response_values = responses.evaluate(op2_model, subcase_id=1)
+       >>> response_values[101]
+       array([0.0215])
+
+    """
+    def __init__(self, model: BDF, dresp_ids: Optional[list[int]]=None):
+        """
+        Groups the DRESP1s by result table
+
+        Parameters
+        ----------
+        model : BDF()
+            the cross-referenced BDF object
+        dresp_ids : list[int]; default=None -> all
+            the DRESP1/DRESP2 ids to evaluate; the responses that are
+            used by the DRESP2s are also evaluated
+
+        """
+        self.model = model
+        if dresp_ids is None:
+            dresp_ids = list(model.dresps)
+        self.dresp1_ids, self.dresp2_ids = _get_dresp_ids(model, dresp_ids)
+
+        # table_name : (ids, offsets)
+        #   offset is the 0-based column for single layer results
+        self._tables: dict[str, Any] = {}
+        # dresp_id : [(table_name, i0, i1), ...]
+        self._segments: dict[int, list[tuple[str, int, int]]] = {}
+        self._element_arrays = None
+        # the model mass for the WEIGHT responses
+        self._weight = None
+
+        for dresp_id in self.dresp1_ids:
+            self._add_dresp1(model.dresps[dresp_id])
+
+        for table_name, (ids, offsets) in self._tables.items():
+            self._tables[table_name] = (
+                np.array(ids, dtype='int64'),
+                np.array(offsets, dtype='int64'))
+
+    def _add_dresp1(self, dresp) -> None:
+        """gets the table entries of a DRESP1"""
+        dresp_id = dresp.dresp_id
+        response_type = dresp.response_type
+        property_type = dresp.property_type
+        atta = dresp.Atta()
+        atti = dresp.atti_values()
+        self._segments[dresp_id] = []
+        if response_type == 'DISP':
+            # the component may be validated to a string (e.g., '3')
+            if isinstance(atta, str) and atta.isdigit():
+                atta = int(atta)
+            if property_type is not None or atta not in {1, 2, 3, 4, 5, 6}:
+                raise NotImplementedError(f'DISP response with ptype={property_type!r} '
+                                          f'atta={atta!r}\n{dresp}')
+            self._add_segment(dresp_id, 'displacements', atti, atta - 1)
+
+        elif response_type in ELEMENT_RESPONSE_TYPES:
+            if not isinstance(atta, int) or atta < 2 or dresp.attb is not None:
+                raise NotImplementedError(f'{response_type} response with item code '
+                                          f'atta={atta!r} attb={dresp.attb!r}\n{dresp}')
+            eids, element_types = self._get_response_elements(dresp, property_type, atti)
+
+            # the elements are split into runs of the same element type,
+            # which keeps the order of the elements
+            table_prefix = response_type.lower()
+            ibreak = np.flatnonzero(element_types[1:] != element_types[:-1]) + 1
+            for i0, i1 in zip(np.hstack([0, ibreak]), np.hstack([ibreak, len(eids)])):
+                element_type = element_types[i0].lower()
+                table_name = f'{table_prefix}.{element_type}_{table_prefix}'
+                self._add_segment(dresp_id, table_name, eids[i0:i1], atta - 2)
+
+        elif response_type in {'FREQ', 'EIGN'}:
+            if not isinstance(atta, int) or atta < 1:
+                raise NotImplementedError(f'{response_type} response with mode '
+                                          f'atta={atta!r}\n{dresp}')
+            self._add_segment(dresp_id, response_type, [atta], 0)
+
+        elif response_type == 'WEIGHT':
+            # ATTA/ATTB are the row/column of the rigid body mass matrix
+            # (3 is the z mass); ATTi are the superelement ids
+            if atta not in {None, 3} or dresp.attb not in {None, 3}:
+                raise NotImplementedError(f'WEIGHT response with atta={atta!r} '
+                                          f'attb={dresp.attb!r}\n{dresp}')
+            if atti not in ([], ['ALL']):
+                raise NotImplementedError(f'WEIGHT response with atti={atti!r}\n{dresp}')
+            if self._weight is None:
+                # Nastran doesn't scale the weight by WTMASS
+                self._weight = mass_properties(self.model)[0] / self.model.wtmass
+            self._add_segment(dresp_id, 'WEIGHT', [0], 0)
+        else:
+            raise NotImplementedError(f'response_type={response_type!r} '
+                                      f'ptype={property_type!r}\n{dresp}')
+
+    def _add_segment(self, dresp_id: int, table_name: str,
+                     ids: list[int], offset: int) -> None:
+        """adds the ids of a DRESP1 to the table"""
+        if table_name not in self._tables:
+            self._tables[table_name] = ([], [])
+        table_ids, offsets = self._tables[table_name]
+        i0 = len(table_ids)
+        table_ids.extend(ids)
+        offsets.extend([offset] * len(ids))
+        self._segments[dresp_id].append((table_name, i0, len(table_ids)))
+
+    def _get_response_elements(self, dresp, property_type: str,
+                               atti: list[int]) -> tuple[np.ndarray, np.ndarray]:
+        """gets the element ids/types of a STRESS/STRAIN/FORCE response"""
+        if self._element_arrays is None:
+            eids_all = []
+            element_types_all = []
+            pids_all = []
+            for eid, elem in self.model.elements.items():
+                if elem.type not in ELEMENT_RESULT_TYPES:
+                    continue
+                eids_all.append(eid)
+                element_types_all.append(elem.type)
+                pids_all.append(0 if elem.type == 'CONROD' else elem.Pid())
+            self._element_arrays = (
+                np.array(eids_all, dtype='int64'),
+                np.array(element_types_all, dtype='<U8'),
+                np.array(pids_all, dtype='int64'))
+        eids_all, element_types_all, pids_all = self._element_arrays
+
+        if property_type == 'ELEM':
+            eids = np.array(atti, dtype='int64')
+            try:
+                ieid = _lookup_ids(eids_all, eids, 'elements')
+            except KeyError as error:
+                raise NotImplementedError(
+                    f'{error.args[0]}; the supported elements are '
+                    f'{sorted(ELEMENT_RESULT_TYPES)}\n{dresp}')
+            element_types = element_types_all[ieid]
+        elif property_type in {'PCOMP', 'PCOMPG'}:
+            raise NotImplementedError(f'composite responses are not supported\n{dresp}')
+        else:
+            iprop = np.isin(pids_all, atti)
+            eids = eids_all[iprop]
+            element_types = element_types_all[iprop]
+            if len(eids) == 0:
+                raise NotImplementedError(
+                    f'{property_type}={atti} has no supported elements; the supported '
+                    f'elements are {sorted(ELEMENT_RESULT_TYPES)}\n{dresp}')
+        return eids, element_types
+
+    def evaluate(self, op2_model: OP2, subcase_id: int, itime: int=0,
+                 desvar_values: Optional[dict[int, float]]=None) -> dict[int, np.ndarray]:
+        """
+        Evaluates the design responses
+
+        Parameters
+        ----------
+        op2_model : OP2()
+            the OP2 object with the results
+        subcase_id : int / tuple
+            the key of the OP2 result dictionaries (e.g., displacements)
+        itime : int; default=0
+            the time/mode/frequency index of the result tables
+        desvar_values : dict[int, float]; default=None
+            the DESVAR values used by the DRESP2s; defaults to the
+            DESVAR xinit values
+
+        Returns
+        -------
+        response_values : dict[int, (nresponses, ) float ndarray]
+            the values of each DRESP1/DRESP2; a DRESP1 has one value
+            per ATTi grid/element, while a DRESP2 has a single value
+
+        """
+        table_values = {}
+        for table_name, (ids, offsets) in self._tables.items():
+            if table_name == 'WEIGHT':
+                values = np.full(len(ids), self._weight, dtype='float64')
+            elif table_name in {'FREQ', 'EIGN'}:
+                case = op2_model.eigenvectors[subcase_id]
+                imode = _lookup_ids(np.asarray(case.modes), ids,
+                                    f'eigenvectors[{subcase_id}].modes')
+                word = 'mode_cycles' if table_name == 'FREQ' else 'eigns'
+                values = np.asarray(getattr(case, word))[imode]
+            else:
+                case = op2_model.get_result(table_name)[subcase_id]
+                values = _get_table_values(case, ids, offsets, itime,
+                                           f'{table_name}[{subcase_id}]')
+            table_values[table_name] = values.astype('float64')
+
+        response_values = {}
+        for dresp_id in self.dresp1_ids:
+            segments = self._segments[dresp_id]
+            if len(segments) == 1:
+                table_name, i0, i1 = segments[0]
+                response_values[dresp_id] = table_values[table_name][i0:i1]
+            else:
+                response_values[dresp_id] = np.hstack([
+                    table_values[table_name][i0:i1]
+                    for table_name, i0, i1 in segments])
+
+        for dresp_id in self.dresp2_ids:
+            self._evaluate_dresp2(dresp_id, response_values, desvar_values, set())
+        return response_values
+
+    def _evaluate_dresp2(self, dresp_id: int, response_values: dict[int, np.ndarray],
+                         desvar_values: Optional[dict[int, float]],
+                         dresp2_ids_active: set[int]) -> np.ndarray:
+        """evaluates a DRESP2 and the DRESP2s it references"""
+        if dresp_id in response_values:
+            return response_values[dresp_id]
+        if dresp_id in dresp2_ids_active:
+            raise RuntimeError(f'DRESP2={dresp_id} references itself')
+        dresp2_ids_active.add(dresp_id)
+
+        model = self.model
+        dresp = model.dresps[dresp_id]
+        args = []
+        for (unused_j, name), values in sorted(dresp.params.items()):
+            if name == 'DRESP1':
+                for value in values:
+                    args.extend(response_values[value])
+            elif name == 'DRESP2':
+                for value in values:
+                    args.extend(self._evaluate_dresp2(
+                        value, response_values, desvar_values, dresp2_ids_active))
+            elif name == 'DESVAR':
+                for desvar_id in values:
+                    if desvar_values is not None and desvar_id in desvar_values:
+                        args.append(desvar_values[desvar_id])
+                    else:
+                        args.append(model.desvars[desvar_id].xinit)
+            elif name == 'DTABLE':
+                for label in values:
+                    args.append(model.dtable[label])
+            else:
+                raise NotImplementedError(f'{name} is not supported\n{dresp}')
+
+        dequation = dresp.DEquation()
+        if isinstance(dequation, str):
+            value = ARRAY_FUNCTIONS[dequation.lower()](*args)
+        else:
+            value = model.dequations[dequation].evaluate_array(*args)
+        value = np.atleast_1d(np.asarray(value, dtype='float64'))
+        response_values[dresp_id] = value
+        dresp2_ids_active.remove(dresp_id)
+        return value
+
+
+def evaluate_design_responses(model: BDF, op2_model: OP2, subcase_id: int,
+                              dresp_ids: Optional[list[int]]=None,
+                              itime: int=0,
+                              desvar_values: Optional[dict[int, float]]=None,
+                              ) -> dict[int, np.ndarray]:
+    """
+    Evaluates the DRESP1s and DRESP2s of a model against the OP2 results
+
+    Parameters
+    ----------
+    model : BDF()
+        the cross-referenced BDF object
+    op2_model : OP2()
+        the OP2 object with the results
+    subcase_id : int / tuple
+        the key of the OP2 result dictionaries (e.g., displacements)
+    dresp_ids : list[int]; default=None -> all
+        the DRESP1/DRESP2 ids to evaluate
+    itime : int; default=0
+        the time/mode/frequency index of the result tables
+    desvar_values : dict[int, float]; default=None
+        the DESVAR values used by the DRESP2s; defaults to the
+        DESVAR xinit values
+
+    Returns
+    -------
+    response_values : dict[int, (nresponses, ) float ndarray]
+        the values of each DRESP1/DRESP2
+
+    .. seealso:: DesignResponses
+
+    """
+    responses = DesignResponses(model, dresp_ids=dresp_ids)
+    return responses.evaluate(op2_model, subcase_id, itime=itime,
+                              desvar_values=desvar_values)
+
+
+def _get_dresp_ids(model: BDF, dresp_ids: list[int]) -> tuple[list[int], list[int]]:
+    """gets the DRESP1s/DRESP2s to evaluate, including the referenced responses"""
+    dresp1_ids = {}
+    dresp2_ids = {}
+    dresp_ids_to_check = list(dresp_ids)
+    while dresp_ids_to_check:
+        dresp_id = dresp_ids_to_check.pop(0)
+        if dresp_id in dresp1_ids or dresp_id in dresp2_ids:
+            continue
+        dresp = model.dresps[dresp_id]
+        if dresp.type == 'DRESP1':
+            dresp1_ids[dresp_id] = None
+        elif dresp.type == 'DRESP2':
+            dresp2_ids[dresp_id] = None
+            for (unused_j, name), values in sorted(dresp.params.items()):
+                if name in {'DRESP1', 'DRESP2'}:
+                    dresp_ids_to_check.extend(values)
+        else:
+            raise NotImplementedError(f'{dresp.type} is not supported\n{dresp}')
+    return list(dresp1_ids), list(dresp2_ids)
+
+
+def _lookup_ids(ids_table: np.ndarray, ids: np.ndarray, table_name: str) -> np.ndarray:
+    """finds the index of the ids in an array of unique ids"""
+    if len(ids_table) == 0:
+        raise KeyError(f'{table_name} is empty; missing ids={np.unique(ids).tolist()}')
+    isort = None
+    if len(ids_table) > 1 and np.any(ids_table[1:] < ids_table[:-1]):
+        isort = np.argsort(ids_table, kind='stable')
+    i = np.searchsorted(ids_table, ids, sorter=isort)
+    i = np.minimum(i, len(ids_table) - 1)
+    if isort is not None:
+        i = isort[i]
+    is_missing = ids_table[i] != ids
+    if is_missing.any():
+        raise KeyError(f'{table_name} is missing ids={np.unique(ids[is_missing]).tolist()}')
+    return i
+
+
+def _get_table_values(case, ids: np.ndarray, offsets: np.ndarray,
+                      itime: int, table_name: str) -> np.ndarray:
+    """
+    Gets the values of a node/element result table
+
+    Parameters
+    ----------
+    case : RealTableArray / RealPlateStressArray / ...
+        the result table
+    ids : (n, ) int ndarray
+        the node/element ids
+    offsets : (n, ) int ndarray
+        the 0-based column; the rows of an element (e.g., the upper
+        and lower layers of a shell) are stacked, so an offset of
+        ncolumns is the first column of the second row
+    itime : int
+        the time/mode/frequency index
+
+    """
+    if hasattr(case, 'node_gridtype'):
+        row_ids = case.node_gridtype[:, 0]
+    elif getattr(case, 'element_node', None) is not None:
+        row_ids = case.element_node[:, 0]
+    else:
+        row_ids = case.element
+    data = case.data[itime]
+    nrows, ncolumns = data.shape
+
+    # the first row of each node/element
+    is_first = np.ones(nrows, dtype='bool')
+    is_first[1:] = row_ids[1:] != row_ids[:-1]
+    irow_first = np.flatnonzero(is_first)
+    i = _lookup_ids(row_ids[irow_first], ids, table_name)
+
+    irow = irow_first[i] + offsets // ncolumns
+    icolumn = offsets % ncolumns
+    is_missing = irow >= nrows
+    is_missing[~is_missing] = row_ids[irow[~is_missing]] != ids[~is_missing]
+    if is_missing.any():
+        raise KeyError(f'{table_name} does not have item codes for '
+                       f'ids={np.unique(ids[is_missing]).tolist()}')
+    return data[irow, icolumn]
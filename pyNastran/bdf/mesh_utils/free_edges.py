@@ -5,12 +5,14 @@ defines:
 
 """
 from __future__ import annotations
-from collections import defaultdict
 from typing import Optional, TYPE_CHECKING
+
+from pyNastran.bdf.mesh_utils.topology import ElementTopology
 if TYPE_CHECKING:  # pragma: no cover
     from pyNastran.bdf.bdf import BDF
 
-def free_edges(model: BDF, eids: Optional[list[int]]=None, maps=None) -> list[tuple[int, int]]:
+def free_edges(model: BDF, eids: Optional[list[int]]=None, maps=None,
+               topology: Optional[ElementTopology]=None) -> list[tuple[int, int]]:
     """
     Gets the free edges for shell elements.
     A free edge is an edge that is only connected to 1 shell element.
@@ -25,6 +27,8 @@ def free_edges(model: BDF, eids: Optional[list[int]]=None, maps=None) -> list[tu
         the output from _get_maps(eids, map_names=None,
                                   consider_0d=False, consider_0d_rigid=False,
                                   consider_1d=False, consider_2d=True, consider_3d=False)
+    topology : ElementTopology; default=None -> calculate
+        the shell element topology; used instead of maps
 
     Returns
     -------
@@ -34,16 +38,18 @@ def free_edges(model: BDF, eids: Optional[list[int]]=None, maps=None) -> list[tu
     """
     if maps is not None:
         edge_to_eid_map = maps['edge_to_eid_map']
-    else:
-        edge_to_eid_map = _get_edge_to_eids_map(model, eids=eids)
+        edges = []
+        for edge, eids in edge_to_eid_map.items():
+            if len(eids) == 1:
+                edges.append(edge)
+        return edges
 
-    edges = []
-    for edge, eids in edge_to_eid_map.items():
-        if len(eids) == 1:
-            edges.append(edge)
-    return edges
+    if topology is None:
+        topology = ElementTopology(model, eids=eids)
+    return [tuple(edge) for edge in topology.free_edges().tolist()]
 
-def non_paired_edges(model: BDF, eids: list[int]=None, maps=None) -> list[tuple[int, int]]:
+def non_paired_edges(model: BDF, eids: list[int]=None, maps=None,
+                     topology: Optional[ElementTopology]=None) -> list[tuple[int, int]]:
     """
     Gets the edges not shared by exactly 2 elements.
     This is useful for identifying rib/spar intersections.
@@ -58,6 +64,8 @@ def non_paired_edges(model: BDF, eids: list[int]=None, maps=None) -> list[tuple[
         the output from _get_maps(eids, map_names=None,
                                   consider_0d=False, consider_0d_rigid=False,
                                   consider_1d=False, consider_2d=True, consider_3d=False)
+    topology : ElementTopology; default=None -> calculate
+        the shell element topology; used instead of maps
 
     Returns
     -------
@@ -67,37 +75,12 @@ def non_paired_edges(model: BDF, eids: list[int]=None, maps=None) -> list[tuple[
     """
     if maps is not None:
         edge_to_eid_map = maps['edge_to_eid_map']
-    else:
-        edge_to_eid_map = _get_edge_to_eids_map(model, eids=eids)
-
-    edges = []
-    for edge, eids in edge_to_eid_map.items():
-        if len(eids) != 2:
-            edges.append(edge)
-    return edges
-
-def _get_edge_to_eids_map(model, eids=None):
-    """helper method"""
-    edge_to_eids = defaultdict(set)
-    shell_elements = ['CTRIA3', 'CTRIAX', 'CTRIA6', 'CTRIAX6',
-                      'CQUAD4', 'CQUAD', 'CQUAD8', 'CQUADR', 'CQUADX', 'CQUADX8',
-                      'CSHEAR']
-    if eids is None:
-        for eid, elem in model.elements.items():
-            if elem.type not in shell_elements:
-                continue
-            edges = elem.get_edge_ids()
-            for edge in edges:
-                edge_to_eids[edge].add(eid)
-    else:
-        if isinstance(eids, int):
-            eids = [eids]
-        for eid in eids:
-            elem = model.elements[eid]
-            if elem.type not in shell_elements:
-                continue
-            edges = elem.get_edge_ids()
-            for edge in edges:
-                edge_to_eids[edge].add(eid)
+        edges = []
+        for edge, eids in edge_to_eid_map.items():
+            if len(eids) != 2:
+                edges.append(edge)
+        return edges
 
-    return edge_to_eids
+    if topology is None:
+        topology = ElementTopology(model, eids=eids)
+    return [tuple(edge) for edge in topology.non_paired_edges().tolist()]
@@ -7,12 +7,11 @@ defines:
                           size=8, is_double=False, encoding=None)
 
 """
-from copy import deepcopy
-from collections import defaultdict
 from typing import Optional, Any
 
 from pyNastran.bdf.field_writer_8 import print_card_8
 from pyNastran.bdf.bdf import read_bdf, BDF
+from pyNastran.bdf.mesh_utils.topology import ElementTopology, get_skin_face_maps
 
 def get_element_faces(model: BDF,
                       element_ids: Optional[list[int]]=None) -> Any:
@@ -73,45 +72,8 @@ def get_solid_skin_faces(model: BDF) -> Any:
        value : unsorted face
 
     """
-    eid_faces = get_element_faces(model)
-    face_set = defaultdict(int)
-    eid_set = defaultdict(list)
-    face_map = {}
-    for eid, face in eid_faces:
-        #print(eid, face)
-        raw_face = deepcopy(face)
-        try:
-            face.sort()
-        except Exception:
-            print('face = %s' % str(face))
-            raise
-        tface = tuple(face)
-        #print(tface)
-        face_set[tface] += 1
-        eid_set[tface].append(eid)
-        face_map[tface] = raw_face
-
-    #print('eid_set:')
-    #for tface, eidset in eid_set.items():
-        #print(tface, eidset)
-
-    #print('face_set:')
-    #for tface, faceset in face_set.items():
-        #print(tface, faceset)
-
-    #print('face_map:')
-    #for tface, facemap in face_map.items():
-        #print(tface, facemap)
-
-    del_faces = []
-    for face, face_count in face_set.items():
-        if face_count == 2:
-            del_faces.append(face)
-
-    for face in del_faces:
-        del face_set[face]
-        del eid_set[face]
-    return eid_set, face_map
+    topology = ElementTopology(model, consider_2d=False, consider_3d=True)
+    return get_skin_face_maps(topology)
 
 
 def write_skin_solid_faces(model, skin_filename,
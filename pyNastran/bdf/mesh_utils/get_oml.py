@@ -5,13 +5,14 @@ defines:
 
 """
 from io import StringIO
-from copy import deepcopy
 from pathlib import PurePath
 import numpy as np
+import scipy.sparse
+from scipy.sparse.csgraph import connected_components
 
 from pyNastran.bdf.bdf import BDF
 from pyNastran.bdf.mesh_utils.internal_utils import get_bdf_model
-#from pyNastran.bdf.bdf_interface.dev_utils import get_free_edges
+from pyNastran.bdf.mesh_utils.topology import ElementTopology, get_shell_normals
 
 
 def get_oml_eids(bdf_filename: str | BDF | PurePath | StringIO,
@@ -39,103 +40,48 @@ def get_oml_eids(bdf_filename: str | BDF | PurePath | StringIO,
         this considers a 180 degree error to be 0.0, which will cause other problems
 
     """
-    #ninety = np.radians(90.)
-
-    #2810 # start for bwb_saero.bdf
-    #2811 # close
-    #2819 # close
-    #2818 # close
-
-    #eids_oml = np.array([eid_start])
-    eids_oml = set([eid_start])
-    #---------------------------------
     theta_tol = np.radians(theta_tol)
 
     model = get_bdf_model(bdf_filename, xref=True, log=None, debug=True)
-    maps = model._get_maps(
-        eids=None, map_names=None,
-        consider_0d=False, consider_0d_rigid=False,
-        consider_1d=False, consider_2d=True, consider_3d=False)
-    edge_to_eid_map = maps['edge_to_eid_map']
-    eid_to_edge_map = maps['eid_to_edge_map']
-    unused_nid_to_edge_map = maps['nid_to_edge_map']
+    topology = ElementTopology(model)
+    eids = topology.eids
 
-    #free_edges = get_free_edges(model, maps=maps)
-    #---------------------------------
-    normals = {}
-    etypes_skipped = set()
+    # the normals of the unsupported elements are nan, so they're
+    # never part of the OML
+    normals = get_shell_normals(model, eids)
     shells = {'CTRIA3', 'CQUAD4', 'CTRIA6', 'CQUAD8', 'CQUAD'}
-    for eid, elem in model.elements.items():
-        if elem.type in shells:
-            normals[eid] = elem.Normal()
-        else:
-            if elem.type in etypes_skipped:
-                continue
-            model.log.debug(f'elem.type={elem.type!r} is not supported')
-            etypes_skipped.add(elem.type)
-
-    #eid_starts = eids_oml.tolist()
-    eids_next = set([eid_start])
-    while eids_next:
-        eid_starts = deepcopy(eids_next)
-        eids_oml_start = deepcopy(eids_oml)
-        model.log.debug(f'nactive_elements = {len(eid_starts)}')
-        while eid_starts:
-            eid_start = eid_starts.pop()
-            normal_start = normals[eid_start]
-
-            # get the next set of edges
-            edges = eid_to_edge_map[eid_start]
-
-
-            #flattened = []
-            #for row in matrix:
-                #for n in row:
-                    #flattened.append(n)
-            # flattened = [n for row in matrix for n in row]
-            #eids_to_consider = [edge_to_eid_map[edge] for edge in edges]
-            list_eids_to_consider = []
-            for edge in edges:
-                eids_with_edge = edge_to_eid_map[edge]
-                list_eids_to_consider += eids_with_edge
-            #list_eids_to_consider = set([eid for eid in edge_to_eid_map[edge] for edge in edges])
-            #print('list_eids_to_consider =', list_eids_to_consider)
-            eids_to_consider = set(list_eids_to_consider)
-
-            # don't do the same element twice; creates an infinite loop if you do
-            #eids_to_check = np.setdiff1d(eids_to_consider, eids_oml)
-            eids_to_check = eids_to_consider.difference(eids_oml)
-
-            # don't check elements we're checking right now
-            #eids_to_check = np.setdiff1d(eids_to_consider, eid_starts)
-            eids_to_check = eids_to_consider.difference(eid_starts)
-
-            #print('eids_to_check =', eids_to_check)
-            for eid in eids_to_check:
-                normal = normals[eid]
-                # a o b = a * b * cos(theta)
-                # cos(theta) = (a o b)/ (a b); where |a| = 1; |b| = 1
-                cos_theta = np.clip(normal @ normal_start, -1.0, 1.0)
-                theta = np.arccos(cos_theta)
-                if theta < theta_tol:
-                    eids_next.add(eid)
-                    eids_oml.add(eid)
-                elif consider_flippped_normals:
-                    # handles flipped normals
-                    cos_theta = np.clip(normal @ -normal_start, -1.0, 1.0)
-                    theta = np.arccos(cos_theta)
-                    if theta < theta_tol:
-                        eids_next.add(eid)
-                        eids_oml.add(eid)
-            #print('eids_next =', eids_next)
-        eids_next = eids_next.difference(eids_oml_start)
-        #eids_next = eids_next.difference(eid_starts)
-        #print('eids_next =', eids_next)
-        #print('-------------------------------')
+    etypes_skipped = {model.elements[eid].type for eid in eids.tolist()} - shells
+    for etype in sorted(etypes_skipped):
+        model.log.debug(f'elem.type={etype!r} is not supported')
+
+    ielement = np.where(eids == eid_start)[0]
+    if len(ielement) == 0 or np.isnan(normals[ielement[0], 0]):
+        raise KeyError(f'eid_start={eid_start} is not a supported shell element')
+
+    # an element is part of the OML if it shares an edge with an OML
+    # element and the angle between the normals is less than theta_tol,
+    # so the OML is the connected set of elements that contains eid_start
+    element_ptr, ineighbor = topology.get_element_neighbors()
+    ielement1 = np.repeat(np.arange(len(eids)), np.diff(element_ptr))
+    ielement2 = ineighbor
+
+    # a o b = a * b * cos(theta)
+    # cos(theta) = (a o b)/ (a b); where |a| = 1; |b| = 1
+    with np.errstate(invalid='ignore'):
+        cos_theta = np.clip((normals[ielement1, :] * normals[ielement2, :]).sum(axis=1), -1.0, 1.0)
+        is_connected = np.arccos(cos_theta) < theta_tol
+        if consider_flippped_normals:
+            # handles flipped normals
+            is_connected |= np.arccos(-cos_theta) < theta_tol
+
+    nelements = len(eids)
+    graph = scipy.sparse.csr_matrix(
+        (np.ones(is_connected.sum(), dtype='int8'),
+         (ielement1[is_connected], ielement2[is_connected])),
+        shape=(nelements, nelements))
+    unused_ncomponents, labels = connected_components(graph, directed=False)
+    eids_oml = set(eids[labels == labels[ielement[0]]].tolist())
     model.log.debug('done with get_oml_eids')
-
-    #with open('eids_oml.txt', 'w') as eids_file:
-        #eids_file.write('eids_oml = %s\n' % list(eids_oml))
     return model, eids_oml
 
 def main():  # pragma: no cover
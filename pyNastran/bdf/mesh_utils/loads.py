@@ -4,6 +4,10 @@ Defines:
       find the net force/moment on the model
   - sum_forces_moments_elements
       find the net force/moment on the model for a subset of elements
+  - sum_forces_moments_loadcases
+      find the net force/moment on the model for multiple load cases
+  - sum_forces_moments_by_element
+      find the pressure force/moment on each element
 
 """
 from __future__ import annotations
@@ -20,6 +24,11 @@ if TYPE_CHECKING:  # pragma: no cover
     from pyNastran.bdf.bdf import BDF, Subcase
 
 
+_NAN3 = np.full(3, np.nan)
+_TRI_TYPES = {'CTRIA3', 'CTRIA6', 'CTRIAR'}
+_QUAD_TYPES = {'CQUAD4', 'CQUAD8', 'CQUAD', 'CQUADR', 'CSHEAR'}
+
+
 def isnan(value):
     return value is None or np.isnan(value)
 
@@ -63,9 +72,10 @@ def sum_forces_moments(model: BDF,
         the moments
 
     .. warning:: not full validated
-    .. todo:: It's super slow for cid != 0.   We can speed this up a lot
-             if we calculate the normal, area, centroid based on
-             precomputed node locations.
+    .. note:: The nodal loads and the PLOAD, PLOAD2 and shell PLOAD4
+              pressures are grouped and summed as arrays.  The rest of
+              the loads (e.g., PLOAD1, solid PLOAD4s) are summed one at
+              a time.
 
     Pressure acts in the normal direction per model/real/loads.bdf and loads.f06
 
@@ -74,13 +84,134 @@ def sum_forces_moments(model: BDF,
         raise RuntimeError('loadcase_id must be an integer; loadcase_id=%r' % loadcase_id)
 
     p = _get_load_summation_point(model, p0, cid=0)
+    xyz = get_xyz_cid0_dict(model, xyz_cid0=xyz_cid0)
+    F, M, unused_load_arrays = _sum_forces_moments(
+        model, p, loadcase_id, include_grav, xyz, None)
+
+    #forces, moments = sum_forces_moments(self, p0, loadcase_id,
+    #include_grav=include_grav, xyz_cid0=xyz_cid0)
+    if cid == 0:
+        return F, M
+    cid0 = 0
+    F2, M2 = transform_load(F, M, cid0, cid, model)
+    return F2, M2
+
+def sum_forces_moments_loadcases(model: BDF,
+                                 p0: int | np.ndarray,
+                                 loadcase_ids: list[int],
+                                 cid: int=0,
+                                 include_grav: bool=False,
+                                 xyz_cid0: Optional[dict[int, NDArray3float]]=None,
+                                 ) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Sums applied forces & moments about a reference point p0 for
+    multiple load cases.  The node locations are only calculated once.
+
+    Parameters
+    ----------
+    model : BDF()
+        a BDF object
+    p0 : NUMPY.NDARRAY shape=(3,) or integer (node ID)
+        the reference point
+    loadcase_ids : list[int]
+        the LOAD=IDs to analyze
+    cid : int; default=0
+        the coordinate system for the summation
+    include_grav : bool; default=False
+        includes gravity in the summation (not supported)
+    xyz_cid0 : None / dict[int] = (3, ) ndarray
+        the nodes in the global coordinate system
+
+    Returns
+    -------
+    forces : (nloadcases, 3) float ndarray
+        the forces
+    moments : (nloadcases, 3) float ndarray
+        the moments
+
+    """
+    p = _get_load_summation_point(model, p0, cid=0)
+    xyz = get_xyz_cid0_dict(model, xyz_cid0=xyz_cid0)
+    nid_xyz = _get_nid_xyz_arrays(xyz)
+
+    nloadcases = len(loadcase_ids)
+    forces = np.zeros((nloadcases, 3), dtype='float64')
+    moments = np.zeros((nloadcases, 3), dtype='float64')
+    for i, loadcase_id in enumerate(loadcase_ids):
+        if not isinstance(loadcase_id, integer_types):
+            raise RuntimeError('loadcase_id must be an integer; loadcase_id=%r' % loadcase_id)
+        F, M, unused_load_arrays = _sum_forces_moments(
+            model, p, loadcase_id, include_grav, xyz, nid_xyz)
+        if cid != 0:
+            F, M = transform_load(F, M, 0, cid, model)
+        forces[i, :] = F
+        moments[i, :] = M
+    return forces, moments
+
+def sum_forces_moments_by_element(model: BDF,
+                                  p0: int | np.ndarray,
+                                  loadcase_id: int,
+                                  cid: int=0,
+                                  xyz_cid0: Optional[dict[int, NDArray3float]]=None,
+                                  ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Sums the PLOAD2/PLOAD4 forces & moments about a reference point p0
+    on each element.
+
+    Parameters
+    ----------
+    model : BDF()
+        a BDF object
+    p0 : NUMPY.NDARRAY shape=(3,) or integer (node ID)
+        the reference point
+    loadcase_id : int
+        the LOAD=ID to analyze
+    cid : int; default=0
+        the coordinate system for the summation
+    xyz_cid0 : None / dict[int] = (3, ) ndarray
+        the nodes in the global coordinate system
+
+    Returns
+    -------
+    eids : (nelements, ) int ndarray
+        the sorted element ids with a pressure load
+    forces : (nelements, 3) float ndarray
+        the forces on each element
+    moments : (nelements, 3) float ndarray
+        the moments on each element
+
+    """
+    if not isinstance(loadcase_id, integer_types):
+        raise RuntimeError('loadcase_id must be an integer; loadcase_id=%r' % loadcase_id)
+
+    p = _get_load_summation_point(model, p0, cid=0)
+    xyz = get_xyz_cid0_dict(model, xyz_cid0=xyz_cid0)
+    unused_F, unused_M, load_arrays = _sum_forces_moments(
+        model, p, loadcase_id, False, xyz, None)
+
+    eids, ieid = np.unique(load_arrays.element_eids, return_inverse=True)
+    forces = np.zeros((len(eids), 3), dtype='float64')
+    moments = np.zeros((len(eids), 3), dtype='float64')
+    np.add.at(forces, ieid, load_arrays.element_forces)
+    np.add.at(moments, ieid, load_arrays.element_moments)
+    if cid != 0:
+        for i, (force, moment) in enumerate(zip(forces, moments)):
+            forces[i, :], moments[i, :] = transform_load(force, moment, 0, cid, model)
+    return eids, forces, moments
+
+def _sum_forces_moments(model: BDF, p: np.ndarray, loadcase_id: int,
+                        include_grav: bool,
+                        xyz: dict[int, np.ndarray],
+                        nid_xyz: Optional[tuple[np.ndarray, np.ndarray]],
+                        ) -> tuple[np.ndarray, np.ndarray, _LoadArrays]:
+    """helper method for ``sum_forces_moments``"""
     loads, scale_factors, unused_is_grav = model.get_reduced_loads(
         loadcase_id, skip_scale_factor0=True)
 
     F = array([0., 0., 0.])
     M = array([0., 0., 0.])
-    xyz = get_xyz_cid0_dict(model, xyz_cid0=xyz_cid0)
 
+    load_arrays = _LoadArrays()
     unsupported_types = set()
     for load, scale in zip(loads, scale_factors):
         #if load.type not in ['FORCE1']:
@@ -90,88 +221,42 @@ def sum_forces_moments(model: BDF,
                 cp_ref = load.cid_ref
                 #from pyNastran.bdf.bdf import CORD2R
                 #cp_ref = CORD2R()
-                f = load.mag * cp_ref.transform_vector_to_global(load.xyz) * scale
+                load_arrays.add_force(load.node_id, load.mag * scale,
+                                      cp_ref.transform_vector_to_global(load.xyz))
             else:
-                f = load.mag * load.xyz * scale
-
-            node = model.Node(load.node_id)
-            r = xyz[node.nid] - p
-            m = cross(r, f)
-            F += f
-            M += m
-        elif load.type == 'FORCE1':
-            f = load.mag * load.xyz * scale
-            node = model.Node(load.node_id)
-            r = xyz[node.nid] - p
-            m = cross(r, f)
-            F += f
-            M += m
-        elif load.type == 'FORCE2':
-            f = load.mag * load.xyz * scale
-            node = model.Node(load.node_id)
-            r = xyz[node.nid] - p
-            m = cross(r, f)
-            F += f
-            M += m
+                load_arrays.add_force(load.node_id, load.mag * scale, load.xyz)
+        elif load.type in ['FORCE1', 'FORCE2']:
+            load_arrays.add_force(load.node_id, load.mag * scale, load.xyz)
         elif load.type == 'MOMENT':
             if load.Cid() != 0:
                 cp = load.cid_ref
                 #from pyNastran.bdf.bdf import CORD2R
                 #cp = CORD2R()
-                m = load.mag * cp.transform_vector_to_global(load.xyz) * scale
+                load_arrays.add_moment(load.mag * scale,
+                                       cp.transform_vector_to_global(load.xyz))
             else:
-                m = load.mag * load.xyz * scale
-            M += m
-        elif load.type == 'MOMENT1':
-            m = load.mag * load.xyz * scale
-            M += m
-        elif load.type == 'MOMENT2':
-            m = load.mag * load.xyz * scale
-            M += m
+                load_arrays.add_moment(load.mag * scale, load.xyz)
+        elif load.type in ['MOMENT1', 'MOMENT2']:
+            load_arrays.add_moment(load.mag * scale, load.xyz)
 
         elif load.type == 'PLOAD':
-            nodes = load.node_ids
-            nnodes = len(nodes)
-            if nnodes == 3:
-                n1, n2, n3 = xyz[nodes[0]], xyz[nodes[1]], xyz[nodes[2]]
-                axb = cross(n1 - n2, n1 - n3)
-                centroid = (n1 + n2 + n3) / 3.
-            elif nnodes == 4:
-                n1, n2, n3, n4 = xyz[nodes[0]], xyz[nodes[1]], xyz[nodes[2]], xyz[nodes[3]]
-                axb = cross(n1 - n3, n2 - n4)
-                centroid = (n1 + n2 + n3 + n4) / 4.
-            else:
-                msg = 'invalid number of nodes on PLOAD card; nodes=%s' % str(nodes)
-                raise RuntimeError(msg)
-
-            area, normal = _get_area_normal(axb, nodes, xyz)
-            r = centroid - p
-            f = load.pressure * area * normal * scale
-            m = cross(r, f)
-
-            F += f
-            M += m
+            load_arrays.add_pload(load.node_ids, load.pressure * scale, 1.)
 
         elif load.type == 'PLOAD1':
             _pload1_total(model, loadcase_id, load, scale, xyz, F, M, p)
 
         elif load.type == 'PLOAD2':
-            pressure = load.pressure * scale
+            eids = []
             for eid in load.element_ids:
                 elem = model.elements[eid]
                 if elem.type in ['CTRIA3', 'CQUAD4', 'CSHEAR', 'CQUADR', 'CTRIAR']:
-                    n = elem.Normal()
-                    area = elem.Area()
-                    f = pressure * n * area
-                    r = elem.Centroid() - p
-                    m = cross(r, f)
-                    F += f
-                    M += m
+                    eids.append(eid)
                 else:
                     model.log.warning('case=%s etype=%r loadtype=%r not supported' % (
                         loadcase_id, elem.type, load.type))
+            load_arrays.add_pressure(load, eids, [load.pressure] * 4, scale, None)
         elif load.type == 'PLOAD4':
-            _pload4_total(loadcase_id, load, scale, xyz, F, M, p)
+            _add_pload4(load_arrays, loadcase_id, load, scale, xyz, F, M, p)
 
         elif load.type == 'GRAV':
             if include_grav:  # this will be super slow
@@ -191,13 +276,262 @@ def sum_forces_moments(model: BDF,
     for load_type in unsupported_types:
         model.log.warning('case=%s loadtype=%r not supported' % (loadcase_id, load_type))
 
-    #forces, moments = sum_forces_moments(self, p0, loadcase_id,
-    #include_grav=include_grav, xyz_cid0=xyz_cid0)
-    if cid == 0:
-        return F, M
-    cid0 = 0
-    F2, M2 = transform_load(F, M, cid0, cid, model)
-    return F2, M2
+    if nid_xyz is None and load_arrays.has_nodes():
+        nid_xyz = _get_nid_xyz_arrays(xyz)
+    load_arrays.sum(model, loadcase_id, p, xyz, nid_xyz, F, M)
+    return F, M, load_arrays
+
+def _add_pload4(load_arrays: _LoadArrays, loadcase_id: int, load: PLOAD4, scale: float,
+                xyz: dict[int, np.ndarray], F: np.ndarray, M: np.ndarray,
+                p: np.ndarray, eids: Optional[set[int]]=None) -> None:
+    """
+    Adds a PLOAD4 to the summation.  SURF loads are summed as arrays;
+    LINE loads are summed one element at a time.
+    """
+    if load.surf_or_line != 'SURF':
+        if eids is None:
+            _pload4_total(loadcase_id, load, scale, xyz, F, M, p)
+        else:
+            _pload4_elements(loadcase_id, load, scale, eids, xyz, F, M, p)
+        return
+    assert load.line_load_dir == 'NORM', f'line_load_dir = {load.line_load_dir!r}'
+    # None: the element normal
+    load_dir = update_pload4_vector(load, None, load.Cid())
+    load_arrays.add_pressure(load, load.eids, load.pressures, scale, load_dir)
+
+
+class _LoadArrays:
+    """
+    Collects the loads that are summed as arrays by ``sum_forces_moments``
+    and ``sum_forces_moments_elements``.
+    """
+    def __init__(self):
+        # FORCE, FORCE1, FORCE2
+        self.force_nids: list[int] = []
+        self.force_scales: list[float] = []
+        self.force_vectors: list[np.ndarray] = []
+
+        # MOMENT, MOMENT1, MOMENT2
+        self.moment_scales: list[float] = []
+        self.moment_vectors: list[np.ndarray] = []
+
+        # PLOAD; keyed by the number of nodes
+        self.pload_nodes: dict[int, list[list[int]]] = {3: [], 4: []}
+        self.pload_scales: dict[int, list[float]] = {3: [], 4: []}
+
+        # PLOAD2, PLOAD4
+        self.pressure_loads: list[PLOAD2 | PLOAD4] = []
+        self.pressure_eids: list[int] = []
+        self.pressure_neids: list[int] = []
+        self.pressure_pressures: list[np.ndarray] = []
+        self.pressure_scales: list[float] = []
+        self.pressure_dirs: list[np.ndarray] = []
+
+        # the force/moment from the PLOAD2/PLOAD4s on each element;
+        # an element is repeated if it has multiple loads
+        self.element_eids = np.zeros(0, dtype='int64')
+        self.element_forces = np.zeros((0, 3), dtype='float64')
+        self.element_moments = np.zeros((0, 3), dtype='float64')
+
+    def add_force(self, nid: int, scale: float, vector: np.ndarray) -> None:
+        """adds a FORCE, FORCE1, FORCE2"""
+        self.force_nids.append(nid)
+        self.force_scales.append(scale)
+        self.force_vectors.append(vector)
+
+    def add_moment(self, scale: float, vector: np.ndarray) -> None:
+        """adds a MOMENT, MOMENT1, MOMENT2"""
+        self.moment_scales.append(scale)
+        self.moment_vectors.append(vector)
+
+    def add_pload(self, nodes: list[int], pressure: float, node_scale: float) -> None:
+        """adds a PLOAD"""
+        nnodes = len(nodes)
+        if nnodes not in self.pload_nodes:
+            msg = 'invalid number of nodes on PLOAD card; nodes=%s' % str(nodes)
+            raise RuntimeError(msg)
+        self.pload_nodes[nnodes].append(nodes)
+        self.pload_scales[nnodes].append(pressure * node_scale)
+
+    def add_pressure(self, load: PLOAD2 | PLOAD4, eids: list[int],
+                     pressures: list[float], scale: float,
+                     load_dir: Optional[np.ndarray]) -> None:
+        """
+        Adds a PLOAD2/PLOAD4
+
+        Parameters
+        ----------
+        load : PLOAD2 / PLOAD4
+            the load
+        eids : list[int]
+            the elements to load
+        pressures : (4, ) float list
+            the corner pressures
+        scale : float
+            the load scale factor
+        load_dir : (3, ) float ndarray / None
+            the direction of the load
+            None : the element normal
+
+        """
+        if len(eids) == 0:
+            return
+        self.pressure_loads.append(load)
+        self.pressure_eids.extend(eids)
+        self.pressure_neids.append(len(eids))
+        self.pressure_pressures.append(pressures)
+        self.pressure_scales.append(scale)
+        self.pressure_dirs.append(_NAN3 if load_dir is None else load_dir)
+
+    def has_nodes(self) -> bool:
+        """are the node locations required"""
+        return bool(self.force_nids or self.pload_nodes[3] or self.pload_nodes[4] or
+                    self.pressure_eids)
+
+    def sum(self, model: BDF, loadcase_id: int, p: np.ndarray,
+            xyz: dict[int, np.ndarray],
+            nid_xyz: tuple[np.ndarray, np.ndarray],
+            F: np.ndarray, M: np.ndarray,
+            eids: Optional[np.ndarray]=None) -> None:
+        """
+        Sums the loads into F and M
+
+        Parameters
+        ----------
+        eids : (n, ) int ndarray; default=None -> all
+            the elements to include for the PLOAD2/PLOAD4s
+
+        """
+        if self.force_nids:
+            r = _get_xyz(nid_xyz, self.force_nids) - p
+            f = np.array(self.force_scales)[:, np.newaxis] * np.array(self.force_vectors)
+            F += f.sum(axis=0)
+            M += cross(r, f).sum(axis=0)
+
+        if self.moment_scales:
+            m = np.array(self.moment_scales)[:, np.newaxis] * np.array(self.moment_vectors)
+            M += m.sum(axis=0)
+
+        for nnodes, nodes in self.pload_nodes.items():
+            if len(nodes) == 0:
+                continue
+            nodes_array = np.array(nodes, dtype='int64')
+            area, centroid, normal = _get_area_centroid_normal_array(
+                _get_xyz(nid_xyz, nodes_array), nodes_array, xyz)
+            f = (np.array(self.pload_scales[nnodes]) * area)[:, np.newaxis] * normal
+            F += f.sum(axis=0)
+            M += cross(centroid - p, f).sum(axis=0)
+
+        if self.pressure_eids:
+            self._sum_pressure(model, loadcase_id, p, xyz, nid_xyz, eids)
+            F += self.element_forces.sum(axis=0)
+            M += self.element_moments.sum(axis=0)
+
+    def _sum_pressure(self, model: BDF, loadcase_id: int, p: np.ndarray,
+                      xyz: dict[int, np.ndarray],
+                      nid_xyz: tuple[np.ndarray, np.ndarray],
+                      eids: Optional[np.ndarray]) -> None:
+        """calculates the force/moment on each element from the PLOAD2/PLOAD4s"""
+        all_eids = np.array(self.pressure_eids, dtype='int64')
+        iload = np.repeat(np.arange(len(self.pressure_neids)), self.pressure_neids)
+        if eids is not None:
+            is_used = np.isin(all_eids, eids)
+            all_eids = all_eids[is_used]
+            iload = iload[is_used]
+
+        # the geometry of the unique shell elements; nface=0 for the others
+        ueids, ieid = np.unique(all_eids, return_inverse=True)
+        nueids = len(ueids)
+        nodes = np.zeros((nueids, 4), dtype='int64')
+        nface = np.zeros(nueids, dtype='int32')
+        elements = model.elements
+        for i, eid in enumerate(ueids.tolist()):
+            elem = elements[eid]
+            if elem.type in _TRI_TYPES:
+                nodes[i, :3] = elem.nodes[:3]
+                nface[i] = 3
+            elif elem.type in _QUAD_TYPES:
+                nodes[i, :] = elem.nodes[:4]
+                nface[i] = 4
+        itri = np.where(nface == 3)[0]
+        iquad = np.where(nface == 4)[0]
+        area = np.full(nueids, np.nan)
+        centroid = np.full((nueids, 3), np.nan)
+        normal = np.full((nueids, 3), np.nan)
+        for ielement, nnodes in ((itri, 3), (iquad, 4)):
+            if len(ielement):
+                nodesi = nodes[ielement, :nnodes]
+                area[ielement], centroid[ielement, :], normal[ielement, :] = (
+                    _get_area_centroid_normal_array(_get_xyz(nid_xyz, nodesi), nodesi, xyz))
+
+        # the mean pressure on the face
+        nface = nface[ieid]
+        pressures = np.array(self.pressure_pressures, dtype='float64')[iload, :]
+        is_tri = nface == 3
+        pressures[is_tri, 3] = pressures[is_tri, 0]
+        pressure = np.where(
+            is_tri,
+            pressures[:, :3].sum(axis=1) / 3.,
+            pressures.sum(axis=1) / 4.)
+        is_constant = pressures.min(axis=1) == pressures.max(axis=1)
+        pressure[is_constant] = pressures[is_constant, 0]
+
+        load_dir = np.array(self.pressure_dirs, dtype='float64')[iload, :]
+        is_normal = np.isnan(load_dir[:, 0])
+        load_dir[is_normal, :] = normal[ieid[is_normal], :]
+
+        scale = np.array(self.pressure_scales, dtype='float64')[iload]
+        forces = (pressure * area[ieid] * scale)[:, np.newaxis] * load_dir
+        moments = cross(centroid[ieid, :] - p, forces)
+
+        # the solid elements
+        for irow in np.where(nface == 0)[0].tolist():
+            load = self.pressure_loads[iload[irow]]
+            elem = elements[all_eids[irow]]
+            forces[irow, :], moments[irow, :] = _pload4_helper(
+                loadcase_id, load, scale[irow], elem, xyz, p)
+
+        self.element_eids = all_eids
+        self.element_forces = forces
+        self.element_moments = moments
+
+def _get_nid_xyz_arrays(xyz: dict[int, np.ndarray]) -> tuple[np.ndarray, np.ndarray]:
+    """gets the sorted node ids and locations from the xyz_cid0 dictionary"""
+    nnodes = len(xyz)
+    nids = np.fromiter(xyz.keys(), dtype='int64', count=nnodes)
+    xyz_array = np.array(list(xyz.values()), dtype='float64').reshape(nnodes, 3)
+    isort = np.argsort(nids)
+    return nids[isort], xyz_array[isort, :]
+
+def _get_xyz(nid_xyz: tuple[np.ndarray, np.ndarray], nids: np.ndarray) -> np.ndarray:
+    """gets the locations of an array of node ids"""
+    all_nids, xyz = nid_xyz
+    nids = np.asarray(nids, dtype='int64')
+    inid = np.searchsorted(all_nids, nids)
+    inid[inid == len(all_nids)] = 0
+    is_missing = (all_nids[inid] != nids) if len(all_nids) else np.ones(nids.shape, dtype='bool')
+    if is_missing.any():
+        raise KeyError('nids=%s are missing' % np.unique(nids[is_missing]).tolist())
+    return xyz[inid]
+
+def _get_area_centroid_normal_array(xyzs: np.ndarray, nodes: np.ndarray,
+                                    xyz: dict[int, np.ndarray],
+                                    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """vectorized version of ``_get_area_normal`` for triangles/quads"""
+    if xyzs.shape[1] == 3:
+        axb = cross(xyzs[:, 0, :] - xyzs[:, 1, :], xyzs[:, 0, :] - xyzs[:, 2, :])
+    else:
+        axb = cross(xyzs[:, 0, :] - xyzs[:, 2, :], xyzs[:, 1, :] - xyzs[:, 3, :])
+    centroid = xyzs.mean(axis=1)
+    nunit = norm(axb, axis=1)
+    area = 0.5 * nunit
+    try:
+        normal = axb / nunit[:, np.newaxis]
+    except FloatingPointError:
+        i = np.where(nunit == 0.)[0][0]
+        _get_area_normal(axb[i], nodes[i], xyz)
+        raise
+    return area, centroid, normal
 
 def _pload1_total(model, loadcase_id, load, scale, xyz, F, M, p):
     """helper method for ``sum_forces_moments``"""
@@ -416,6 +750,8 @@ def sum_forces_moments_elements(model: BDF,
         eids = list(model.element_ids)
     if nids is None:
         nids = list(model.node_ids)
+    eids_set = set(eids)
+    nids_set = set(nids)
 
     #for (key, load_case) in model.loads.items():
         #if key != loadcase_id:
@@ -429,6 +765,7 @@ def sum_forces_moments_elements(model: BDF,
 
     xyz = get_xyz_cid0_dict(model, xyz_cid0)
 
+    load_arrays = _LoadArrays()
     unsupported_types = set()
     shell_elements = {
         'CTRIA3', 'CQUAD4', 'CTRIAR', 'CQUADR',
@@ -440,59 +777,23 @@ def sum_forces_moments_elements(model: BDF,
         #print(load.type)
         loadtype = load.type
         if loadtype == 'FORCE':
-            if load.node_id not in nids:
+            if load.node_id not in nids_set:
                 continue
             if load.Cid() != 0:
                 cp_ref = load.cid_ref
                 #from pyNastran.bdf.bdf import CORD2R
                 #cp = CORD2R()
-                f = load.mag * cp_ref.transform_vector_to_global(load.xyz) * scale
+                load_arrays.add_force(load.node_id, load.mag * scale,
+                                      cp_ref.transform_vector_to_global(load.xyz))
             else:
-                f = load.mag * load.xyz * scale
-
-            node = model.Node(load.node_id)
-            r = xyz[node.nid] - p
-            m = cross(r, f)
-            F += f
-            M += m
-
-        elif load.type == 'FORCE1':
-            not_found_nid = False
-            for nid in load.node_ids:
-                if nid not in nids:
-                    not_found_nid = True
-                    break
-            if not_found_nid:
-                continue
+                load_arrays.add_force(load.node_id, load.mag * scale, load.xyz)
 
-            f = load.mag * load.xyz * scale
-            node = model.Node(load.node_id)
-            r = xyz[node.nid] - p
-            m = cross(r, f)
-            F += f
-            M += m
-        elif load.type == 'FORCE2':
-            not_found_nid = False
-            for nid in load.node_ids:
-                if nid not in nids:
-                    not_found_nid = True
-                    break
-            if not_found_nid:
+        elif loadtype in ['FORCE1', 'FORCE2']:
+            if not nids_set.issuperset(load.node_ids):
                 continue
-
-            f = load.mag * load.xyz * scale
-            node = model.Node(load.node_id)
-            r = xyz[node.nid] - p
-            m = cross(r, f)
-            F += f
-            M += m
-        elif load.type == 'MOMENT':
-            not_found_nid = False
-            for nid in load.node_ids:
-                if nid not in nids:
-                    not_found_nid = True
-                    break
-            if not_found_nid:
+            load_arrays.add_force(load.node_id, load.mag * scale, load.xyz)
+        elif loadtype == 'MOMENT':
+            if not nids_set.issuperset(load.node_ids):
                 continue
 
             if load.Cid() != 0:
@@ -500,92 +801,45 @@ def sum_forces_moments_elements(model: BDF,
                 m = cp_ref.transform_vector_to_global(load.xyz)
             else:
                 m = load.xyz
-            M += load.mag * m * scale
-        elif load.type == 'MOMENT1':
-            not_found_nid = False
-            for nid in load.node_ids:
-                if nid not in nids:
-                    not_found_nid = True
-                    break
-            if not_found_nid:
-                continue
-            m = load.mag * load.xyz * scale
-            M += m
-        elif loadtype == 'MOMENT2':
-            not_found_nid = False
-            for nid in load.node_ids:
-                if nid not in nids:
-                    not_found_nid = True
-                    break
-            if not_found_nid:
+            load_arrays.add_moment(load.mag * scale, m)
+        elif loadtype in ['MOMENT1', 'MOMENT2']:
+            if not nids_set.issuperset(load.node_ids):
                 continue
-            m = load.mag * load.xyz * scale
-            M += m
+            load_arrays.add_moment(load.mag * scale, load.xyz)
 
         elif loadtype == 'PLOAD':
             nodes = load.node_ids
             nnodes = len(nodes)
-            nodesi = 0
-            if nnodes == 3:
-                n1, n2, n3 = xyz[nodes[0]], xyz[nodes[1]], xyz[nodes[2]]
-                axb = cross(n1 - n2, n1 - n3)
-                centroid = (n1 + n2 + n3) / 3.
-
-            elif nnodes == 4:
-                n1, n2, n3, n4 = xyz[nodes[0]], xyz[nodes[1]], xyz[nodes[2]], xyz[nodes[3]]
-                axb = cross(n1 - n3, n2 - n4)
-                centroid = (n1 + n2 + n3 + n4) / 4.
-                if nodes[3] in nids:
-                    nodesi += 1
-            else:
-                raise RuntimeError('invalid number of nodes on PLOAD card; '
-                                   'nodes=%s' % str(nodes))
-            if nodes[0] in nids:
-                nodesi += 1
-            if nodes[1] in nids:
-                nodesi += 1
-            if nodes[2] in nids:
-                nodesi += 1
-
-            area, normal = _get_area_normal(axb, nodes, xyz)
-            r = centroid - p
-            f = load.pressure * area * normal * scale
-            m = cross(r, f)
-
+            nodesi = sum(nid in nids_set for nid in nodes)
             node_scale = nodesi / float(nnodes)
-            F += f * node_scale
-            M += m * node_scale
+            load_arrays.add_pload(nodes, load.pressure * scale, node_scale)
 
         elif loadtype == 'PLOAD1':
-            _pload1_elements(model, loadcase_id, load, scale, eids, xyz, F, M, p)
+            _pload1_elements(model, loadcase_id, load, scale, eids_set, xyz, F, M, p)
 
         elif loadtype == 'PLOAD2':
-            pressure = load.pressure * scale
+            eids_pload2 = []
             for eid in load.element_ids:
-                if eid not in eids:
+                if eid not in eids_set:
                     continue
                 elem = model.elements[eid]
                 if elem.type in shell_elements:
-                    normal = elem.Normal()
-                    area = elem.Area()
-                    f = pressure * normal * area
-                    r = elem.Centroid() - p
-                    m = cross(r, f)
-                    F += f
-                    M += m
+                    eids_pload2.append(eid)
                 else:
                     #model.log.warning('case=%s etype=%r loadtype=%r not supported' % (
                         #loadcase_id, elem.type, loadtype))
                     raise NotImplementedError('case=%s etype=%r loadtype=%r not supported' % (
                         loadcase_id, elem.type, loadtype))
+            load_arrays.add_pressure(load, eids_pload2, [load.pressure] * 4, scale, None)
         elif loadtype == 'PLOAD4':
-            _pload4_elements(loadcase_id, load, scale, eids, xyz, F, M, p)
+            _add_pload4(load_arrays, loadcase_id, load, scale, xyz, F, M, p,
+                        eids=eids_set)
 
         elif loadtype == 'GRAV':
             if include_grav:  # this will be super slow
                 g = load.GravityVector() * scale
                 for eid, elem in model.elements.items():
-                    if eid not in eids:
+                    if eid not in eids_set:
                         continue
                     centroid = elem.Centroid()
                     mass = elem.Mass()
@@ -600,6 +854,10 @@ def sum_forces_moments_elements(model: BDF,
             # we collect them so we only get one print
             unsupported_types.add(loadtype)
 
+    nid_xyz = _get_nid_xyz_arrays(xyz) if load_arrays.has_nodes() else None
+    load_arrays.sum(model, loadcase_id, p, xyz, nid_xyz, F, M,
+                    eids=np.array(list(eids_set), dtype='int64'))
+
     for loadtype in unsupported_types:
         model.log.warning('case=%s loadtype=%r not supported' % (loadcase_id, loadtype))
     #model.log.info("case=%s F=%s M=%s\n" % (loadcase_id, F, M))
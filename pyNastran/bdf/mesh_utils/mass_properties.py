@@ -161,14 +161,17 @@ def _mass_properties_elements_init(model: BDF,
             elements = []
         else:
             assert len(model.elements) > 0
-            elements = [element for eid, element in model.elements.items() if eid in element_ids]
+            element_ids_set = set(element_ids)
+            elements = [element for eid, element in model.elements.items()
+                        if eid in element_ids_set]
 
         if mass_ids is None:
             mass_ids = []
             masses = []
         else:
             assert len(model.masses) > 0
-            masses = [mass for eid, mass in model.masses.items() if eid in mass_ids]
+            mass_ids_set = set(mass_ids)
+            masses = [mass for eid, mass in model.masses.items() if eid in mass_ids_set]
     assert element_ids is not None, element_ids
     assert mass_ids is not None, mass_ids
     return element_ids, elements, mass_ids, masses
@@ -270,48 +273,36 @@ def _mass_properties(model: BDF, elements: list[Element], masses: list[int],
     mass = 0.
     cg = array([0., 0., 0.])
     inertia = array([0., 0., 0., 0., 0., 0., ])
-    no_mass = NO_MASS
-    mass_inertia = {'CONM2'}
+
+    # the common elements are calculated as arrays; the rest are
+    # calculated one at a time
+    class_elements: dict[str, list[Element]] = defaultdict(list)
     for pack in (elements, masses):
         for element in pack:
-            if element.type == 'CBEAM':
-                mass = _get_cbeam_mass_no_nsm(model, element, mass, cg, inertia, reference_point)
-                continue
-            if element.type in mass_inertia:
-                centroid, m, dI = element.centroid_mass_inertia()
-                di_list = [dI[0][0], dI[1][1], dI[2][2], dI[0][1], dI[0][2], dI[1][2]]
-                mass = _increment_inertia(centroid, reference_point, m, mass, cg, inertia)
-                inertia = [i1 + di for i1, di in zip(inertia, di_list)]
-                continue
-
-            try:
-                p = element.center_of_mass()  # was Centroid()
-            except AttributeError:
-                if element.type in no_mass:
-                    continue
-                model.log.error(element.rstrip())
-                raise
+            class_elements[element.__class__.__name__].append(element)
 
+    nid_xyz = None
+    for class_name, elements_list in class_elements.items():
+        if class_name == 'CONM2':
+            mass = _get_conm2_mass(elements_list, mass, cg, inertia, reference_point)
+            continue
+        func = MASS_CENTROID_ARRAY_FUNCS.get(class_name)
+        if func is not None:
+            if nid_xyz is None:
+                nid_xyz = _get_nid_xyz(model)
             try:
-                m = element.Mass()
-                #print(f'eid={element.eid:d} type={element.type} mass={m}')
-            #except AttributeError:
-                #raise
-            #except SystemExit:
-                #raise
-            except Exception:
-                #raise
-                if element.type in no_mass:
-                    continue
-                # PLPLANE
-                if element.pid_ref.type == 'PSHELL':
-                    model.log.warning('p=%s reference_point=%s type(reference_point)=%s' % (
-                        p, reference_point, type(reference_point)))
-                    raise
-                model.log.warning("could not get the inertia for element/property\n%s%s" % (
-                    element, element.pid_ref))
+                masses_array, centroids = func(elements_list, nid_xyz)
+            except (AttributeError, KeyError) as error:
+                # let the element methods handle the error
+                # (e.g., a PLPLANE doesn't have a mass or a node is missing)
+                model.log.debug(f'{class_name}: the elements are calculated one at '
+                                f'a time; {type(error).__name__}: {error}')
+            else:
+                mass = _increment_inertia_array(centroids, reference_point, masses_array,
+                                                mass, cg, inertia)
                 continue
-            mass = _increment_inertia(p, reference_point, m, mass, cg, inertia)
+        mass = _mass_properties_elements(model, elements_list, mass, cg, inertia,
+                                         reference_point)
 
     if mass:
         cg /= mass
@@ -323,6 +314,60 @@ def _mass_properties(model: BDF, elements: list[Element], masses: list[int],
         inertia = transform_inertia(mass, cg, xyz_ref, xyz_ref2, inertia)
     return mass, cg, inertia
 
+def _get_conm2_mass(elements: list[Any],
+                    mass: float, cg: np.ndarray, inertia: np.ndarray,
+                    reference_point: np.ndarray) -> float:
+    """helper method for the CONM2s"""
+    if len(elements) == 0:
+        return mass
+    centroids = []
+    masses = []
+    dinertia = np.zeros(6, dtype='float64')
+    for element in elements:
+        centroid, m, dI = element.centroid_mass_inertia()
+        centroids.append(centroid)
+        masses.append(m)
+        dinertia += [dI[0][0], dI[1][1], dI[2][2], dI[0][1], dI[0][2], dI[1][2]]
+    mass = _increment_inertia_array(np.array(centroids, dtype='float64'), reference_point,
+                                    np.array(masses, dtype='float64'), mass, cg, inertia)
+    inertia += dinertia
+    return mass
+
+def _mass_properties_elements(model: BDF, elements: list[Element],
+                              mass: float, cg: np.ndarray, inertia: np.ndarray,
+                              reference_point: np.ndarray) -> float:
+    """calculates the mass of the elements one at a time for ``mass_properties``"""
+    no_mass = NO_MASS
+    for element in elements:
+        if element.type == 'CBEAM':
+            mass = _get_cbeam_mass_no_nsm(model, element, mass, cg, inertia, reference_point)
+            continue
+
+        try:
+            p = element.center_of_mass()  # was Centroid()
+        except AttributeError:
+            if element.type in no_mass:
+                continue
+            model.log.error(element.rstrip())
+            raise
+
+        try:
+            m = element.Mass()
+            #print(f'eid={element.eid:d} type={element.type} mass={m}')
+        except Exception:
+            if element.type in no_mass:
+                continue
+            # PLPLANE
+            if element.pid_ref.type == 'PSHELL':
+                model.log.warning('p=%s reference_point=%s type(reference_point)=%s' % (
+                    p, reference_point, type(reference_point)))
+                raise
+            model.log.warning("could not get the inertia for element/property\n%s%s" % (
+                element, element.pid_ref))
+            continue
+        mass = _increment_inertia(p, reference_point, m, mass, cg, inertia)
+    return mass
+
 def _mass_properties_no_xref(model: BDF, elements: list[int], masses: list[int],
                              reference_point: np.ndarray, is_cg: bool,
                              ) -> tuple[float, np.ndarray, np.ndarray]:  # pragma: no cover
@@ -422,6 +467,255 @@ def _increment_inertia(centroid: np.ndarray, reference_point: np.ndarray,
     cg += m * centroid
     return mass
 
+def _increment_inertia_array(centroids: np.ndarray, reference_point: np.ndarray,
+                             masses: np.ndarray, mass: float,
+                             cg: np.ndarray,
+                             inertia: np.ndarray) -> float:
+    """vectorized version of ``_increment_inertia``"""
+    if len(masses) == 0:
+        return mass
+    (x, y, z) = (centroids - reference_point).T
+    x2 = x * x
+    y2 = y * y
+    z2 = z * z
+    inertia[0] += (masses * (y2 + z2)).sum()  # Ixx
+    inertia[1] += (masses * (x2 + z2)).sum()  # Iyy
+    inertia[2] += (masses * (x2 + y2)).sum()  # Izz
+    inertia[3] += (masses * x * y).sum()      # Ixy
+    inertia[4] += (masses * x * z).sum()      # Ixz
+    inertia[5] += (masses * y * z).sum()      # Iyz
+    mass += masses.sum()
+    cg += masses @ centroids
+    return mass
+
+def _get_nid_xyz(model: BDF,
+                 xyz_cid0_dict: Optional[dict[int, np.ndarray]]=None,
+                 ) -> tuple[np.ndarray, np.ndarray]:
+    """gets the sorted node ids and the global positions of the nodes"""
+    if xyz_cid0_dict is not None:
+        all_nids = np.array(list(xyz_cid0_dict), dtype='int64')
+        xyz_cid0 = np.array(list(xyz_cid0_dict.values()), dtype='float64').reshape(len(all_nids), 3)
+    elif model.nodes:
+        all_nids, xyz_cid0 = _get_nid_xyzcid0(model)
+    else:
+        return np.zeros(0, dtype='int64'), np.zeros((0, 3), dtype='float64')
+    isort = np.argsort(all_nids)
+    return all_nids[isort], xyz_cid0[isort, :]
+
+def _get_node_xyz(nid_xyz: tuple[np.ndarray, np.ndarray],
+                  elements: list[Any], nnodes: int) -> np.ndarray:
+    """gets the (nelements, nnodes, 3) positions of the first nnodes of each element"""
+    all_nids, xyz_cid0 = nid_xyz
+    nelements = len(elements)
+    nids = np.array([elem.nodes[:nnodes] for elem in elements],
+                    dtype='int64').reshape(nelements, nnodes)
+    inids = np.searchsorted(all_nids, nids)
+    inids[inids == len(all_nids)] = 0
+    is_missing = (all_nids[inids] != nids) if len(all_nids) else np.ones(nids.shape, dtype='bool')
+    if is_missing.any():
+        raise KeyError('missing nodes=%s' % np.unique(nids[is_missing]).tolist())
+    return xyz_cid0[inids, :]
+
+def _get_cached_values(elements: list[Any], get_key, get_value) -> np.ndarray:
+    """evaluates get_value(elem) once per get_key(elem) (e.g., a property id)"""
+    cache = {}
+    values = []
+    for elem in elements:
+        key = get_key(elem)
+        try:
+            value = cache[key]
+        except KeyError:
+            value = cache[key] = get_value(elem)
+        values.append(value)
+    return np.array(values, dtype='float64')
+
+def _line_length_centroid(xyz: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """gets the length and centroid of (n, 2, 3) line elements"""
+    p1 = xyz[:, 0, :]
+    p2 = xyz[:, 1, :]
+    length = norm(p2 - p1, axis=1)
+    centroid = (p1 + p2) / 2.
+    return length, centroid
+
+def _tri_area_centroid(xyz: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """gets the area and centroid of (n, 3, 3) triangles"""
+    p1 = xyz[:, 0, :]
+    p2 = xyz[:, 1, :]
+    p3 = xyz[:, 2, :]
+    area = 0.5 * norm(cross(p1 - p2, p1 - p3), axis=1)
+    centroid = (p1 + p2 + p3) / 3.
+    return area, centroid
+
+def _quad_area_centroid(xyz: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """gets the area and centroid of (n, 4, 3) quads"""
+    p1 = xyz[:, 0, :]
+    p2 = xyz[:, 1, :]
+    p3 = xyz[:, 2, :]
+    p4 = xyz[:, 3, :]
+    area = 0.5 * norm(cross(p3 - p1, p4 - p2), axis=1)
+    centroid = (p1 + p2 + p3 + p4) / 4.
+    return area, centroid
+
+def _tetra_volume_centroid(xyz: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """gets the (signed) volume and centroid of (n, 4, 3) tets"""
+    p1 = xyz[:, 0, :]
+    p2 = xyz[:, 1, :]
+    p3 = xyz[:, 2, :]
+    p4 = xyz[:, 3, :]
+    volume = -(
+        (p1 - p4) * cross(p2 - p4, p3 - p4)).sum(axis=1) / 6.
+    centroid = (p1 + p2 + p3 + p4) / 4.
+    return volume, centroid
+
+def _pyram_volume_centroid(xyz: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """gets the volume and centroid of (n, 5, 3) pyramids"""
+    area1, centroid1 = _quad_area_centroid(xyz[:, :4, :])
+    centroid5 = xyz[:, 4, :]
+    volume = area1 / 3. * norm(centroid1 - centroid5, axis=1)
+    centroid = (centroid1 + centroid5) / 2.
+    return volume, centroid
+
+def _penta_volume_centroid(xyz: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """gets the volume and centroid of (n, 6, 3) pentas"""
+    p1 = xyz[:, 0, :]
+    p2 = xyz[:, 1, :]
+    p3 = xyz[:, 2, :]
+    p4 = xyz[:, 3, :]
+    p5 = xyz[:, 4, :]
+    p6 = xyz[:, 5, :]
+    area1 = 0.5 * norm(cross(p3 - p1, p2 - p1), axis=1)
+    area2 = 0.5 * norm(cross(p6 - p4, p5 - p4), axis=1)
+    centroid1 = (p1 + p2 + p3) / 3.
+    centroid2 = (p4 + p5 + p6) / 3.
+    volume = (area1 + area2) / 2. * norm(centroid1 - centroid2, axis=1)
+    centroid = (centroid1 + centroid2) / 2.
+    return volume, centroid
+
+def _hexa_volume_centroid(xyz: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """gets the volume and centroid of (n, 8, 3) hexas"""
+    area1, centroid1 = _quad_area_centroid(xyz[:, :4, :])
+    area2, centroid2 = _quad_area_centroid(xyz[:, 4:8, :])
+    volume = (area1 + area2) / 2. * norm(centroid1 - centroid2, axis=1)
+    centroid = (centroid1 + centroid2) / 2.
+    return volume, centroid
+
+def _shell_mass_per_area(elem: Element, ptypes_to_skip: set[str]) -> float:
+    """
+    Gets the mass per area of a CTRIA3/CQUAD4-style element for
+    ``mass_properties_nsm``
+
+    Returns nan for properties without mass (e.g., PLPLANE).
+    """
+    prop = elem.pid_ref
+    if prop.type == 'PSHELL':
+        tflag = elem.tflag
+        ti = prop.Thickness()
+        tscales = elem.get_thickness_scale()
+        if tflag == 0:
+            # absolute
+            thicknesses = [ti if tscale is None else tscale for tscale in tscales]
+        elif tflag == 1:
+            # relative
+            thicknesses = [ti if tscale is None else tscale * ti for tscale in tscales]
+        else:  # pragma: no cover
+            raise RuntimeError('tflag=%r' % tflag)
+        assert sum(thicknesses) > 0., 'thicknesses=%s' % thicknesses
+        t = sum(thicknesses) / len(thicknesses)
+
+        # m/A = rho * A * t + nsm
+        mpa = prop.nsm + prop.Rho() * t
+    elif prop.type in ['PCOMP', 'PCOMPG']:
+        mpa = prop.get_mass_per_area()
+    elif prop.type in ptypes_to_skip:
+        mpa = np.nan
+    else:
+        raise NotImplementedError(prop.type)
+    return mpa
+
+def _shell_key(elem: Element) -> tuple[Any, ...]:
+    """the values that define the mass per area of a shell element"""
+    return elem.pid, elem.tflag, tuple(elem.get_thickness_scale())
+
+def _add_nsm_data(eids_pids_dict: dict[str, list[np.ndarray]],
+                  values_dict: dict[str, list[np.ndarray]],
+                  centroids_dict: dict[str, list[np.ndarray]],
+                  ptype: str, eids: np.ndarray, pids: Any,
+                  values: np.ndarray, centroids: np.ndarray) -> None:
+    """stores the area/length data that the NSM cards are distributed over"""
+    if len(eids) == 0:
+        return
+    eids_pids = np.zeros((len(eids), 2), dtype='int64')
+    eids_pids[:, 0] = eids
+    eids_pids[:, 1] = pids
+    eids_pids_dict[ptype].append(eids_pids)
+    values_dict[ptype].append(np.asarray(values, dtype='float64'))
+    centroids_dict[ptype].append(np.asarray(centroids, dtype='float64').reshape(len(eids), 3))
+
+def _mass_centroid_crod(elements: list[CROD], nid_xyz) -> tuple[np.ndarray, np.ndarray]:
+    """vectorized CROD.Mass() and CROD.center_of_mass()"""
+    length, centroid = _line_length_centroid(_get_node_xyz(nid_xyz, elements, 2))
+    mass_per_length = _get_cached_values(
+        elements, lambda elem: elem.pid,
+        lambda elem: elem.Rho() * elem.Area() + elem.Nsm())
+    return mass_per_length * length, centroid
+
+def _mass_centroid_conrod(elements: list[CONROD], nid_xyz) -> tuple[np.ndarray, np.ndarray]:
+    """vectorized CONROD.Mass() and CONROD.center_of_mass()"""
+    length, centroid = _line_length_centroid(_get_node_xyz(nid_xyz, elements, 2))
+    mass_per_length = np.array([elem.Rho() * elem.Area() + elem.Nsm() for elem in elements])
+    return mass_per_length * length, centroid
+
+def _mass_centroid_ctube(elements: list[Any], nid_xyz) -> tuple[np.ndarray, np.ndarray]:
+    """vectorized CTUBE.Mass() and CTUBE.center_of_mass()"""
+    length, centroid = _line_length_centroid(_get_node_xyz(nid_xyz, elements, 2))
+    mass_per_length = _get_cached_values(
+        elements, lambda elem: elem.pid, lambda elem: elem.pid_ref.MassPerLength())
+    return mass_per_length * length, centroid
+
+def _mass_centroid_cbar(elements: list[CBAR], nid_xyz) -> tuple[np.ndarray, np.ndarray]:
+    """vectorized CBAR.Mass() and CBAR.center_of_mass()"""
+    length, centroid = _line_length_centroid(_get_node_xyz(nid_xyz, elements, 2))
+    mass_per_length = _get_cached_values(
+        elements, lambda elem: elem.pid, lambda elem: elem.pid_ref.MassPerLength())
+    return length * mass_per_length, centroid
+
+def _mass_centroid_tri(elements: list[CTRIA3], nid_xyz) -> tuple[np.ndarray, np.ndarray]:
+    """vectorized CTRIA3.Mass() and CTRIA3.center_of_mass()"""
+    area, centroid = _tri_area_centroid(_get_node_xyz(nid_xyz, elements, 3))
+    mass_per_area = _get_cached_values(elements, _shell_key, lambda elem: elem.MassPerArea())
+    return mass_per_area * area, centroid
+
+def _mass_centroid_quad(elements: list[CQUAD4], nid_xyz) -> tuple[np.ndarray, np.ndarray]:
+    """vectorized CQUAD4.Mass() and CQUAD4.center_of_mass()"""
+    area, centroid = _quad_area_centroid(_get_node_xyz(nid_xyz, elements, 4))
+    mass_per_area = _get_cached_values(elements, _shell_key, lambda elem: elem.MassPerArea())
+    return mass_per_area * area, centroid
+
+def _mass_centroid_solid(volume_centroid_func, nnodes: int, is_abs: bool):
+    """vectorized SolidElement.Mass() and SolidElement.center_of_mass()"""
+    def mass_centroid_solid(elements: list[Any], nid_xyz) -> tuple[np.ndarray, np.ndarray]:
+        volume, centroid = volume_centroid_func(_get_node_xyz(nid_xyz, elements, nnodes))
+        if is_abs:
+            volume = np.abs(volume)
+        rho = _get_cached_values(elements, lambda elem: elem.pid, lambda elem: elem.Rho())
+        return rho * volume, centroid
+    return mass_centroid_solid
+
+# the class name of the element -> vectorized (mass, center_of_mass)
+MASS_CENTROID_ARRAY_FUNCS = {
+    'CROD': _mass_centroid_crod,
+    'CONROD': _mass_centroid_conrod,
+    'CTUBE': _mass_centroid_ctube,
+    'CBAR': _mass_centroid_cbar,
+    'CTRIA3': _mass_centroid_tri,
+    'CTRIAR': _mass_centroid_tri,
+    'CQUAD4': _mass_centroid_quad,
+    'CQUADR': _mass_centroid_quad,
+    'CTETRA4': _mass_centroid_solid(_tetra_volume_centroid, 4, is_abs=False),
+    'CPENTA6': _mass_centroid_solid(_penta_volume_centroid, 6, is_abs=True),
+    'CHEXA8': _mass_centroid_solid(_hexa_volume_centroid, 8, is_abs=True),
+}
+
 def mass_properties_nsm(model: BDF, element_ids=None, mass_ids=None, nsm_id=None,
                         reference_point=None,
                         sym_axis=None, scale=None, inertia_reference: str='cg',
@@ -515,9 +809,11 @@ def mass_properties_nsm(model: BDF, element_ids=None, mass_ids=None, nsm_id=None
     reference_point, is_cg = _update_reference_point(
         model, reference_point, inertia_reference)
 
-    xyz = _get_xyz_cid0_dict(model, xyz_cid0_dict)
+    nid_xyz = _get_nid_xyz(model, xyz_cid0_dict)
     element_ids, unused_elements, mass_ids, unused_masses = _mass_properties_elements_init(
         model, element_ids, mass_ids)
+    element_ids_array = np.unique(np.array(list(element_ids), dtype='int64'))
+    mass_ids_array = np.unique(np.array(list(mass_ids), dtype='int64'))
 
     mass = 0.
     cg = array([0., 0., 0.])
@@ -541,13 +837,13 @@ def mass_properties_nsm(model: BDF, element_ids=None, mass_ids=None, nsm_id=None
 
     etypes_skipped: set[str] = set()
     #eid_areas = defaultdict(list)
-    area_eids_pids: dict[str, list[tuple[int, int]]] = defaultdict(list)
+    area_eids_pids: dict[str, list[np.ndarray]] = defaultdict(list)
     nsm_centroids_area: dict[str, list[np.ndarray]] = defaultdict(list)
-    areas: dict[str, list[float]] = defaultdict(list)
+    areas: dict[str, list[np.ndarray]] = defaultdict(list)
 
-    length_eids_pids: dict[str, list[tuple[int, int]]] = defaultdict(list)
+    length_eids_pids: dict[str, list[np.ndarray]] = defaultdict(list)
     nsm_centroids_length: dict[str, list[np.ndarray]] = defaultdict(list)
-    lengths: dict[str, list[float]] = defaultdict(list)
+    lengths: dict[str, list[np.ndarray]] = defaultdict(list)
 
     no_mass = NO_MASS
     type_to_id_map = cast(dict[str, list[int]], model._type_to_id_map)
@@ -557,9 +853,9 @@ def mass_properties_nsm(model: BDF, element_ids=None, mass_ids=None, nsm_id=None
             continue
         #assert isinstance(eids, list), 'etype=%r eids=%s'%  (etype, eids)
         mass, cg, inertia = _get_mass_nsm(
-            model, element_ids, mass_ids,
+            model, element_ids_array, mass_ids_array,
             all_eids, all_mass_ids, etypes_skipped,
-            etype, eids, xyz,
+            etype, eids, nid_xyz,
             length_eids_pids, nsm_centroids_length, lengths,
             area_eids_pids, nsm_centroids_area, areas,
             mass, cg, inertia, reference_point)
@@ -588,18 +884,6 @@ def mass_properties_nsm(model: BDF, element_ids=None, mass_ids=None, nsm_id=None
     mass, cg, inertia = _apply_mass_symmetry(model, sym_axis, scale, mass, cg, inertia)
     return mass, cg, inertia
 
-def _get_xyz_cid0_dict(model: BDF,
-                       xyz_cid0_dict: Optional[dict[int, np.ndarray]],
-                       ) -> dict[int, np.ndarray]:
-    """gets the nodal positions as a dictionary"""
-    if xyz_cid0_dict is None:
-        xyz = {}
-        for nid, node in model.nodes.items():
-            xyz[nid] = node.get_position()
-    else:
-        xyz = xyz_cid0_dict
-    return xyz
-
 def _get_nid_xyzcid0(model: BDF) -> tuple[np.ndarray, np.ndarray]:
     out = model.get_xyz_in_coord_array(cid=0, fdtype='float64', idtype='int32')
     nid_cp_cd, xyz_cid0, unused_xyz_cp, unused_icd_transform, unused_icp_transform = out
@@ -621,254 +905,145 @@ def get_sub_eids(all_eids: np.ndarray,
     return eids2
 
 def _get_mass_nsm(model: BDF,
-                  element_ids: list[int], mass_ids: list[int],
+                  element_ids: np.ndarray, mass_ids: np.ndarray,
                   all_eids: np.ndarray, all_mass_ids: np.ndarray, etypes_skipped: set[str],
-                  etype: str, eids: list[int], xyz: dict[int, np.ndarray],
+                  etype: str, eids: list[int], nid_xyz: tuple[np.ndarray, np.ndarray],
                   #length
-                  length_eids_pids: dict[str, list[tuple[int, int]]],
+                  length_eids_pids: dict[str, list[np.ndarray]],
                   nsm_centroids_length: dict[str, list[np.ndarray]],
-                  lengths: dict[str, list[float]],
+                  lengths: dict[str, list[np.ndarray]],
                   #area
-                  area_eids_pids: dict[str, list[tuple[int, int]]],
+                  area_eids_pids: dict[str, list[np.ndarray]],
                   nsm_centroids_area: dict[str, list[np.ndarray]],
-                  areas: dict[str, list[float]],
+                  areas: dict[str, list[np.ndarray]],
                   #other
                   mass: float, cg: np.ndarray, I: np.ndarray,
                   reference_point: np.ndarray) -> tuple[float, np.ndarray, np.ndarray]:
-    """helper method for ``mass_properties_nsm``"""
-    element_ids_set = set(element_ids)
-    mass_ids_set = set(mass_ids)
-    if etype in {'CROD', 'CONROD'}:
-        eids2 = get_sub_eids(all_eids, eids, etype)
-        for eid in eids2:
-            elem = model.elements[eid]
-            n1, n2 = elem.node_ids
-            length = norm(xyz[n2] - xyz[n1])
-            centroid = (xyz[n1] + xyz[n2]) / 2.
-            mpl = elem.MassPerLength()
-            if elem.type == 'CONROD':
-                #nsm = property_nsms[nsm_id]['CONROD'][eid] + element_nsms[nsm_id][eid]
-                length_eids_pids['CONROD'].append((eid, -42))  # faked number
-                lengths['CONROD'].append(length)
-                nsm_centroids_length['CONROD'].append(centroid)
-            else:
-                pid = elem.pid
-                #nsm = property_nsms[nsm_id]['PROD'][pid] + element_nsms[nsm_id][eid]
-                length_eids_pids['PROD'].append((eid, pid))
-                nsm_centroids_length['PROD'].append(centroid)
-                lengths['PROD'].append(length)
-            #m = (mpl + nsm) * length
-            massi = mpl * length
-            #if massi != elem.Mass():  # pragma: no cover
-                #msg = 'mass_new=%s mass_old=%s\n%s' % (massi, elem.Mass(), str(elem))
-                #raise RuntimeError(msg)
-            if eid in element_ids_set:
-                mass = _increment_inertia(centroid, reference_point, massi, mass, cg, I)
-    elif etype == 'CTUBE':
+    """
+    helper method for ``mass_properties_nsm``
+
+    The elements of a type are calculated as arrays.  The areas/lengths
+    of all the elements are stored for the NSM cards, while only the
+    element_ids/mass_ids are added to the mass.
+    """
+    if etype in {'CROD', 'CONROD', 'CTUBE', 'CBAR'}:
         eids2 = get_sub_eids(all_eids, eids, etype)
-        for eid in eids2:
-            elem = model.elements[eid]
-            pid = elem.pid
-            n1, n2 = elem.node_ids
-            length = norm(xyz[n2] - xyz[n1])
-            centroid = (xyz[n1] + xyz[n2]) / 2.
-            mpl = elem.pid_ref.MassPerLength()
-            length_eids_pids['PTUBE'].append((eid, pid))
-            lengths['PTUBE'].append(length)
-            #nsm = property_nsms[nsm_id]['PTUBE'][pid] + element_nsms[nsm_id][eid]
-            #m = (mpl + nsm) * length
-            massi = mpl * length
-            #if massi != elem.Mass():  # pragma: no cover
-                #msg = 'mass_new=%s mass_old=%s\n%s' % (massi, elem.Mass(), str(elem))
-                #raise RuntimeError(msg)
-            if eid in element_ids_set:
-                mass = _increment_inertia(centroid, reference_point, massi, mass, cg, I)
-    elif etype == 'CBAR':
-        mass = _get_cbar_mass(
-            model, xyz, element_ids_set, all_eids,
-            length_eids_pids, lengths, nsm_centroids_length,
-            eids, mass, cg, I, reference_point)
+        elements = [model.elements[eid] for eid in eids2]
+        length, centroid = _line_length_centroid(_get_node_xyz(nid_xyz, elements, 2))
+        if etype == 'CONROD':
+            ptype = 'CONROD'
+            pids = -42  # faked number
+            mpl = np.array([elem.MassPerLength() for elem in elements], dtype='float64')
+        else:
+            ptype = {'CROD': 'PROD', 'CTUBE': 'PTUBE', 'CBAR': 'PBAR'}[etype]
+            pids = [elem.pid for elem in elements]
+            mpl = _get_cached_values(elements, lambda elem: elem.pid,
+                                     lambda elem: elem.pid_ref.MassPerLength())
+        _add_nsm_data(length_eids_pids, lengths, nsm_centroids_length,
+                      ptype, eids2, pids, length, centroid)
+        #m = (mpl + nsm) * length
+        massi = mpl * length
+        is_used = np.isin(eids2, element_ids)
+        mass = _increment_inertia_array(centroid[is_used], reference_point, massi[is_used],
+                                        mass, cg, I)
 
     elif etype == 'CBEAM':
         mass = _get_cbeam_mass(
-            model, xyz, element_ids_set, all_eids,
+            model, nid_xyz, element_ids, all_eids,
             length_eids_pids, lengths, nsm_centroids_length,
             eids, mass, cg, I, reference_point)
 
-    elif etype in {'CTRIA3', 'CTRIA6', 'CTRIAR'}:
-        mass = _get_tri_mass(
-            model, xyz, element_ids_set, all_eids,
-            area_eids_pids, areas, nsm_centroids_area,
-            eids, mass, cg, I, reference_point)
-
-    elif etype in {'CQUAD4', 'CQUAD8', 'CQUADR'}:
-        mass = _get_quad_mass(
-            model, xyz, element_ids_set, all_eids,
-            area_eids_pids, areas, nsm_centroids_area,
-            eids, mass, cg, I, reference_point)
-
-    elif etype == 'CQUAD':
+    elif etype in {'CTRIA3', 'CTRIA6', 'CTRIAR',
+                   'CQUAD4', 'CQUAD8', 'CQUADR', 'CQUAD', 'CSHEAR'}:
         eids2 = get_sub_eids(all_eids, eids, etype)
-        for eid in eids2:
-            elem = model.elements[eid]
-            n1, n2, n3, n4 = elem.node_ids[:4]
-            prop = elem.pid_ref
-            centroid = (xyz[n1] + xyz[n2] + xyz[n3] + xyz[n4]) / 4.
-            area = 0.5 * norm(cross(xyz[n3] - xyz[n1], xyz[n4] - xyz[n2]))
-
-            if prop.type == 'PSHELL':
-                t = prop.Thickness()
-                mpa = prop.nsm + prop.Rho() * t
-            elif prop.type in ['PCOMP', 'PCOMPG']:
-                mpa = prop.get_mass_per_area()
-            elif prop.type == 'PLPLANE':
-                continue
-                #raise NotImplementedError(prop.type)
+        elements = [model.elements[eid] for eid in eids2]
+        if etype in {'CTRIA3', 'CTRIA6', 'CTRIAR'}:
+            ptype = 'PSHELL'
+            area, centroid = _tri_area_centroid(_get_node_xyz(nid_xyz, elements, 3))
+            mpa = _get_cached_values(
+                elements, _shell_key,
+                lambda elem: _shell_mass_per_area(elem, {'PLPLANE', 'PPLANE'}))
+        elif etype == 'CSHEAR':
+            ptype = 'PSHEAR'
+            area, centroid = _quad_area_centroid(_get_node_xyz(nid_xyz, elements, 4))
+            mpa = _get_cached_values(elements, lambda elem: elem.pid,
+                                     lambda elem: elem.pid_ref.MassPerArea())
+        else:
+            # the CQUAD doesn't support NSM cards
+            ptype = 'PSHELL' if etype != 'CQUAD' else ''
+            area, centroid = _quad_area_centroid(_get_node_xyz(nid_xyz, elements, 4))
+            if etype == 'CQUAD':
+                mpa = _get_cached_values(elements, lambda elem: elem.pid, _cquad_mass_per_area)
             else:
-                raise NotImplementedError(prop.type)
-            m = area * mpa
-            if CHECK_MASS and (m != elem.Mass() or not np.array_equal(centroid, elem.Centroid())):  # pragma: no cover
-                msg = 'mass_new=%s mass_old=%s\n' % (m, elem.Mass())
-                msg += 'centroid_new=%s centroid_old=%s\n%s' % (
-                    str(centroid), str(elem.Centroid()), str(elem))
-                raise RuntimeError(msg)
-            if eid in element_ids_set:
-                mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
-
-    elif etype == 'CSHEAR':
-        mass = _get_cshear_mass(
-            model, xyz, element_ids_set, all_eids,
-            area_eids_pids, areas, nsm_centroids_area,
-            eids, mass, cg, I, reference_point, etype)
+                mpa = _get_cached_values(
+                    elements, _shell_key,
+                    lambda elem: _shell_mass_per_area(elem, {'PLPLANE', 'PPLANE', 'PMIC'}))
+
+        # PLPLANE/PPLANE/PMIC don't have mass
+        is_mass = ~np.isnan(mpa)
+        eids2 = eids2[is_mass]
+        area = area[is_mass]
+        centroid = centroid[is_mass, :]
+        mpa = mpa[is_mass]
+        if ptype:
+            pids = [elem.pid for elem, is_massi in zip(elements, is_mass) if is_massi]
+            _add_nsm_data(area_eids_pids, areas, nsm_centroids_area,
+                          ptype, eids2, pids, area, centroid)
+        #m = area * (mpa + nsm)
+        massi = area * mpa
+        is_used = np.isin(eids2, element_ids)
+        mass = _increment_inertia_array(centroid[is_used], reference_point, massi[is_used],
+                                        mass, cg, I)
 
     elif etype == 'CONM2':
         eids2 = get_sub_eids(all_mass_ids, eids, etype)
-        for eid in eids2:
-            elem = model.masses[eid]
-            centroid, m, dI = elem.centroid_mass_inertia()
-            di_list = [dI[0][0], dI[1][1], dI[2][2], dI[0][1], dI[0][2], dI[1][2]]
-            if eid in mass_ids_set:
-                mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
-                I = [i1 + di for i1, di in zip(I, di_list)]
+        eids2 = eids2[np.isin(eids2, mass_ids)]
+        mass = _get_conm2_mass([model.masses[eid] for eid in eids2],
+                               mass, cg, I, reference_point)
 
     elif etype in {'CONM1', 'CMASS1', 'CMASS2', 'CMASS3', 'CMASS4'}:
         eids2 = get_sub_eids(all_mass_ids, eids, etype)
-        for eid in eids2:
-            elem = model.masses[eid]
-            m = elem.Mass()
-            centroid = elem.Centroid()
-            if eid in mass_ids_set:
-                mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
-    elif etype == 'CTETRA':
+        eids2 = eids2[np.isin(eids2, mass_ids)]
+        elements = [model.masses[eid] for eid in eids2]
+        massi = np.array([elem.Mass() for elem in elements], dtype='float64')
+        centroid = np.array([elem.Centroid() for elem in elements],
+                            dtype='float64').reshape(len(elements), 3)
+        mass = _increment_inertia_array(centroid, reference_point, massi, mass, cg, I)
+
+    elif etype in {'CTETRA', 'CPYRAM', 'CPENTA', 'CHEXA', 'CHEXA1', 'CHEXA2'}:
         eids2 = get_sub_eids(all_eids, eids, etype)
-        for eid in eids2:
-            elem = model.elements[eid]
-            n1, n2, n3, n4 = elem.node_ids[:4]
-            centroid = (xyz[n1] + xyz[n2] + xyz[n3] + xyz[n4]) / 4.
-            #V = -dot(n1 - n4, cross(n2 - n4, n3 - n4)) / 6.
-            volume = -dot(xyz[n1] - xyz[n4], cross(xyz[n2] - xyz[n4], xyz[n3] - xyz[n4])) / 6.
-            m = elem.Rho() * volume
-            #if m != elem.Mass() or not np.array_equal(centroid, elem.Centroid()):  # pragma: no cover
-                #msg = 'mass_new=%s mass_old=%s\n' % (m, elem.Mass())
-                #msg += 'centroid_new=%s centroid_old=%s\n%s' % (
-                    #str(centroid), str(elem.Centroid()), str(elem))
-                #raise RuntimeError(msg)
-            if eid in element_ids_set:
-                mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
-
-    elif etype == 'CPYRAM':
-        eids2 = get_sub_eids(all_eids, eids, etype)
-        for eid in eids2:
-            elem = model.elements[eid]
-            n1, n2, n3, n4, n5 = elem.node_ids[:5]
-            centroid1 = (xyz[n1] + xyz[n2] + xyz[n3] + xyz[n4]) / 4.
-            area1 = 0.5 * norm(cross(xyz[n3]-xyz[n1], xyz[n4]-xyz[n2]))
-            centroid5 = xyz[n5]
-
-            #V = (l * w) * h / 3
-            #V = A * h / 3
-            centroid = (centroid1 + centroid5) / 2.
-
-            #(n1, n2, n3, n4, n5) = self.get_node_positions()
-            #area1, c1 = area_centroid(n1, n2, n3, n4)
-            #volume = area1 / 3. * norm(c1 - n5)
-            volume = area1 / 3. * norm(centroid1 - centroid5)
-            m = elem.Rho() * volume
-            if CHECK_MASS and (m != elem.Mass() or not np.array_equal(centroid, elem.Centroid())):  # pragma: no cover
-                msg = 'mass_new=%s mass_old=%s\n' % (m, elem.Mass())
-                msg += 'centroid_new=%s centroid_old=%s\n%s' % (
-                    str(centroid), str(elem.Centroid()), str(elem))
-                raise RuntimeError(msg)
-            #print('*eid=%s type=%s mass=%s rho=%s V=%s' % (
-                #elem.eid, 'CPYRAM', m, elem.Rho(), volume))
-            if eid in element_ids_set:
-                mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
-
-    elif etype == 'CPENTA':
-        eids2 = get_sub_eids(all_eids, eids, etype)
-        for eid in eids2:
-            elem = model.elements[eid]
-            n1, n2, n3, n4, n5, n6 = elem.node_ids[:6]
-            area1 = 0.5 * norm(cross(xyz[n3] - xyz[n1], xyz[n2] - xyz[n1]))
-            area2 = 0.5 * norm(cross(xyz[n6] - xyz[n4], xyz[n5] - xyz[n4]))
-            centroid1 = (xyz[n1] + xyz[n2] + xyz[n3]) / 3.
-            centroid2 = (xyz[n4] + xyz[n5] + xyz[n6]) / 3.
-            centroid = (centroid1 + centroid2) / 2.
-            volume = (area1 + area2) / 2. * norm(centroid1 - centroid2)
-            m = elem.Rho() * volume
-            #if m != elem.Mass() or not np.array_equal(centroid, elem.Centroid()):  # pragma: no cover
-                #msg = 'mass_new=%s mass_old=%s\n' % (m, elem.Mass())
-                #msg += 'centroid_new=%s centroid_old=%s\n%s' % (
-                    #str(centroid), str(elem.Centroid()), str(elem))
-                #raise RuntimeError(msg)
-            #print('*eid=%s type=%s mass=%s rho=%s V=%s' % (
-                #elem.eid, 'CPENTA', m, elem.Rho(), volume))
-            if eid in element_ids_set:
-                mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
-
-    elif etype in ['CHEXA', 'CHEXA1', 'CHEXA2']:
-        eids2 = get_sub_eids(all_eids, eids, etype)
-        for eid in eids2:
-            elem = model.elements[eid]
-            n1, n2, n3, n4, n5, n6, n7, n8 = elem.node_ids[:8]
-            #(A1, c1) = area_centroid(n1, n2, n3, n4)
-            centroid1 = (xyz[n1] + xyz[n2] + xyz[n3] + xyz[n4]) / 4.
-            area1 = 0.5 * norm(cross(xyz[n3] - xyz[n1], xyz[n4] - xyz[n2]))
-            #(A2, c2) = area_centroid(n5, n6, n7, n8)
-            centroid2 = (xyz[n5] + xyz[n6] + xyz[n7] + xyz[n8]) / 4.
-            area2 = 0.5 * norm(cross(xyz[n7] - xyz[n5], xyz[n8] - xyz[n6]))
-
-            volume = (area1 + area2) / 2. * norm(centroid1 - centroid2)
-            m = elem.Rho() * volume
-            centroid = (centroid1 + centroid2) / 2.
-            #if m != elem.Mass() or not np.array_equal(centroid, elem.Centroid()):  # pragma: no cover
-                #msg = 'mass_new=%s mass_old=%s\n' % (m, elem.Mass())
-                #msg = 'centroid_new=%s centroid_old=%s\n%s' % (
-                    #str(centroid), str(elem.Centroid()), str(elem))
-                #raise RuntimeError(msg)
-            #print('*centroid1=%s centroid2=%s' % (str(centroid1), str(centroid2)))
-            #print('*area1=%s area2=%s length=%s' % (area1, area2, norm(centroid1 - centroid2)))
-            #print('*eid=%s type=%s mass=%s rho=%s V=%s' % (
-                #elem.eid, 'CHEXA', m, elem.Rho(), volume))
-            if eid in element_ids_set:
-                mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
+        eids2 = eids2[np.isin(eids2, element_ids)]
+        elements = [model.elements[eid] for eid in eids2]
+        volume_centroid_func, nnodes = {
+            'CTETRA': (_tetra_volume_centroid, 4),
+            'CPYRAM': (_pyram_volume_centroid, 5),
+            'CPENTA': (_penta_volume_centroid, 6),
+            'CHEXA': (_hexa_volume_centroid, 8),
+            'CHEXA1': (_hexa_volume_centroid, 8),
+            'CHEXA2': (_hexa_volume_centroid, 8),
+        }[etype]
+        volume, centroid = volume_centroid_func(_get_node_xyz(nid_xyz, elements, nnodes))
+        if etype in {'CHEXA1', 'CHEXA2'}:
+            rho = np.array([elem.Rho() for elem in elements], dtype='float64')
+        else:
+            rho = _get_cached_values(elements, lambda elem: elem.pid, lambda elem: elem.Rho())
+        mass = _increment_inertia_array(centroid, reference_point, rho * volume, mass, cg, I)
 
     elif etype == 'CBEND':
         model.log.info('elem.type=%s mass is innaccurate' % etype)
         #nsm = property_nsms[nsm_id]['PBEND'][pid] + element_nsms[nsm_id][eid]
         eids2 = get_sub_eids(all_eids, eids, etype)
-        for eid in eids2:
+        for eid in eids2[np.isin(eids2, element_ids)]:
             elem = model.elements[eid]
             m = elem.Mass()
             centroid = elem.Centroid()
-            if eid in element_ids_set:
-                mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
+            mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
 
     elif etype == 'CQUADX':
         pass
     elif etype in {'CTRIAX', 'CTRIAX6'}:
         mass = _mass_catch_all(model, etype, etypes_skipped,
-                               element_ids_set, all_eids, eids,
+                               element_ids, all_eids, eids,
                                mass, cg, I, reference_point)
     elif etype in {'CSUPER', 'CSUPEXT'}:
         pass
@@ -876,29 +1051,37 @@ def _get_mass_nsm(model: BDF,
         model.log.warning('etype=%r should be explicit' % etype)
         #raise RuntimeError('etype=%r should be explicit' % etype) ## TODO: this is temporary
         mass = _mass_catch_all(model, etype, etypes_skipped,
-                               element_ids_set, all_eids, eids,
+                               element_ids, all_eids, eids,
                                mass, cg, I, reference_point)
 
-    #property_nsms[nsm_id][nsm.nsm_type][nsm_idi]
-    #for nsm_id, prop_types in sorted(property_nsms.items()):
-        #for prop_type, prop_id_to_val in sorted(prop_types.items()):
-            #for pid, val in sorted(prop_id_to_val.items()):
-        #TODO: CRAC2D mass not supported...how does this work???
-        #      I know it's an "area" element similar to a CQUAD4
-        #TODO: CCONEAX mass not supported...how does this work???
-        #TODO: CBEND mass not supported...how do I calculate the length?
-
-        #area_eids['PSHELL'].append(eid)
-        #areas['PSHELL'].append(area)
+    #TODO: CRAC2D mass not supported...how does this work???
+    #      I know it's an "area" element similar to a CQUAD4
+    #TODO: CCONEAX mass not supported...how does this work???
+    #TODO: CBEND mass not supported...how do I calculate the length?
     return mass, cg, I
 
+def _cquad_mass_per_area(elem: Any) -> float:
+    """gets the mass per area of a CQUAD; nan for a PLPLANE"""
+    prop = elem.pid_ref
+    if prop.type == 'PSHELL':
+        t = prop.Thickness()
+        mpa = prop.nsm + prop.Rho() * t
+    elif prop.type in ['PCOMP', 'PCOMPG']:
+        mpa = prop.get_mass_per_area()
+    elif prop.type == 'PLPLANE':
+        mpa = np.nan
+    else:
+        raise NotImplementedError(prop.type)
+    return mpa
+
 def _mass_catch_all(model: BDF, etype: str, etypes_skipped: set[str],
-                    element_ids: set[int], all_eids: np.ndarray, eids: list[int],
+                    element_ids: np.ndarray, all_eids: np.ndarray, eids: list[int],
                     mass: float, cg: np.ndarray, I: np.ndarray,
                     reference_point: np.ndarray) -> float:
     """helper method for ``get_mass_new``"""
     eids2 = get_sub_eids(all_eids, eids, etype)
-    for eid in eids2:
+    is_used = np.isin(eids2, element_ids)
+    for eid, is_usedi in zip(eids2, is_used):
         elem = model.elements[eid]
         #if elem.pid_ref.type in ['PPLANE']:
         try:
@@ -912,55 +1095,28 @@ def _mass_catch_all(model: BDF, etype: str, etypes_skipped: set[str],
         if m > 0.0:
             model.log.info('elem.type=%r is not supported in new '
                            'mass properties method' % elem.type)
-            if eid in element_ids:
+            if is_usedi:
                 mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
         elif etype not in etypes_skipped:
             model.log.info('elem.type=%s doesnt have mass' % elem.type)
             etypes_skipped.add(etype)
     return mass
 
-def _get_cbar_mass(model: BDF, xyz: dict[int, np.ndarray],
-                   element_ids_set: set[int], all_eids: np.ndarray,
-                   length_eids_pids, lengths, nsm_centroids_length,
-                   eids: list[int],
-                   mass: float, cg: np.ndarray, I: np.ndarray,
-                   reference_point) -> float:
-    """helper method for ``get_mass_new``"""
-    eids2 = get_sub_eids(all_eids, eids, 'CBAR')
-    for eid in eids2:
-        elem = model.elements[eid]
-        pid = elem.pid
-        n1, n2 = elem.node_ids
-        centroid = (xyz[n1] + xyz[n2]) / 2.
-        length: float = norm(xyz[n2] - xyz[n1])
-        mpl = elem.pid_ref.MassPerLength()
-        length_eids_pids['PBAR'].append((eid, pid))
-        lengths['PBAR'].append(length)
-        nsm_centroids_length['PBAR'].append(centroid)
-        #nsm = property_nsms[nsm_id]['PBAR'][pid] + element_nsms[nsm_id][eid]
-        #m = (mpl + nsm) * length
-        massi = mpl * length
-        #if massi != elem.Mass() or not np.array_equal(centroid, elem.Centroid()):  # pragma: no cover
-            #msg = 'mass_new=%s mass_old=%s\n' % (massi, elem.Mass())
-            #msg += 'centroid_new=%s centroid_old=%s\n%s' % (
-                #str(centroid), str(elem.Centroid()), str(elem))
-            #raise RuntimeError(msg)
-        if eid in element_ids_set:
-            mass = _increment_inertia(centroid, reference_point, massi, mass, cg, I)
-    return mass
-
-def _get_cbeam_mass(model, xyz, element_ids, all_eids,
+def _get_cbeam_mass(model, nid_xyz, element_ids, all_eids,
                     length_eids_pids, lengths, nsm_centroids_length,
                     eids, mass, cg, inertia, reference_point):
     """helper method for ``get_mass_new``"""
     eids2 = get_sub_eids(all_eids, eids, 'CBEAM')
-    for eid in eids2:
-        elem = model.elements[eid]
+    elements = [model.elements[eid] for eid in eids2]
+    xyz = _get_node_xyz(nid_xyz, elements, 2)
+    is_used = np.isin(eids2, element_ids)
+    eids_nsm = []
+    pids_nsm = []
+    lengths_nsm = []
+    centroids_nsm = []
+    for eid, elem, (xyz1, xyz2), is_usedi in zip(eids2, elements, xyz, is_used):
         prop = elem.pid_ref
         pid = elem.pid
-        n1, n2 = elem.node_ids
-        xyz1 = xyz[n1]
-        xyz2 = xyz[n2]
         centroid = (xyz1 + xyz2) / 2.
         length = norm(xyz2 - xyz1)
 
@@ -1020,9 +1176,10 @@ def _get_cbeam_mass(model, xyz, element_ids, all_eids,
         #mpl = elem.pid_ref.MassPerLength()
         #m = mpl * length
 
-        length_eids_pids['PBEAM'].append((eid, pid))
-        lengths['PBEAM'].append(length)
-        nsm_centroids_length['PBEAM'].append(nsm_centroid)
+        eids_nsm.append(eid)
+        pids_nsm.append(pid)
+        lengths_nsm.append(length)
+        centroids_nsm.append(nsm_centroid)
         m = mass_per_length * length
         nsm = nsm_per_length * length
         if CHECK_MASS and ((m + nsm) != elem.Mass() or not np.array_equal(centroid, elem.Centroid())):  # pragma: no cover
@@ -1033,7 +1190,7 @@ def _get_cbeam_mass(model, xyz, element_ids, all_eids,
                 str(centroid), str(elem.Centroid()), str(elem))
             raise RuntimeError(msg)
 
-        if eid not in element_ids:
+        if not is_usedi:
             continue
         #nsm = (nsm_per_length + nsmi) * length
         (x, y, z) = centroid - reference_point
@@ -1062,6 +1219,9 @@ def _get_cbeam_mass(model, xyz, element_ids, all_eids,
             msg += 'centroid_new=%s centroid_old=%s\n%s' % (
                 str(centroid), str(elem.Centroid()), str(elem))
             raise RuntimeError(msg)
+    _add_nsm_data(length_eids_pids, lengths, nsm_centroids_length,
+                  'PBEAM', np.array(eids_nsm, dtype='int64'), pids_nsm,
+                  np.array(lengths_nsm), np.array(centroids_nsm))
     return mass
 
 def _get_cbeam_mass_no_nsm(model: BDF, elem: CBEAM,
@@ -1157,206 +1317,6 @@ def _get_cbeam_mass_no_nsm(model: BDF, elem: CBEAM,
     cg += m * centroid + nsm * nsm_centroid
     return mass
 
-def _get_tri_mass(model: BDF,
-                  xyz: dict[int, np.ndarray],
-                  element_ids: set[int], all_eids: np.ndarray,
-                  #area
-                  area_eids_pids: dict[str, list[tuple[int, int]]],
-                  areas: dict[str, list[float]],
-                  nsm_centroids_area: dict[str, list[np.ndarray]],
-                  #other
-                  eids: list[int], mass: float, cg: np.ndarray, inertia: np.ndarray,
-                  reference_point: np.ndarray) -> float:
-    """helper method for ``get_mass_new``"""
-    eids2 = get_sub_eids(all_eids, eids, 'tri')
-    for eid in eids2:
-        elem = model.elements[eid]
-        n1, n2, n3 = elem.node_ids[:3]
-        prop = elem.pid_ref
-        pid = elem.pid
-        centroid = (xyz[n1] + xyz[n2] + xyz[n3]) / 3.
-        area: float = 0.5 * norm(cross(xyz[n1] - xyz[n2], xyz[n1] - xyz[n3]))
-        #areas_prop[pid] += area
-        if prop.type == 'PSHELL':
-            tflag = elem.tflag
-            ti = prop.Thickness()
-            if tflag == 0:
-                # absolute
-                t1 = ti if elem.T1 is None else elem.T1
-                t2 = ti if elem.T2 is None else elem.T2
-                t3 = ti if elem.T3 is None else elem.T3
-            elif tflag == 1:
-                # relative
-                t1 = ti if elem.T1 is None else elem.T1 * ti
-                t2 = ti if elem.T2 is None else elem.T2 * ti
-                t3 = ti if elem.T3 is None else elem.T3 * ti
-            else:  # pragma: no cover
-                raise RuntimeError('tflag=%r' % tflag)
-            assert t1 + t2 + t3 > 0., 't1=%s t2=%s t3=%s' % (t1, t2, t3)
-            t = (t1 + t2 + t3) / 3.
-
-            # m/A = rho * A * t + nsm
-            #mass_per_area = elem.nsm + rho * elem.t
-
-            #areas_prop[pid] += area
-            mpa = prop.nsm + prop.Rho() * t
-            #mpa = elem.pid_ref.MassPerArea()
-        elif prop.type in ['PCOMP', 'PCOMPG']:
-            # TODO: do PCOMPs even support differential thickness?
-            #       I don't think so...
-
-            #rho_t = prop.get_rho_t()
-            #nsm = prop.nsm
-            #rho_t = [mat.Rho() * t for (mat, t) in zip(prop.mids_ref, prop.ts)]
-            #mpa = sum(rho_t) + nsm
-
-            # works for PCOMP
-            # F:\Program Files\Siemens\NXNastran\nxn10p1\nxn10p1\nast\tpl\cqr3compbuck.dat
-            mpa = prop.get_mass_per_area()
-        elif prop.type in ['PLPLANE', 'PPLANE']:
-            continue
-        else:
-            raise NotImplementedError(prop.type)
-        area_eids_pids['PSHELL'].append((eid, pid))
-        areas['PSHELL'].append(area)
-
-        nsm_centroids_area['PSHELL'].append(centroid)
-        #nsm = property_nsms[nsm_id]['PSHELL'][pid] + element_nsms[nsm_id][eid]
-        #m = area * (mpa + nsm)
-        massi = area * mpa
-        if CHECK_MASS and not np.array_equal(centroid, elem.Centroid()):  # pragma: no cover
-            msg = 'centroid_new=%s centroid_old=%s\n%s' % (
-                str(centroid), str(elem.Centroid()), str(elem))
-            raise RuntimeError(msg)
-        if eid in element_ids:
-            mass = _increment_inertia(centroid, reference_point, massi, mass, cg, inertia)
-    return mass
-
-def _get_quad_mass(model: BDF, xyz: dict[int, np.ndarray], element_ids: set[int], all_eids: np.ndarray,
-                   #area
-                   area_eids_pids: dict[str, list[tuple[int, int]]],
-                   areas: dict[str, list[float]],
-                   nsm_centroids_area: dict[str, list[np.ndarray]],
-                   #other
-                   eids: list[int], mass: float, cg: np.ndarray, inertia: np.ndarray,
-                   reference_point: np.ndarray) -> float:
-    """helper method for ``get_mass_new``"""
-    eids2 = get_sub_eids(all_eids, eids, 'quad')
-    for eid in eids2:
-        elem = model.elements[eid]
-        n1, n2, n3, n4 = elem.node_ids[:4]
-        prop = elem.pid_ref
-        pid = prop.pid
-        centroid = (xyz[n1] + xyz[n2] + xyz[n3] + xyz[n4]) / 4.
-        x31 = xyz[n3] - xyz[n1]
-        x42 = xyz[n4] - xyz[n2]
-        area: float = 0.5 * norm(cross(x31, x42))
-
-        if prop.type == 'PSHELL':
-            tflag = elem.tflag
-            ti = prop.Thickness()
-            if tflag == 0:
-                # absolute
-                t1 = ti if elem.T1 is None else elem.T1
-                t2 = ti if elem.T2 is None else elem.T2
-                t3 = ti if elem.T3 is None else elem.T3
-                t4 = ti if elem.T4 is None else elem.T4
-            elif tflag == 1:
-                # relative
-                t1 = ti if elem.T1 is None else elem.T1 * ti
-                t2 = ti if elem.T2 is None else elem.T2 * ti
-                t3 = ti if elem.T3 is None else elem.T3 * ti
-                t4 = ti if elem.T4 is None else elem.T4 * ti
-            else:  # pragma: no cover
-                raise RuntimeError('tflag=%r' % tflag)
-            assert t1 + t2 + t3 + t4 > 0., 't1=%s t2=%s t3=%s t4=%s' % (t1, t2, t3, t4)
-            t = (t1 + t2 + t3 + t4) / 4.
-
-            # m/A = rho * A * t + nsm
-            #mass_per_area = model.nsm + rho * model.t
-
-            #areas_prop[pid] += area
-            rho = prop.Rho()
-            mpa = prop.nsm + rho * t
-            #mpa = elem.pid_ref.MassPerArea()
-            #m = mpa * area
-        elif prop.type in ['PCOMP', 'PCOMPG']:
-            # PCOMP, PCOMPG
-            #rho_t = prop.get_rho_t()
-            #nsm = prop.nsm
-            #rho_t = [mat.Rho() * t for (mat, t) in zip(prop.mids_ref, prop.ts)]
-            #mpa = sum(rho_t) + nsm
-            mpa = prop.get_mass_per_area()
-        elif prop.type in ['PLPLANE', 'PPLANE', 'PMIC']:
-            continue
-            #raise NotImplementedError(prop.type)
-        else:
-            raise NotImplementedError(prop.type)
-        area_eids_pids['PSHELL'].append((eid, pid))
-        areas['PSHELL'].append(area)
-        nsm_centroids_area['PSHELL'].append(centroid)
-        #nsm = property_nsms[nsm_id]['PSHELL'][pid] + element_nsms[nsm_id][eid]
-        #m = area * (mpa + nsm)
-        m = area * mpa
-        if CHECK_MASS and not np.array_equal(centroid, elem.Centroid()):  # pragma: no cover
-            msg = 'centroid_new=%s centroid_old=%s\n%s' % (
-                str(centroid), str(elem.Centroid()), str(elem))
-            raise RuntimeError(msg)
-        #elem = model.elements[eid]
-
-        #mass_expected = elem.Mass()
-        #if not np.allclose(m, mass_expected):  # pragma: no cover
-            #msg = 'massi=%s expected=%s' % (m, mass_expected)
-            #for node in elem.nodes_ref:
-                #node.comment = ''
-            #elem.comment = ''
-            #prop.comment = ''
-            #prop.mid1_ref.comment = ''
-            #msg += elem.get_stats()
-            #msg += prop.get_stats()
-            #msg += prop.mid_ref.get_stats()
-            #raise RuntimeError(msg)
-        #print('eid=%s type=%s mass=%s; area=%s mpa=%s'  % (elem.eid, elem.type, m, area, mpa))
-        if eid in element_ids:
-            mass = _increment_inertia(centroid, reference_point, m, mass, cg, inertia)
-    return mass
-
-def _get_cshear_mass(model: BDF,
-                     xyz: dict[int, np.ndarray],
-                     element_ids_set: set[int],
-                     all_eids: np.ndarray,
-                     area_eids_pids, areas, nsm_centroids_area,
-                     eids: list[int],
-                     mass: float, cg: np.ndarray, I: np.ndarray,
-                     reference_point: np.ndarray,
-                     etype: str) -> float:
-    """helper method for ``get_mass_new``"""
-    eids2 = get_sub_eids(all_eids, eids, etype)
-    for eid in eids2:
-        elem = model.elements[eid]
-        n1, n2, n3, n4 = elem.node_ids
-        prop = elem.pid_ref
-        pid = elem.pid
-        centroid = (xyz[n1] + xyz[n2] + xyz[n3] + xyz[n4]) / 4.
-        area: float = 0.5 * norm(cross(xyz[n3] - xyz[n1], xyz[n4] - xyz[n2]))
-        mpa = prop.MassPerArea()
-
-        area_eids_pids['PSHEAR'].append((eid, pid))
-        areas['PSHEAR'].append(area)
-        nsm_centroids_area['PSHEAR'].append(centroid)
-
-        #nsm = property_nsms[nsm_id]['PSHEAR'][pid] + element_nsms[nsm_id][eid]
-        #m = area * (mpa + nsm)
-        m = area * mpa
-        #if m != elem.Mass() or not np.array_equal(centroid, elem.Centroid()):  # pragma: no cover
-            #msg = 'mass_new=%s mass_old=%s\n' % (m, elem.Mass())
-            #msg += 'centroid_new=%s centroid_old=%s\n%s' % (
-                #str(centroid), str(elem.Centroid()), str(elem))
-            #raise RuntimeError(msg)
-        if eid in element_ids_set:
-            mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
-    return mass
-
 def _setup_apply_nsm(area_eids_pids: dict[str, np.ndarray],
                      areas: dict[str, np.ndarray],
                      nsm_centroids_area: dict[str, np.ndarray],
@@ -1410,53 +1370,52 @@ def _setup_apply_nsm(area_eids_pids: dict[str, np.ndarray],
     assert isinstance(nsm_centroids_length, dict), type(nsm_centroids_length)
 
     nsm_centroids_list = []
-    all_eids_pids_list: list[tuple[int, int]] = []
+    all_eids_pids_list: list[np.ndarray] = []
     area_length_list = []
     is_area_list = []
-    #is_data = False
-    #print(areas)
-    for ptype, eids_pids in area_eids_pids.items():
-        areasi = np.array(areas[ptype], dtype='float64')
-        area_eids_pids[ptype] = np.array(eids_pids, dtype='int32')
-        areas[ptype] = areasi
+    for ptype, eids_pids_list in area_eids_pids.items():
+        eids_pids = np.vstack(eids_pids_list)
+        areasi = np.hstack(areas[ptype])
+        nsm_centroidsi = np.vstack(nsm_centroids_area[ptype])
         assert len(areasi) > 0, areas
-        all_eids_pids_list += eids_pids
-        nsm_centroidsi = np.array(nsm_centroids_area[ptype])
+        assert len(eids_pids) == len(nsm_centroidsi), ptype
+        area_eids_pids[ptype] = eids_pids
+        areas[ptype] = areasi
+        nsm_centroids_area[ptype] = nsm_centroidsi
+
+        all_eids_pids_list.append(eids_pids)
         nsm_centroids_list.append(nsm_centroidsi)
-        assert len(eids_pids) == len(nsm_centroids_area[ptype]), ptype
         area_length_list.append(areasi)
-        is_area_list += [True] * len(areasi)
-        #is_data = True
-        nsm_centroids_area[ptype] = nsm_centroidsi
+        is_area_list.append(np.ones(len(areasi), dtype='bool'))
 
-    for ptype, eids_pids in length_eids_pids.items():
-        lengthsi = np.array(lengths[ptype], dtype='float64')
-        length_eids_pids[ptype] = np.array(eids_pids, dtype='int32')
-        lengths[ptype] = lengthsi
+    for ptype, eids_pids_list in length_eids_pids.items():
+        eids_pids = np.vstack(eids_pids_list)
+        lengthsi = np.hstack(lengths[ptype])
+        nsm_centroidsi = np.vstack(nsm_centroids_length[ptype])
         assert len(lengthsi) > 0, lengthsi
-        all_eids_pids_list += eids_pids
-        nsm_centroidsi = np.array(nsm_centroids_length[ptype])
+        assert len(eids_pids) == len(nsm_centroidsi), ptype
+        length_eids_pids[ptype] = eids_pids
+        lengths[ptype] = lengthsi
+        nsm_centroids_length[ptype] = nsm_centroidsi
+
+        all_eids_pids_list.append(eids_pids)
         nsm_centroids_list.append(nsm_centroidsi)
-        assert len(eids_pids) == len(nsm_centroids_length[ptype]), ptype
         area_length_list.append(lengthsi)
-        is_area_list += [False] * len(lengthsi)
-        #is_data = True
-        nsm_centroids_length[ptype] = nsm_centroidsi
+        is_area_list.append(np.zeros(len(lengthsi), dtype='bool'))
 
-    all_eids_pids = np.array(all_eids_pids_list, dtype='int32')
-    nelements = len(is_area_list)
-    if nelements == 0:
-        all_eids_pids = np.zeros((0, 2), dtype='int32')
+    if len(is_area_list) == 0:
+        all_eids_pids = np.zeros((0, 2), dtype='int64')
         area_length = np.zeros((0, 2), dtype='float64')
         is_area = np.array([], dtype='bool')
         nsm_centroids = np.zeros((0, 4), dtype='float64')
         return all_eids_pids, area_length, is_area, nsm_centroids
 
+    all_eids_pids = np.vstack(all_eids_pids_list)
     isort = np.argsort(all_eids_pids[:, 0])
     all_eids_pids = all_eids_pids[isort, :]
     area_length = np.hstack(area_length_list)[isort]
 
-    is_area = np.array(is_area_list, dtype='bool')[isort]
+    is_area = np.hstack(is_area_list)[isort]
     nsm_centroids = np.vstack(nsm_centroids_list)[isort]
     return all_eids_pids, area_length, is_area, nsm_centroids
 
@@ -1510,15 +1469,12 @@ def _combine_prop_weighted_area_length_simple(model: BDF,
         if debug:
             model.log.debug('dividing by %s=%s' % (word, area_sum))
 
-    for eid, areai, centroid in zip(eids, area, centroids):
-        #area_sum += areai
-        m = nsm_value * areai
-        if debug:  # pragma: no cover
+    masses = nsm_value * area
+    if debug:  # pragma: no cover
+        for eid, areai, m in zip(eids, area, masses):
             model.log.debug('  eid=%s %si=%s nsm_value=%s mass=%s %s=%s' % (
                 eid, word, areai, nsm_value, m, word, areai))
-        #elem = model.elements[eid]
-        #assert np.allclose(m, elem.Mass()), elem.get_stats()
-        mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
+    mass = _increment_inertia_array(centroids, reference_point, masses, mass, cg, I)
     if debug:  # pragma: no cover
         model.log.debug('mass = %s' % mass)
     return mass
@@ -1556,14 +1512,12 @@ def _combine_prop_weighted_area_length(
         centroids = nsm_centroidsi[ipid, :]
 
         area2 = area / area_sum
-        for areai, centroid in zip(area2, centroids):
-            #print('  areai=%s area_sum=%s nsm_value=%s' % (areai*area_sum, area_sum, nsm_value))
-            m = nsm_value * areai
-            if debug:  # pragma: no cover
+        masses = nsm_value * area2
+        if debug:  # pragma: no cover
+            for areai, m in zip(area2, masses):
                 model.log.debug('  %si=%s %s_sum=%s nsm_value=%s mass=%s' % (
                     word, areai*area_sum, word, area_sum, nsm_value, m))
-            #assert np.allclose(m, elem.Mass()), elem.get_stats()
-            mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
+        mass = _increment_inertia_array(centroids, reference_point, masses, mass, cg, I)
     return mass
 
 def _apply_nsm(model: BDF, nsm_id: int,
@@ -2037,12 +1991,8 @@ def _nsm1_element(model: BDF, nsm: NSM1,
         #area_sum_str = ''
         area_length_actual2 = area_length_actual
 
-    for eid, area_lengthi, centroid in zip(eids_actual, area_length_actual2, nsm_centroid):
-        massi = nsm_value * area_lengthi
-        #if debug:  # pragma: no cover
-            #print('  eid=%s %si=%s %snsm_value=%s mass=%s' % (
-                #eid, word, area_lengthi, area_sum_str, nsm_value, massi))
-        mass = _increment_inertia(centroid, reference_point, massi, mass, cg, I)
+    masses = nsm_value * area_length_actual2
+    mass = _increment_inertia_array(nsm_centroid, reference_point, masses, mass, cg, I)
     return mass
 
 def _get_sym_axis(model, sym_axis):
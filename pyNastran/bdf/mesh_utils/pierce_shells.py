@@ -1,12 +1,11 @@
 """
 Defines:
- - pierce_shell_model(bdf_filename, xyz_points, tol=1.0)
+ - pierce_shell_model(bdf_filename, xyz_points, tol=1.0, direction=None)
 """
-from itertools import count
 from typing import Optional, Union, Any
 import numpy as np
 from pyNastran.bdf.bdf import BDF, read_bdf
-from pyNastran.bdf.mesh_utils.bdf_equivalence import _get_tree
+from pyNastran.bdf.mesh_utils.bvh import ShellBVH
 
 
 def quad_intersection(orig: np.ndarray, direction: np.ndarray,
@@ -79,7 +78,9 @@ def triangle_intersection(orig: np.ndarray, direction: np.ndarray,
 
 
 def pierce_shell_model(bdf_filename: Union[BDF, str], xyz_points: Any,
-                       tol: float=1.0) -> tuple[list[int], np.ndarray, list[list[int]]]:
+                       tol: float=1.0,
+                       direction: Optional[np.ndarray]=None,
+                       ) -> tuple[list[int], np.ndarray, list[list[int]]]:
     """
     Pierces a shell model with a <0., 0., 1.> vector.  In other words,
     models are pierced in the xy plane.
@@ -91,15 +92,17 @@ def pierce_shell_model(bdf_filename: Union[BDF, str], xyz_points: Any,
     xyz_points : (npoints, 3) float ndarray
         the xyz_points to pierce
     tol : float; default=1.0
-        the pierce tolerance
-        pick a value that is ~3x the max local element edge length
+        unused; the elements are found with a bounding volume hierarchy
+    direction : (3, ) float ndarray; default=None -> [0., 0., 1.]
+        the pierce vector
 
     Returns
     -------
     eids_pierce : list[int]
         int : The element ids that were pierced.
-              If multiple elements are pierced, the one with the largest
-              pierced z value will be returned.
+              If multiple elements are pierced, the one furthest along
+              the direction (e.g., the largest pierced z value) will be
+              returned.
         None : invalid pierce
     xyz_pierces_max : list[float ndarray, None]
         ndarray : pierce location
@@ -109,126 +112,34 @@ def pierce_shell_model(bdf_filename: Union[BDF, str], xyz_points: Any,
         None : invalid pierce
 
     """
-    xyz_points = np.asarray(xyz_points)
+    xyz_points = np.asarray(xyz_points, dtype='float64')
     assert xyz_points.shape[1] == 3, xyz_points.shape
-    xy_points = xyz_points[:, :2].copy()
-    assert xy_points.shape[1] == 2, xy_points.shape
+    if direction is None:
+        direction = np.array([0., 0., 1.])
 
     if isinstance(bdf_filename, BDF):
         model = bdf_filename
     else:
         model = read_bdf(bdf_filename)
 
-    eids = []
-    centroids = []
-    etypes_to_skip = [
-        'CHEXA', 'CPENTA', 'CTETRA', 'CPYRAM',
-        'CBUSH', 'CBUSH1D', 'CBUSH2D',
-        'CBEAM', 'CROD', 'CONROD',
-        'CELAS1', 'CELAS2', 'CELAS3', 'CELAS4',
-        'CDAMP1', 'CDAMP2', 'CDAMP3', 'CDAMP4', 'CDAMP5',
-    ]
-    for eid, elem in model.elements.items():
-        if elem.type in ['CQUAD4', 'CTRIA3']:
-            centroid = elem.Centroid()
-        elif elem.type in etypes_to_skip:
-            continue
-        else:
-            print(elem.type)
-            #raise NotImplementedError(elem)
-            continue
-        eids.append(eid)
-        centroids.append(centroid)
-    eids = np.array(eids, dtype='int32')
-    assert len(eids) > 0, 'eids=%s\n' % eids
-    centroids_xy = np.array(centroids, dtype='float64')[:, :2]
-
-    #print('centroids:\n%s\n' % str(centroids_xy))
-    assert centroids_xy.shape[1] == 2, centroids_xy.shape
-
-
-    msg = 'which is required by pierce_shell_model'
-    kdt = _get_tree(centroids_xy, msg=msg)
-    results = kdt.query_ball_point(xy_points, tol)
-    nresults = len(results)
-    iresults = np.arange(nresults)
-    #print(results)
-    #print(iresults)
-
-    nan3 = np.full(3, np.nan, dtype='float64') # was None
-    direction = np.array([0., 0., 1.])
-    ipoints = []
+    # the points are pierced along a line, so points above the model
+    # are also pierced
+    bvh = ShellBVH.from_model(model)
+    eids, xyz_pierces_max, unused_t = bvh.intersect(
+        xyz_points, direction, tmin=-np.inf, tmax=np.inf, closest=False)
+
     eids_pierce = []
-    xyz_pierces_max = []
     node_ids = []
-    for i, xyz_point, eidsi in zip(count(), xyz_points, results):
-        model.log.debug('eidsi = [%s]' % ', '.join([str(eidii).rstrip('L') for eidii in eidsi]))
-        if not eidsi:
-            ipoints.append(i)
+    for xyz_point, eid in zip(xyz_points, eids.tolist()):
+        if eid == -1:
             eids_pierce.append(None)
-            xyz_pierces_max.append(nan3)
             node_ids.append(None)
-            model.log.warning('skipping %s because it failed tolerancing (tol=%s)' % (xyz_point, tol))
+            model.log.warning('skipping %s because no pierces found' % xyz_point)
             continue
+        eids_pierce.append(eid)
+        node_ids.append(model.elements[eid].node_ids)
 
-        model.log.debug('xyz_point = %s' % xyz_point)
-        eidsi2 = eids[eidsi]
-        eids_newi = []
-        piercesi = []
-        zpiercesi = []
-        for eid in eidsi2:
-            elem = model.elements[eid]
-            if elem.type == 'CQUAD4':
-                v0 = elem.nodes_ref[0].get_position()
-                v1 = elem.nodes_ref[1].get_position()
-                v2 = elem.nodes_ref[2].get_position()
-                v3 = elem.nodes_ref[3].get_position()
-                xyz_pierce = quad_intersection(xyz_point, direction, v0, v1, v2, v3)
-            elif elem.type == 'CTRIA3':
-                v0 = elem.nodes_ref[0].get_position()
-                v1 = elem.nodes_ref[1].get_position()
-                v2 = elem.nodes_ref[2].get_position()
-                xyz_pierce = triangle_intersection(xyz_point, direction, v0, v1, v2)
-            else:
-                raise NotImplementedError(elem)
-
-            if xyz_pierce is None:
-                #model.log.warning('failed to pierce eid=%s' % eid)
-                continue
-
-            zpierce = xyz_pierce[2]
-            model.log.debug('  eid=%s xyz_pierce=%s zpierce=%s' % (eid, xyz_pierce, zpierce))
-            eids_newi.append(eid)
-            piercesi.append(xyz_pierce)
-            zpiercesi.append(zpierce)
-
-        if len(zpiercesi) == 0:
-            ipoints.append(i)
-            eids_pierce.append(None)
-            xyz_pierces_max.append(nan3)
-            node_ids.append(None)
-            model.log.warning('skipping %s because no pierces found (tol=%s)' % (xyz_point, tol))
-            continue
-
-        #print('zpiercesi = %s' % zpiercesi)
-        zpiercesi_max = max(zpiercesi)
-        ipierce_max = zpiercesi.index(zpiercesi_max)
-        eid_max = eids_newi[ipierce_max]
-        xyz_piercei_max = piercesi[ipierce_max]
-        model.log.debug('i=%s xyz_point=%s xyz_piercei_max=%s zpiercesi=%s zmax=%s eid_max=%s' % (
-            i, xyz_point, xyz_piercei_max,
-            zpiercesi, zpiercesi_max, eid_max))
-
-        ipoints.append(i)
-        eids_pierce.append(eid_max)
-        xyz_pierces_max.append(xyz_piercei_max)
-        #print(model.elements[eid_max])
-        node_ids.append(model.elements[eid_max].node_ids)
-
-    xyz_pierces_max = np.array(xyz_pierces_max)
-    model.log.debug('ipoints=%s' % ipoints)
     model.log.info('eids_pierce=%s' % eids_pierce)
     model.log.info('xyz_pierces_max:\n%s' % xyz_pierces_max)
     model.log.info('node_ids=%s' % node_ids)
-
     return eids_pierce, xyz_pierces_max, node_ids
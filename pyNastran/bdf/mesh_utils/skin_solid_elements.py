@@ -3,11 +3,9 @@ defines:
  - get_solid_skin_faces(model)
 
 """
-from collections import defaultdict
-from copy import deepcopy
-
 from pyNastran.bdf.field_writer_8 import print_card_8
 from pyNastran.bdf.field_writer_16 import print_card_16
+from pyNastran.bdf.mesh_utils.topology import ElementTopology, get_skin_face_maps
 
 
 def write_skin_solid_faces(model, skin_filename,
@@ -122,45 +120,8 @@ def get_solid_skin_faces(model):
            the face nids
 
     """
-    eid_faces = model.get_element_faces()
-    face_set = defaultdict(int)
-    eid_set = defaultdict(list)
-    face_map = {}
-    for eid, face in eid_faces:
-        #print(eid, face)
-        raw_face = deepcopy(face)
-        try:
-            face.sort()
-        except Exception:
-            print('face = %s' % str(face))
-            raise
-        tface = tuple(face)
-        #print(tface)
-        face_set[tface] += 1
-        eid_set[tface].append(eid)
-        face_map[tface] = raw_face
-
-    #print('eid_set:')
-    #for tface, eidset in eid_set.items():
-        #print(tface, eidset)
-
-    #print('face_set:')
-    #for tface, faceset in face_set.items():
-        #print(tface, faceset)
-
-    #print('face_map:')
-    #for tface, facemap in face_map.items():
-        #print(tface, facemap)
-
-    del_faces = []
-    for face, face_count in face_set.items():
-        if face_count == 2:
-            del_faces.append(face)
-
-    for face in del_faces:
-        del face_set[face]
-        del eid_set[face]
-    return eid_set, face_map
+    topology = ElementTopology(model, consider_2d=False, consider_3d=True)
+    return get_skin_face_maps(topology)
 
 
 def _write_skin_solid_faces(model, skin_filename, face_map,
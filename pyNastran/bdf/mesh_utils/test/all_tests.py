@@ -9,6 +9,9 @@ from pyNastran.bdf.mesh_utils.test.test_remove_unused import TestRemoveUnused
 from pyNastran.bdf.mesh_utils.test.test_sum_loads import TestLoadSum
 from pyNastran.bdf.mesh_utils.test.test_refine import TestRefine
 from pyNastran.bdf.mesh_utils.test.test_flutter import TestFlutter
+from pyNastran.bdf.mesh_utils.test.test_topology import TestTopology
+from pyNastran.bdf.mesh_utils.test.test_bvh import TestBVH
+from pyNastran.bdf.mesh_utils.test.test_design_responses import TestDesignResponses
 
 if __name__ == "__main__":  # pragma: no cover
     import os
@@ -0,0 +1,131 @@
+"""tests the bounding volume hierarchy"""
+import unittest
+
+import numpy as np
+from cpylog import SimpleLogger
+
+from pyNastran.bdf.bdf import BDF
+from pyNastran.bdf.mesh_utils.mesh import create_structured_chexas
+from pyNastran.bdf.mesh_utils.bvh import ShellBVH, _closest_point_on_triangles
+from pyNastran.bdf.mesh_utils.pierce_shells import triangle_intersection
+
+
+class TestBVH(unittest.TestCase):
+    """tests the bounding volume hierarchy"""
+
+    def test_bvh_random_triangles(self):
+        """the ray/closest queries match a brute force search"""
+        rng = np.random.default_rng(42)
+        ntri = 200
+        triangles = rng.random((ntri, 3, 3)) * 10.
+        triangles = triangles[:, :1, :] + 0.2 * (triangles - triangles[:, :1, :])
+        eids = np.arange(ntri) + 1
+        bvh = ShellBVH(triangles, eids, leaf_size=3)
+
+        npoints = 50
+        origins = rng.random((npoints, 3)) * 10.
+        directions = rng.normal(size=(npoints, 3))
+        eids_hit, xyz_hit, t_hit = bvh.intersect(origins, directions)
+        counts = bvh.count_intersections(origins, directions)
+        for origin, direction, eid, xyz, t, count in zip(
+                origins, directions, eids_hit, xyz_hit, t_hit, counts):
+            hits = []
+            for eidi, (v0, v1, v2) in zip(eids, triangles):
+                xyz_pierce = triangle_intersection(origin, direction, v0, v1, v2)
+                if xyz_pierce is not None:
+                    ti = (xyz_pierce - origin).dot(direction) / direction.dot(direction)
+                    if ti >= 0.:
+                        hits.append((ti, eidi, xyz_pierce))
+            assert count == len(hits)
+            if hits:
+                ti, eidi, xyz_pierce = min(hits, key=lambda hit: hit[0])
+                assert eid == eidi
+                assert np.isclose(t, ti)
+                assert np.allclose(xyz, xyz_pierce)
+            else:
+                assert eid == -1
+                assert np.isnan(t)
+
+        points = rng.random((npoints, 3)) * 12. - 1.
+        eids_closest, xyz_closest, distance = bvh.closest_element(points)
+        for point, eid, xyz, distancei in zip(points, eids_closest, xyz_closest, distance):
+            xyz_all = _closest_point_on_triangles(np.tile(point, (ntri, 1)), triangles)
+            distances = np.linalg.norm(xyz_all - point, axis=1)
+            assert np.isclose(distancei, distances.min())
+            assert np.isclose(np.linalg.norm(xyz - point), distancei)
+            assert np.isclose(distances[eid - 1], distancei)
+
+    def test_bvh_closest_point_on_triangle(self):
+        """the closest point in each Voronoi region of a triangle"""
+        triangle = np.array([[[0., 0., 0.], [1., 0., 0.], [0., 1., 0.]]])
+        points = np.array([
+            [0.2, 0.2, 1.],    # face
+            [-1., -1., 0.],    # vertex 1
+            [2., -0.5, 0.],    # vertex 2
+            [-0.5, 2., 1.],    # vertex 3
+            [0.5, -1., 0.],    # edge 1-2
+            [-1., 0.5, 0.],    # edge 1-3
+            [1., 1., -1.],     # edge 2-3
+        ])
+        expected = np.array([
+            [0.2, 0.2, 0.],
+            [0., 0., 0.],
+            [1., 0., 0.],
+            [0., 1., 0.],
+            [0.5, 0., 0.],
+            [0., 0.5, 0.],
+            [0.5, 0.5, 0.],
+        ])
+        triangles = np.repeat(triangle, len(points), axis=0)
+        xyz = _closest_point_on_triangles(points, triangles)
+        assert np.allclose(xyz, expected), xyz
+
+    def test_bvh_shells(self):
+        """the triangles/quads of a shell model"""
+        log = SimpleLogger(level='error')
+        model = BDF(log=log)
+        model.add_grid(1, [0., 0., 0.])
+        model.add_grid(2, [1., 0., 0.])
+        model.add_grid(3, [1., 1., 0.])
+        model.add_grid(4, [0., 1., 0.])
+        model.add_grid(5, [2., 0., 0.])
+        model.add_cquad4(10, 1, [1, 2, 3, 4])
+        model.add_ctria3(11, 1, [2, 5, 3])
+        model.add_conrod(12, 1, [1, 5], A=1.0)
+        model.add_pshell(1, mid1=1, t=0.1)
+        model.add_mat1(1, 3.0e7, None, 0.3)
+
+        bvh = ShellBVH.from_model(model)
+        assert sorted(bvh.eids.tolist()) == [10, 10, 11]
+        origins = [[0.9, 0.2, 1.], [1.1, 0.2, -1.], [1.9, 0.9, 1.], [0.5, 0.5, 1.]]
+        directions = [[0., 0., -1.], [0., 0., 1.], [0., 0., -1.], [1., 0., 0.]]
+        eids, xyz, t = bvh.intersect(origins, directions)
+        assert eids.tolist() == [10, 11, -1, -1], eids
+        assert np.allclose(xyz[:2, :], [[0.9, 0.2, 0.], [1.1, 0.2, 0.]])
+        assert np.allclose(t[:2], [1., 1.])
+
+        eids, xyz, distance = bvh.closest_element([[0.5, 0.5, 2.], [3., 0., 0.]])
+        assert eids.tolist() == [10, 11], eids
+        assert np.allclose(xyz, [[0.5, 0.5, 0.], [2., 0., 0.]])
+        assert np.allclose(distance, [2., 1.])
+
+    def test_bvh_solid_skin(self):
+        """points inside a block of CHEXAs"""
+        log = SimpleLogger(level='error')
+        model = BDF(log=log)
+        x = np.linspace(0., 1., num=4)
+        create_structured_chexas(model, 1, x, x, x, 4, 4, 4)
+        model.add_psolid(1, 1)
+        model.add_mat1(1, 3.0e7, None, 0.3)
+
+        bvh = ShellBVH.from_solid_skin(model)
+        assert len(bvh.eids) == 6 * 9 * 2
+        rng = np.random.default_rng(0)
+        points = rng.random((2000, 3)) * 1.5 - 0.25
+        is_inside = bvh.is_inside(points)
+        expected = (points > 0.).all(axis=1) & (points < 1.).all(axis=1)
+        assert np.array_equal(is_inside, expected)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,162 @@
+"""tests the batch DRESP1/DRESP2 evaluation"""
+import os
+import unittest
+
+import numpy as np
+from cpylog import SimpleLogger
+
+import pyNastran
+from pyNastran.bdf.bdf import read_bdf
+from pyNastran.op2.op2 import OP2, read_op2
+from pyNastran.bdf.mesh_utils.mass_properties import mass_properties
+from pyNastran.bdf.mesh_utils.design_responses import (
+    DesignResponses, evaluate_design_responses)
+
+PKG_PATH = pyNastran.__path__[0]
+MODEL_PATH = os.path.join(PKG_PATH, '..', 'models')
+
+
+class TestDesignResponses(unittest.TestCase):
+    """tests the batch DRESP1/DRESP2 evaluation"""
+
+    def test_design_responses_sol200(self):
+        """the objective matches the f06 for the first and last design cycle"""
+        log = SimpleLogger(level='error')
+        bdf_filename = os.path.join(MODEL_PATH, 'sol200', 'model_200.bdf')
+        op2_filename = os.path.join(MODEL_PATH, 'sol200', 'model_200.op2')
+        model = read_bdf(bdf_filename, log=log)
+        op2_model = read_op2(op2_filename, log=log)
+
+        responses = DesignResponses(model)
+        assert responses.dresp1_ids == [101, 102, 103, 104, 105]
+        assert responses.dresp2_ids == [100]
+        key0, key1 = list(op2_model.displacements)
+        response_values = responses.evaluate(op2_model, key0)
+        disp = op2_model.displacements[key0].data[0, :, 2]
+        for i, dresp_id in enumerate(responses.dresp1_ids):
+            assert np.allclose(response_values[dresp_id], disp[i])
+        assert np.allclose(response_values[100], 3.5934E+02, rtol=1e-4)
+
+        response_values = responses.evaluate(op2_model, key1)
+        assert np.allclose(response_values[100], 1.7575E-02, rtol=1e-4)
+
+        response_values = evaluate_design_responses(model, op2_model, key1, dresp_ids=[103])
+        assert list(response_values) == [103]
+
+    def test_design_responses_elements(self):
+        """element/weight/frequency responses match the OP2 results"""
+        log = SimpleLogger(level='error')
+        bdf_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.bdf')
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.op2')
+        model = read_bdf(bdf_filename, log=log)
+        op2_model = read_op2(op2_filename, log=log)
+
+        # item 9/17 is the upper/lower von mises stress of a shell
+        model.add_dresp1(1, 'vm1', 'STRESS', 'ELEM', None, 9, None, [7, 6])
+        model.add_dresp1(2, 'vm2', 'STRESS', 'ELEM', None, 17, None, [6, 10, 8, 7])
+        model.add_dresp1(3, 'vmp', 'STRESS', 'PSHELL', None, 9, None, [4])
+        model.add_dresp1(4, 'axial', 'FORCE', 'PBAR', None, 8, None, [1],
+                         validate=False)
+        model.add_dresp1(5, 'rod', 'STRAIN', 'PROD', None, 2, None, [3])
+        model.add_dresp1(6, 'disp', 'DISP', None, None, 3, None, [13, 5])
+        model.add_dresp1(7, 'weight', 'WEIGHT', None, None, None, None, ['ALL'])
+        model.add_dtable({'SCALE': 2.0})
+        model.add_desvar(1, 'X', 3.0)
+        model.add_deqatn(100, ['F(A,B,C,D)=A*MAX(B,C)+D'])
+        model.add_dresp2(10, 'obj', 100, None, {(0, 'DTABLE'): ['SCALE'],
+                                                 (1, 'DRESP1'): [1],
+                                                 (2, 'DESVAR'): [1]})
+        model.add_dresp2(11, 'chain', 'SUM', None, {(0, 'DRESP2'): [10],
+                                                     (1, 'DRESP1'): [4]})
+        model.cross_reference()
+
+        subcase_id = 1
+        responses = DesignResponses(model)
+        response_values = responses.evaluate(op2_model, subcase_id)
+
+        stress = op2_model.op2_results.stress
+        quad = stress.cquad4_stress[subcase_id]
+        tri = stress.ctria3_stress[subcase_id]
+        def _get_vm(case, eid, ilayer):
+            irow = np.flatnonzero(case.element_node[:, 0] == eid)[ilayer]
+            return case.data[0, irow, 7]
+
+        assert np.allclose(response_values[1], [_get_vm(quad, 7, 0), _get_vm(quad, 6, 0)])
+        assert np.allclose(response_values[2], [_get_vm(quad, 6, 1), _get_vm(tri, 10, 1),
+                                                _get_vm(tri, 8, 1), _get_vm(quad, 7, 1)])
+        vm_pshell = [_get_vm(quad, 6, 0), _get_vm(quad, 7, 0)] + [
+            _get_vm(tri, eid, 0) for eid in [8, 9, 10, 11]]
+        assert np.allclose(response_values[3], vm_pshell)
+
+        bar_force = op2_model.op2_results.force.cbar_force[subcase_id]
+        assert np.allclose(response_values[4], bar_force.data[0, :, 6])
+        rod_strain = op2_model.op2_results.strain.crod_strain[subcase_id]
+        assert np.allclose(response_values[5], rod_strain.data[0, :, 0])
+
+        disp = op2_model.displacements[subcase_id]
+        inid = np.searchsorted(disp.node_gridtype[:, 0], [13, 5])
+        assert np.allclose(response_values[6], disp.data[0, inid, 2])
+
+        mass = mass_properties(model)[0] / model.wtmass
+        assert np.allclose(response_values[7], mass)
+
+        obj = 2.0 * response_values[1].max() + 3.0
+        assert np.allclose(response_values[10], obj)
+        assert np.allclose(response_values[11], obj + response_values[4][0])
+
+        response_values = responses.evaluate(op2_model, subcase_id, desvar_values={1: 4.0})
+        assert np.allclose(response_values[10], obj + 1.0)
+
+        # item 9 of a rod is out of range
+        model.add_dresp1(20, 'bad', 'STRESS', 'ELEM', None, 9, None, [14])
+        with self.assertRaises(KeyError):
+            evaluate_design_responses(model, op2_model, subcase_id, dresp_ids=[20])
+        model.add_dresp1(21, 'solid', 'STRESS', 'ELEM', None, 9, None, [1])
+        with self.assertRaises(NotImplementedError):
+            DesignResponses(model, dresp_ids=[21])
+        model.add_dresp1(22, 'psolid', 'STRESS', 'PSOLID', None, 13, None, [2])
+        with self.assertRaises(NotImplementedError):
+            DesignResponses(model, dresp_ids=[22])
+
+    def test_design_responses_weight(self):
+        """the WEIGHT response isn't scaled by WTMASS"""
+        log = SimpleLogger(level='error')
+        bdf_filename = os.path.join(MODEL_PATH, 'aero', 'cpmopt.bdf')
+        model = read_bdf(bdf_filename, log=log)
+        assert np.isclose(model.wtmass, 0.031081)
+
+        responses = DesignResponses(model, dresp_ids=[10])
+        response_values = responses.evaluate(OP2(log=log), 1)
+        mass = mass_properties(model)[0]
+        assert np.allclose(response_values[10], mass / 0.031081)
+        assert np.allclose(response_values[10], 9075., rtol=1e-4)
+
+        # only the total z mass is supported
+        model.add_dresp1(20, 'wx', 'WEIGHT', None, None, 1, 1, ['ALL'], validate=False)
+        model.add_dresp1(21, 'wxz', 'WEIGHT', None, None, 3, 1, ['ALL'], validate=False)
+        model.add_dresp1(22, 'wse', 'WEIGHT', None, None, 3, 3, [1], validate=False)
+        for dresp_id in [20, 21, 22]:
+            with self.assertRaises(NotImplementedError):
+                DesignResponses(model, dresp_ids=[dresp_id])
+
+    def test_design_responses_modes(self):
+        """FREQ/EIGN responses"""
+        log = SimpleLogger(level='error')
+        bdf_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'mode_solid_shell_bar.bdf')
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'mode_solid_shell_bar.op2')
+        model = read_bdf(bdf_filename, log=log)
+        op2_model = read_op2(op2_filename, log=log)
+        model.add_dresp1(1, 'freq', 'FREQ', None, None, 2, None, [])
+        model.add_dresp1(2, 'eign', 'EIGN', None, None, 3, None, [])
+        model.add_dresp1(3, 'freq', 'FREQ', None, None, 1, None, [])
+        model.cross_reference()
+
+        response_values = evaluate_design_responses(model, op2_model, 1)
+        eigenvectors = op2_model.eigenvectors[1]
+        assert np.allclose(response_values[1], eigenvectors.mode_cycles[1])
+        assert np.allclose(response_values[2], eigenvectors.eigns[2])
+        assert np.allclose(response_values[3], eigenvectors.mode_cycles[0])
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
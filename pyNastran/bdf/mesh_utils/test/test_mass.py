@@ -4,7 +4,8 @@ import os
 import numpy as np
 import pyNastran
 from pyNastran.bdf.bdf import BDF
-from pyNastran.bdf.mesh_utils.mass_properties import mass_properties
+from pyNastran.bdf.mesh_utils.mass_properties import (
+    mass_properties, mass_properties_nsm, _mass_properties_elements)
 from pyNastran.utils import object_methods
 
 PKG_PATH = pyNastran.__path__[0]
@@ -163,5 +164,68 @@ class TestMass(unittest.TestCase):
         assert np.allclose(mass, 0.005311658333), 'mass=%s' % mass
         assert np.allclose(mass2, 2.050833333), 'mass2=%s' % mass2
 
+    def test_mass_array(self):
+        """the array-based mass properties match the element methods"""
+        model = BDF(debug=False, log=None)
+        model.add_grid(1, [0., 0., 0.])
+        model.add_grid(2, [1., 0., 0.])
+        model.add_grid(3, [1., 1., 0.])
+        model.add_grid(4, [0., 1., 0.])
+        model.add_grid(5, [0., 0., 1.])
+        model.add_grid(6, [1., 0., 1.5])
+        model.add_grid(7, [1., 1., 1.])
+        model.add_grid(8, [0., 1., 2.])
+        model.add_mat1(1, 3.0e7, None, 0.3, rho=0.1)
+
+        model.add_crod(1, 1, [1, 2])
+        model.add_prod(1, 1, 0.2, nsm=0.3)
+        model.add_conrod(2, 1, [2, 3], A=0.4, nsm=0.5)
+        model.add_ctube(3, 3, [3, 7])
+        model.add_ptube(3, 1, 0.5, t=0.1, nsm=0.2)
+        model.add_cbar(4, 4, [4, 8], [0., 0., 1.], None)
+        model.add_pbar(4, 1, A=0.3, nsm=0.1)
+
+        model.add_ctria3(5, 5, [1, 2, 7])
+        model.add_cquad4(6, 5, [5, 6, 7, 8], tflag=1, T1=0.5, T2=1., T3=1.5, T4=2.)
+        model.add_cquad4(7, 5, [1, 2, 6, 5], T1=0.1, T2=0.2, T3=0.3, T4=0.4)
+        model.add_pshell(5, mid1=1, t=0.1, mid2=1, nsm=0.05)
+        model.add_ctria3(8, 8, [2, 3, 6])
+        model.add_pcomp(8, [1, 1], [0.1, 0.2], thetas=[0., 45.], nsm=0.2)
+
+        model.add_ctetra(9, 9, [1, 2, 3, 5])
+        model.add_cpenta(10, 9, [1, 2, 3, 5, 6, 7])
+        model.add_chexa(11, 9, [1, 2, 3, 4, 5, 6, 7, 8])
+        model.add_psolid(9, 1)
+        model.add_conm2(12, 8, 2.0, X=[0.1, 0.2, 0.3], I=[1., 0., 2., 0., 0., 3.])
+        model.add_conm2(13, 7, 1.5)
+        model.cross_reference()
+
+        reference_point = np.array([0.1, -0.2, 0.3])
+        mass_expected = 0.
+        cg_expected = np.zeros(3)
+        inertia_expected = np.zeros(6)
+        elements = list(model.elements.values()) + list(model.masses.values())
+        mass_expected = _mass_properties_elements(
+            model, elements, mass_expected, cg_expected, inertia_expected,
+            reference_point)
+        cg_expected /= mass_expected
+        inertia_expected += [1., 2., 3., 0., 0., 0.]  # CONM2 12 about its cg
+        assert np.allclose(
+            mass_expected,
+            sum(elem.Mass() for elem in model.elements.values()) +
+            sum(elem.Mass() for elem in model.masses.values()))
+
+        for func in (mass_properties, mass_properties_nsm):
+            mass, cg, inertia = func(model, reference_point=reference_point,
+                                     inertia_reference='ref')
+            assert np.allclose(mass, mass_expected), (func.__name__, mass, mass_expected)
+            assert np.allclose(cg, cg_expected), (func.__name__, cg, cg_expected)
+            assert np.allclose(inertia, inertia_expected), (func.__name__, inertia, inertia_expected)
+
+        # a subset of the elements
+        mass, cg, inertia = mass_properties_nsm(model, element_ids=[1, 6, 9], mass_ids=[13])
+        mass_expected = sum(model.elements[eid].Mass() for eid in [1, 6, 9]) + 1.5
+        assert np.allclose(mass, mass_expected), (mass, mass_expected)
+
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
@@ -993,7 +993,16 @@ class TestMeshUtils(unittest.TestCase):
             [0.4, 0.6, 0.],
             [-1., -1, 0.],
         ]
-        pierce_shell_model(model, xyz_points)
+        eids, xyz_pierce, node_ids = pierce_shell_model(model, xyz_points)
+        assert eids == [2, None], eids
+        assert np.allclose(xyz_pierce[0, :], [0.4, 0.6, 1.])
+        assert np.isnan(xyz_pierce[1, :]).all()
+        assert node_ids == [[5, 6, 7, 8], None], node_ids
+
+        eids, xyz_pierce, node_ids = pierce_shell_model(
+            model, xyz_points, direction=[0., 0., -1.])
+        assert eids == [1, None], eids
+        assert np.allclose(xyz_pierce[0, :], [0.4, 0.6, 0.])
 
     #def test_intersect(self):
         #p0 = np.array([0,0,0], 'd')
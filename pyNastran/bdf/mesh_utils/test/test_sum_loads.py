@@ -7,7 +7,9 @@ import numpy as np
 import pyNastran
 from pyNastran.bdf.bdf import BDF
 from pyNastran.bdf.bdf import GRID
-from pyNastran.bdf.mesh_utils.loads import sum_forces_moments, sum_forces_moments_elements
+from pyNastran.bdf.mesh_utils.loads import (
+    sum_forces_moments, sum_forces_moments_elements,
+    sum_forces_moments_loadcases, sum_forces_moments_by_element)
 model_path = os.path.join(pyNastran.__path__[0], '..', 'models')
 
 
@@ -422,6 +424,61 @@ class TestLoadSum(unittest.TestCase):
             self.assertTrue(allclose(F1_expected, F1), 'loadcase_id=%s F_expected=%s F1=%s' % (loadcase_id, F1_expected, F1))
             self.assertTrue(allclose(M1_expected, M1), 'loadcase_id=%s M_expected=%s M1=%s' % (loadcase_id, M1_expected, M1))
 
+    def test_loads_sum_pressure_array(self):
+        """tests the PLOAD2/PLOAD4 summation on shells/solids"""
+        model = BDF(log=None, debug=False)
+        model.add_grid(1, [0., 0., 0.])
+        model.add_grid(2, [1., 0., 0.])
+        model.add_grid(3, [1., 1., 0.])
+        model.add_grid(4, [0., 1., 0.])
+        model.add_grid(5, [2., 0., 0.])
+        model.add_grid(6, [0., 0., 1.])
+        model.add_cquad4(1, 1, [1, 2, 3, 4])
+        model.add_ctria3(2, 1, [2, 5, 3])
+        model.add_ctetra(3, 2, [1, 2, 4, 6])
+        model.add_pshell(1, mid1=1, t=0.1)
+        model.add_psolid(2, 1)
+        model.add_mat1(1, 3.0e7, None, 0.3)
+
+        # quad: area=1, centroid=[0.5, 0.5, 0]
+        # tri:  area=0.5, centroid=[4/3, 1/3, 0]
+        model.add_pload4(10, [1, 2], [1., 2., 3., 4.])
+        model.add_pload4(10, [2], 2., nvector=[0., 3., 4.])
+        model.add_pload2(10, 10., [1])
+        model.add_pload4(10, [3], 5., g1=1, g34=6)
+        model.add_force(11, 5, 2., [0., 0., 1.])
+        model.add_load(12, 1., [1., 2.], [10, 11])
+        model.cross_reference()
+
+        p0 = np.array([0., 0., 0.])
+        F, M = sum_forces_moments(model, p0, 10)
+        face = model.elements[3].get_face_area_centroid_normal(1, 6)
+        unused_face, area, centroid, normal = face
+        f_quad = (2.5 + 10.) * np.array([0., 0., 1.])
+        f_tri = 0.5 * (2. * np.array([0., 0., 1.]) + 2. * np.array([0., 0.6, 0.8]))
+        f_tetra = 5. * area * normal
+        F_expected = f_quad + f_tri + f_tetra
+        M_expected = (cross([0.5, 0.5, 0.], f_quad) + cross([4/3, 1/3, 0.], f_tri) +
+                      cross(centroid, f_tetra))
+        assert np.allclose(F, F_expected), 'F=%s F_expected=%s' % (F, F_expected)
+        assert np.allclose(M, M_expected), 'M=%s M_expected=%s' % (M, M_expected)
+
+        eids, forces, moments = sum_forces_moments_by_element(model, p0, 10)
+        assert eids.tolist() == [1, 2, 3], eids
+        assert np.allclose(forces, [f_quad, f_tri, f_tetra]), forces
+        assert np.allclose(moments.sum(axis=0), M_expected), moments
+
+        F2, M2 = sum_forces_moments_elements(model, p0, 10, [2, 3], [])
+        assert np.allclose(F2, f_tri + f_tetra), 'F2=%s' % F2
+        assert np.allclose(M2, M_expected - cross([0.5, 0.5, 0.], f_quad)), 'M2=%s' % M2
+
+        forces, moments = sum_forces_moments_loadcases(model, p0, [10, 11, 12])
+        for loadcase_id, force, moment in zip([10, 11, 12], forces, moments):
+            F1, M1 = sum_forces_moments(model, p0, loadcase_id)
+            assert np.allclose(force, F1), 'loadcase_id=%s F=%s F1=%s' % (loadcase_id, force, F1)
+            assert np.allclose(moment, M1), 'loadcase_id=%s M=%s M1=%s' % (loadcase_id, moment, M1)
+        assert np.allclose(forces[2], F_expected + [0., 0., 4.]), forces[2]
+
     def test_loads_sum_radial_01(self):
         model = BDF(log=None, debug=None)
         model.nodes[1] = GRID(1, cp=1, xyz=[0., 0., 0.], cd=0, ps='', seid=0,
@@ -0,0 +1,120 @@
+"""tests the array-based element topology"""
+import unittest
+
+import numpy as np
+from cpylog import SimpleLogger
+
+from pyNastran.bdf.bdf import BDF
+from pyNastran.bdf.mesh_utils.mesh import create_structured_chexas
+from pyNastran.bdf.mesh_utils.topology import ElementTopology, get_shell_normals
+from pyNastran.bdf.mesh_utils.free_edges import free_edges, non_paired_edges
+from pyNastran.bdf.mesh_utils.skin_solid_elements import get_solid_skin_faces
+from pyNastran.bdf.mesh_utils.get_oml import get_oml_eids
+
+
+class TestTopology(unittest.TestCase):
+    """tests the array-based element topology"""
+
+    def test_topology_shells(self):
+        """the edges/neighbors of a folded plate match the element methods"""
+        log = SimpleLogger(level='error')
+        model = BDF(log=log)
+        model.add_grid(1, [0., 0., 0.])
+        model.add_grid(2, [1., 0., 0.])
+        model.add_grid(3, [2., 0., 0.])
+        model.add_grid(4, [0., 1., 0.])
+        model.add_grid(5, [1., 1., 0.])
+        model.add_grid(6, [2., 1., 0.])
+        model.add_grid(7, [2., 0., 1.])
+        model.add_grid(8, [2., 1., 1.])
+        model.add_grid(9, [-1., 0.5, 0.])
+        model.add_grid(10, [1., 0.5, 1.])
+        model.add_cquad4(1, 1, [1, 2, 5, 4])
+        model.add_cquad4(2, 1, [2, 3, 6, 5])
+        model.add_ctria3(3, 1, [1, 4, 9])
+
+        # a fold at x=2 and a fin on edge (2, 5)
+        model.add_cquad4(4, 1, [3, 7, 8, 6])
+        model.add_ctria3(5, 1, [2, 5, 10])
+        model.add_pshell(1, mid1=1, t=0.1)
+        model.add_mat1(1, 3.0e7, None, 0.3)
+        model.cross_reference()
+
+        topology = ElementTopology(model)
+        assert np.array_equal(topology.eids, list(model.elements))
+
+        # compare against the dictionaries
+        edge_to_eids = {}
+        for eidi, elem in model.elements.items():
+            for edge in elem.get_edge_ids():
+                edge_to_eids.setdefault(edge, []).append(eidi)
+        assert [tuple(edge) for edge in topology.edges.tolist()] == list(edge_to_eids)
+        for iedge, eids in enumerate(edge_to_eids.values()):
+            assert topology.get_edge_eids(iedge).tolist() == eids
+
+        for ielement, eidi in enumerate(topology.eids):
+            iedges = topology.element_iedge[
+                topology.element_edge_ptr[ielement]:topology.element_edge_ptr[ielement + 1]]
+            edges = [tuple(edge) for edge in topology.edges[iedges, :].tolist()]
+            assert edges == model.elements[eidi].get_edge_ids()
+
+        element_ptr, ineighbor = topology.get_element_neighbors()
+        for ielement, eidi in enumerate(topology.eids.tolist()):
+            neighbors = set()
+            for edge in model.elements[eidi].get_edge_ids():
+                neighbors.update(edge_to_eids[edge])
+            neighbors.remove(eidi)
+            eids_neighbor = topology.eids[ineighbor[element_ptr[ielement]:element_ptr[ielement + 1]]]
+            assert set(eids_neighbor.tolist()) == neighbors, eidi
+
+        edges = free_edges(model, topology=topology)
+        assert edges == [edge for edge, eids in edge_to_eids.items() if len(eids) == 1]
+        assert edges == free_edges(model)
+        edges = non_paired_edges(model, topology=topology)
+        assert edges == [edge for edge, eids in edge_to_eids.items() if len(eids) != 2]
+
+        normals = get_shell_normals(model, topology.eids)
+        for normal, eidi in zip(normals, topology.eids):
+            assert np.allclose(normal, model.elements[eidi].Normal()), eidi
+
+        # the fold is larger than the tolerance
+        model, eids_oml = get_oml_eids(model, 1, theta_tol=30.)
+        assert eids_oml == {1, 2, 3}, eids_oml
+        model, eids_oml = get_oml_eids(model, 1, theta_tol=95.)
+        assert eids_oml == set(model.elements), eids_oml
+
+    def test_topology_solids(self):
+        """the skin of a block of CHEXAs/CPENTAs"""
+        log = SimpleLogger(level='error')
+        model = BDF(log=log)
+        x = np.linspace(0., 1., num=4)
+        y = np.linspace(0., 1., num=3)
+        z = np.linspace(0., 1., num=3)
+        nid, eid = create_structured_chexas(model, 1, x, y, z, 4, 3, 3)
+        # put a CPENTA on the first face of the first CHEXA
+        n1, n2, n3, n4 = model.elements[1].faces[2]
+        model.add_grid(nid, [0., 0., -1.])
+        model.add_grid(nid + 1, [1., 0., -1.])
+        model.add_cpenta(eid, 1, [n1, n2, nid, n4, n3, nid + 1])
+        model.add_psolid(1, 1)
+        model.add_mat1(1, 3.0e7, None, 0.3)
+
+        topology = ElementTopology(model, consider_2d=False, consider_3d=True)
+        nfaces = 6 * (eid - 1) + 5
+        face_counts = np.diff(topology.face_ptr)
+        assert face_counts.sum() == nfaces
+
+        # 3x2x2 block: 2*(3*2 + 3*2 + 2*2) = 32 faces on the outside;
+        # the CPENTA covers 1 of them and adds 4 of its own
+        eid_set, face_map = get_solid_skin_faces(model)
+        assert len(eid_set) == 32 - 1 + 4, len(eid_set)
+        assert set(face_map) == set(eid_set)
+        for face, eids in eid_set.items():
+            assert len(eids) == 1, (face, eids)
+            assert sorted(face_map[face]) == list(face)
+            elem = model.elements[eids[0]]
+            assert any(sorted(facei) == list(face) for facei in elem.faces.values())
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
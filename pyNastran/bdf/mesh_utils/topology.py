@@ -0,0 +1,472 @@
+"""
+defines:
+ - topology = ElementTopology(model, eids=None,
+                              consider_1d=False, consider_2d=True, consider_3d=False)
+ - normals = get_shell_normals(model, eids)
+
+The topology index stores the edges and faces of the elements as arrays,
+so it can be built once and used by:
+ - free_edges(model, ...)
+ - non_paired_edges(model, ...)
+ - get_solid_skin_faces(model)
+ - get_oml_eids(...)
+
+The sorted node ids of an edge/face are packed into a single int64 key,
+so the edges/faces are found with a sort instead of a dictionary lookup
+per element.  The edge/face to element and element to element maps are
+stored in CSR format (e.g., the elements of edge ``iedge`` are
+``eids[edge_ielement[edge_ptr[iedge]:edge_ptr[iedge+1]]]``).
+
+"""
+from __future__ import annotations
+from collections import defaultdict
+from types import SimpleNamespace
+from typing import Optional, Any, TYPE_CHECKING
+
+import numpy as np
+import scipy.sparse
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+ELEMENTS_1D = ['CROD', 'CONROD', 'CBAR', 'CBEAM', 'CBEAM3']
+ELEMENTS_2D = ['CTRIA3', 'CTRIAX', 'CTRIA6', 'CTRIAX6',
+               'CQUAD4', 'CQUAD', 'CQUAD8', 'CQUADR', 'CQUADX', 'CQUADX8',
+               'CSHEAR']
+ELEMENTS_3D = ['CTETRA', 'CPENTA', 'CPYRAM', 'CHEXA']
+
+#: the element class to the
+#: (edge index table, (face index table, face padding), nnodes)
+_INDEX_TABLES: dict[type, tuple[np.ndarray, tuple[np.ndarray, ...], int]] = {}
+
+
+class ElementTopology:
+    """
+    Array-based edge/face topology of a model
+
+    Attributes
+    ----------
+    eids : (nelements, ) int ndarray
+        the element ids
+    edges : (nedges, 2) int ndarray
+        the sorted node ids of the edges in order of first use
+    edge_keys : (nedges, ) int ndarray
+        the packed key of each edge
+    edge_ptr : (nedges + 1, ) int ndarray
+        the CSR pointer from edges to elements
+    edge_ielement : (nedge_elements, ) int ndarray
+        the indices into eids of the elements of each edge
+    element_edge_ptr : (nelements + 1, ) int ndarray
+        the CSR pointer from elements to edges
+    element_iedge : (nedge_elements, ) int ndarray
+        the indices into edges of the edges of each element
+    faces : (nfaces, nnodes_max) int ndarray
+        the sorted node ids of the solid element faces in order of first
+        use; a missing midside node is 0 and the unused columns are -1
+    face_nnodes : (nfaces, ) int ndarray
+        the number of nodes of each face
+    face_raw : (nfaces, nnodes_max) int ndarray
+        the unsorted node ids of the faces (from the last element)
+    face_keys / face_ptr / face_ielement : int ndarray
+        the same as edge_keys / edge_ptr / edge_ielement for the faces
+
+    """
+    def __init__(self, model: BDF, eids: Optional[list[int]]=None,
+                 consider_1d: bool=False,
+                 consider_2d: bool=True,
+                 consider_3d: bool=False):
+        """
+        Builds the topology index
+
+        Parameters
+        ----------
+        model : BDF()
+            the BDF model
+        eids : list[int]; default=None -> all
+            a subset of elements to consider
+        consider_1d : bool; default=False
+            considers CONROD, CROD, CBAR, CBEAM elements
+        consider_2d : bool; default=True
+            considers CQUAD4, CQUAD8, CQUADR, CQUAD,
+            CTRIA3, CTRIA6, CTRIAX, CTRIAX6, CSHEAR elements
+        consider_3d : bool; default=False
+            considers CTETRA, CPENTA, CPYRAM, CHEXA elements
+
+        """
+        types_to_consider = set()
+        if consider_1d:
+            types_to_consider.update(ELEMENTS_1D)
+        if consider_2d:
+            types_to_consider.update(ELEMENTS_2D)
+        if consider_3d:
+            types_to_consider.update(ELEMENTS_3D)
+
+        if eids is None:
+            eids = model.elements.keys()
+        elif isinstance(eids, int):
+            eids = [eids]
+
+        # group the elements by class, so the edges/faces are found
+        # with an index table per class
+        class_to_elements = defaultdict(list)
+        class_to_ielements = defaultdict(list)
+        eids_list = []
+        elements = model.elements
+        for eid in eids:
+            elem = elements[eid]
+            if elem.type not in types_to_consider:
+                continue
+            card_class = elem.__class__
+            class_to_elements[card_class].append(elem)
+            class_to_ielements[card_class].append(len(eids_list))
+            eids_list.append(eid)
+        self.eids = np.array(eids_list, dtype='int64')
+        nelements = len(self.eids)
+
+        edge_ielements = []
+        edge_nodes = []
+        face_ielements = []
+        face_nodes = []
+        for card_class, class_elements in class_to_elements.items():
+            edge_table, face_tables, nnodes = _get_index_tables(card_class, class_elements[0])
+            nodes = _get_element_nodes(class_elements, nnodes)
+            ielement = np.array(class_to_ielements[card_class], dtype='int64')
+            if len(edge_table):
+                edge_ielements.append(np.repeat(ielement, len(edge_table)))
+                edge_nodes.append(nodes[:, edge_table].reshape(-1, 2))
+            if len(face_tables):
+                # the faces are padded with -1, so the faces are in 1 array
+                face_table, iface_pad = face_tables
+                face_nodesi = nodes[:, face_table]
+                face_nodesi[:, iface_pad] = -1
+                face_ielements.append(np.repeat(ielement, len(face_table)))
+                face_nodes.append(face_nodesi.reshape(-1, face_table.shape[1]))
+
+        # edges
+        edge_ielement, edge_nodes_all = _stack_items(edge_ielements, edge_nodes, 2)
+        edges_sorted = np.sort(edge_nodes_all, axis=1)
+        (self.edge_keys, iedge, iunique, self.edge_ptr,
+         self.edge_ielement) = _build_index(edges_sorted, edge_ielement)
+        self.edges = edges_sorted[iedge, :]
+        self.element_edge_ptr, self.element_iedge = _get_csr(edge_ielement, iunique, nelements)
+
+        # faces
+        nface_nodes_max = max([face_nodesi.shape[1] for face_nodesi in face_nodes], default=0)
+        face_nodes = [_pad(face_nodesi, nface_nodes_max) for face_nodesi in face_nodes]
+        face_ielement, face_raw = _stack_items(face_ielements, face_nodes, nface_nodes_max)
+        faces_sorted = _sort_padded(face_raw)
+        (self.face_keys, iface, iunique, self.face_ptr,
+         self.face_ielement) = _build_index(faces_sorted, face_ielement)
+        self.faces = faces_sorted[iface, :]
+        self.face_nnodes = (self.faces != -1).sum(axis=1)
+
+        # the raw face is from the last element (see get_solid_skin_faces)
+        ilast = np.zeros(len(self.face_keys), dtype='int64')
+        np.maximum.at(ilast, iunique, np.arange(len(iunique)))
+        self.face_raw = face_raw[ilast, :]
+
+        self._element_neighbors: Optional[tuple[np.ndarray, np.ndarray]] = None
+
+    @property
+    def nelements(self) -> int:
+        return len(self.eids)
+
+    @property
+    def nedges(self) -> int:
+        return len(self.edges)
+
+    def get_edge_counts(self) -> np.ndarray:
+        """gets the number of elements of each edge"""
+        return np.diff(self.edge_ptr)
+
+    def free_edges(self) -> np.ndarray:
+        """gets the (n, 2) edges that are only used by 1 element"""
+        return self.edges[self.get_edge_counts() == 1, :]
+
+    def non_paired_edges(self) -> np.ndarray:
+        """gets the (n, 2) edges that are not used by exactly 2 elements"""
+        return self.edges[self.get_edge_counts() != 2, :]
+
+    def get_edge_eids(self, iedge: int) -> np.ndarray:
+        """gets the element ids of an edge"""
+        ielement = self.edge_ielement[self.edge_ptr[iedge]:self.edge_ptr[iedge + 1]]
+        return self.eids[ielement]
+
+    def get_element_neighbors(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Gets the elements that share an edge with each element
+
+        Returns
+        -------
+        element_ptr : (nelements + 1, ) int ndarray
+            the CSR pointer
+        ineighbor : (nneighbors, ) int ndarray
+            the indices into eids of the neighbors of each element, so
+            the neighbors of eids[i] are
+            ``eids[ineighbor[element_ptr[i]:element_ptr[i+1]]]``
+
+        """
+        if self._element_neighbors is None:
+            ielement1, ielement2 = _get_shared_pairs(self.edge_ptr, self.edge_ielement)
+            is_neighbor = ielement1 != ielement2
+            nelements = self.nelements
+            adjacency = scipy.sparse.csr_matrix(
+                (np.ones(is_neighbor.sum(), dtype='int8'),
+                 (ielement1[is_neighbor], ielement2[is_neighbor])),
+                shape=(nelements, nelements))
+            adjacency.sum_duplicates()
+            adjacency.sort_indices()
+            self._element_neighbors = (adjacency.indptr.astype('int64'),
+                                       adjacency.indices.astype('int64'))
+        return self._element_neighbors
+
+    def get_skin_faces(self) -> np.ndarray:
+        """gets the indices of the faces that are not shared by exactly 2 elements"""
+        return np.where(np.diff(self.face_ptr) != 2)[0]
+
+    def get_face_eids(self, iface: int) -> np.ndarray:
+        """gets the element ids of a face"""
+        ielement = self.face_ielement[self.face_ptr[iface]:self.face_ptr[iface + 1]]
+        return self.eids[ielement]
+
+
+def get_shell_normals(model: BDF, eids: np.ndarray) -> np.ndarray:
+    """
+    Gets the normals of the CTRIA3, CTRIA6, CQUAD4, CQUAD8, CQUAD elements
+    (see ``elem.Normal()``)
+
+    Parameters
+    ----------
+    model : BDF()
+        the cross-referenced BDF model
+    eids : (nelements, ) int ndarray
+        the element ids
+
+    Returns
+    -------
+    normals : (nelements, 3) float ndarray
+        the unit normals; nan for unsupported elements and elements
+        without area
+
+    """
+    nid_cp_cd, xyz_cid0 = model.get_xyz_in_coord_array(cid=0, fdtype='float64')[:2]
+    nids = nid_cp_cd[:, 0]
+
+    neids = len(eids)
+    normals = np.full((neids, 3), np.nan, dtype='float64')
+    trias = {'CTRIA3', 'CTRIA6'}
+    quads = {'CQUAD4', 'CQUAD8', 'CQUAD'}
+    itri = []
+    tri_nodes = []
+    iquad = []
+    quad_nodes = []
+    for i, eid in enumerate(eids):
+        elem = model.elements[eid]
+        if elem.type in trias:
+            itri.append(i)
+            tri_nodes.append(elem.node_ids[:3])
+        elif elem.type in quads:
+            iquad.append(i)
+            quad_nodes.append(elem.node_ids[:4])
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if itri:
+            xyz = xyz_cid0[np.searchsorted(nids, tri_nodes), :]
+            normal = np.cross(xyz[:, 1, :] - xyz[:, 0, :], xyz[:, 2, :] - xyz[:, 0, :])
+            normals[itri, :] = normal / np.linalg.norm(normal, axis=1)[:, np.newaxis]
+        if iquad:
+            xyz = xyz_cid0[np.searchsorted(nids, quad_nodes), :]
+            normal = np.cross(xyz[:, 2, :] - xyz[:, 0, :], xyz[:, 3, :] - xyz[:, 1, :])
+            normals[iquad, :] = normal / np.linalg.norm(normal, axis=1)[:, np.newaxis]
+    return normals
+
+
+def _get_index_tables(card_class: type, elem: Any) -> tuple[np.ndarray, tuple[np.ndarray, ...], int]:
+    """
+    Gets the edges/faces of an element class in terms of the node indices
+
+    The tables come from the element's ``get_edge_ids()`` and ``faces``,
+    so the topology is consistent with the cards.
+    """
+    if card_class in _INDEX_TABLES:
+        return _INDEX_TABLES[card_class]
+
+    nnodes = len(elem.node_ids)
+    dummy = SimpleNamespace(node_ids=list(range(nnodes)))
+    edges = card_class.get_edge_ids(dummy)
+    edge_table = np.array(edges, dtype='int64').reshape(len(edges), 2)
+
+    face_tables = ()
+    faces_property = getattr(card_class, 'faces', None)
+    if isinstance(faces_property, property) and elem.type in ELEMENTS_3D:
+        faces = list(faces_property.fget(dummy).values())
+        nface_nodes = max(len(face) for face in faces)
+        face_table = np.zeros((len(faces), nface_nodes), dtype='int64')
+        iface_pad = np.zeros((len(faces), nface_nodes), dtype='bool')
+        for iface, face in enumerate(faces):
+            face_table[iface, :len(face)] = face
+            iface_pad[iface, len(face):] = True
+        face_tables = (face_table, iface_pad)
+    _INDEX_TABLES[card_class] = (edge_table, face_tables, nnodes)
+    return edge_table, face_tables, nnodes
+
+
+def _get_element_nodes(elements: list[Any], nnodes: int) -> np.ndarray:
+    """gets the (nelements, nnodes) node ids; a blank node is 0"""
+    # elem.nodes is much faster than elem.node_ids and is the same
+    # (except for blank nodes) for the supported elements
+    try:
+        nodes = np.array([elem.nodes for elem in elements], dtype='int64')
+        if nodes.shape == (len(elements), nnodes):
+            return nodes
+    except (TypeError, ValueError):
+        pass
+
+    node_ids = [elem.node_ids for elem in elements]
+    nodes = np.array([[0 if nid is None else nid for nid in nids]
+                      for nids in node_ids], dtype='int64')
+    return nodes
+
+
+def _stack_items(item_ielements: list[np.ndarray], item_nodes: list[np.ndarray],
+                 nnodes: int) -> tuple[np.ndarray, np.ndarray]:
+    """stacks the edges/faces of the element classes in element order"""
+    if not item_nodes:
+        return np.zeros(0, dtype='int64'), np.zeros((0, nnodes), dtype='int64')
+    item_ielement = np.hstack(item_ielements)
+    nodes = np.vstack(item_nodes)
+    isort = np.argsort(item_ielement, kind='stable')
+    return item_ielement[isort], nodes[isort, :]
+
+
+def _pad(nodes: np.ndarray, nnodes: int) -> np.ndarray:
+    """pads the (n, m) nodes with -1 to (n, nnodes)"""
+    nrows, ncols = nodes.shape
+    if ncols == nnodes:
+        return nodes
+    padded = np.full((nrows, nnodes), -1, dtype=nodes.dtype)
+    padded[:, :ncols] = nodes
+    return padded
+
+
+def _sort_padded(nodes: np.ndarray) -> np.ndarray:
+    """sorts the rows of the nodes, leaving the -1 padding at the end"""
+    sorted_nodes = np.sort(np.where(nodes == -1, np.iinfo(nodes.dtype).max, nodes), axis=1)
+    sorted_nodes[sorted_nodes == np.iinfo(nodes.dtype).max] = -1
+    return sorted_nodes
+
+
+def _pack_keys(nodes: np.ndarray) -> np.ndarray:
+    """
+    Packs the rows of an (n, m) int array into an int64 key, so
+    identical rows have the same key
+
+    The key is built one column at a time with dense ranks, so it
+    doesn't overflow for large node ids.
+    """
+    nrows, ncols = nodes.shape
+    if nrows == 0:
+        return np.zeros(0, dtype='int64')
+    keys = nodes[:, 0].astype('int64')
+    for icol in range(1, ncols):
+        keys = np.unique(keys, return_inverse=True)[1].ravel().astype('int64')
+        ucol, icol_rank = np.unique(nodes[:, icol], return_inverse=True)
+        keys = keys * len(ucol) + icol_rank.ravel()
+    return keys
+
+
+def _build_index(sorted_nodes: np.ndarray,
+                 item_ielement: np.ndarray) -> tuple[np.ndarray, ...]:
+    """
+    Finds the unique edges/faces and the elements that use them
+
+    Parameters
+    ----------
+    sorted_nodes : (nitems, nnodes) int ndarray
+        the sorted node ids of each edge/face of each element
+    item_ielement : (nitems, ) int ndarray
+        the element index of each edge/face
+
+    Returns
+    -------
+    keys : (nunique, ) int ndarray
+        the packed keys in order of first use
+    ifirst : (nunique, ) int ndarray
+        the first item with that key
+    iunique : (nitems, ) int ndarray
+        the unique edge/face of each item
+    ptr, ielement : int ndarray
+        the CSR map from the unique edges/faces to the elements
+
+    """
+    keys = _pack_keys(sorted_nodes)
+    ukeys, ifirst, iunique = np.unique(keys, return_index=True, return_inverse=True)
+    iunique = iunique.ravel()
+
+    # renumber the unique values in order of first use
+    iorder = np.argsort(ifirst, kind='stable')
+    rank = np.empty(len(iorder), dtype='int64')
+    rank[iorder] = np.arange(len(iorder))
+    iunique = rank[iunique]
+    ptr, ielement = _get_csr(iunique, item_ielement, len(ukeys))
+    return ukeys[iorder], ifirst[iorder], iunique, ptr, ielement
+
+
+def _get_csr(irow: np.ndarray, values: np.ndarray,
+             nrows: int) -> tuple[np.ndarray, np.ndarray]:
+    """groups the values by row (stable)"""
+    isort = np.argsort(irow, kind='stable')
+    counts = np.bincount(irow, minlength=nrows)
+    ptr = np.zeros(nrows + 1, dtype='int64')
+    np.cumsum(counts, out=ptr[1:])
+    return ptr, values[isort]
+
+
+def _get_shared_pairs(ptr: np.ndarray, ielement: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """gets every (element1, element2) pair that shares an edge/face"""
+    counts = np.diff(ptr)
+    npairs = counts ** 2
+    ntotal = npairs.sum()
+    irow = np.repeat(np.arange(len(counts)), npairs)
+    offset = np.arange(ntotal) - np.repeat(np.cumsum(npairs) - npairs, npairs)
+    countsi = counts[irow]
+    ielement1 = ielement[ptr[irow] + offset // countsi]
+    ielement2 = ielement[ptr[irow] + offset % countsi]
+    return ielement1, ielement2
+
+
+def get_skin_face_maps(topology: ElementTopology) -> tuple[dict[tuple[int, ...], list[int]],
+                                                           dict[tuple[int, ...], list[int]]]:
+    """
+    Gets the solid element faces that are not shared by exactly 2 elements
+    (see ``get_solid_skin_faces``)
+
+    Returns
+    -------
+    eid_set : dict[sorted_face] = eids
+       sorted_face : tuple(int, int, ...)
+           the face nids in sorted order
+       eids : list[int]
+           list of element ids with that face
+    face_map : dict[sorted_face] = face
+       sorted_face : tuple(int, int, ...)
+           the face nids in sorted order
+       face : list(int, int, ...)
+           the face nids
+
+    """
+    iskin = topology.get_skin_faces()
+    faces = topology.faces[iskin, :].tolist()
+    faces_raw = topology.face_raw[iskin, :].tolist()
+    face_nnodes = topology.face_nnodes[iskin].tolist()
+    face_ptr = topology.face_ptr
+    eids = topology.eids[topology.face_ielement].tolist()
+
+    eid_set = {}
+    face_map = {}
+    for iface, face, face_raw, nnodes in zip(iskin.tolist(), faces, faces_raw, face_nnodes):
+        # a missing midside node is None (see elem.node_ids)
+        sorted_face = tuple(nid if nid else None for nid in face[:nnodes])
+        eid_set[sorted_face] = eids[face_ptr[iface]:face_ptr[iface + 1]]
+        face_map[sorted_face] = [nid if nid else None for nid in face_raw[:nnodes]]
+    return eid_set, face_map
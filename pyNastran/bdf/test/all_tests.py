@@ -18,6 +18,13 @@ from pyNastran.bdf.bdf_interface.test.test_assign_type import TestAssignType
 from pyNastran.bdf.bdf_interface.test.test_bdf_interface import TestBDFInterface
 from pyNastran.bdf.bdf_interface.test.test_dev_utils import DevUtils
 from pyNastran.bdf.bdf_interface.test.test_case_control_deck import CaseControlTest
+from pyNastran.bdf.bdf_interface.test.test_fast_cards import TestFastCards
+from pyNastran.bdf.bdf_interface.test.test_parallel_cards import TestParallelCards
+from pyNastran.bdf.bdf_interface.test.test_bdf_cache import TestBdfCache
+from pyNastran.bdf.bdf_interface.test.test_fast_writer import TestFastWriter
+from pyNastran.bdf.bdf_interface.test.test_parallel_writer import TestParallelWriter
+from pyNastran.bdf.bdf_interface.test.test_node_memo import TestNodeMemo
+from pyNastran.bdf.bdf_interface.test.test_lazy_xref import TestLazyXref
 
 
 if __name__ == "__main__":  # pragma: no cover
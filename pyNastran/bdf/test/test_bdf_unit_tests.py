@@ -77,6 +77,33 @@ class TestBDFUnit(Tester):
         #import pickle
         model3.save(obj_filename=obj_filename, unxref=True)
 
+    def test_bdf_load_reread(self):
+        """a loaded model can be saved again and a reread model isn't doubled"""
+        log = SimpleLogger(level='error')
+        dirname = os.path.join(MODEL_PATH, 'bugs', 'euler_column_linear_buckling')
+        bdf_filename = os.path.join(dirname, 'euler_column_linear_buckling.bdf')
+        obj_filename = os.path.join(dirname, 'model.obj')
+        model = read_bdf(bdf_filename, log=log)
+        card_count = dict(model.card_count)
+
+        # the cards are added to the loaded model, not the pickled one
+        model.save(obj_filename=obj_filename)
+        model2 = BDF(log=log)
+        model2.load(obj_filename=obj_filename)
+        nid = max(model2.nodes) + 1
+        model2.add_grid(nid, [0., 0., 0.])
+        model2.add_param('POST', -1)
+        assert nid in model2.nodes and nid not in model.nodes
+        assert model2.params['POST'].values == [-1]
+        model2.save(obj_filename=obj_filename)
+        os.remove(obj_filename)
+
+        # clear_attributes resets the counters
+        model.clear_attributes()
+        assert model.card_count == {}
+        model.read_bdf(bdf_filename)
+        assert model.card_count == card_count, (model.card_count, card_count)
+
     def test_bdf_include5(self):
         """verify we get 5 include files if they are one after the other"""
         model = BDF(debug=False)
@@ -882,6 +909,13 @@ class TestBDFUnit(Tester):
                         save_file_structure=False, skip_cards=None, read_cards=None,
                         encoding=None, log=None, debug=True, mode='msc')
 
+        # the deck is reread with is_superelements=True, which keeps the ENDDATA
+        assert fem1.is_superelements
+        for size, is_double in [(8, False), (16, False), (16, True)]:
+            bdf_file = StringIO()
+            fem1.write_bdf(bdf_file, size=size, is_double=is_double, close=False)
+            assert bdf_file.getvalue().rstrip().endswith('ENDDATA'), (size, is_double)
+
         superelement_renumber(
             fem1, bdf_filename_out=bdf_filename_out,
             starting_id_dict=None)
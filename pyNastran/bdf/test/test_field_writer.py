@@ -6,9 +6,13 @@ from pyNastran.bdf.field_writer import print_card
 from pyNastran.bdf.field_writer_8 import (print_field_8, print_float_8,
                                           set_default_if_blank,
                                           set_blank_if_default, is_same, print_card_8,
-                                          print_scientific_8)
-from pyNastran.bdf.field_writer_16 import print_field_16, print_card_16, print_float_16, print_scientific_16
-from pyNastran.bdf.field_writer_double import print_card_double
+                                          print_scientific_8, print_float_8_cached)
+from pyNastran.bdf.field_writer_16 import (
+    print_field_16, print_card_16, print_float_16, print_scientific_16, print_float_16_cached)
+from pyNastran.bdf.field_writer_double import (
+    print_card_double, print_scientific_double, print_scientific_double_cached)
+from pyNastran.bdf.field_writer_array import (
+    print_float_8_array, print_float_16_array, print_scientific_double_array)
 
 
 from pyNastran.bdf.bdf_interface.assign_type import interpret_value
@@ -482,6 +486,41 @@ class Testfield_writer_8(unittest.TestCase):
         unused_positive_output = [print_float_16(x) for x in nums]
         unused_negative_output = [print_float_16(-x) for x in nums]
 
+    def test_float_array(self):
+        """the array/cached writers match print_float_8/16 and print_scientific_double"""
+        rng = np.random.default_rng(42)
+        nvalues = 20000
+        values = np.hstack([
+            # all magnitudes
+            rng.uniform(-1., 1., nvalues) * 10. ** rng.integers(-20, 20, nvalues),
+            # coordinates
+            np.round(rng.uniform(-1e5, 1e6, nvalues), 1),
+            np.round(rng.uniform(-100., 100., nvalues), 4),
+            # repeated values
+            rng.choice([0.1, 1.0, 0.3, 2.9e7, -1.0], nvalues),
+            # group edges
+            [0., -0., np.nan, 0.001, -0.01, 1., -1., 1e5, 1e6, -1e4, -1e5,
+             999999.96, -99999.96, 0.99999999, -0.99999999, 1e13, -1e12, 1e14,
+             5e-8, -5e-7, 5e-16, -5e-15, -999999.5],
+        ])
+        float32_values = values.astype('float32')
+        funcs = [
+            (print_float_8_array, print_float_8, print_float_8_cached),
+            (print_float_16_array, print_float_16, print_float_16_cached),
+            (print_scientific_double_array, print_scientific_double,
+             print_scientific_double_cached),
+        ]
+        for print_array, print_float, print_cached in funcs:
+            for valuesi in [values, float32_values]:
+                fields = print_array(valuesi)
+                assert len(fields) == len(valuesi)
+                for value, field in zip(valuesi, fields):
+                    expected = print_float(value)
+                    assert field == expected, (print_float.__name__, value, field, expected)
+                    assert print_cached(value) == expected, (print_cached.__name__, value)
+        assert print_float_8_array(np.array([])) == []
+
+
 
 def compare(value_in):
     field = print_field_8(value_in)
@@ -5123,7 +5123,7 @@ class BDF(BDF_):
 
     def _write_grids(self, bdf_file: Any,
                      size: int=8, is_double: bool=False,
-                     is_long_ids: Optional[bool]=None) -> None:
+                     is_long_ids: Optional[bool]=None, nworkers: int=1) -> None:
         """Writes the GRID-type cards"""
         self.nodes.write_card(size=size, is_double=is_double, bdf_file=bdf_file)
 
@@ -5135,7 +5135,7 @@ class BDF(BDF_):
         self._write_properties(bdf_file, size=size, is_double=is_double, is_long_ids=is_long_ids)
 
     def _write_elements(self, bdf_file: Any, size: int=8, is_double: bool=False,
-                        is_long_ids: Optional[bool]=None) -> None:
+                        is_long_ids: Optional[bool]=None, nworkers: int=1) -> None:
         """Writes the elements in a sorted order"""
         if self.elements:
             bdf_file.write('$ELEMENTS\n')
@@ -9,6 +9,7 @@ from pyNastran.utils import object_attributes
 from pyNastran.utils.numpy_utils import integer_types
 #from pyNastran.op2.errors import FortranMarkerError, SortCodeError
 from pyNastran.op2.errors import EmptyRecordError
+from pyNastran.op2.op2_interface.op2_filter import slice_record
 
 from pyNastran.op2.tables.oef_forces.oef import OEF
 from pyNastran.op2.tables.oef_forces.oefpk import OEFPK
@@ -90,6 +91,9 @@ class FortranFormat:
         #: stores if the user entered [] for isubcases
         self.is_all_subcases = True
         self.valid_subcases = []
+
+        #: the node/element ids and modes/frequencies to read (ResultFilter)
+        self.result_filter = None
         #self.op2_reader = OP2Reader()
         self.IS_TESTING = False
 
@@ -141,10 +145,19 @@ class FortranFormat:
         op2_reader = self.op2_reader  # type: OP2Reader
         #datai = b''
         n = 0
+        result_filter = self.result_filter
         if self.read_mode == 2:
             self.ntotal = 0
 
+            record_start = self.n
             data, ndata = op2_reader._read_record_ndata()
+            op2_reader._set_record_offset(record_start, ndata)
+            if record_start in op2_reader.filtered_records:
+                # the rows were selected on the array sizing pass
+                data = slice_record(data, op2_reader.filtered_records[record_start])
+                ndata = len(data)
+                op2_reader.record_offset = None
+
             n = table4_parser(data, ndata)
             assert isinstance(n, integer_types), self.table_name
 
@@ -161,6 +174,23 @@ class FortranFormat:
                 # PVT/PVTS - we want to know what the PARAM cards are,
                 #            so we can determine the NXVER
                 data, ndata = op2_reader._read_record_ndata()
+            elif result_filter is not None and result_filter.is_sliced_table(self):
+                # the rows need to be read to size the arrays, but
+                # they're still only parsed on the array filling pass
+                record_start = self.n
+                data, ndata = op2_reader._read_record_ndata()
+                mask = result_filter.get_row_mask(self, data, ndata)
+                data = None
+                if mask is not None:
+                    nselected = int(mask.sum())
+                    if nselected == 0:
+                        op2_reader.skipped_records.add(record_start)
+                        self._cleanup_data_members()
+                        return n
+                    op2_reader.filtered_records[record_start] = mask
+                    ndata0 = ndata
+                    ndata = nselected * (ndata0 // len(mask))
+                    record_len -= ndata0 - ndata
             else:
                 try:
                     data, ndata = op2_reader._skip_record_ndata()
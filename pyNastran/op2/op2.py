@@ -7,6 +7,10 @@ Defines the main OP2 class.  Defines:
             log=None, debug=True, debug_file=None, build_dataframe=False,
             skip_undefined_matrices=True, mode='msc', encoding=None)
 
+ - iter_op2_results(op2_filename, subcases=None, exclude_results=None,
+                    include_results=None, table_names=None, log=None,
+                    debug=True, mode=None, encoding=None, write_index=False)
+
  - OP2(debug=True, log=None, debug_file=None, mode='msc')
    - build_dataframe()
    - combine_results(combine=True)
@@ -15,7 +19,10 @@ Defines the main OP2 class.  Defines:
    - object_methods(mode='public', keys_to_skip=None)
    - print_subcase_key()
    - read_op2(op2_filename=None, combine=True, build_dataframe=False,
-              skip_undefined_matrices=False, encoding=None)
+              skip_undefined_matrices=False, encoding=None, write_index=False,
+              nworkers=1)
+   - read_op2_from_index(op2_filename, table_names=None, subcases=None,
+                         element_types=None, nonlinear_factors=None)
    - set_mode(mode)
    - transform_displacements_to_global(i_transform, coords, xyz_cid0=None, debug=False)
    - transform_gpforce_to_global(nids_all, nids_transform, i_transform, coords, xyz_cid0=None)
@@ -24,8 +31,9 @@ Defines the main OP2 class.  Defines:
 from __future__ import annotations
 import sys
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pickle import load, dump, dumps
-from typing import Optional, Any, TYPE_CHECKING
+from typing import Iterator, Optional, Any, TYPE_CHECKING
 
 import numpy as np
 
@@ -42,6 +50,13 @@ from pyNastran.op2.writer.op2_writer import OP2Writer
 #from pyNastran.op2.op2_interface.op2_f06_common import Op2F06Attributes
 from pyNastran.op2.op2_interface.types import NastranKey
 from pyNastran.op2.op2_interface.op2_scalar import OP2_Scalar
+from pyNastran.op2.op2_interface.op2_index import (
+    OP2Index, read_op2_index, write_op2_index)
+from pyNastran.op2.op2_interface.op2_memmap import map_result_data
+from pyNastran.op2.op2_interface.op2_parallel import (
+    submit_parallel_tables, merge_parallel_results, restore_deferred_tables,
+    read_op2_tables, get_stored_results)
+from pyNastran.op2.op2_interface.op2_lazy import make_results_lazy
 from pyNastran.op2.op2_interface.transforms import (
     transform_displacement_to_global, transform_gpforce_to_globali)
 from pyNastran.utils import check_path
@@ -547,7 +562,9 @@ class OP2(OP2_Scalar, OP2Writer):
                  combine: bool=True,
                  build_dataframe: Optional[bool]=False,
                  skip_undefined_matrices: bool=False,
-                 encoding: Optional[str]=None) -> None:
+                 encoding: Optional[str]=None,
+                 write_index: bool=False,
+                 nworkers: int=1) -> None:
         """
         Starts the OP2 file reading
 
@@ -569,6 +586,12 @@ class OP2(OP2_Scalar, OP2Writer):
              True : prevents matrix reading crashes
         encoding : str
             the unicode encoding (default=None; system default)
+        write_index : bool; default=False
+            writes the table index to a sidecar file (e.g., model.op2.idx),
+            which is used by ``read_op2_from_index``
+        nworkers : int; default=1
+            the number of processes used to fill the result tables;
+            the results are the same as the serial reader
 
         """
         if op2_filename:
@@ -609,7 +632,24 @@ class OP2(OP2_Scalar, OP2Writer):
             self.log.debug('-------- reading op2 with read_mode=2 (array filling) --------')
             op2_reader = self.op2_reader
             _create_hdf5_info(self.op2_reader.h5_file, self)
-            OP2_Scalar.read_op2(self, op2_filename=self.op2_filename, mode=mode)
+            if self.use_lazy_results and self.use_table_index and not load_as_h5:
+                make_results_lazy(self, op2_reader, mode=mode)
+                OP2_Scalar.read_op2(self, op2_filename=self.op2_filename, mode=mode)
+                restore_deferred_tables(op2_reader)
+            elif nworkers > 1 and self.use_table_index and not load_as_h5:
+                with ProcessPoolExecutor(max_workers=nworkers) as executor:
+                    futures = submit_parallel_tables(self, executor, nworkers, mode=mode)
+                    OP2_Scalar.read_op2(self, op2_filename=self.op2_filename, mode=mode)
+                    merge_parallel_results(self, op2_reader, futures)
+            else:
+                OP2_Scalar.read_op2(self, op2_filename=self.op2_filename, mode=mode)
+
+            #: the location of the tables/subtables in the OP2
+            self.table_index = op2_reader.table_index
+            map_result_data(self.op2_filename, op2_reader.memmap_blocks, log=self.log)
+            op2_reader.memmap_blocks = {}
+            if write_index:
+                write_op2_index(self.table_index, self.op2_filename)
         except FileNotFoundError:
             raise
         except Exception:
@@ -625,6 +665,78 @@ class OP2(OP2_Scalar, OP2Writer):
         if len(self.op2_results.thermal_load):
             self.app = 'HEAT'
 
+    def read_op2_from_index(self, op2_filename: str,
+                            table_names: Optional[list[str]]=None,
+                            subcases: Optional[list[int]]=None,
+                            element_types: Optional[list[int]]=None,
+                            nonlinear_factors: Optional[list[float]]=None,
+                            combine: bool=True,
+                            encoding: Optional[str]=None) -> None:
+        """
+        Reads a subset of the results using the sidecar table index
+        (e.g., model.op2.idx), so only the requested table3/table4 records
+        are visited.  If the index doesn't exist or is out of date
+        (the OP2 size/modification time changed), it's rebuilt.
+
+        Parameters
+        ----------
+        op2_filename : str
+            the op2_filename
+        table_names : list[str]; default=None -> all
+            the tables to read (e.g., ['OES1X1'])
+        subcases : list[int]; default=None -> all
+            the subcases to read
+        element_types : list[int]; default=None -> all
+            the Nastran element types to read (e.g., 33 for CQUAD4)
+        nonlinear_factors : list[float]; default=None -> all
+            the modes/times/frequencies to read
+        combine : bool; default=True
+            True : objects are isubcase based
+            False : objects are (isubcase, subtitle) based;
+                    will be used for superelements regardless of the option
+        encoding : str
+            the unicode encoding (default=None; system default)
+
+        Examples
+        --------
+        Read the CQUAD4 stress for subcase 12, mode 3
+
+        >>> model = OP2()
+        >>> model.read_op2_from_index(
+        ...     'model.op2', table_names=['OES1X1', 'OES1'], subcases=[12],
+        ...     element_types=[33], nonlinear_factors=[3])
+        >>> stress = model.op2_results.stress.cquad4_stress[12]
+
+        """
+        check_path(op2_filename, name='op2_filename')
+        table_index = read_op2_index(op2_filename, log=self.log)
+        if table_index is None:
+            table_index = self._build_table_index(op2_filename, encoding=encoding)
+            write_op2_index(table_index, op2_filename)
+
+        if table_names is not None:
+            table_names = [table_name.encode('latin1') if isinstance(table_name, str)
+                           else table_name for table_name in table_names]
+        op2_reader = self.op2_reader
+        op2_reader.table_index = table_index
+        op2_reader.subtable_filter = table_index.select(
+            table_names=table_names, subcases=subcases,
+            element_types=element_types, nonlinear_factors=nonlinear_factors)
+        self.read_op2(op2_filename=op2_filename, combine=combine, encoding=encoding)
+
+    def _build_table_index(self, op2_filename: str,
+                           encoding: Optional[str]=None) -> OP2Index:
+        """runs the array sizing pass (read_mode=1) to get the table index"""
+        model = OP2(log=self.log, mode=self.mode)
+        model.encoding = sys.getdefaultencoding() if encoding is None else encoding
+        model.skip_undefined_matrices = False
+        model.is_vectorized = True
+        model.read_mode = 1
+        model._close_op2 = True
+        op2_reader = model.op2_reader
+        OP2_Scalar.read_op2(model, op2_filename=op2_filename, mode=self.mode)
+        return op2_reader.table_index
+
     def _finalize(self) -> None:
         """internal method"""
         if hasattr(self, 'subcase'):
@@ -1353,7 +1465,13 @@ def read_op2(op2_filename: Optional[str]=None,
              build_dataframe: Optional[bool]=False,
              skip_undefined_matrices: bool=True,
              mode: Optional[str]=None,
-             encoding: Optional[str]=None) -> OP2:
+             encoding: Optional[str]=None,
+             write_index: bool=False,
+             nworkers: int=1,
+             node_ids: Optional[list[int]]=None,
+             element_ids: Optional[list[int]]=None,
+             modes: Optional[list[int]]=None,
+             frequency_range: Optional[tuple[float, float]]=None) -> OP2:
     """
     Creates the OP2 object without calling the OP2 class.
 
@@ -1391,6 +1509,16 @@ def read_op2(op2_filename: Optional[str]=None,
         {nx, msc, autodesk, optistruct, nasa95}
     encoding : str
         the unicode encoding (default=None; system default)
+    write_index : bool; default=False
+        writes the table index to a sidecar file (e.g., model.op2.idx)
+    nworkers : int; default=1
+        the number of processes used to fill the result tables
+    node_ids / element_ids : list[int]; default=None -> all
+        the nodes/elements to read for the nodal/element results
+    modes : list[int]; default=None -> all
+        the modes to read for the eigenvalue/buckling results
+    frequency_range : (float, float); default=None -> all
+        the (min, max) frequency to read for the frequency results
 
     Returns
     -------
@@ -1414,16 +1542,21 @@ def read_op2(op2_filename: Optional[str]=None,
             validate=True, xref=True,
             build_dataframe=build_dataframe,
             skip_undefined_matrices=skip_undefined_matrices,
-            mode=mode, log=log, debug=debug, encoding=encoding)
+            mode=mode, log=log, debug=debug, encoding=encoding,
+            write_index=write_index, nworkers=nworkers,
+            node_ids=node_ids, element_ids=element_ids, modes=modes,
+            frequency_range=frequency_range)
     else:
         model = OP2(log=log, debug=debug, mode=mode)
         model.set_subcases(subcases)
+        model.set_result_filter(node_ids=node_ids, element_ids=element_ids,
+                                modes=modes, frequency_range=frequency_range)
         model.include_exclude_results(exclude_results=exclude_results,
                                       include_results=include_results)
 
         model.read_op2(op2_filename=op2_filename, build_dataframe=build_dataframe,
                        skip_undefined_matrices=skip_undefined_matrices, combine=combine,
-                       encoding=encoding)
+                       encoding=encoding, write_index=write_index, nworkers=nworkers)
 
     ## TODO: this will go away when OP2 is refactored
     ## TODO: many methods will be missing, but it's a start...
@@ -1437,6 +1570,96 @@ def read_op2(op2_filename: Optional[str]=None,
     return model
 
 
+def iter_op2_results(op2_filename: str,
+                     subcases: Optional[list[int]]=None,
+                     exclude_results: Optional[list[str]]=None,
+                     include_results: Optional[list[str]]=None,
+                     table_names: Optional[list[str]]=None,
+                     log: Any=None,
+                     debug: Optional[bool]=True,
+                     mode: Optional[str]=None,
+                     encoding: Optional[str]=None,
+                     write_index: bool=False) -> Iterator[tuple[str, Any, Any]]:
+    """
+    Reads an OP2 one table3/table4 block (e.g., a single
+    subcase/time/element type) at a time, so only a single block is in
+    memory.  The table index (e.g., model.op2.idx) is used to jump to
+    each block; it's built if it doesn't exist or is out of date.
+
+    Parameters
+    ----------
+    op2_filename : str
+        the op2_filename
+    subcases : list[int, ...] / int; default=None->all subcases
+        list of [subcase1_ID,subcase2_ID]
+    exclude_results / include_results : list[str] / str; default=None
+        a list of result types to exclude/include
+        one of these must be None
+    table_names : list[str]; default=None -> all
+        the tables to read (e.g., ['OES1X1'])
+    log : Log()
+        a logging object to write debug messages to
+    debug : bool/None; default=True
+        used to set the logger if no logger is passed in
+    mode : str; default=None -> 'msc'
+        the version of the Nastran you're using
+        {nx, msc, autodesk, optistruct, nasa95}
+    encoding : str
+        the unicode encoding (default=None; system default)
+    write_index : bool; default=False
+        writes the table index to a sidecar file if it was built
+
+    Yields
+    ------
+    result_name : str
+        the result type (e.g., 'displacements', 'stress.cquad4_stress')
+    key : tuple
+        the result key; see ``OP2.read_op2(combine=False)``
+        (the subcase id is obj.isubcase)
+    obj : result object
+        the result for a single time/mode/frequency
+
+    Examples
+    --------
+    Find the peak CQUAD4 von Mises stress
+
+    >>> max_vm = 0.
+    >>> for result_name, key, obj in iter_op2_results(
+    ...         'model.op2', include_results=['stress.cquad4_stress']):
+    ...     max_vm = max(max_vm, obj.data[:, :, -1].max())
+
+    """
+    check_path(op2_filename, name='op2_filename')
+    model = OP2(log=log, debug=debug, mode=mode)
+    log = model.log
+    table_index = read_op2_index(op2_filename, log=log)
+    if table_index is None:
+        table_index = model._build_table_index(op2_filename, encoding=encoding)
+        if write_index:
+            write_op2_index(table_index, op2_filename)
+
+    if table_names is not None:
+        table_names = [table_name.encode('latin1') if isinstance(table_name, str)
+                       else table_name for table_name in table_names]
+    table3_offsets = table_index.select(table_names=table_names, subcases=subcases)
+    for table in table_index.tables_to_refill():
+        for subtable in table.subtables:
+            if subtable.table3_offset not in table3_offsets or subtable.obj_class is None:
+                continue
+            model = OP2(log=log, mode=mode)
+            model.encoding = sys.getdefaultencoding() if encoding is None else encoding
+            model.set_subcases(subcases)
+            model.include_exclude_results(exclude_results=exclude_results,
+                                          include_results=include_results)
+            read_op2_tables(model, op2_filename, table_index, {table.start},
+                            {subtable.table3_offset}, mode=mode)
+            model._finalize()
+            for result_name, storage_dict in get_stored_results(model).items():
+                for key, obj in storage_dict.items():
+                    yield result_name, key, obj
+            del model
+
+
 def _create_hdf5_info(h5_file: H5File, op2_model: OP2) -> None:
     """exports the h5 info group"""
     load_as_h5 = False
@@ -47,7 +47,13 @@ def read_op2_geom(op2_filename: Optional[Union[str, PurePath]]=None,
                   build_dataframe: bool=False, skip_undefined_matrices: bool=True,
                   mode: str='msc', log: SimpleLogger=None, debug: bool=True,
                   debug_file: Optional[str]=None,
-                  encoding: Optional[str]=None):
+                  encoding: Optional[str]=None,
+                  write_index: bool=False,
+                  nworkers: int=1,
+                  node_ids: Optional[list[int]]=None,
+                  element_ids: Optional[list[int]]=None,
+                  modes: Optional[list[int]]=None,
+                  frequency_range: Optional[tuple[float, float]]=None):
     """
     Creates the OP2 object without calling the OP2 class.
 
@@ -81,6 +87,16 @@ def read_op2_geom(op2_filename: Optional[Union[str, PurePath]]=None,
         sets the filename that will be written to
     encoding : str
         the unicode encoding (default=None; system default)
+    write_index : bool; default=False
+        writes the table index to a sidecar file (e.g., model.op2.idx)
+    nworkers : int; default=1
+        the number of processes used to fill the result tables
+    node_ids / element_ids : list[int]; default=None -> all
+        the nodes/elements to read for the nodal/element results
+    modes : list[int]; default=None -> all
+        the modes to read for the eigenvalue/buckling results
+    frequency_range : (float, float); default=None -> all
+        the (min, max) frequency to read for the frequency results
 
     Returns
     -------
@@ -95,12 +111,14 @@ def read_op2_geom(op2_filename: Optional[Union[str, PurePath]]=None,
     """
     model = OP2Geom(log=log, debug=debug, debug_file=debug_file, mode=mode)
     model.set_subcases(subcases)
+    model.set_result_filter(node_ids=node_ids, element_ids=element_ids,
+                            modes=modes, frequency_range=frequency_range)
     model.include_exclude_results(exclude_results=exclude_results,
                                   include_results=include_results)
 
     model.read_op2(op2_filename=op2_filename, build_dataframe=build_dataframe,
                    skip_undefined_matrices=skip_undefined_matrices, combine=combine,
-                   encoding=encoding)
+                   encoding=encoding, write_index=write_index, nworkers=nworkers)
     if validate:
         model.validate()
     if xref:
@@ -313,12 +331,14 @@ class OP2Geom(BDF, OP2GeomCommon):
     def read_op2(self, op2_filename: Optional[Union[str, PurePath]]=None, combine: bool=True,
                  build_dataframe: Optional[bool]=False,
                  skip_undefined_matrices: bool=False,
-                 encoding: Optional[str]=None):
+                 encoding: Optional[str]=None,
+                 write_index: bool=False,
+                 nworkers: int=1):
         """see ``OP2.read_op2``"""
         OP2.read_op2(self, op2_filename=op2_filename, combine=combine,
                      build_dataframe=build_dataframe,
                      skip_undefined_matrices=skip_undefined_matrices,
-                     encoding=encoding)
+                     encoding=encoding, write_index=write_index, nworkers=nworkers)
         if len(self.nodes) == 0:
             self.gpdt_to_nodes()
 
@@ -1193,7 +1193,7 @@ class OP2Common(Op2Codes, F06Writer):
             assert nids.min() > 0, nids.min()
             obj.node_gridtype[obj.itotal:itotal2, 0] = nids
             obj.node_gridtype[obj.itotal:itotal2, 1] = ints[:, 1].copy()
-            obj.data[obj.itime, obj.itotal:itotal2, :] = floats[:, 2:].copy()
+            self._set_float_data(obj, floats, obj.itime, obj.itotal, itotal2, 2)
             obj.itotal = itotal2
         else:
             n = read_real_table_static(self, obj, flag,
@@ -1233,7 +1233,7 @@ class OP2Common(Op2Codes, F06Writer):
                 obj.node_gridtype[itotal:itotal2, 1] = ints[:, 1].copy()
 
             floats = np.frombuffer(data, dtype=self.fdtype8).reshape(nnodes, 8)
-            obj.data[obj.itime, obj.itotal:itotal2, :] = floats[:, 2:].copy()
+            self._set_float_data(obj, floats, obj.itime, obj.itotal, itotal2, 2)
             obj._times[itime] = dt
             obj.itotal = itotal2
         else:
@@ -1600,6 +1600,19 @@ class OP2Common(Op2Codes, F06Writer):
                 storage_obj[code] = self.obj
         assert self.obj.table_name is not None, f'apply the data_code...{self.data_code}'
 
+    def _set_float_data(self, obj, floats: np.ndarray, itime: int,
+                        itotal: int, itotal2: int, icol: int) -> None:
+        """
+        Fills obj.data[itime, itotal:itotal2, :] with floats[:, icol:]
+
+        With use_memmap, the location of the floats in the OP2 is stored
+        instead and the data is mapped once the OP2 has been read.
+        """
+        if self.use_memmap and self.op2_reader.add_memmap_block(
+                obj, floats, itime, itotal, icol):
+            return
+        obj.data[itime, itotal:itotal2, :] = floats[:, icol:]
+
     def _get_code(self):
         """
         The code is a the way you access something like self.displacements.
@@ -0,0 +1,212 @@
+"""
+Defines a filter on the node/element ids and the modes/frequencies of
+the OP2 results (OP2.set_result_filter):
+ - ResultFilter(node_ids=None, element_ids=None, modes=None,
+                frequency_range=None)
+   - is_valid_subtable(op2)
+   - is_sliced_table(op2)
+   - get_row_mask(op2, data, ndata)
+ - slice_record(data, mask)
+
+The table3 (header) record defines the mode/frequency for SORT1 results
+and the node/element id for SORT2 results, so a table4 (data) record
+that isn't selected is skipped without reading it.  The table4 rows of
+the selected records are sliced with a mask on the first word of the row
+(the node/element id for SORT1; the mode/frequency for SORT2).  The
+masks are found on the array sizing pass (read_mode=1), so the result
+arrays are only sized for the selected rows, and are reused on the array
+filling pass (read_mode=2).
+
+"""
+from __future__ import annotations
+from typing import Optional, Any, TYPE_CHECKING
+
+import numpy as np
+
+from pyNastran.utils.numpy_utils import integer_types
+from pyNastran.op2.op2_interface.op2_codes import _adjust_table_code
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.op2.op2 import OP2
+
+#: the tables where each row starts with a node id
+#: (e.g., displacement, eigenvector, spc/mpc forces, applied loads)
+NODE_TABLE_CODES = {1, 2, 3, 7, 10, 11, 14, 15, 16, 17, 39}
+
+#: the tables where each row starts with an element id (force, stress/strain)
+ELEMENT_TABLE_CODES = {4, 5}
+
+#: the analysis codes where the time is a mode number
+#: (real eigenvalues, post-buckling, complex eigenvalues)
+MODE_ANALYSIS_CODES = {2, 8, 9}
+
+#: the analysis codes where the time is a frequency
+FREQUENCY_ANALYSIS_CODES = {5}
+
+
+class ResultFilter:
+    """selects the rows of the result tables to read"""
+    def __init__(self, node_ids: Optional[list[int]]=None,
+                 element_ids: Optional[list[int]]=None,
+                 modes: Optional[list[int]]=None,
+                 frequency_range: Optional[tuple[float, float]]=None):
+        """
+        Parameters
+        ----------
+        node_ids : list[int]; default=None -> all
+            the nodes to read for the nodal results (e.g., displacement)
+        element_ids : list[int]; default=None -> all
+            the elements to read for the element results (e.g., stress)
+        modes : list[int]; default=None -> all
+            the modes to read for the eigenvalue/buckling results
+            (e.g., range(1, 11))
+        frequency_range : (float, float); default=None -> all
+            the (min, max) frequency to read for the frequency results
+
+        """
+        self.node_ids = _to_ids(node_ids)
+        self.element_ids = _to_ids(element_ids)
+        self.modes = _to_ids(modes)
+        if frequency_range is not None:
+            fmin, fmax = frequency_range
+            assert fmin <= fmax, f'frequency_range={frequency_range}'
+            frequency_range = (float(fmin), float(fmax))
+        self.frequency_range = frequency_range
+
+    @property
+    def is_active(self) -> bool:
+        """is there anything to filter?"""
+        return (self.node_ids is not None or self.element_ids is not None or
+                self.modes is not None or self.frequency_range is not None)
+
+    def is_valid_subtable(self, op2: OP2) -> bool:
+        """
+        Checks the table3 values (set by the table3 parser) to see if the
+        table4 record needs to be read
+
+        Returns
+        -------
+        is_valid : bool
+            False : the table4 record can be skipped
+
+        """
+        data_code = op2.data_code
+        if not _is_result_table(op2):
+            return True
+        if not op2.is_sort1:
+            ids = self._get_ids(op2)
+            if ids is None:
+                return True
+            if 'node_id' in data_code:
+                return data_code['node_id'] in ids
+            if 'element_id' in data_code:
+                return data_code['element_id'] in ids
+            return True
+
+        analysis_code = data_code.get('analysis_code')
+        if self.modes is not None and analysis_code in MODE_ANALYSIS_CODES:
+            mode = data_code.get('mode', data_code.get('lsdvmn'))
+            if mode is not None:
+                return int(mode) in self.modes
+        if self.frequency_range is not None and analysis_code in FREQUENCY_ANALYSIS_CODES:
+            freq = data_code.get('freq')
+            if freq is not None:
+                return self.frequency_range[0] <= freq <= self.frequency_range[1]
+        return True
+
+    def is_sliced_table(self, op2: OP2) -> bool:
+        """are the rows of the table4 record sliced?"""
+        if not _is_result_table(op2):
+            return False
+        if op2.is_sort1:
+            return self._get_ids(op2) is not None
+        analysis_code = op2.data_code.get('analysis_code')
+        return ((self.modes is not None and analysis_code in MODE_ANALYSIS_CODES) or
+                (self.frequency_range is not None and
+                 analysis_code in FREQUENCY_ANALYSIS_CODES))
+
+    def get_row_mask(self, op2: OP2, data: bytes, ndata: int) -> Optional[np.ndarray]:
+        """
+        Gets the selected rows of a table4 record (see ``is_sliced_table``)
+        using the first word of the row (the node/element id for SORT1;
+        the mode/frequency for SORT2)
+
+        Returns
+        -------
+        mask : (nrows, ) bool ndarray
+            the selected rows
+            None : all the rows are selected
+
+        """
+        num_wide = op2.num_wide
+        ntotal = num_wide * op2.size
+        nrows = ndata // ntotal
+        if num_wide <= 0 or nrows * ntotal != ndata:
+            return None
+
+        if op2.is_sort1:
+            ints = np.frombuffer(data, dtype=op2.idtype8, count=nrows * num_wide)
+            row_ids = ints.reshape(nrows, num_wide)[:, 0] // 10
+            mask = np.isin(row_ids, self._get_ids(op2))
+        elif op2.data_code.get('analysis_code') in MODE_ANALYSIS_CODES:
+            ints = np.frombuffer(data, dtype=op2.idtype8, count=nrows * num_wide)
+            mask = np.isin(ints.reshape(nrows, num_wide)[:, 0], self.modes)
+        else:
+            floats = np.frombuffer(data, dtype=op2.fdtype8, count=nrows * num_wide)
+            freqs = floats.reshape(nrows, num_wide)[:, 0]
+            fmin, fmax = self.frequency_range
+            mask = (fmin <= freqs) & (freqs <= fmax)
+
+        if mask.all():
+            return None
+        return mask
+
+    def _get_ids(self, op2: OP2) -> Optional[np.ndarray]:
+        """gets the node/element ids that apply to the table"""
+        table_code = _get_table_code(op2)
+        if table_code in NODE_TABLE_CODES:
+            return self.node_ids
+        if table_code in ELEMENT_TABLE_CODES:
+            return self.element_ids
+        return None
+
+    def __repr__(self) -> str:
+        nnodes = None if self.node_ids is None else len(self.node_ids)
+        nelements = None if self.element_ids is None else len(self.element_ids)
+        nmodes = None if self.modes is None else len(self.modes)
+        return (f'ResultFilter(nnodes={nnodes}, nelements={nelements}, nmodes={nmodes}, '
+                f'frequency_range={self.frequency_range})')
+
+
+def _to_ids(ids: Any) -> Optional[np.ndarray]:
+    """casts an int/list/range/array of ids to a sorted array"""
+    if ids is None:
+        return None
+    if isinstance(ids, integer_types):
+        ids = [ids]
+    elif not isinstance(ids, np.ndarray):
+        ids = list(ids)
+    return np.unique(np.asarray(ids, dtype='int64'))
+
+
+def slice_record(data: bytes, mask: np.ndarray) -> bytes:
+    """gets the selected rows of a table4 record"""
+    rows = np.frombuffer(data, dtype='uint8').reshape(len(mask), -1)
+    return rows[mask].tobytes()
+
+
+def _get_table_code(op2: OP2) -> int:
+    """gets the table code (e.g., 501 -> 1)"""
+    return _adjust_table_code(op2.data_code.get('table_code', -1))
+
+
+def _is_result_table(op2: OP2) -> bool:
+    """is the table a SORT1/SORT2 nodal/element result that may be filtered?"""
+    table_code = _get_table_code(op2)
+    if table_code not in NODE_TABLE_CODES and table_code not in ELEMENT_TABLE_CODES:
+        return False
+    try:
+        unused_is_sort1 = op2.is_sort1
+    except ValueError:
+        # the sort method isn't known (e.g., PSDF)
+        return False
+    return True
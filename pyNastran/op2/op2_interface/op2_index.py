@@ -0,0 +1,328 @@
+"""
+Defines the table index that is built while sizing the arrays
+(read_mode=1) of an OP2:
+ - OP2Index()
+   - add_table(table_name, start, refill, count=0)
+   - tables_to_refill()
+   - select(table_names=None, subcases=None, element_types=None,
+            nonlinear_factors=None)
+ - TableEntry(table_name, start, refill, count=0)
+ - SubtableEntry(isubtable, table3_offset)
+ - write_op2_index(table_index, op2_filename, idx_filename=None)
+ - read_op2_index(op2_filename, idx_filename=None, log=None)
+
+The second (array filling) pass uses the index to jump straight to the
+tables that need to be filled rather than walking every marker in the file.
+
+The index may be saved as a sidecar file (e.g., model.op2.idx), so a later
+run can seek straight to a single result without rescanning the OP2.
+
+"""
+from __future__ import annotations
+import os
+import json
+from typing import Optional, Any
+
+import numpy as np
+
+#: bump this if the sidecar format changes
+INDEX_VERSION = 2
+
+
+class SubtableEntry:
+    """a table3/table4 pair in a macro table (e.g., OUGV1, OES1X1)"""
+    __slots__ = ('isubtable', 'table3_offset', 'table4_offset', 'end',
+                 'record_len', 'ntotal', 'isubcase', 'element_type', 'num_wide',
+                 'nonlinear_factor', 'obj_class', 'data_code')
+    def __init__(self, isubtable: int, table3_offset: int):
+        self.isubtable = isubtable
+
+        #: location of the table3 (header) record
+        self.table3_offset = table3_offset
+
+        #: location of the table4 (data) record and the end of the record
+        self.table4_offset = -1
+        self.end = -1
+
+        #: the length of the table4 record in bytes (e.g., ntotal*num_wide*size)
+        self.record_len = 0
+
+        #: the number of nodes/elements/layers in the table4 record
+        self.ntotal = 0
+
+        self.isubcase = None
+        self.element_type = None
+        self.num_wide = None
+
+        #: the time/mode/frequency
+        self.nonlinear_factor = None
+
+        #: the result class that was sized (e.g., 'RealDisplacementArray')
+        self.obj_class = None
+
+        #: the parsed table3 values (e.g., table_code, approach_code, mode)
+        self.data_code: dict[str, Any] = {}
+
+    def __repr__(self) -> str:
+        return (f'SubtableEntry(isubtable={self.isubtable}, isubcase={self.isubcase}, '
+                f'element_type={self.element_type}, num_wide={self.num_wide}, '
+                f'nonlinear_factor={self.nonlinear_factor}, '
+                f'table3_offset={self.table3_offset}, table4_offset={self.table4_offset}, '
+                f'record_len={self.record_len}, obj_class={self.obj_class!r})')
+
+
+class TableEntry:
+    """a macro table (e.g., OUGV1, OES1X1, KAA) in the OP2"""
+    __slots__ = ('table_name', 'start', 'end', 'refill', 'count', 'subtables')
+    def __init__(self, table_name: bytes, start: int, refill: bool, count: int=0):
+        self.table_name = table_name
+
+        #: the location of the table name record and the start of the next table
+        self.start = start
+        self.end = -1
+
+        #: does the table need to be read on the array filling pass?
+        self.refill = refill
+
+        #: the optimization counter (OP2._count) at the start of the table,
+        #: which is part of the result key
+        self.count = count
+        self.subtables: list[SubtableEntry] = []
+
+    def __repr__(self) -> str:
+        return (f'TableEntry(table_name={self.table_name!r}, start={self.start}, '
+                f'end={self.end}, refill={self.refill}, nsubtables={len(self.subtables)})')
+
+
+class OP2Index:
+    """
+    Stores the location of every table and table3/table4 pair in an OP2
+
+    Built on the array sizing pass (read_mode=1); the array filling pass
+    (read_mode=2) only visits the tables that are flagged with refill.
+
+    """
+    def __init__(self):
+        self.tables: list[TableEntry] = []
+
+    def add_table(self, table_name: bytes, start: int, refill: bool,
+                  count: int=0) -> TableEntry:
+        """adds a macro table"""
+        table = TableEntry(table_name, start, refill, count=count)
+        self.tables.append(table)
+        return table
+
+    @property
+    def current_table(self) -> Optional[TableEntry]:
+        """the table that is being read"""
+        if len(self.tables) == 0:
+            return None
+        return self.tables[-1]
+
+    def tables_to_refill(self) -> list[TableEntry]:
+        """gets the tables that need to be read on the array filling pass"""
+        return [table for table in self.tables if table.refill]
+
+    def select(self, table_names: Optional[list[bytes]]=None,
+               subcases: Optional[list[int]]=None,
+               element_types: Optional[list[int]]=None,
+               nonlinear_factors: Optional[list[float]]=None) -> set[int]:
+        """
+        Flags the tables that contain the requested results
+
+        Parameters
+        ----------
+        table_names : list[bytes]; default=None -> all
+            the tables to read (e.g., [b'OES1X1'])
+        subcases : list[int]; default=None -> all
+            the subcases to read
+        element_types : list[int]; default=None -> all
+            the Nastran element types to read (e.g., 33 for CQUAD4)
+        nonlinear_factors : list[float]; default=None -> all
+            the modes/times/frequencies to read
+
+        Returns
+        -------
+        table3_offsets : set[int]
+            the location of the table3 records to read
+
+        """
+        table3_offsets = set()
+        for table in self.tables:
+            table.refill = False
+            if table_names is not None and table.table_name not in table_names:
+                continue
+            for subtable in table.subtables:
+                if subtable.table4_offset == -1:
+                    continue
+                if subcases is not None and subtable.isubcase not in subcases:
+                    continue
+                if element_types is not None and subtable.element_type not in element_types:
+                    continue
+                if nonlinear_factors is not None and not _is_in_factors(
+                        subtable.nonlinear_factor, nonlinear_factors):
+                    continue
+                table3_offsets.add(subtable.table3_offset)
+                table.refill = True
+        return table3_offsets
+
+    def __len__(self) -> int:
+        return len(self.tables)
+
+    def __iter__(self):
+        return iter(self.tables)
+
+    def __repr__(self) -> str:
+        msg = f'OP2Index(ntables={len(self.tables)})\n'
+        for table in self.tables:
+            msg += f'  {table}\n'
+        return msg
+
+
+def write_op2_index(table_index: OP2Index, op2_filename: str,
+                    idx_filename: Optional[str]=None) -> str:
+    """
+    Writes the table index as a sidecar file
+
+    Parameters
+    ----------
+    table_index : OP2Index
+        the index to write
+    op2_filename : str
+        the OP2 the index was built from
+    idx_filename : str; default=None -> op2_filename + '.idx'
+        the sidecar file
+
+    Returns
+    -------
+    idx_filename : str
+        the sidecar file
+
+    """
+    if idx_filename is None:
+        idx_filename = str(op2_filename) + '.idx'
+    stat = os.stat(op2_filename)
+    tables = []
+    for table in table_index:
+        subtables = []
+        for subtable in table.subtables:
+            subtables.append({
+                'isubtable': subtable.isubtable,
+                'table3_offset': subtable.table3_offset,
+                'table4_offset': subtable.table4_offset,
+                'end': subtable.end,
+                'record_len': subtable.record_len,
+                'ntotal': subtable.ntotal,
+                'isubcase': subtable.isubcase,
+                'element_type': subtable.element_type,
+                'num_wide': subtable.num_wide,
+                'nonlinear_factor': _to_json_value(subtable.nonlinear_factor),
+                'obj_class': subtable.obj_class,
+                'data_code': subtable.data_code,
+            })
+        tables.append({
+            'table_name': table.table_name.decode('latin1'),
+            'start': table.start,
+            'end': table.end,
+            'refill': table.refill,
+            'count': table.count,
+            'subtables': subtables,
+        })
+
+    data = {
+        'version': INDEX_VERSION,
+        'op2_size': stat.st_size,
+        'op2_mtime': stat.st_mtime_ns,
+        'tables': tables,
+    }
+    with open(idx_filename, 'w') as idx_file:
+        json.dump(data, idx_file)
+    return idx_filename
+
+
+def read_op2_index(op2_filename: str, idx_filename: Optional[str]=None,
+                   log=None) -> Optional[OP2Index]:
+    """
+    Loads a sidecar table index
+
+    Parameters
+    ----------
+    op2_filename : str
+        the OP2 the index was built from
+    idx_filename : str; default=None -> op2_filename + '.idx'
+        the sidecar file
+    log : SimpleLogger; default=None
+        logs why the index is out of date
+
+    Returns
+    -------
+    table_index : OP2Index / None
+        None : the index doesn't exist or is out of date
+               (the OP2 size/modification time changed)
+
+    """
+    if idx_filename is None:
+        idx_filename = str(op2_filename) + '.idx'
+    if not os.path.exists(idx_filename):
+        return None
+
+    with open(idx_filename, 'r') as idx_file:
+        data = json.load(idx_file)
+
+    stat = os.stat(op2_filename)
+    if (data.get('version') != INDEX_VERSION or
+            data['op2_size'] != stat.st_size or
+            data['op2_mtime'] != stat.st_mtime_ns):
+        if log is not None:
+            log.warning(f'{idx_filename!r} is out of date and will be ignored')
+        return None
+
+    table_index = OP2Index()
+    for table_dict in data['tables']:
+        table = table_index.add_table(
+            table_dict['table_name'].encode('latin1'),
+            table_dict['start'], table_dict['refill'], count=table_dict['count'])
+        table.end = table_dict['end']
+        for subtable_dict in table_dict['subtables']:
+            subtable = SubtableEntry(subtable_dict['isubtable'],
+                                     subtable_dict['table3_offset'])
+            for key in ('table4_offset', 'end', 'record_len', 'ntotal', 'isubcase',
+                        'element_type', 'num_wide', 'nonlinear_factor',
+                        'obj_class', 'data_code'):
+                setattr(subtable, key, subtable_dict[key])
+            table.subtables.append(subtable)
+    return table_index
+
+
+def get_data_code_values(data_code: dict[str, Any]) -> dict[str, Any]:
+    """gets the json-able parameters of a table3 data_code"""
+    values = {}
+    for key, value in data_code.items():
+        if key in {'h5_file', 'load_as_h5'}:
+            continue
+        value = _to_json_value(value)
+        if isinstance(value, (int, float, str, bool)) or value is None:
+            values[key] = value
+        elif isinstance(value, list) and all(isinstance(val, str) for val in value):
+            values[key] = value
+    return values
+
+
+def _to_json_value(value: Any) -> Any:
+    """casts numpy scalars and bytes so they can be saved"""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, bytes):
+        return value.decode('latin1')
+    return value
+
+
+def _is_in_factors(nonlinear_factor: Optional[float],
+                   nonlinear_factors: list[float]) -> bool:
+    """is the time/mode/frequency one of the requested values?"""
+    if nonlinear_factor is None:
+        return False
+    for value in nonlinear_factors:
+        if np.isclose(nonlinear_factor, value, rtol=1e-6, atol=0.):
+            return True
+    return False
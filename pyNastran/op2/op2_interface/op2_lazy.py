@@ -0,0 +1,347 @@
+"""
+Defines methods to decode the result data of an OP2 on first access
+(OP2.use_lazy_results):
+ - make_results_lazy(op2, op2_reader, mode=None)
+ - LazyResultLoader(op2_filename, table_index, settings, log=None,
+                    max_nbytes=None)
+   - load(obj)
+   - unload(obj)
+ - LazyResultMixin
+
+The array sizing pass (read_mode=1) builds the OP2Index, so the tables
+that make up each result (e.g., displacements[1]) are already located.
+Rather than filling those tables on the array filling pass (read_mode=2),
+the result's class is swapped for a subclass where data is a property.
+The table3 header (data_code), the times/modes/frequencies (_times) and
+the node/element ids (read from the first time) are available right away,
+but the data is only read when it's accessed.
+
+If max_nbytes is set, the least recently used data is unloaded once the
+loaded data exceeds the budget and is read again on the next access.
+
+"""
+from __future__ import annotations
+import copy
+import copyreg
+from collections import OrderedDict
+from typing import Optional, Any, TYPE_CHECKING
+
+import numpy as np
+
+from pyNastran.op2.op2_interface.op2_scalar import RESULT_TABLES
+from pyNastran.op2.op2_interface.op2_index import OP2Index
+from pyNastran.op2.op2_interface.op2_parallel import (
+    get_reader_settings, create_table_reader, read_op2_tables, get_stored_results)
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.op2.op2 import OP2
+    from pyNastran.op2.op2_interface.op2_reader import OP2Reader
+
+#: result class -> lazy result class
+_LAZY_CLASSES: dict[type, type] = {}
+
+
+class LazyResultMixin:
+    """reads the data of a result object when it's first accessed"""
+    _base_class: type = object
+
+    @property
+    def data(self) -> np.ndarray:
+        """the result data, which is read from the OP2 if it's not loaded"""
+        try:
+            data = self.__dict__['data']
+        except KeyError:
+            return self._lazy[0].load(self)
+        self._lazy[0].touch(self)
+        return data
+
+    @data.setter
+    def data(self, data: np.ndarray) -> None:
+        self.__dict__['data'] = data
+
+    @data.deleter
+    def data(self) -> None:
+        del self.__dict__['data']
+
+    @property
+    def is_loaded(self) -> bool:
+        """has the data been read?"""
+        return 'data' in self.__dict__
+
+    def __eq__(self, table) -> bool:
+        """compares the loaded result"""
+        base_class = self._base_class
+        unused_data = self.data
+        return base_class.__eq__(self, table)
+
+    def finalize(self) -> None:
+        """the data is finalized when it's loaded"""
+        return
+
+    def __reduce_ex__(self, protocol: int):
+        """pickles/copies the object as the (loaded) result class"""
+        base_class = self._base_class
+        unused_data = self.data
+        state = self.__getstate__()
+        state.pop('_lazy', None)
+        return copyreg.__newobj__, (base_class, ), state
+
+
+class LazyResultLoader:
+    """reads the tables for a lazy result object"""
+    def __init__(self, op2_filename: str, table_index: OP2Index,
+                 settings: dict[str, Any], log=None,
+                 max_nbytes: Optional[int]=None):
+        """
+        Parameters
+        ----------
+        op2_filename : str
+            the OP2 that was read
+        table_index : OP2Index
+            the index from the array sizing pass
+        settings : dict[str, Any]
+            the reader options; see ``get_reader_settings``
+        log : SimpleLogger; default=None
+            logs the results that are loaded/unloaded
+        max_nbytes : int; default=None -> unlimited
+            the number of bytes of data to keep in memory
+
+        """
+        self.op2_filename = op2_filename
+
+        # the refill flags are changed on every read
+        self.table_index = copy.deepcopy(table_index)
+        self.settings = settings
+        self.log = log
+        self.max_nbytes = max_nbytes
+
+        #: the loaded objects in least recently used order
+        self.loaded: OrderedDict[int, Any] = OrderedDict()
+
+    def load(self, obj: LazyResultMixin) -> np.ndarray:
+        """reads the result and returns the data"""
+        unused_loader, table_starts, table3_offsets = obj._lazy
+        obj_loaded = self.read_result(obj, table_starts, table3_offsets)
+        obj.__dict__.update(obj_loaded.__dict__)
+        data = obj.__dict__['data']
+        if self.log is not None:
+            self.log.debug(f'loaded {obj.__class__.__name__} data={data.shape}')
+
+        if self.max_nbytes is None:
+            # there's no budget, so it's a normal result from now on
+            del obj._lazy
+            obj.__class__ = obj._base_class
+            return data
+
+        self.loaded[id(obj)] = obj
+        self._unload_oldest()
+        return data
+
+    def read_result(self, obj: Any, table_starts: set[int],
+                    table3_offsets: set[int]) -> Any:
+        """reads the tables of a single result into a new model"""
+        model = create_table_reader(self.settings)
+        read_op2_tables(model, self.op2_filename, self.table_index,
+                        table_starts, table3_offsets, mode=self.settings['mode'])
+        model._finalize()
+
+        class_name = obj.__class__.__name__
+        objs = [obji for storage_dict in get_stored_results(model).values()
+                for obji in storage_dict.values()
+                if obji.__class__.__name__ == class_name]
+        if len(objs) != 1:
+            raise RuntimeError(f'expected 1 {class_name}; found {len(objs)}')
+        return objs[0]
+
+    def touch(self, obj: LazyResultMixin) -> None:
+        """flags the object as the most recently used"""
+        if self.max_nbytes is not None:
+            self.loaded.move_to_end(id(obj))
+
+    def unload(self, obj: LazyResultMixin) -> None:
+        """removes the data, so it's read again on the next access"""
+        self.loaded.pop(id(obj), None)
+        if obj.is_loaded:
+            del obj.data
+            if self.log is not None:
+                self.log.debug(f'unloaded {obj.__class__.__name__}')
+
+    def _unload_oldest(self) -> None:
+        """unloads the least recently used data until it fits in the budget"""
+        nbytes = sum(obj.__dict__['data'].nbytes for obj in self.loaded.values())
+        while nbytes > self.max_nbytes and len(self.loaded) > 1:
+            unused_key, obj = self.loaded.popitem(last=False)
+            nbytes -= obj.__dict__['data'].nbytes
+            self.unload(obj)
+
+
+def make_results_lazy(op2: OP2, op2_reader: OP2Reader, mode: Optional[str]=None) -> int:
+    """
+    Flags the result tables, so they're skipped on the array filling pass,
+    and swaps the sized (but unfilled) result objects for lazy results.
+    The tables are flagged as refilled again by ``restore_deferred_tables``.
+
+    Parameters
+    ----------
+    op2 : OP2
+        the model after the array sizing pass (read_mode=1)
+    op2_reader : OP2Reader
+        the reader with the table index
+    mode : str; default=None
+        the Nastran version the OP2 was opened with
+
+    Returns
+    -------
+    nlazy : int
+        the number of lazy results
+
+    """
+    table_index = op2_reader.table_index
+    if table_index is None or op2_reader.subtable_filter is not None:
+        return 0
+
+    objs = _get_lazy_candidates(op2, op2_reader)
+    table_starts = _get_lazy_tables(table_index, objs, op2_reader.result_subtables)
+    if not table_starts:
+        return 0
+
+    settings = get_reader_settings(op2, mode=mode)
+    loader = LazyResultLoader(op2.op2_filename, table_index, settings, log=op2.log,
+                              max_nbytes=op2.lazy_max_nbytes)
+
+    # read the first time/mode/frequency of every result to get the ids
+    first_starts = set()
+    first_offsets = set()
+    obj_subtables = {}
+    for key, (unused_result_name, unused_result_key, obj) in objs.items():
+        subtables = sorted(op2_reader.result_subtables[key][1],
+                           key=lambda start_subtable: start_subtable[1].table3_offset)
+        obj_subtables[key] = subtables
+        table_start, subtable = subtables[0]
+        first_starts.add(table_start)
+        first_offsets.add(subtable.table3_offset)
+
+    model = create_table_reader(settings)
+    read_op2_tables(model, op2.op2_filename, loader.table_index,
+                    first_starts, first_offsets, mode=mode)
+    model._finalize()
+    first_results = get_stored_results(model)
+
+    nlazy = 0
+    for key, (result_name, result_key, obj) in objs.items():
+        subtables = obj_subtables[key]
+        obj_table_starts = {table_start for table_start, unused_subtable in subtables}
+        table3_offsets = {subtable.table3_offset for unused_start, subtable in subtables}
+        obj_first = first_results.get(result_name, {}).get(result_key)
+        if obj_first is None or not _set_lazy_ids(obj, obj_first, subtables):
+            # the ids depend on the time, so read it now
+            obj_loaded = loader.read_result(obj, obj_table_starts, table3_offsets)
+            obj.__dict__.update(obj_loaded.__dict__)
+            continue
+
+        obj.__class__ = _get_lazy_class(obj.__class__)
+        obj._lazy = (loader, obj_table_starts, table3_offsets)
+        nlazy += 1
+
+    for table in table_index:
+        if table.start in table_starts:
+            table.refill = False
+    op2_reader.deferred_tables.update(table_starts)
+    op2.log.debug(f'{nlazy} lazy results')
+    return nlazy
+
+
+def _get_lazy_candidates(op2: OP2, op2_reader: OP2Reader) -> dict[int, tuple[str, Any, Any]]:
+    """gets the sized SORT1 results that were created by a subtable"""
+    result_subtables = op2_reader.result_subtables
+    objs = {}
+    for result_name in op2.get_table_types():
+        storage_dict = op2.get_result(result_name)
+        if not isinstance(storage_dict, dict):
+            continue
+        for result_key, obj in storage_dict.items():
+            key = id(obj)
+            if (key not in result_subtables or not hasattr(obj, 'build') or
+                    getattr(obj, 'load_as_h5', False) or not getattr(obj, 'is_sort1', False)):
+                continue
+            objs[key] = (result_name, result_key, obj)
+    return objs
+
+
+def _get_lazy_tables(table_index: OP2Index, objs: dict[int, tuple[str, Any, Any]],
+                     result_subtables: dict[int, tuple[Any, list]]) -> set[int]:
+    """
+    Gets the result tables where every subtable belongs to a lazy result.
+    The results that are also in another table are removed from objs.
+    """
+    subtable_objs = {}
+    for key, (unused_obj, subtables) in result_subtables.items():
+        for unused_table_start, subtable in subtables:
+            subtable_objs[id(subtable)] = key
+
+    result_tables = set(RESULT_TABLES)
+    while True:
+        table_starts = set()
+        for table in table_index:
+            if not table.refill or table.table_name not in result_tables:
+                continue
+            keys = [subtable_objs.get(id(subtable)) for subtable in table.subtables
+                    if subtable.table4_offset != -1]
+            if keys and all(key in objs for key in keys):
+                table_starts.add(table.start)
+
+        nobjs = len(objs)
+        for key in list(objs):
+            subtables = result_subtables[key][1]
+            if any(table_start not in table_starts for table_start, unused_subtable in subtables):
+                del objs[key]
+        if len(objs) == nobjs:
+            return table_starts
+
+
+def _set_lazy_ids(obj: Any, obj_first: Any, subtables: list) -> bool:
+    """
+    Sizes the result and sets the times and the node/element ids from the
+    first time; each SORT1 subtable is a time/mode/frequency
+
+    Returns
+    -------
+    is_lazy : bool
+        False : the ids depend on the time (e.g., grid point forces)
+    """
+    obj.build()
+    del obj.data
+    factors = [subtable.nonlinear_factor for unused_table_start, subtable in subtables]
+    ntimes = len(factors)
+    if ntimes != len(obj._times):
+        return False
+
+    ids = {}
+    for name, value in obj.__dict__.items():
+        if name in {'data', '_times'} or not isinstance(value, np.ndarray):
+            continue
+        value_first = obj_first.__dict__.get(name)
+        if not isinstance(value_first, np.ndarray) or value_first.shape != value.shape:
+            return False
+        ids[name] = value_first
+
+    times = obj_first._times
+    if ntimes > 1:
+        if any(factor is None or np.isnan(factor) for factor in factors):
+            return False
+        times = np.array(factors, dtype=times.dtype)
+    obj.__dict__.update(ids)
+    obj._times = times
+    return True
+
+
+def _get_lazy_class(cls: type) -> type:
+    """creates a subclass of the result class where data is read on first access"""
+    lazy_cls = _LAZY_CLASSES.get(cls)
+    if lazy_cls is None:
+        lazy_cls = type(cls.__name__, (LazyResultMixin, cls), {
+            '__module__': cls.__module__,
+            '__qualname__': cls.__qualname__,
+            '_base_class': cls,
+        })
+        _LAZY_CLASSES[cls] = lazy_cls
+    return lazy_cls
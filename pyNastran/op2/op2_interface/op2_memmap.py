@@ -0,0 +1,125 @@
+"""
+Defines methods to map the real table4 data of an OP2 into the result
+arrays rather than copying it into memory (OP2.use_memmap):
+ - MemmapBlocks(obj, dtype, num_wide, icol)
+   - add_block(itime, itotal, nrows, offset)
+ - map_result_data(op2_filename, memmap_blocks, log=None)
+
+On the array filling pass (read_mode=2), the location of each single
+block table4 record is stored rather than copying the floats.  Once the
+OP2 has been read, the result's data is:
+ - a strided view into a copy-on-write np.memmap of the OP2, which is
+   only paged in when it's accessed, if every time/mode/frequency is a
+   single record of the same size with a constant spacing
+ - filled from the np.memmap for anything else
+
+"""
+from __future__ import annotations
+from typing import Any
+
+import numpy as np
+
+
+class MemmapBlocks:
+    """the table4 records that fill a result's data array"""
+    def __init__(self, obj: Any, dtype: np.dtype, num_wide: int, icol: int):
+        self.obj = obj
+        self.dtype = np.dtype(dtype)
+
+        #: the number of words in a row of the record
+        self.num_wide = num_wide
+
+        #: the first float column in the row (e.g., 2 for OUG, 1 for OES)
+        self.icol = icol
+
+        #: (itime, itotal, nrows, offset)
+        self.blocks: list[tuple[int, int, int, int]] = []
+
+    def add_block(self, itime: int, itotal: int, nrows: int, offset: int) -> None:
+        """stores the location of a table4 record"""
+        self.blocks.append((itime, itotal, nrows, offset))
+
+    @property
+    def row_nbytes(self) -> int:
+        """the number of bytes in a row of the record"""
+        return self.num_wide * self.dtype.itemsize
+
+    def get_time_stride(self) -> int:
+        """
+        Gets the spacing between the records if every time is a
+        single record of the full size with a constant spacing.
+
+        Returns
+        -------
+        stride : int
+            -1 : the data can't be viewed with a constant stride
+
+        """
+        data = self.obj.data
+        ntimes, ntotal = data.shape[:2]
+        if data.dtype != self.dtype or len(self.blocks) != ntimes:
+            return -1
+
+        offsets = []
+        for itime, (itimei, itotal, nrows, offset) in enumerate(sorted(self.blocks)):
+            if itimei != itime or itotal != 0 or nrows != ntotal:
+                return -1
+            offsets.append(offset)
+        if ntimes == 1:
+            return 0
+
+        strides = np.diff(offsets)
+        if not np.all(strides == strides[0]) or strides[0] <= 0:
+            return -1
+        return int(strides[0])
+
+
+def map_result_data(op2_filename: str, memmap_blocks: dict[int, MemmapBlocks],
+                    log=None) -> int:
+    """
+    Points the result data at the table4 records in the OP2
+
+    Parameters
+    ----------
+    op2_filename : str
+        the OP2 that was read
+    memmap_blocks : dict[int, MemmapBlocks]
+        the table4 records that weren't copied on the array filling pass
+    log : SimpleLogger; default=None
+        logs the number of mapped results
+
+    Returns
+    -------
+    nmapped : int
+        the number of results that are views into the OP2
+
+    """
+    if len(memmap_blocks) == 0:
+        return 0
+
+    # copy-on-write, so the results may be modified without changing the OP2
+    op2_map = np.memmap(op2_filename, dtype='uint8', mode='c')
+    nmapped = 0
+    for blocks in memmap_blocks.values():
+        obj = blocks.obj
+        ntimes, ntotal, ncols = obj.data.shape
+        itemsize = blocks.dtype.itemsize
+        stride = blocks.get_time_stride()
+        if stride >= 0:
+            offset = blocks.blocks[0][3] + blocks.icol * itemsize
+            obj.data = np.ndarray(
+                (ntimes, ntotal, ncols), dtype=blocks.dtype, buffer=op2_map,
+                offset=offset, strides=(stride, blocks.row_nbytes, itemsize))
+            nmapped += 1
+            continue
+
+        # the records aren't uniform (e.g., a result that's split across
+        # multiple records), so fill the array
+        for itime, itotal, nrows, offset in blocks.blocks:
+            floats = np.frombuffer(op2_map, dtype=blocks.dtype, count=nrows * blocks.num_wide,
+                                   offset=offset).reshape(nrows, blocks.num_wide)
+            obj.data[itime, itotal:itotal+nrows, :] = floats[:, blocks.icol:]
+
+    if log is not None:
+        log.debug(f'mapped {nmapped}/{len(memmap_blocks)} results from {op2_filename}')
+    return nmapped
@@ -0,0 +1,287 @@
+"""
+Defines methods to fill the result tables of an OP2 on worker processes:
+ - get_table_groups(table_index, subtable_filter=None)
+ - submit_parallel_tables(op2, executor, nworkers, mode=None)
+ - merge_parallel_results(op2, op2_reader, futures)
+ - restore_deferred_tables(op2_reader)
+ - read_op2_tables(model, op2_filename, table_index, table_starts,
+                   table3_offsets, mode=None)
+ - get_stored_results(model)
+ - get_reader_settings(op2, mode=None)
+ - create_table_reader(settings, log=None)
+
+The array sizing pass (read_mode=1) builds the OP2Index, so the result
+tables are already located.  Tables that don't share a result class
+(e.g., OUGV1, OES1X1, OEF1X) are independent, so they're filled on
+separate processes and then merged into the model, while the main
+process fills everything else (e.g., geometry, LAMA).
+
+"""
+from __future__ import annotations
+from concurrent.futures import Executor, Future
+from typing import Optional, Any, TYPE_CHECKING
+
+from cpylog import SimpleLogger
+from pyNastran.op2.op2_interface.op2_scalar import OP2_Scalar, RESULT_TABLES
+from pyNastran.op2.op2_interface.op2_index import OP2Index, TableEntry
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.op2.op2 import OP2
+    from pyNastran.op2.op2_interface.op2_reader import OP2Reader
+
+
+def get_table_groups(table_index: OP2Index,
+                     subtable_filter: Optional[set[int]]=None) -> list[list[TableEntry]]:
+    """
+    Groups the result tables that need to be filled on the same process
+
+    Tables that create the same result class (e.g., RealDisplacementArray)
+    may write to the same result object, so they're kept together.
+
+    Parameters
+    ----------
+    table_index : OP2Index
+        the index from the array sizing pass
+    subtable_filter : set[int]; default=None -> all
+        the table3 locations to read
+
+    Returns
+    -------
+    groups : list[list[TableEntry]]
+        the independent groups of tables
+
+    """
+    result_tables = set(RESULT_TABLES)
+    groups: list[list[TableEntry]] = []
+    group_classes: list[set[str]] = []
+    for table in table_index:
+        if not table.refill or table.table_name not in result_tables:
+            continue
+        obj_classes = _get_obj_classes(table, subtable_filter)
+        if not obj_classes:
+            continue
+
+        # merge every group that shares a result class with this table
+        igroups = [igroup for igroup, classes in enumerate(group_classes)
+                   if classes & obj_classes]
+        group = [table]
+        for igroup in reversed(igroups):
+            group = groups.pop(igroup) + group
+            obj_classes |= group_classes.pop(igroup)
+        groups.append(group)
+        group_classes.append(obj_classes)
+
+    groups.sort(key=lambda group: group[0].start)
+    return groups
+
+
+def submit_parallel_tables(op2: OP2, executor: Executor, nworkers: int,
+                           mode: Optional[str]=None) -> list[Future]:
+    """
+    Submits the result tables to the worker processes after the array
+    sizing pass and flags them, so the main process skips them
+
+    Parameters
+    ----------
+    op2 : OP2
+        the model after the array sizing pass (read_mode=1)
+    executor : Executor
+        the process pool
+    nworkers : int
+        the number of processes
+    mode : str; default=None
+        the Nastran version the OP2 was opened with
+
+    Returns
+    -------
+    futures : list[Future]
+        the results for each process; see ``merge_parallel_results``
+
+    """
+    op2_reader = op2.op2_reader
+    table_index = op2_reader.table_index
+    subtable_filter = op2_reader.subtable_filter
+    groups = get_table_groups(table_index, subtable_filter)
+    if len(groups) < 2:
+        return []
+
+    # balance the processes on the number of bytes in the tables
+    workers: list[list[TableEntry]] = [[] for unused_i in range(min(nworkers, len(groups)))]
+    nbytes = [0] * len(workers)
+    for group in sorted(groups, key=_get_group_nbytes, reverse=True):
+        iworker = nbytes.index(min(nbytes))
+        workers[iworker].extend(group)
+        nbytes[iworker] += _get_group_nbytes(group)
+
+    settings = get_reader_settings(op2, mode=mode)
+    futures = []
+    for tables in workers:
+        table_starts = {table.start for table in tables}
+        table3_offsets = set()
+        for table in tables:
+            for subtable in table.subtables:
+                if subtable_filter is None or subtable.table3_offset in subtable_filter:
+                    table3_offsets.add(subtable.table3_offset)
+        futures.append(executor.submit(
+            _read_op2_tables, op2.op2_filename, table_index,
+            table_starts, table3_offsets, settings))
+        op2_reader.deferred_tables.update(table_starts)
+
+    for table in table_index:
+        if table.start in op2_reader.deferred_tables:
+            table.refill = False
+    return futures
+
+
+def merge_parallel_results(op2: OP2, op2_reader: OP2Reader,
+                           futures: list[Future]) -> None:
+    """
+    Replaces the sized (but unfilled) result objects with the results
+    that were filled on the worker processes
+
+    The op2_reader is passed in because it's removed from the model
+    once the OP2 is closed.
+    """
+    for future in futures:
+        results = future.result()
+        for result_name, storage_dict in results.items():
+            op2.get_result(result_name).update(storage_dict)
+    restore_deferred_tables(op2_reader)
+
+
+def restore_deferred_tables(op2_reader: OP2Reader) -> None:
+    """flags the tables that were filled elsewhere as refilled tables"""
+    for table in op2_reader.table_index:
+        if table.start in op2_reader.deferred_tables:
+            table.refill = True
+    op2_reader.deferred_tables = set()
+
+
+def _read_op2_tables(op2_filename: str, table_index: OP2Index,
+                     table_starts: set[int], table3_offsets: set[int],
+                     settings: dict[str, Any]) -> dict[str, dict[Any, Any]]:
+    """
+    Fills a set of result tables on a worker process
+
+    Returns
+    -------
+    results : dict[result_name, storage_dict]
+        the results that were read (e.g., {'displacements': {1: disp}})
+
+    """
+    model = create_table_reader(settings)
+    read_op2_tables(model, op2_filename, table_index, table_starts, table3_offsets,
+                    mode=settings['mode'])
+    return get_stored_results(model)
+
+
+def get_reader_settings(op2: OP2, mode: Optional[str]=None) -> dict[str, Any]:
+    """
+    Gets the options that were used on the array sizing pass, so another
+    model (e.g., on a worker process) reads the tables the same way
+    """
+    settings = {
+        'mode': mode,
+        'nastran_format': op2._nastran_format,
+        'post': op2.post,
+        'encoding': op2.encoding,
+        'saved': set(op2._results.saved),
+        'is_all_subcases': op2.is_all_subcases,
+        'valid_subcases': op2.valid_subcases,
+        'expected_times': op2.expected_times,
+        'use_table_name_in_code': op2.use_table_name_in_code,
+        'result_filter': op2.result_filter,
+    }
+    return settings
+
+
+def create_table_reader(settings: dict[str, Any], log=None) -> OP2:
+    """creates a model to read a set of tables; see ``get_reader_settings``"""
+    from pyNastran.op2.op2 import OP2
+    if log is None:
+        log = SimpleLogger(level='error')
+
+    model = OP2(log=log, mode=settings['mode'])
+    if settings['nastran_format'] is not None:
+        model.set_mode(settings['nastran_format'])
+    model.post = settings['post']
+    model.encoding = settings['encoding']
+    model._results.saved = settings['saved']
+    model.is_all_subcases = settings['is_all_subcases']
+    model.valid_subcases = settings['valid_subcases']
+    model.expected_times = settings['expected_times']
+    model.use_table_name_in_code = settings['use_table_name_in_code']
+    model.result_filter = settings['result_filter']
+    return model
+
+
+def read_op2_tables(model: OP2, op2_filename: str, table_index: OP2Index,
+                    table_starts: set[int], table3_offsets: set[int],
+                    mode: Optional[str]=None) -> None:
+    """
+    Sizes and fills a set of tables using the OP2Index, jumping over
+    everything else
+
+    Parameters
+    ----------
+    model : OP2
+        a new model (the OP2 is closed and the reader is removed)
+    op2_filename : str
+        the OP2 to read
+    table_index : OP2Index
+        the index from the array sizing pass
+    table_starts : set[int]
+        the location of the tables to read
+    table3_offsets : set[int]
+        the location of the table3 records to read
+    mode : str; default=None
+        the Nastran version
+
+    """
+    for table in table_index:
+        table.refill = table.start in table_starts
+
+    model.op2_reader.table_index = table_index
+    model.op2_reader.subtable_filter = table3_offsets
+    model.is_vectorized = True
+    model.read_mode = 1
+    model._close_op2 = False
+    OP2_Scalar.read_op2(model, op2_filename=op2_filename, mode=mode)
+
+    model.read_mode = 2
+    model._close_op2 = True
+    OP2_Scalar.read_op2(model, op2_filename=op2_filename, mode=mode)
+
+
+def get_stored_results(model: OP2) -> dict[str, dict[Any, Any]]:
+    """
+    Gets the results that were read
+
+    Returns
+    -------
+    results : dict[result_name, storage_dict]
+        the non-empty results (e.g., {'displacements': {1: disp}})
+
+    """
+    results = {}
+    for result_name in model.get_table_types():
+        storage_dict = model.get_result(result_name)
+        if isinstance(storage_dict, dict) and len(storage_dict):
+            results[result_name] = storage_dict
+    return results
+
+
+def _get_obj_classes(table: TableEntry, subtable_filter: Optional[set[int]]) -> set[str]:
+    """gets the result classes that are created by a table"""
+    obj_classes = set()
+    for subtable in table.subtables:
+        if subtable_filter is not None and subtable.table3_offset not in subtable_filter:
+            continue
+        if subtable.obj_class is None:
+            continue
+        obj_classes.add(subtable.obj_class)
+    return obj_classes
+
+
+def _get_group_nbytes(group: list[TableEntry]) -> int:
+    """gets the size of a group of tables"""
+    return sum(table.end - table.start for table in group)
@@ -40,11 +40,12 @@ Defines various tables that don't fit in other sections:
 from __future__ import annotations
 import os
 import sys
+from bisect import bisect_right
 from copy import deepcopy
 from itertools import count
 from functools import partial
 from struct import unpack, Struct # , error as struct_error
-from typing import Optional, Callable, TYPE_CHECKING
+from typing import Optional, Callable, Any, TYPE_CHECKING
 
 import numpy as np
 
@@ -62,6 +63,9 @@ from pyNastran.op2.result_objects.op2_results import CSTM
 from pyNastran.op2.op2_interface.msc_tables import MSC_GEOM_TABLES
 from pyNastran.op2.op2_interface.nx_tables import NX_GEOM_TABLES
 
+from pyNastran.op2.op2_interface.op2_index import (
+    OP2Index, TableEntry, SubtableEntry, get_data_code_values)
+from pyNastran.op2.op2_interface.op2_memmap import MemmapBlocks
 from pyNastran.op2.op2_interface.utils import (
     mapfmt, reshape_bytes_block,
     reshape_bytes_block_size)
@@ -113,6 +117,40 @@ class OP2Reader:
         self.h5_file = None
         self.size = 4
 
+        #: the location of the tables/subtables; built on read_mode=1
+        self.table_index: Optional[OP2Index] = None
+
+        #: the table3 locations to read; None -> read everything
+        self.subtable_filter: Optional[set[int]] = None
+        self._is_filtered_subtable = False
+
+        #: the location of the tables that are filled elsewhere
+        #: (worker processes or lazy results)
+        self.deferred_tables: set[int] = set()
+
+        #: the sized result objects and their tables/subtables, which are
+        #: built on the array sizing pass (id(obj) -> (obj, [(table_start, subtable)]))
+        self.result_subtables: dict[int, tuple[Any, list[tuple[int, SubtableEntry]]]] = {}
+
+        #: the table4 records that are skipped/sliced by the result filter,
+        #: which are found on the array sizing pass (record_start -> row mask)
+        self.skipped_records: set[int] = set()
+        self.filtered_records: dict[int, np.ndarray] = {}
+
+        #: the table3 locations/isubtable values of the table that's being
+        #: read with a subtable filter, which are used to jump over the
+        #: table3/table4 pairs that weren't requested
+        self._table3_isubtables: dict[int, int] = {}
+        self._selected_table3_offsets: list[int] = []
+
+        #: the location/length of the table4 data in the OP2 (read_mode=2);
+        #: None if the record is split across multiple blocks
+        self.record_offset: Optional[int] = None
+        self.record_ndata = 0
+
+        #: the table4 records that weren't copied (use_memmap)
+        self.memmap_blocks: dict[int, MemmapBlocks] = {}
+
         # Hack to dump the IBULK/CASECC decks in reverse order
         # It's in reverse because that's how Nastran writes it.
         #
@@ -3502,6 +3540,36 @@ class OP2Reader:
             return False
         return True
 
+    def is_valid_result(self, record_start: int) -> bool:
+        """
+        Lets the code check whether or not to read a table4 record based
+        on the mode/frequency (SORT1) or node/element id (SORT2) that was
+        set by the table3 record (see ``set_result_filter``)
+
+        The check is made on the array sizing pass, so the array filling
+        pass skips the same records.
+
+        Parameters
+        ----------
+        record_start : int
+            the location of the table4 record
+
+        Returns
+        -------
+        is_valid : bool
+            should the table4 record be read?
+
+        """
+        op2: OP2 = self.op2
+        if op2.result_filter is None:
+            return True
+        if op2.read_mode == 2:
+            return record_start not in self.skipped_records
+        is_valid = op2.result_filter.is_valid_subtable(op2)
+        if not is_valid:
+            self.skipped_records.add(record_start)
+        return is_valid
+
     def read_results_table(self) -> None:
         """Reads a results table"""
         if self.size == 4:
@@ -3754,6 +3822,8 @@ class OP2Reader:
             if self.is_debug_file:
                 self.binary_debug.write(f'***isubtable = {op2.isubtable:d}\n')
 
+            if self._table3_isubtables:
+                self._goto_selected_subtable()
             try:
                 self._read_subtable_3_4(table3_parser, table4_parser, passer)
             except EmptyRecordError:
@@ -3860,12 +3930,21 @@ class OP2Reader:
         if self.binary_debug:
             self.binary_debug.write('-' * 60 + '\n')
         # this is the length of the current record inside table3/table4
+        record_start = op2.n
         record_len = self._get_record_length()
         if self.is_debug_file:
             self.binary_debug.write(f'record_length = {record_len:d}\n')
 
-        oes_nl = [b'OESNLXD', b'OESNL1X', b'OESNLXR'] # 'OESCP'?
         factor = self.factor
+        if self.subtable_filter is not None:
+            # skip the table3/table4 pairs that weren't requested
+            if record_len == 584 * factor:
+                self._is_filtered_subtable = record_start not in self.subtable_filter
+            if self._is_filtered_subtable:
+                self._skip_record()
+                return None
+
+        oes_nl = [b'OESNLXD', b'OESNL1X', b'OESNLXR'] # 'OESCP'?
         #print('record_len =', record_len)
         table_name = op2.table_name
         if record_len == 584 * factor:  # table3 has a length of 584
@@ -3882,9 +3961,12 @@ class OP2Reader:
             }
             op2.obj = None
             data, ndata = self._read_record_ndata()
+            subtable = self._add_subtable_to_index(record_start)
             if not passer:
                 try:
                     table3_parser(data, ndata)
+                    if subtable is not None:
+                        subtable.data_code = get_data_code_values(op2.data_code)
                 except SortCodeError:
                     if self.is_debug_file:
                         self.binary_debug.write('except SortCodeError!\n')
@@ -3910,6 +3992,8 @@ class OP2Reader:
                         else:
                             self.op2._reset_vector_counter()
 
+                        self._update_subtable_index(subtable, record_start, record_len)
+                        self._update_subtable_obj(subtable)
                         #print('except...')
                         return False
                     raise RuntimeError(op2.code_information())
@@ -3923,13 +4007,16 @@ class OP2Reader:
                     data, ndata = self._read_record_ndata()
                     unused_n = table4_parser(data, ndata)
 
-            elif passer or not self.is_valid_subcase():
+            elif passer or not self.is_valid_subcase() or not self.is_valid_result(record_start):
                 data = self._skip_record()
             else:
                 if hasattr(op2, 'num_wide'):
                     # num_wide is the result size and is usually found in
                     # table3, but some B-list tables don't have it
+                    subtable = self._get_subtable_from_index()
+                    self._update_subtable_index(subtable, record_start, record_len)
                     unused_n = op2._read_subtable_results(table4_parser, record_len)
+                    self._update_subtable_obj(subtable)
                 else:
                     data, ndata = self._read_record_ndata()
                     unused_n = table4_parser(data, ndata)
@@ -3938,6 +4025,142 @@ class OP2Reader:
                 #del n
         return None
 
+    def set_filtered_table(self, table: Optional[TableEntry]) -> None:
+        """
+        Stores the subtables of the table that's about to be read with a
+        subtable filter, so the unrequested subtables can be jumped over
+
+        Parameters
+        ----------
+        table : TableEntry / None
+            None : clears the table
+        """
+        self._table3_isubtables = {}
+        self._selected_table3_offsets = []
+        if table is None or self.subtable_filter is None:
+            return
+        self._table3_isubtables = {subtable.table3_offset: subtable.isubtable
+                                   for subtable in table.subtables}
+        self._selected_table3_offsets = sorted(
+            offset for offset in self._table3_isubtables
+            if offset in self.subtable_filter)
+
+    def _goto_selected_subtable(self) -> None:
+        """
+        Jumps from an unrequested table3 record to the next requested table3
+        record (or the last table3 record, so the table is finished normally)
+        """
+        op2: OP2 = self.op2
+        n = op2.n
+        if n not in self._table3_isubtables or n in self.subtable_filter:
+            return
+        selected_offsets = self._selected_table3_offsets
+        i = bisect_right(selected_offsets, n)
+        if i < len(selected_offsets):
+            offset = selected_offsets[i]
+        else:
+            offset = max(self._table3_isubtables)
+        if offset > n:
+            self._goto(offset)
+            op2.isubtable = self._table3_isubtables[offset]
+
+    @property
+    def is_building_index(self) -> bool:
+        """is the table index being built (array sizing pass without a filter)?"""
+        return (self.op2.read_mode == 1 and self.table_index is not None and
+                self.subtable_filter is None)
+
+    def _add_subtable_to_index(self, table3_offset: int) -> Optional[SubtableEntry]:
+        """adds a table3 record to the index on the array sizing pass"""
+        op2: OP2 = self.op2
+        if not self.is_building_index:
+            return None
+        table = self.table_index.current_table
+        if table is None:
+            return None
+        subtable = SubtableEntry(op2.isubtable, table3_offset)
+        table.subtables.append(subtable)
+        return subtable
+
+    def _get_subtable_from_index(self) -> Optional[SubtableEntry]:
+        """gets the table3 entry that goes with the current table4 record"""
+        if not self.is_building_index:
+            return None
+        table = self.table_index.current_table
+        if table is None or len(table.subtables) == 0:
+            return None
+        subtable = table.subtables[-1]
+        if subtable.table4_offset != -1:
+            return None
+        return subtable
+
+    def _update_subtable_index(self, subtable: Optional[SubtableEntry],
+                               table4_offset: int, record_len: int) -> None:
+        """stores the table4 record info on the array sizing pass"""
+        if subtable is None:
+            return
+        op2: OP2 = self.op2
+        subtable.table4_offset = table4_offset
+        subtable.record_len = record_len
+        subtable.isubcase = getattr(op2, 'isubcase', None)
+        subtable.element_type = getattr(op2, 'element_type', None)
+        subtable.num_wide = getattr(op2, 'num_wide', None)
+        subtable.nonlinear_factor = getattr(op2, 'nonlinear_factor', None)
+        if subtable.num_wide:
+            subtable.ntotal = record_len // (subtable.num_wide * self.size) * op2._data_factor
+
+    def _update_subtable_obj(self, subtable: Optional[SubtableEntry]) -> None:
+        """stores the sized result class on the array sizing pass"""
+        if subtable is None:
+            return
+        op2: OP2 = self.op2
+        subtable.end = op2.n
+        obj = getattr(op2, 'obj', None)
+        if obj is not None:
+            subtable.obj_class = obj.__class__.__name__
+            table_start = self.table_index.current_table.start
+            key = id(obj)
+            if key not in self.result_subtables:
+                self.result_subtables[key] = (obj, [])
+            self.result_subtables[key][1].append((table_start, subtable))
+
+    def _set_record_offset(self, record_start: int, ndata: int) -> None:
+        """stores the location of the table4 data if it's a single block"""
+        op2: OP2 = self.op2
+        nmarker = 8 + self.size  # [4, marker, 4]
+        self.record_ndata = ndata
+        self.record_offset = None
+        if op2.n - record_start == nmarker + ndata + 8:
+            self.record_offset = record_start + nmarker + 4
+
+    def add_memmap_block(self, obj, floats: np.ndarray, itime: int, itotal: int,
+                         icol: int) -> bool:
+        """
+        Stores the location of the floats rather than copying them
+        into the result (use_memmap)
+
+        Returns
+        -------
+        is_mapped : bool
+            False : the floats need to be copied
+
+        """
+        if (self.record_offset is None or floats.nbytes != self.record_ndata or
+                not isinstance(obj.data, np.ndarray)):
+            return False
+        nrows, num_wide = floats.shape
+        if num_wide - icol != obj.data.shape[2]:
+            return False
+
+        key = id(obj)
+        if key not in self.memmap_blocks:
+            self.memmap_blocks[key] = MemmapBlocks(obj, floats.dtype, num_wide, icol)
+        blocks = self.memmap_blocks[key]
+        if blocks.dtype != floats.dtype or blocks.num_wide != num_wide or blocks.icol != icol:
+            return False
+        blocks.add_block(itime, itotal, nrows, self.record_offset)
+        return True
+
     def _run_checks(self, table4_parser):
         """helper method"""
         if table4_parser != self.op2._table_passer:
@@ -32,6 +32,8 @@ Defines the sub-OP2 class.  This should never be called outside of the OP2 class
    - _create_binary_debug()
    - _make_tables()
    - _read_tables(table_name)
+   - _read_table(table_name)
+   - _read_tables_from_index(table_names)
    - _skip_table(table_name)
    - _read_table_name(rewind=False, stop_on_failure=True)
    - _update_generalized_tables(tables)
@@ -63,6 +65,8 @@ from pyNastran import is_release, __version__
 from pyNastran.f06.errors import FatalError
 from pyNastran.op2.errors import EmptyRecordError
 from pyNastran.op2.op2_interface.op2_reader import OP2Reader, reshape_bytes_block
+from pyNastran.op2.op2_interface.op2_index import OP2Index
+from pyNastran.op2.op2_interface.op2_filter import ResultFilter
 from pyNastran.bdf.cards.params import PARAM
 
 #============================
@@ -562,6 +566,24 @@ class OP2_Scalar(OP2Common, FortranFormat):
         self.is_vectorized = False
         self._close_op2 = True
 
+        #: use the table index from the array sizing pass (read_mode=1)
+        #: to jump over tables that don't need to be filled (read_mode=2)
+        self.use_table_index = True
+
+        #: map the real table4 data (e.g., displacement, rod stress) from the
+        #: OP2 rather than copying it into memory (read_mode=2); the data is
+        #: only paged in when it's accessed, so the OP2 must not be deleted
+        self.use_memmap = False
+
+        #: read the result data (e.g., displacements[1].data) from the OP2
+        #: when it's first accessed rather than on the array filling pass;
+        #: data_code, _times and the node/element ids are read right away
+        self.use_lazy_results = False
+
+        #: the number of bytes of lazy result data to keep in memory; the
+        #: least recently used data is unloaded (None -> unlimited)
+        self.lazy_max_nbytes = None
+
         self.result_names = set()
 
         self.grid_point_weight: dict[str, GridPointWeight] = {}
@@ -626,6 +648,40 @@ class OP2_Scalar(OP2Common, FortranFormat):
             expected_times[isubcase] = array(etimes)
         self.expected_times = expected_times
 
+    def set_result_filter(self, node_ids: Optional[list[int]]=None,
+                          element_ids: Optional[list[int]]=None,
+                          modes: Optional[list[int]]=None,
+                          frequency_range: Optional[tuple[float, float]]=None) -> None:
+        """
+        Reads only the selected nodes/elements/modes/frequencies of the
+        results.  The table4 records that aren't selected are skipped and
+        the rows of the selected records are sliced before they're parsed,
+        so the result arrays only contain the selected rows.
+
+        Parameters
+        ----------
+        node_ids : list[int]; default=None -> all
+            the nodes to read for the nodal results (e.g., displacement)
+        element_ids : list[int]; default=None -> all
+            the elements to read for the element results (e.g., stress)
+        modes : list[int]; default=None -> all
+            the modes to read for the eigenvalue/buckling results
+            (e.g., range(1, 11))
+        frequency_range : (float, float); default=None -> all
+            the (min, max) frequency to read for the frequency results
+
+        Examples
+        --------
+        >>> model = OP2()
+        >>> model.set_result_filter(node_ids=[1, 2, 3], modes=range(1, 11))
+        >>> model.read_op2(op2_filename)
+
+        """
+        result_filter = ResultFilter(node_ids=node_ids, element_ids=element_ids,
+                                     modes=modes, frequency_range=frequency_range)
+        self.result_filter = result_filter if result_filter.is_active else None
+        self.log.debug(f'set_result_filter - {result_filter}')
+
     def _get_table_mapper(self):
         """gets the dictionary of function3 / function4"""
 
@@ -2149,6 +2205,15 @@ class OP2_Scalar(OP2Common, FortranFormat):
 
         op2_reader = self.op2_reader
         self.table_count = defaultdict(int)
+        if self.read_mode == 1:
+            op2_reader.skipped_records = set()
+            op2_reader.filtered_records = {}
+        if self.read_mode == 1 and op2_reader.subtable_filter is None:
+            op2_reader.table_index = OP2Index()
+        elif self.use_table_index and op2_reader.table_index is not None:
+            self._read_tables_from_index(table_names)
+            return
+
         while table_name is not None:
             self.table_count[table_name] += 1
             table_names.append(table_name)
@@ -2179,62 +2244,138 @@ class OP2_Scalar(OP2Common, FortranFormat):
                 self.log.debug(f'  table_name={table_name2:<11} ({desc})')
                 #assert desc != '???', table_name2
 
-            self.table_name = table_name
-            #if 0:
-                #op2_reader._skip_table(table_name)
-            #else:
-            #print(table_name, table_name in op2_reader.mapped_tables)
-            if table_name in self.generalized_tables:
-                t0 = self.f.tell()
-                self.generalized_tables[table_name](self)
-                assert self.f.tell() != t0, 'the position was unchanged...'
-            elif table_name in op2_reader.mapped_tables:
-                t0 = self.f.tell()
-                func, unused_desc = op2_reader.mapped_tables[table_name]
-                func()
-                assert self.f.tell() != t0, 'the position was unchanged...'
-            elif table_name in GEOM_TABLES:
-                op2_reader.read_geom_table()  # DIT (agard)
-            elif table_name in MATRIX_TABLES:
-                read_matrix(op2_reader, table_name)
-            elif table_name in RESULT_TABLES:
-                op2_reader.read_results_table()
-            elif self.skip_undefined_matrices:
-                read_matrix(op2_reader, table_name)
-            elif table_name.strip() in self.additional_matrices:
-                read_matrix(op2_reader, table_name)
-            else:
-                #self.show(1000, types='ifsq')
-                msg = (
-                    f'Invalid Table = {table_name!r}\n\n'
-                    'If you have matrices that you want to read, see:\n'
-                    '  model.set_additional_matrices_to_read(matrices)\n'
-                    '  matrices = {\n'
-                    "      b'BHH' : True,\n"
-                    "      b'KHH' : False,\n"
-                    '  }  # you want to read some matrices, but not others\n'
-                    "  matrices = [b'BHH', b'KHH']  # assumes True\n\n"
-
-                    'If you the table is a geom/result table, see:\n'
-                    '  model.set_additional_result_tables_to_read(methods_dict)\n'
-                    "  methods_dict = {\n"
-                    "      b'OUGV1' : [method3, method4],\n"
-                    "      Gb'GEOM4SX' : [method3, method4],\n"
-                    "      b'OES1X1' : False,\n"
-                    '  }\n\n'
-
-                    'If you want to take control of the OP2 reader (mainly useful '
-                    'for obscure tables), see:\n'
-                    "  methods_dict = {\n"
-                    "      b'OUGV1' : [method],\n"
-                    '  }\n'
-                    '  model.set_additional_generalized_tables_to_read(methods_dict)\n'
-                )
-                raise NotImplementedError(msg)
+            is_building_index = op2_reader.is_building_index
+            if is_building_index:
+                table = op2_reader.table_index.add_table(
+                    table_name, self.n, self._is_refilled_table(table_name),
+                    count=self._count)
+            self._read_table(table_name)
+            if is_building_index:
+                table.end = self.n
 
             table_name = op2_reader._read_table_name(last_table_name=table_name,
                                                      rewind=True, stop_on_failure=False)
 
+    def _read_table(self, table_name: bytes) -> None:
+        """reads a single geometry/result/matrix table"""
+        op2_reader = self.op2_reader
+        self.table_name = table_name
+        #if 0:
+            #op2_reader._skip_table(table_name)
+        #else:
+        #print(table_name, table_name in op2_reader.mapped_tables)
+        if table_name in self.generalized_tables:
+            t0 = self.f.tell()
+            self.generalized_tables[table_name](self)
+            assert self.f.tell() != t0, 'the position was unchanged...'
+        elif table_name in op2_reader.mapped_tables:
+            t0 = self.f.tell()
+            func, unused_desc = op2_reader.mapped_tables[table_name]
+            func()
+            assert self.f.tell() != t0, 'the position was unchanged...'
+        elif table_name in GEOM_TABLES:
+            op2_reader.read_geom_table()  # DIT (agard)
+        elif table_name in MATRIX_TABLES:
+            read_matrix(op2_reader, table_name)
+        elif table_name in RESULT_TABLES:
+            op2_reader.read_results_table()
+        elif self.skip_undefined_matrices:
+            read_matrix(op2_reader, table_name)
+        elif table_name.strip() in self.additional_matrices:
+            read_matrix(op2_reader, table_name)
+        else:
+            #self.show(1000, types='ifsq')
+            msg = (
+                f'Invalid Table = {table_name!r}\n\n'
+                'If you have matrices that you want to read, see:\n'
+                '  model.set_additional_matrices_to_read(matrices)\n'
+                '  matrices = {\n'
+                "      b'BHH' : True,\n"
+                "      b'KHH' : False,\n"
+                '  }  # you want to read some matrices, but not others\n'
+                "  matrices = [b'BHH', b'KHH']  # assumes True\n\n"
+
+                'If you the table is a geom/result table, see:\n'
+                '  model.set_additional_result_tables_to_read(methods_dict)\n'
+                "  methods_dict = {\n"
+                "      b'OUGV1' : [method3, method4],\n"
+                "      Gb'GEOM4SX' : [method3, method4],\n"
+                "      b'OES1X1' : False,\n"
+                '  }\n\n'
+
+                'If you want to take control of the OP2 reader (mainly useful '
+                'for obscure tables), see:\n'
+                "  methods_dict = {\n"
+                "      b'OUGV1' : [method],\n"
+                '  }\n'
+                '  model.set_additional_generalized_tables_to_read(methods_dict)\n'
+            )
+            raise NotImplementedError(msg)
+
+    def _is_refilled_table(self, table_name: bytes) -> bool:
+        """
+        Should the table be read on the array filling pass (read_mode=2)?
+
+        Matrices are fully read on the array sizing pass (read_mode=1)
+        and geometry is only read for an OP2Geom, so they may be skipped.
+        """
+        if table_name in self.generalized_tables:
+            return True
+        elif table_name in self.op2_reader.mapped_tables:
+            return True
+        elif table_name in GEOM_TABLES:
+            return self.make_geom
+        elif table_name in MATRIX_TABLES:
+            return False
+        elif table_name in RESULT_TABLES:
+            # unsupported result tables are skipped on both passes
+            return table_name in self.table_mapper
+        return False
+
+    def _read_tables_from_index(self, table_names: list[bytes]) -> None:
+        """
+        Reads the tables using the OP2Index that was built on the array
+        sizing pass (read_mode=1).  Tables that don't need to be filled are
+        jumped over instead of being walked marker by marker.
+
+        If a subtable filter was applied (see ``OP2.read_op2_from_index``),
+        both passes only visit the requested tables.
+
+        Parameters
+        ----------
+        table_names : list[bytes str]
+            the table names that were read
+
+        """
+        op2_reader = self.op2_reader
+        n = self.n
+        for table in op2_reader.table_index:
+            if table.start < n:
+                # some readers (e.g., EXTDB) consume the following tables
+                # on the array filling pass
+                continue
+            table_name = table.table_name
+            self.table_count[table_name] += 1
+            table_names.append(table_name)
+            if not table.refill:
+                if (table_name in RESULT_TABLES and op2_reader.subtable_filter is None and
+                        table.start not in op2_reader.deferred_tables):
+                    self.log.info(f'skipping table_name = {table_name!r}')
+                continue
+
+            op2_reader._goto(table.start)
+            self._count = table.count
+            if self.is_debug_file:
+                self.binary_debug.write('-' * 80 + '\n')
+                self.binary_debug.write(f'table_name = {table_name!r}\n')
+            op2_reader.set_filtered_table(table)
+            self._read_table(table_name)
+            op2_reader.set_filtered_table(None)
+            n = self.n
+
+        if len(op2_reader.table_index):
+            op2_reader._goto(max(n, op2_reader.table_index.tables[-1].end))
+
     def set_additional_generalized_tables_to_read(self, tables: dict[bytes, Any]) -> None:
         """
         Adds methods to call a generalized table.
@@ -0,0 +1,75 @@
+import unittest
+from pathlib import Path
+
+import numpy as np
+from cpylog import SimpleLogger
+
+import pyNastran
+from pyNastran.op2.op2 import OP2, read_op2
+
+PKG_PATH = Path(pyNastran.__path__[0])
+MODEL_PATH = (PKG_PATH / '..' / 'models').resolve()
+
+
+class TestOP2Filter(unittest.TestCase):
+    def test_op2_filter_ids(self):
+        """the filtered nodes/elements match the sliced results"""
+        log = SimpleLogger(level='warning')
+        op2_filenames = [
+            MODEL_PATH / 'sol_101_elements' / 'static_solid_shell_bar.op2',
+            MODEL_PATH / 'sol_101_elements' / 'transient_solid_shell_bar.op2',
+        ]
+        for op2_filename in op2_filenames:
+            model1 = read_op2(op2_filename, log=log)
+            disp1 = model1.displacements[1]
+            stress1 = model1.op2_results.stress.cquad4_stress[1]
+            node_ids = disp1.node_gridtype[::2, 0]
+            element_ids = np.unique(stress1.element_node[:, 0])[::2]
+
+            model2 = read_op2(op2_filename, log=log,
+                              node_ids=node_ids, element_ids=element_ids)
+            disp2 = model2.displacements[1]
+            stress2 = model2.op2_results.stress.cquad4_stress[1]
+
+            inode = np.isin(disp1.node_gridtype[:, 0], node_ids)
+            assert np.array_equal(disp2.node_gridtype, disp1.node_gridtype[inode])
+            assert np.array_equal(disp2.data, disp1.data[:, inode, :])
+
+            ielement = np.isin(stress1.element_node[:, 0], element_ids)
+            assert np.array_equal(stress2.element_node, stress1.element_node[ielement])
+            assert np.array_equal(stress2.data, stress1.data[:, ielement, :])
+
+            # none of the CTRIA3s were selected
+            if not np.isin(model1.op2_results.stress.ctria3_stress[1].element_node[:, 0],
+                           element_ids).any():
+                assert len(model2.op2_results.stress.ctria3_stress) == 0
+
+    def test_op2_filter_modes(self):
+        """the filtered modes/frequencies match the sliced results"""
+        log = SimpleLogger(level='warning')
+        op2_filename = MODEL_PATH / 'sol_101_elements' / 'mode_solid_shell_bar.op2'
+        model1 = read_op2(op2_filename, log=log)
+        model2 = OP2(log=log)
+        model2.set_result_filter(modes=[2, 3])
+        model2.read_op2(op2_filename)
+        eigenvectors1 = model1.eigenvectors[1]
+        eigenvectors2 = model2.eigenvectors[1]
+        assert list(eigenvectors2.modes) == [2, 3], eigenvectors2.modes
+        assert np.array_equal(eigenvectors2.data, eigenvectors1.data[1:3])
+        stress1 = model1.op2_results.stress.cquad4_stress[1]
+        stress2 = model2.op2_results.stress.cquad4_stress[1]
+        assert np.array_equal(stress2.data, stress1.data[1:3])
+
+        op2_filename = MODEL_PATH / 'sol_101_elements' / 'freq_solid_shell_bar.op2'
+        model1 = read_op2(op2_filename, log=log)
+        disp1 = model1.displacements[1]
+        freqs = disp1._times
+        frequency_range = (freqs[1], freqs[-2])
+        model2 = read_op2(op2_filename, log=log, frequency_range=frequency_range)
+        disp2 = model2.displacements[1]
+        assert np.array_equal(disp2._times, freqs[1:-1])
+        assert np.array_equal(disp2.data, disp1.data[1:-1])
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
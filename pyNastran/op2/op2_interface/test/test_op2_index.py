@@ -0,0 +1,123 @@
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+from cpylog import SimpleLogger
+
+import pyNastran
+from pyNastran.op2.op2 import OP2, read_op2, iter_op2_results
+from pyNastran.op2.op2_geom import OP2Geom
+from pyNastran.op2.op2_interface.op2_index import read_op2_index
+
+PKG_PATH = Path(pyNastran.__path__[0])
+MODEL_PATH = (PKG_PATH / '..' / 'models').resolve()
+
+
+class TestOP2Index(unittest.TestCase):
+    def test_op2_index_static(self):
+        """the table index is built on the array sizing pass"""
+        log = SimpleLogger(level='warning')
+        op2_filename = MODEL_PATH / 'sol_101_elements' / 'static_solid_shell_bar.op2'
+        model = OP2(log=log)
+        model.read_op2(op2_filename)
+
+        table_index = model.table_index
+        table_names = [table.table_name for table in table_index]
+        assert b'OUGV1' in table_names, table_names
+
+        oug = table_index.tables[table_names.index(b'OUGV1')]
+        assert oug.refill
+        assert oug.start < oug.end
+        assert len(oug.subtables) == 1, oug.subtables
+        subtable = oug.subtables[0]
+        assert subtable.isubcase == 1, subtable
+        assert subtable.obj_class == 'RealDisplacementArray', subtable
+        assert subtable.ntotal == model.displacements[1].data.shape[1], subtable
+        assert subtable.table3_offset < subtable.table4_offset < subtable.end, subtable
+        str(table_index)
+
+    def test_op2_index_refill(self):
+        """the index driven array filling pass matches the full second pass"""
+        log = SimpleLogger(level='warning')
+        op2_filenames = [
+            MODEL_PATH / 'sol_101_elements' / 'static_solid_shell_bar.op2',
+            MODEL_PATH / 'sol_101_elements' / 'mode_solid_shell_bar.op2',
+            MODEL_PATH / 'sol_101_elements' / 'freq_solid_shell_bar.op2',
+        ]
+        for op2_filename in op2_filenames:
+            for op2_class in [OP2, OP2Geom]:
+                model1 = op2_class(log=log)
+                model1.read_op2(op2_filename)
+
+                model2 = op2_class(log=log)
+                model2.use_table_index = False
+                model2.read_op2(op2_filename)
+                model1.assert_op2_equal(model2)
+                for key, disp in model2.eigenvectors.items():
+                    assert np.array_equal(model1.eigenvectors[key].data, disp.data)
+
+    def test_op2_index_file(self):
+        """the sidecar index is used to read a single result"""
+        log = SimpleLogger(level='warning')
+        with tempfile.TemporaryDirectory() as dirname:
+            op2_filename = os.path.join(dirname, 'mode_solid_shell_bar.op2')
+            shutil.copyfile(MODEL_PATH / 'sol_101_elements' / 'mode_solid_shell_bar.op2',
+                            op2_filename)
+            model = read_op2(op2_filename, log=log, write_index=True)
+            idx_filename = op2_filename + '.idx'
+            assert os.path.exists(idx_filename)
+
+            table_index = read_op2_index(op2_filename, log=log)
+            assert len(table_index) == len(model.table_index)
+            oes = [table for table in table_index if table.table_name == b'OES1X1'][0]
+            subtable = oes.subtables[0]
+            assert subtable.data_code['table_code'] == 5, subtable.data_code
+            assert subtable.data_code['mode'] == 1, subtable.data_code
+
+            # CQUAD4-144 stress for mode 3
+            model2 = OP2(log=log)
+            model2.read_op2_from_index(
+                op2_filename, table_names=['OES1X1'], subcases=[1],
+                element_types=[144], nonlinear_factors=[3])
+            stress = model.op2_results.stress.cquad4_stress[1]
+            stress2 = model2.op2_results.stress.cquad4_stress[1]
+            assert stress2.data.shape == (1, ) + stress.data.shape[1:], stress2.data.shape
+            assert np.array_equal(stress2.data[0], stress.data[2])
+            assert np.array_equal(stress2.element_node, stress.element_node)
+            assert len(model2.eigenvectors) == 0
+            assert len(model2.op2_results.stress.ctria3_stress) == 0
+
+            # the index is out of date, so it's rebuilt
+            os.utime(op2_filename, ns=(1, 1))
+            assert read_op2_index(op2_filename) is None
+            model3 = OP2(log=log)
+            model3.read_op2_from_index(op2_filename, table_names=['OUGV1'],
+                                       nonlinear_factors=[2])
+            eigenvectors = model3.eigenvectors[1]
+            assert eigenvectors.data.shape[0] == 1, eigenvectors.data.shape
+            assert np.array_equal(eigenvectors.data[0], model.eigenvectors[1].data[1])
+            assert read_op2_index(op2_filename) is not None
+
+    def test_iter_op2_results(self):
+        """the results are streamed one time/mode/frequency at a time"""
+        log = SimpleLogger(level='warning')
+        op2_filename = MODEL_PATH / 'sol_101_elements' / 'mode_solid_shell_bar.op2'
+        model = read_op2(op2_filename, log=log, combine=False)
+
+        result_names = set()
+        for result_name, key, obj in iter_op2_results(
+                op2_filename, log=log,
+                include_results=['eigenvectors', 'stress.cquad4_stress']):
+            result_names.add(result_name)
+            assert obj.data.shape[0] == 1, obj.data.shape
+            obj_full = model.get_result(result_name)[key]
+            itime = list(obj_full._times).index(obj._times[0])
+            assert np.array_equal(obj.data[0], obj_full.data[itime])
+        assert result_names == {'eigenvectors', 'stress.cquad4_stress'}, result_names
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,100 @@
+import copy
+import pickle
+import unittest
+from pathlib import Path
+
+import numpy as np
+from cpylog import SimpleLogger
+
+import pyNastran
+from pyNastran.op2.op2 import OP2
+from pyNastran.op2.op2_geom import OP2Geom
+from pyNastran.op2.tables.oug.oug_displacements import RealDisplacementArray
+
+PKG_PATH = Path(pyNastran.__path__[0])
+MODEL_PATH = (PKG_PATH / '..' / 'models').resolve()
+
+
+class TestOP2Lazy(unittest.TestCase):
+    def test_op2_lazy(self):
+        """the lazy results match the eagerly read results"""
+        log = SimpleLogger(level='warning')
+        op2_filenames = [
+            MODEL_PATH / 'sol_101_elements' / 'static_solid_shell_bar.op2',
+            MODEL_PATH / 'sol_101_elements' / 'mode_solid_shell_bar.op2',
+            MODEL_PATH / 'sol_101_elements' / 'transient_solid_shell_bar.op2',
+            MODEL_PATH / 'sol_101_elements' / 'freq_solid_shell_bar.op2',
+        ]
+        for op2_filename in op2_filenames:
+            for op2_class in [OP2, OP2Geom]:
+                model1 = op2_class(log=log)
+                model1.read_op2(op2_filename)
+
+                model2 = op2_class(log=log)
+                model2.use_lazy_results = True
+                model2.read_op2(op2_filename)
+                assert all(table.refill for table in model2.table_index
+                           if table.table_name in {b'OUGV1', b'OES1X1'})
+                model1.assert_op2_equal(model2)
+
+    def test_op2_lazy_access(self):
+        """the header and ids are available before the data is read"""
+        log = SimpleLogger(level='warning')
+        op2_filename = MODEL_PATH / 'sol_101_elements' / 'transient_solid_shell_bar.op2'
+        model1 = OP2(log=log)
+        model1.read_op2(op2_filename)
+
+        model2 = OP2(log=log)
+        model2.use_lazy_results = True
+        model2.read_op2(op2_filename)
+
+        disp1 = model1.displacements[1]
+        disp2 = model2.displacements[1]
+        stress1 = model1.op2_results.stress.cquad4_stress[1]
+        stress2 = model2.op2_results.stress.cquad4_stress[1]
+        assert isinstance(disp2, RealDisplacementArray)
+        assert not disp2.is_loaded
+        assert disp2.data_code['table_code'] == disp1.data_code['table_code']
+        assert np.allclose(disp2._times, disp1._times)
+        assert np.array_equal(disp2.node_gridtype, disp1.node_gridtype)
+        assert np.array_equal(stress2.element_node, stress1.element_node)
+        assert not stress2.is_loaded
+
+        assert np.array_equal(disp2.data, disp1.data)
+        assert type(disp2) is RealDisplacementArray
+        assert not stress2.is_loaded
+
+        # pickling/copying loads the data
+        stress3 = pickle.loads(pickle.dumps(stress2))
+        assert type(stress3) is type(stress1)
+        assert np.array_equal(stress3.data, stress1.data)
+        stress4 = copy.deepcopy(model2.op2_results.stress.ctria3_stress[1])
+        assert np.array_equal(stress4.data, model1.op2_results.stress.ctria3_stress[1].data)
+
+    def test_op2_lazy_budget(self):
+        """the least recently used data is unloaded"""
+        log = SimpleLogger(level='warning')
+        op2_filename = MODEL_PATH / 'sol_101_elements' / 'mode_solid_shell_bar.op2'
+        model1 = OP2(log=log)
+        model1.read_op2(op2_filename)
+
+        model2 = OP2(log=log)
+        model2.use_lazy_results = True
+        model2.lazy_max_nbytes = 1
+        model2.read_op2(op2_filename)
+
+        eigenvectors = model2.eigenvectors[1]
+        stress = model2.op2_results.stress.cquad4_stress[1]
+        assert np.array_equal(eigenvectors.data, model1.eigenvectors[1].data)
+        assert eigenvectors.is_loaded
+        assert np.array_equal(stress.data, model1.op2_results.stress.cquad4_stress[1].data)
+        assert stress.is_loaded
+        assert not eigenvectors.is_loaded
+
+        # it's read again
+        assert np.array_equal(eigenvectors.data, model1.eigenvectors[1].data)
+        assert not stress.is_loaded
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
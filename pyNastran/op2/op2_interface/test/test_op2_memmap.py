@@ -0,0 +1,68 @@
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+from cpylog import SimpleLogger
+
+import pyNastran
+from pyNastran.op2.op2 import OP2
+from pyNastran.op2.op2_geom import OP2Geom
+
+PKG_PATH = Path(pyNastran.__path__[0])
+MODEL_PATH = (PKG_PATH / '..' / 'models').resolve()
+
+
+class TestOP2Memmap(unittest.TestCase):
+    def test_op2_memmap(self):
+        """the memory mapped results match the copied results"""
+        log = SimpleLogger(level='warning')
+        op2_filenames = [
+            MODEL_PATH / 'sol_101_elements' / 'static_solid_shell_bar.op2',
+            MODEL_PATH / 'sol_101_elements' / 'mode_solid_shell_bar.op2',
+            MODEL_PATH / 'sol_101_elements' / 'transient_solid_shell_bar.op2',
+        ]
+        for op2_filename in op2_filenames:
+            for op2_class in [OP2, OP2Geom]:
+                model1 = op2_class(log=log)
+                model1.read_op2(op2_filename)
+
+                model2 = op2_class(log=log)
+                model2.use_memmap = True
+                model2.read_op2(op2_filename)
+                model1.assert_op2_equal(model2)
+
+    def test_op2_memmap_view(self):
+        """the eigenvectors/stresses are views into the OP2"""
+        log = SimpleLogger(level='warning')
+        with tempfile.TemporaryDirectory() as dirname:
+            op2_filename = os.path.join(dirname, 'mode_solid_shell_bar.op2')
+            shutil.copyfile(MODEL_PATH / 'sol_101_elements' / 'mode_solid_shell_bar.op2',
+                            op2_filename)
+            model1 = OP2(log=log)
+            model1.read_op2(op2_filename)
+
+            model2 = OP2(log=log)
+            model2.use_memmap = True
+            model2.read_op2(op2_filename)
+
+            eigenvectors = model2.eigenvectors[1]
+            assert isinstance(eigenvectors.data.base, np.memmap), type(eigenvectors.data.base)
+            assert eigenvectors.data.shape == model1.eigenvectors[1].data.shape
+            assert np.array_equal(eigenvectors.data, model1.eigenvectors[1].data)
+
+            stress = model2.op2_results.stress.crod_stress[1]
+            assert isinstance(stress.data.base, np.memmap), type(stress.data.base)
+
+            # copy-on-write, so the OP2 isn't changed
+            eigenvectors.data[:] = 0.
+            model3 = OP2(log=log)
+            model3.read_op2(op2_filename)
+            assert np.array_equal(model3.eigenvectors[1].data, model1.eigenvectors[1].data)
+            del model2, eigenvectors, stress
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
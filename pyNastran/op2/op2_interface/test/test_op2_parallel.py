@@ -0,0 +1,60 @@
+import unittest
+from pathlib import Path
+
+from cpylog import SimpleLogger
+
+import pyNastran
+from pyNastran.op2.op2 import OP2, read_op2
+from pyNastran.op2.op2_geom import OP2Geom
+from pyNastran.op2.op2_interface.op2_parallel import get_table_groups
+
+PKG_PATH = Path(pyNastran.__path__[0])
+MODEL_PATH = (PKG_PATH / '..' / 'models').resolve()
+
+
+class TestOP2Parallel(unittest.TestCase):
+    def test_op2_table_groups(self):
+        """tables that share a result class are read on the same process"""
+        log = SimpleLogger(level='warning')
+        op2_filename = MODEL_PATH / 'sol_101_elements' / 'static_solid_shell_bar.op2'
+        model = read_op2(op2_filename, log=log)
+        groups = get_table_groups(model.table_index)
+        assert len(groups) > 1, groups
+
+        obj_classes = []
+        for group in groups:
+            obj_classesi = set()
+            for table in group:
+                obj_classesi.update(subtable.obj_class for subtable in table.subtables)
+            for obj_classesj in obj_classes:
+                assert not obj_classesi & obj_classesj, (obj_classesi, obj_classesj)
+            obj_classes.append(obj_classesi)
+
+    def test_op2_parallel(self):
+        """the parallel reader matches the serial reader"""
+        log = SimpleLogger(level='warning')
+        op2_filenames = [
+            MODEL_PATH / 'sol_101_elements' / 'static_solid_shell_bar.op2',
+            MODEL_PATH / 'sol_101_elements' / 'mode_solid_shell_bar.op2',
+            MODEL_PATH / 'sol_101_elements' / 'freq_solid_shell_bar.op2',
+        ]
+        for op2_filename in op2_filenames:
+            for op2_class in [OP2, OP2Geom]:
+                model1 = op2_class(log=log)
+                model1.read_op2(op2_filename)
+
+                model2 = op2_class(log=log)
+                model2.read_op2(op2_filename, nworkers=2)
+                model1.assert_op2_equal(model2)
+                for result_name in model1.get_table_types():
+                    results1 = model1.get_result(result_name)
+                    if isinstance(results1, dict):
+                        results2 = model2.get_result(result_name)
+                        assert list(results1) == list(results2), result_name
+                refill1 = [table.refill for table in model1.table_index]
+                refill2 = [table.refill for table in model2.table_index]
+                assert refill1 == refill2
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
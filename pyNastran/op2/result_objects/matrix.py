@@ -9,6 +9,8 @@ import numpy as np
 from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.bdf.cards.dmig import dtype_to_tin_tout_str
 from pyNastran.bdf.field_writer import print_card_8, print_card_16, print_card_double
+from pyNastran.bdf.field_writer_array import (
+    print_float_8_array, print_float_16_array, print_scientific_double_array)
 from pyNastran.op2.op2_interface.write_utils import export_to_hdf5
 from pyNastran.utils import object_attributes, object_methods, object_stats
 sparse_types = (scipy.sparse.coo_matrix, scipy.sparse.csr_matrix, scipy.sparse.csc_matrix)
@@ -467,6 +469,26 @@ def form_to_int(form: str) -> int:
     raise RuntimeError(f'form = {form!r}')
 
 
+def _get_float_fields(values: np.ndarray, func: Callable[list[Any]]) -> np.ndarray:
+    """
+    Formats the DMI values at once, so print_card_8/16/double write the
+    formatted fields as-is.  Values that the print_card function doesn't
+    write with print_float_8/16 or print_scientific_double are left alone.
+    """
+    if values.dtype.name not in {'float32', 'float64'} or np.isnan(values).any():
+        # nan fields are blank and may be wiped
+        return values
+    if func is print_card_8:
+        fields = print_float_8_array(values)
+    elif func is print_card_16:
+        fields = print_float_16_array(values)
+    elif func is print_card_double and values.dtype == np.float64:
+        fields = print_scientific_double_array(values)
+    else:
+        return values
+    return np.array(fields, dtype=object)
+
+
 def _dmi_get_real_fields(dmi: Matrix, func: Callable[list[Any]]) -> str:
     """writes a real DMI"""
     msg = ''
@@ -474,12 +496,14 @@ def _dmi_get_real_fields(dmi: Matrix, func: Callable[list[Any]]) -> str:
     #nrows = dmi.nrows
     nrows = dmi.shape[0]
     real_array, GCi, GCj = dmi.data_i_j()
+    real_fields = _get_float_fields(real_array, func)
 
     uGCj = np.unique(GCj)
     for gcj in uGCj:
         i = np.where(gcj == GCj)[0]
         gcis = GCi[i]
         reals = real_array[i]
+        real_fieldsi = real_fields[i]
 
         list_fields = ['DMI', name, gcj]
         max_value = reals.max()
@@ -487,25 +511,25 @@ def _dmi_get_real_fields(dmi: Matrix, func: Callable[list[Any]]) -> str:
         if len(i) == (reals != 0).sum():
             # dense
             list_fields.append(1)
-            list_fields.extend(reals)
+            list_fields.extend(real_fieldsi)
             msg += func(list_fields)
             continue
 
         if len(reals) == 1:
-            list_fields.extend([1, max_value])
+            list_fields.extend([1, real_fieldsi[0]])
             msg += func(list_fields)
             continue
 
         if max_value == reals.min():
             #DMI     WKK     1       1       1.0     THRU    112
-            list_fields.extend([1, max_value, 'THRU', nrows])
+            list_fields.extend([1, real_fieldsi[0], 'THRU', nrows])
             msg += func(list_fields)
             continue
 
         if len(i) == (reals != 0).sum():
             # dense
             list_fields.append(1)
-            list_fields.extend(reals)
+            list_fields.extend(real_fieldsi)
             msg += func(list_fields)
             continue
 
@@ -513,7 +537,7 @@ def _dmi_get_real_fields(dmi: Matrix, func: Callable[list[Any]]) -> str:
 
         # will always write the first one
         gci_last = -1
-        for gci, real in zip(gcis[isort], reals[isort]):
+        for gci, real in zip(gcis[isort], real_fieldsi[isort]):
             if gci == gci_last + 1:
                 pass
             else:
@@ -529,8 +553,8 @@ def _dmi_get_complex_fields(dmi: Matrix, func: Callable[list[Any]]) -> str:
     name = dmi.name
     #nrows = dmi.nrows
     data, GCi, GCj = dmi.data_i_j()
-    real_array = data.real
-    imag_array = data.imag
+    real_array = _get_float_fields(data.real, func)
+    imag_array = _get_float_fields(data.imag, func)
 
     uGCj = np.unique(dmi.GCj)
     for gcj in uGCj:
@@ -579,7 +579,7 @@ class OEF:
                     #obj.element_type[obj.itime, itotal:itotal2, :] = strings[:, 3:]
 
                 #[etype, xgrad, ygrad, zgrad, xflux, yflux, zflux]
-                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 3:].copy()
+                op2._set_float_data(obj, floats, obj.itime, itotal, itotal2, 3)
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -679,7 +679,7 @@ class OEF:
                 obj.element_data_type[itotal:itotal2] = array([s1+s2 for s1, s2 in zip(strings[:, 1], strings[:, 2])])
 
                 #[etype, xgrad, ygrad, zgrad, xflux, yflux, zflux]
-                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 3:].copy()
+                op2._set_float_data(obj, floats, obj.itime, itotal, itotal2, 3)
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -818,7 +818,7 @@ class OEF:
                         #obj.element_type[obj.itime, itotal:itotal2, :] = strings[:, 3:]
 
                     #[fapplied, free_conv, force_conv, frad, ftotal]
-                    obj.data[obj.itime, itotal:itotal2, :] = floats[:, 3:].copy()
+                    op2._set_float_data(obj, floats, obj.itime, itotal, itotal2, 3)
                     obj.itotal = itotal2
                     obj.ielement = ielement2
                 else:
@@ -1301,7 +1301,7 @@ class OEF:
                     obj.element[itotal:itotal2] = eids
 
                 #[axial, torsion]
-                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                op2._set_float_data(obj, floats, obj.itime, itotal, itotal2, 1)
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -1704,7 +1704,7 @@ class OEF:
                     obj.element[itotal:itotal2] = eids
 
                 #(eid_device, axial, torque)
-                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                op2._set_float_data(obj, floats, obj.itime, itotal, itotal2, 1)
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -1826,7 +1826,7 @@ class OEF:
                     obj.element[itotal:itotal2] = eids
 
                 #[bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq]
-                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                op2._set_float_data(obj, floats, obj.itime, itotal, itotal2, 1)
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             # elif op2.use_vector and is_vectorized and op2.sort_method == 1:
@@ -1892,7 +1892,7 @@ class OEF:
                     obj.element[itotal:itotal2] = eids
 
                 #[axial, torsion, SMa, SMt]
-                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                op2._set_float_data(obj, floats, obj.itime, itotal, itotal2, 1)
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -1964,7 +1964,7 @@ class OEF:
                     obj.element[ielement:ielement2] = eids
 
                 #[mx, my, mxy, bmx, bmy, bmxy, tx, ty]
-                obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:].copy()
+                op2._set_float_data(obj, floats, obj.itime, ielement, ielement2, 1)
                 obj.itotal = ielement2
                 obj.ielement = ielement2
             else:
@@ -2334,7 +2334,7 @@ class OEF:
 
                 # [f41, f21, f12, f32, f23, f43, f34, f14, kf1,
                 #  s12, kf2, s23, kf3, s34, kf4, s41]
-                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                op2._set_float_data(obj, floats, obj.itime, itotal, itotal2, 1)
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -2430,7 +2430,7 @@ class OEF:
                     obj.element[itotal:itotal2] = eids
 
                 # [hopa, bmu, bmv, tm, su, sv]
-                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                op2._set_float_data(obj, floats, obj.itime, itotal, itotal2, 1)
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -2480,7 +2480,7 @@ class OEF:
                     obj.element[itotal:itotal2] = eids
 
                 # [fx, sfy, sfz, u, v, w, sv, sw]
-                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                op2._set_float_data(obj, floats, obj.itime, itotal, itotal2, 1)
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -2728,7 +2728,7 @@ class OEF:
                     obj.element[itotal:itotal2] = eids
 
                 #[axial_force, torque]
-                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 3:].copy()
+                op2._set_float_data(obj, floats, obj.itime, itotal, itotal2, 3)
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -2264,7 +2264,7 @@ class OES(OP2Common2):
                 self.obj_set_element(obj, itotal, itotal2, data, nelements)
 
                 #[axial, torsion, SMa, SMt]
-                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                op2._set_float_data(obj, floats, obj.itime, itotal, itotal2, 1)
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -2338,7 +2338,7 @@ class OES(OP2Common2):
                 self.obj_set_element(obj, itotal, itotal2, data, nelements)
 
                 #[axial, torsion, SMa, SMt]
-                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                op2._set_float_data(obj, floats, obj.itime, itotal, itotal2, 1)
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -2599,7 +2599,7 @@ class OES(OP2Common2):
                 self.obj_set_element(obj, itotal, itotal2, data, nelements)
 
                 #[max_strain, avg_strain, margin]
-                obj.data[itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                op2._set_float_data(obj, floats, itime, itotal, itotal2, 1)
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -2660,7 +2660,7 @@ class OES(OP2Common2):
                 self.obj_set_element(obj, itotal, itotal2, data, nelements)
 
                 #[max_strain, avg_strain, margin]
-                obj.data[itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                op2._set_float_data(obj, floats, itime, itotal, itotal2, 1)
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -2736,7 +2736,7 @@ class OES(OP2Common2):
 
                 #[s1a, s2a, s3a, s4a, axial, smaxa, smina, margin_tension,
                 # s1b, s2b, s3b, s4b,        smaxb, sminb, margin_compression]
-                obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:].copy()
+                op2._set_float_data(obj, floats, obj.itime, ielement, ielement2, 1)
                 obj.itotal = ielement2
                 obj.ielement = ielement2
             else:
@@ -2837,7 +2837,7 @@ class OES(OP2Common2):
 
                 #[s1a, s2a, s3a, s4a, axial,
                 # s1b, s2b, s3b, s4b]
-                obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:].copy()
+                op2._set_float_data(obj, floats, obj.itime, ielement, ielement2, 1)
                 obj.itotal = ielement2
                 obj.ielement = ielement2
             else:
@@ -4553,7 +4553,7 @@ class OES(OP2Common2):
                 floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 8)
 
                 #[axial, maxa, mina, maxb, minb, max_shear, bearing]
-                obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:].copy()
+                op2._set_float_data(obj, floats, obj.itime, ielement, ielement2, 1)
                 obj.itotal = ielement2
                 obj.ielement = ielement2
             else:
@@ -4599,7 +4599,7 @@ class OES(OP2Common2):
                 floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 8)
 
                 #[axial, maxa, mina, maxb, minb, max_shear, bearing]
-                obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:].copy()
+                op2._set_float_data(obj, floats, obj.itime, ielement, ielement2, 1)
                 obj.itotal = ielement2
                 obj.ielement = ielement2
             else:
@@ -4681,7 +4681,7 @@ class OES(OP2Common2):
                 floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 7)
 
                 #[force_x, force_y, force_z, moment_x, moment_y, moment_z]
-                obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:].copy()
+                op2._set_float_data(obj, floats, obj.itime, ielement, ielement2, 1)
                 obj.itotal = ielement2
                 obj.ielement = ielement2
             else:
@@ -6192,7 +6192,7 @@ class OES(OP2Common2):
 
                 floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 11)
                 #[o1, o2, t12, t1z, t2z, angle, major, minor, ovm]
-                obj.data[obj.itime, istart:iend, :] = floats[:, 2:].copy()
+                op2._set_float_data(obj, floats, obj.itime, istart, iend, 2)
             else:
                 if is_vectorized and op2.use_vector:  # pragma: no cover
                     op2.log.debug(f'vectorize COMP_SHELL real SORT{sort_method}')
@@ -6292,7 +6292,7 @@ class OES(OP2Common2):
 
                 floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 13)
                 #[o1a, o2a, t12a, o1za, o2za, o1b, o2b, t12b, o1zb, e2zb, ovm]
-                obj.data[obj.itime, istart:iend, :] = floats[:, 2:].copy()
+                op2._set_float_data(obj, floats, obj.itime, istart, iend, 2)
                 # struct1 = Struct(op2._endian + op2._analysis_code_fmt + b'i9f ff')
                 # add_sort_x = getattr(obj, 'add_sort' + str(op2.sort_method))
                 # for unused_i in range(nelements):
@@ -6713,7 +6713,7 @@ class OES(OP2Common2):
 
                 floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 7)
                 #[tx, ty, tz, rx, ry, rz]
-                obj.data[obj.itime, istart:iend, :] = floats[:, 1:].copy()
+                op2._set_float_data(obj, floats, obj.itime, istart, iend, 1)
             else:
                 n = oes_cbush_real_7(op2, data, obj,
                                      nelements, ntotal, dt)
@@ -6956,7 +6956,7 @@ class OES(OP2Common2):
                 floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 7)
                 #[axial_stress, equiv_stress, total_strain,
                 # eff_plastic_creep_strain, eff_creep_strain, linear_torsional_stresss]
-                obj.data[obj.itime, istart:iend, :] = floats[:, 1:].copy()
+                op2._set_float_data(obj, floats, obj.itime, istart, iend, 1)
             else:
                 struct1 = Struct(op2._endian + mapfmt(op2._analysis_code_fmt + b'6f', self.size))  # 1+6=7
                 for unused_i in range(nelements):
@@ -7038,7 +7038,7 @@ class OES(OP2Common2):
                 floats = frombuffer(data, dtype=op2.fdtype).reshape(nelements, numwide_real)
 
                 #[force, stress]
-                obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:].copy()
+                op2._set_float_data(obj, floats, obj.itime, ielement, ielement2, 1)
                 obj.itotal = ielement2
                 obj.ielement = ielement2
             else:
@@ -7112,7 +7112,7 @@ class OES(OP2Common2):
                 floats = frombuffer(data, dtype=op2.fdtype).reshape(nelements, 19)
                 #[fx, fy, fz, otx, oty, otz, etx, ety, etz,
                 # mx, my, mz, orx, ory, orz, erx, ery, erz]
-                obj.data[obj.itime, istart:iend, :] = floats[:, 1:].copy()
+                op2._set_float_data(obj, floats, obj.itime, istart, iend, 1)
             else:
                 #             N O N L I N E A R   F O R C E S  A N D  S T R E S S E S  I N   B U S H   E L E M E N T S    ( C B U S H )
                 #
@@ -7501,7 +7501,7 @@ class OES(OP2Common2):
                     obj.element[itotal:itotal2] = eids
 
                 #[max_strain, avg_strain, margin]
-                obj.data[itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                op2._set_float_data(obj, floats, itime, itotal, itotal2, 1)
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -7556,7 +7556,7 @@ class OES(OP2Common2):
                     obj.element[itotal:itotal2] = eids
 
                 #[max_strain, avg_strain, margin]
-                obj.data[itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                op2._set_float_data(obj, floats, itime, itotal, itotal2, 1)
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -7605,7 +7605,7 @@ class OES(OP2Common2):
                     obj.element[itotal:itotal2] = eids
 
                 #[max_strain, avg_strain, margin]
-                obj.data[itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                op2._set_float_data(obj, floats, itime, itotal, itotal2, 1)
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -7851,7 +7851,7 @@ class OES(OP2Common2):
 
                 floats = frombuffer(data, dtype=op2.fdtype8).reshape(nelements, 10)
                 #[sd, sxc, sxd, sxe, sxf, axial, smax, smin, MS]
-                obj.data[obj.itime, istart:iend, :] = floats[:, 1:].copy()
+                op2._set_float_data(obj, floats, obj.itime, istart, iend, 1)
             else:
                 n = oes_cbar100_real_10(op2, data, obj, nelements, ntotal, dt)
 
@@ -11,6 +11,11 @@ from pyNastran.op2.tables.test.test_grid_point_forces import TestGridPointForces
 from pyNastran.op2.tables.test.test_oug import TestOUG
 from pyNastran.op2.writer.test_op2_writer import TestOP2Writer
 from pyNastran.op2.op2_interface.test.test_results_set import TestResultSet
+from pyNastran.op2.op2_interface.test.test_op2_index import TestOP2Index
+from pyNastran.op2.op2_interface.test.test_op2_memmap import TestOP2Memmap
+from pyNastran.op2.op2_interface.test.test_op2_parallel import TestOP2Parallel
+from pyNastran.op2.op2_interface.test.test_op2_lazy import TestOP2Lazy
+from pyNastran.op2.op2_interface.test.test_op2_filter import TestOP2Filter
 
 
 if __name__ == "__main__":  # pragma: no cover
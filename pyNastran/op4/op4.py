@@ -1,17 +1,17 @@
 """Main OP4 class"""
-
+from __future__ import annotations
 import sys
 import os
 from struct import pack, unpack, Struct
-from typing import TextIO, BinaryIO, Optional, Union, cast
+from typing import TextIO, BinaryIO, Iterable, Optional, Union, cast
 
 import numpy as np
 from numpy import float32, float64, complex64, complex128
-from scipy.sparse import coo_matrix  # type: ignore
+from scipy.sparse import coo_matrix, csc_matrix, csr_matrix  # type: ignore
 from cpylog import get_logger2, SimpleLogger
 
 from pyNastran.utils import is_binary_file as file_is_binary, PathLike, PurePath
-from pyNastran.utils.mathematics import print_matrix #, print_annotated_matrix
+#from pyNastran.utils.mathematics import print_matrix, print_annotated_matrix
 from pyNastran.op2.result_objects.matrix import Matrix
 
 
@@ -31,6 +31,9 @@ class OP4:
         self._new = False
         self.large = False
 
+        # the memory map of the binary file that's being read
+        self._data: Optional[np.memmap] = None
+
     def read_op4(self, op4_filename: Optional[PathLike]=None,
                  matrix_names: Optional[list[str]]=None,
                  precision: str='default') -> dict[str, Matrix]:
@@ -63,6 +66,19 @@ class OP4:
                 op4_filename, matrix_names, precision)
         return matrices
 
+    def memmap_op4(self, op4_filename: PathLike,
+                   matrix_names: Optional[list[str]]=None) -> dict[str, MemmapMatrix]:
+        """See ``memmap_op4``"""
+        if not os.path.exists(op4_filename):
+            raise IOError('cannot find op4_filename=%r' % op4_filename)
+        if isinstance(matrix_names, str):
+            matrix_names = [matrix_names]
+        if not file_is_binary(op4_filename):
+            raise ValueError('op4_filename=%r is not a binary OP4; '
+                             'only binary OP4s can be memory mapped' % op4_filename)
+        matrices = self.read_op4_binary(op4_filename, matrix_names, memmap=True)
+        return matrices
+
 #--------------------------------------------------------------------------
     def read_op4_ascii(self, op4_filename: PathLike,
                        matrix_names: Optional[list[str]]=None,
@@ -542,30 +558,6 @@ class OP4:
             self.log.info('  IS=%s L=%s irow=%s' % (IS, L, irow))
         return irow, iline
 
-    def _get_irow_small_binary(self, op4: BinaryIO, data_bytes: bytes) -> tuple[int, int]:
-        """
-        Returns
-        -------
-        irow : int
-           the row id
-        L : int
-            the row length
-
-        """
-        if len(data_bytes) == 0:
-            data_bytes = op4.read(4)
-            self.n += 4
-
-        IS, = unpack(self._endian + 'i', data_bytes)
-        L = IS // 65536 - 1
-        irow = IS - 65536 * (L + 1)
-        if self.debug:
-            self.log.info('small_mat-next row')
-            self.log.info("  IS=%s L=%s irow=%s" % (IS, L, irow))
-            assert IS > 0, IS
-            assert L > 0, L
-        return irow, L
-
     def _get_irow_big_ascii(self, op4: TextIO, iline: int,
                             line: str,
                             sline: list[str], irow: int) -> tuple[int, int]:
@@ -582,37 +574,30 @@ class OP4:
             self.log.debug("idummy=%s irow=%s" % (idummy, irow))
         return irow, iline
 
-    def _get_irow_big_binary(self, op4: BinaryIO, data_bytes: bytes) -> tuple[int, int]:
-        """
-        Returns
-        -------
-        irow : int
-           the row id
-        L : int
-            ???
-
-        """
-        if len(data_bytes) == 0:
-            data_bytes = op4.read(8)
-            self.n += 8
-        idummy, irow = unpack(self._endian + '2i', data_bytes)
-        if self.debug:
-            self.log.debug("idummy=%s irow=%s" % (idummy, irow))
-            assert irow < 100, irow
-        return irow, idummy - 1
-
 #--------------------------------------------------------------------------
     def read_op4_binary(self, op4_filename: PathLike,
                         matrix_names: Optional[list[str]]=None,
                         precision: str='default',
-                       use_matrix_class=False):
-        """matrix_names must be a list or None, but basically the same"""
+                       use_matrix_class=False,
+                       memmap: bool=False):
+        """
+        matrix_names must be a list or None, but basically the same
+
+        memmap : bool; default=False
+            don't read the matrices and return a ``MemmapMatrix`` for
+            each matrix, which reads the columns from the file on demand
+        """
         self.n = 0
         matrices: dict[str, Matrix] = {}
         name = 'dummyName'
 
         with open(op4_filename, mode='rb') as op4:
             self._endian = self._determine_endian(op4)
+
+            # the column records are indexed and read from a memory map
+            # instead of reading the file one string at a time
+            self._data = np.memmap(op4, dtype='uint8', mode='r')
+            op4.seek(0)
             while name is not None:
                 # checks for the end of the file
                 assert self.n == op4.tell(), 'n=%s tell=%s' % (self.n, op4.tell())
@@ -623,9 +608,13 @@ class OP4:
                     break
                 #self.show(f, 60)
 
-                (name, amat) = self._read_matrix_binary(op4, precision, matrix_names)
+                (name, amat) = self._read_matrix_binary(op4, precision, matrix_names,
+                                                        memmap=memmap)
                 #print(print_matrix(amat.matrix))
-                if is_saved_matrix(name, matrix_names):
+                if memmap:
+                    if is_saved_matrix(name, matrix_names):
+                        matrices[name] = amat
+                elif is_saved_matrix(name, matrix_names):
                     _save_matrix(matrices, name, amat)
 
                 #print("not op4.closed = ",not op4.closed,form,name)
@@ -647,6 +636,7 @@ class OP4:
                 #         assert record_length2 == 24
                 #         op4.seek(self.n)
                 #
+        self._data = None
         return matrices
 
     def read_start_marker(self, op4: BinaryIO) -> tuple[int, int, int, int]:
@@ -672,7 +662,8 @@ class OP4:
         return a, icol, irow, nwords
 
     def _read_matrix_binary(self, op4: BinaryIO, precision: str,
-                            matrix_names: list[str]) -> tuple[str, Matrix]:
+                            matrix_names: list[str],
+                            memmap: bool=False) -> tuple[str, Matrix]:
         """Reads a binary matrix"""
         #self.show(f, 60)
         log = self.log
@@ -733,20 +724,18 @@ class OP4:
             is_sparse = True
 
         assert self.n == op4.tell(), 'n=%s tell=%s' % (self.n, op4.tell())
-        if matrix_type in {1, 2}:  # real
-            if is_sparse:
-                data_mat = self._read_real_sparse_binary(op4, nrows, ncols, matrix_type, is_big_mat)
-            else:
-                data_mat = self._read_real_dense_binary(op4, nrows, ncols, matrix_type, is_big_mat)
-        elif matrix_type in {3, 4}:  # complex
-            if is_sparse:
-                data_mat = self._read_complex_sparse_binary(op4, nrows, ncols, matrix_type, is_big_mat)
-            else:
-                data_mat = self._read_complex_dense_binary(op4, nrows, ncols, matrix_type, is_big_mat)
-        else:
+        if matrix_type not in {1, 2, 3, 4}:
             log.error('is_sparse=%s data_format=%s dtype=%s' % (is_sparse, data_format, dtype))
             raise TypeError(f'matrix_type={matrix_type}')
 
+        if memmap:
+            data_mat = self._memmap_matrix_binary(
+                op4, name, form, nrows, ncols, matrix_type, is_sparse, is_big_mat)
+        elif is_sparse:
+            data_mat = self._read_sparse_binary(op4, nrows, ncols, matrix_type, is_big_mat)
+        else:
+            data_mat = self._read_dense_binary(op4, nrows, ncols, matrix_type)
+
         #try:
             #print_matrix(A.toarray())
         #except Exception:
@@ -765,157 +754,69 @@ class OP4:
         #f.read(4); self.n+=4
 
         assert self.n == op4.tell(), 'n=%s op4.tell=%s' % (self.n, op4.tell())
+        if memmap:
+            return name, data_mat
         amat = Matrix(name, form, data=data_mat)
         return name, amat
 
-    def _read_real_dense_binary(self, op4: BinaryIO, nrows: int, ncols: int,
-                                matrix_type: int, is_big_mat: bool) -> np.ndarray:
+    def _read_dense_binary(self, op4: BinaryIO, nrows: int, ncols: int,
+                           matrix_type: int) -> np.ndarray:
+        """Reads a dense real/complex binary matrix"""
         if self.debug:
-            self.log.info('_read_real_dense_binary')
-        out = _get_matrix_info(matrix_type, self.log, debug=False)
-        (nwords_per_value, _nbytes_per_value, data_format, dtype) = out
-        data_mat = np.zeros((nrows, ncols), dtype=dtype)
+            self.log.info('_read_dense_binary')
+        dtype = _get_matrix_info(matrix_type, self.log, debug=False)[3]
+        record_icols, record_irows, record_pos, record_nwords, self.n = _scan_binary_columns(
+            self._data, self.n, ncols, self._endian, is_sparse=False, is_big_mat=False)
+        rows, cols, values = _get_binary_values(
+            self._data, record_icols, record_irows, record_pos, record_nwords,
+            matrix_type, self._endian,
+            is_sparse=False, is_big_mat=False)
 
-        icol = -1  # dummy value so the loop starts
-        while icol < ncols + 1:  # if isDense
-            assert self.n == op4.tell(), 'n=%s tell=%s' % (self.n, op4.tell())
-            (icol, irow, nwords) = self.get_markers_dense(op4)
-            L = nwords
-            if icol == ncols + 1:
-                break
-            if L == -1:
-                break
-
-            record_length = 4 * nwords
-            data_bytes = op4.read(record_length)
-            self.n += record_length
-            nvalues = L // nwords_per_value
-            str_values = self._endian + '%i%s' % (nvalues, data_format)
-            data_mat[irow-1:irow-1+nvalues, icol-1] = unpack(str_values, data_bytes)
-            if self.debug:
-                self.log.info('A[%s:%s, %s] = %s' % (
-                    irow - 1,
-                    irow - 1 + nvalues,
-                    icol-1,
-                    data_mat[irow-1:irow-1+nvalues, icol-1]))
-        #assert self.n == op4.tell(), 'n=%s tell=%s' % (self.n, op4.tell())
+        data_mat = np.zeros((nrows, ncols), dtype=dtype)
+        data_mat[rows, cols] = values
+        if self.debug:
+            self.log.info('nrecords=%s nvalues=%s' % (len(record_icols), len(values)))
+        op4.seek(self.n)
         op4.read(4)
         self.n += 4
         return data_mat
 
-    def _read_real_sparse_binary(self, op4: BinaryIO,
-                                 nrows: int, ncols: int, matrix_type: int,
-                                 is_big_mat: bool) -> coo_matrix:
+    def _read_sparse_binary(self, op4: BinaryIO, nrows: int, ncols: int,
+                            matrix_type: int, is_big_mat: bool) -> coo_matrix:
+        """Reads a sparse real/complex binary matrix"""
         if self.debug:
-            self.log.info('_read_real_sparse_binary')
-        #self._show(op4, 200, types='ifsdq', endian=None)
-        out = _get_matrix_info(matrix_type, self.log, debug=False)
-        (nwords_per_value, nbytes_per_value, data_format, dtype) = out
-        log = self.log
-        rows = []
-        cols = []
-        entries: list[float] = []
-
-        data_bytes = b''
-        icol = -1  # dummy value so the loop starts
-        while icol < ncols + 1:  # if isDense
-            #if record_length==0:
-            assert self.n == op4.tell(), 'n=%s tell=%s' % (self.n, op4.tell())
-            (icol, irow, nwords) = self.get_markers_sparse(op4, is_big_mat)
-            L = nwords
-
-            if icol == ncols + 1:
-                if self.debug:
-                    log.info('breaking on icol=%s ncol+1=%s' % (icol, ncols + 1))
-                break
-
-            if is_big_mat:
-                irow, L = self._get_irow_big_binary(op4, data_bytes[:8])
-                data_bytes = data_bytes[8:]
-            else:
-                irow, L = self._get_irow_small_binary(op4, data_bytes[:4])
-                data_bytes = data_bytes[4:]
-
-            if L == -1:
-                if self.debug:
-                    log.info('breaking on L=-1')
-                break
-
-            if self.debug:
-                log.info("  next icol")
-                log.info("    n=%s icol=%s irow=%s nwords=%s" % (
-                    self.n, icol, irow, nwords))
-                self._show(op4, 100, types='qd')
-                log.info('**************************************************')
-
-            #if nwords == 0 and is_big_mat:
-                #self.n -= 4
-                #op4.seek(self.n)
-                #break
-
-            record_length = 4 * nwords
-            data_bytes = op4.read(record_length)
-            self.n += record_length
-            if self.debug:
-                log.info("  data_format=%s record_length=%s n_next=%s" % (
-                    data_format, record_length, self.n))
-            #if icol == ncols + 1:
-                #break
-
-            i = 0
-            while len(data_bytes) > 0:
-                if i > 0:
-                    if is_big_mat:
-                        (irow, L) = self._get_irow_big_binary(op4, data_bytes[0:8])
-                        data_bytes = data_bytes[8:]
-                    else:
-                        (irow, L) = self._get_irow_small_binary(op4, data_bytes[0:4])
-                        data_bytes = data_bytes[4:]
-                    assert irow > 0
-                nvalues = L // nwords_per_value
-                str_values = self._endian + '%i%s' % (nvalues, data_format)
-
-                if self.debug:
-                    log.info('irow=%s L=%s nwords_per_value=%s nvalues=%s '
-                             'nbytes_per_value=%s' % (irow, L, nwords_per_value,
-                                                      nvalues, nbytes_per_value))
-                    log.info('str_values = %r' % str_values)
-
-                value_list = unpack(str_values, data_bytes[0:nvalues * nbytes_per_value])
-                assert self.n == op4.tell(), 'n=%s tell=%s' % (self.n, op4.tell())
-
-                #irow -= 1
-                #icol -= 1
-                if self.debug:
-                    log.info('rows = %s' % list(i+irow-1 for i in range(nvalues)))
-                    log.info('cols = %s ' % ([icol-1] * nvalues))
-                    log.info('value_list = %s' % str(value_list))
-
-                rows.extend([i+irow-1 for i in range(nvalues)])
-                irow += nvalues
-                cols.extend([icol-1] * nvalues)
-                entries.extend(value_list)
-
-                record_length -= nvalues * nbytes_per_value
-                data_bytes = data_bytes[nvalues * nbytes_per_value:]
-                if self.debug:
-                    log.info("  record_length=%s nbytes_per_value=%s len(data)=%s" % (
-                        record_length, nbytes_per_value, len(data_bytes)))
-                    ##print(A)
-                    #print("********")  # ,data_bytes
-                    #print(self.print_block(data_bytes))
-                i += 1
-            #print "-------------------------------"
-
-        #if rows == []:  # NULL matrix
-            #raise NotImplementedError()
+            self.log.info('_read_sparse_binary')
+        dtype = _get_matrix_info(matrix_type, self.log, debug=False)[3]
+        record_icols, record_irows, record_pos, record_nwords, self.n = _scan_binary_columns(
+            self._data, self.n, ncols, self._endian, is_sparse=True, is_big_mat=is_big_mat)
+        rows, cols, values = _get_binary_values(
+            self._data, record_icols, record_irows, record_pos, record_nwords,
+            matrix_type, self._endian,
+            is_sparse=True, is_big_mat=is_big_mat)
+        if self.debug:
+            self.log.info('nrecords=%s nvalues=%s' % (len(record_icols), len(values)))
 
-        A = coo_matrix((entries, (rows, cols)), shape=(nrows, ncols),
-                       dtype=dtype)
+        A = coo_matrix((values, (rows, cols)), shape=(nrows, ncols), dtype=dtype)
+        op4.seek(self.n)
         op4.read(4)
         self.n += 4
         return A
 
+    def _memmap_matrix_binary(self, op4: BinaryIO, name: str, form: int,
+                              nrows: int, ncols: int, matrix_type: int,
+                              is_sparse: bool, is_big_mat: bool) -> MemmapMatrix:
+        """Indexes the columns of a binary matrix without reading the values"""
+        record_icols, record_irows, record_pos, record_nwords, self.n = _scan_binary_columns(
+            self._data, self.n, ncols, self._endian, is_sparse=is_sparse, is_big_mat=is_big_mat)
+        amat = MemmapMatrix(
+            name, form, nrows, ncols, matrix_type, self._data, self._endian,
+            record_icols, record_irows, record_pos, record_nwords,
+            is_sparse=is_sparse, is_big_mat=is_big_mat)
+        op4.seek(self.n)
+        op4.read(4)
+        self.n += 4
+        return amat
+
     def _show(self, op4: BinaryIO, n, types: str='ifs', endian: Optional[str]=None):
         """Shows binary data"""
         assert self.n == op4.tell()
@@ -968,229 +869,6 @@ class OP4:
         f.seek(self.n)
         return _write_data(fout, data_bytes, endian=endian, types=types)
 
-    def _read_complex_dense_binary(self, op4: BinaryIO, nrows: int, ncols: int,
-                                   matrix_type: int, is_big_mat: bool) -> coo_matrix:
-        """reads a dense complex binary matrix"""
-        if self.debug:
-            self.log.info('_read_complex_dense_binary')
-        out = _get_matrix_info(matrix_type, self.log, debug=False)
-        (nwords_per_value, nbytes_per_value, data_format, dtype) = out
-
-        A = np.zeros((nrows, ncols), dtype=dtype)
-        record_length = 0
-        icol = -1  # dummy value so the loop starts
-        while icol < ncols + 1:  # if isDense
-            #if record_length==0:
-            assert self.n == op4.tell(), 'n=%s tell=%s' % (self.n, op4.tell())
-            (icol, irow, nwords) = self.get_markers_dense(op4)
-            if self.debug:
-                self.log.info("N=%s icol=%s irow=%s nwords=%s" % (
-                    self.n, icol, irow, nwords))
-                self.log.info("-----------")
-
-            L = nwords
-            if icol == ncols + 1:
-                if self.debug:
-                    self.log.info('breaking...icol=%s ncols+1=%s' % (
-                        icol, ncols + 1))
-                break
-
-            if L == -1:
-                if self.debug:
-                    self.log.info('breaking...nwords (L) = %s' % nwords)
-                break
-
-            if self.debug:
-                self.log.info("  n=%s icol=%s irow=%s nwords=%s" % (
-                    self.n, icol, irow, nwords))
-
-            #if nwords == 0 and is_big_mat:
-                #self.n -=4
-                #f.seek(self.n)
-                #break
-
-            record_length = 4 * nwords
-            data_bytes = op4.read(record_length)
-            self.n += record_length
-            if self.debug:
-                self.log.info("data_format=%s record_length=%s n_next=%s" % (
-                    data_format, record_length, self.n))
-            if icol == ncols + 1:
-                continue
-
-            nvalues = nwords // nwords_per_value
-            #nread = nwords // 4
-            while record_length >= nbytes_per_value:
-                if self.debug:
-                    self.log.info("inner while...")
-                    self.log.info("nwords  = %s" % nwords)
-                    self.log.info("nvalues = %s" % nvalues)
-                    self.log.info("nwords_per_value = %s" % nwords_per_value)
-
-                #if nvalues == 0:
-                    #assert icol == ncols + 1
-                    #break
-
-                # we have more 2x values for complex numbers
-                str_values = self._endian + '%i%s' % (nvalues * 2, data_format)
-                if self.debug:
-                    self.log.info("str_values = %s" % str_values)
-                    self.log.info("nvalues*nbytes_per_value=%s len(data)=%s" % (
-                        nvalues * nbytes_per_value, len(data_bytes)))
-                value_list = unpack(str_values, data_bytes[0:nvalues * nbytes_per_value])
-                assert self.n == op4.tell(), 'n=%s tell=%s' % (self.n, op4.tell())
-                #self.show(op4, 4)
-                #print self.print_block(data)
-                if self.debug:
-                    self.log.info("value_list = %s" % str(value_list))
-
-                #irow -= 1
-                #icol -= 1
-                irow -= 1
-                icol -= 1
-                for i, value in enumerate(value_list):
-                    if i % 2 == 0:
-                        real_value = value
-                    else:
-                        ai = complex(real_value, value)
-                        if self.debug:
-                            self.log.info("A[%s,%s] = %s" % (irow, icol, ai))
-                        A[irow, icol] = ai
-                        irow += 1
-
-                record_length -= nvalues * nbytes_per_value
-                data_bytes = data_bytes[nvalues * nbytes_per_value:]
-                if self.debug:
-                    self.log.info("record_length=%s nbytes_per_value=%s" % (
-                        record_length, nbytes_per_value))
-                    self.log.info(print_matrix(A))
-                    self.log.info("******** %r" % data_bytes)
-
-        op4.read(4)
-        self.n += 4
-        return A
-
-    #def _read_complex_binary(self, op4: BinaryIO, nrows: int, ncols: int,
-                             #matrix_type: int, is_sparse: bool, is_big_mat: bool) -> coo_matrix:
-        #"""Reads a complex binary matrix"""
-        #if is_sparse:
-            #A = self._read_complex_sparse_binary(op4, nrows, ncols, matrix_type, is_big_mat)
-        #else:
-            #A = self._read_complex_dense_binary(op4, nrows, ncols, matrix_type, is_big_mat)
-        #return A
-
-    def _read_complex_sparse_binary(self, op4: BinaryIO, nrows: int, ncols: int,
-                                    matrix_type: int, is_big_mat: bool) -> coo_matrix:
-        """Reads a sparse complex binary matrix"""
-        if self.debug:
-            self.log.info('_read_complex_sparse_binary')
-        out = _get_matrix_info(matrix_type, self.log, debug=False)
-        (nwords_per_value, nbytes_per_value, data_format, dtype) = out
-        rows = []
-        cols = []
-        entries = []
-        record_length = 0
-        data_bytes = b''
-        icol = -1  # dummy value so the loop starts
-        while icol < ncols + 1:  # if isDense
-            #if record_length == 0:
-            assert self.n == op4.tell(), 'n=%s tell=%s' % (self.n, op4.tell())
-            (icol, irow, nwords) = self.get_markers_sparse(op4, is_big_mat)
-            if self.debug:
-                self.log.info("n=%s icol=%s irow=%s nwords=%s" % (
-                    self.n, icol, irow, nwords))
-                self.log.info("-----------")
-
-            L = nwords
-            if icol == ncols + 1:
-                break
-
-            if is_big_mat:
-                (irow, L) = self._get_irow_big_binary(op4, data_bytes[:8])
-                data_bytes = data_bytes[8:]
-            else:
-                (irow, L) = self._get_irow_small_binary(op4, data_bytes[:4])
-                data_bytes = data_bytes[4:]
-
-            if L == -1:
-                if self.debug:
-                    self.log.info('breaking on L=-1')
-                break
-
-            if self.debug:
-                self.log.info("n=%s icol=%s irow=%s nwords=%s" % (
-                    self.n, icol, irow, nwords))
-                self._show(op4, 100, types='qf')
-                self.log.info('\n\n')
-
-            #if nwords == 0 and is_big_mat:
-                #self.n -= 4
-                #op4.seek(self.n)
-                #break
-
-            record_length = 4 * nwords
-            data_bytes = op4.read(record_length)
-            self.n += record_length
-            if self.debug:
-                self.log.info("data_format=%s record_length=%s n_next=%s" % (
-                    data_format, record_length, self.n))
-            if icol == ncols + 1:
-                continue
-
-            nvalues = nwords // nwords_per_value
-            while record_length >= nbytes_per_value:
-                if self.debug:
-                    self.log.info("inner while...")
-                    self.log.info("nwords  = %s" % nwords)
-                    self.log.info("nvalues = %s" % nvalues)
-                    self.log.info("nwords_per_value = %s" % nwords_per_value)
-
-                #if nvalues == 0:
-                    #assert icol == ncols + 1
-                    #break
-
-                # we have 2x values for complex
-                str_values = self._endian + '%i%s' % (nvalues * 2, data_format)
-                if self.debug:
-                    self.log.info("  str_values = %s" % str_values)
-                    self.log.info("  nvalues*nbytes_per_value=%s len(data_bytes)=%s" % (
-                        nvalues * nbytes_per_value, len(data_bytes)))
-                value_list = unpack(str_values, data_bytes[0:nvalues * nbytes_per_value])
-                assert self.n == op4.tell(), 'n=%s tell=%s' % (self.n, op4.tell())
-                #self.show(op4, 4)
-                #print(self.print_block(data))
-                if self.debug:
-                    self.log.info("  value_list = %s" % str(value_list))
-
-                #irow -= 1
-                #icol -= 1
-                irow -= 1
-                icol -= 1
-
-                cols += [icol] * nvalues
-                rows += [i + irow for i in range(nvalues)]
-                for i, value in enumerate(value_list):
-                    if i % 2 == 0:
-                        real_value = value
-                    else:
-                        if self.debug:
-                            self.log.info("  A[%s,%s] = %s" % (
-                                irow, icol, complex(real_value, value)))
-                        #A[irow, icol] = complex(real_value, value)
-                        entries.append(complex(real_value, value))
-                        irow += 1
-
-                record_length -= nvalues * nbytes_per_value
-                data_bytes = data_bytes[nvalues * nbytes_per_value:]
-                #print("record_length=%s nbytes_per_value=%s" % (record_length, nbytes_per_value))
-                #print(print_matrix(A))
-                #print("********", data)
-
-        data_mat = coo_matrix((entries, (rows, cols)), shape=(nrows, ncols), dtype=dtype)
-        op4.read(4)
-        self.n += 4
-        return data_mat
-
     def get_markers_sparse(self, op4: BinaryIO, is_big_mat: bool) -> tuple[int, int, int]:
         if is_big_mat:
             (unused_a, icol, irow, nwords) = self.read_start_marker(op4)
@@ -1293,6 +971,26 @@ class OP4:
                 op4 = cast(TextIO, op4)
                 self._write_op4_file_ascii(op4, name_order2, precision, matrices)
 
+    def write_op4_columns(self, op4_filename: Union[PathLike, BinaryIO],
+                          name: str, shape: tuple[int, int],
+                          column_chunks: Iterable[Union[csc_matrix, np.ndarray]],
+                          form: int=2, precision: str='default') -> None:
+        """See ``write_op4_columns``"""
+        if precision not in ('single', 'double', 'default'):
+            msg = "precision=%r and must be 'single', 'double', or 'default'" % precision
+            raise ValueError(msg)
+        endian = _get_write_endian(self._endian)
+        if isinstance(op4_filename, (str, PurePath)):
+            with open(op4_filename, 'wb') as op4:
+                _write_sparse_column_chunks_binary(
+                    op4, name, shape, column_chunks, form=form,
+                    precision=precision, endian=endian)
+        else:
+            op4 = cast(BinaryIO, op4_filename)
+            _write_sparse_column_chunks_binary(
+                op4, name, shape, column_chunks, form=form,
+                precision=precision, endian=endian)
+
     def _write_op4_file_ascii(self, op4: TextIO, name_order: list[str],
                               precision: str,
                               matrices: dict[str, Matrix]) -> None:
@@ -1325,9 +1023,10 @@ class OP4:
         for name in name_order:
             form, matrix = _write_form_matrix_helper(matrices, name)
 
-            if isinstance(matrix, coo_matrix):
-                #write_DMIG(f, name, matrix, form, precision='default')
-                raise NotImplementedError('sparse binary op4 writing not implemented')
+            if isinstance(matrix, (coo_matrix, csc_matrix, csr_matrix)):
+                _write_sparse_matrix_binary(
+                    op4, name, matrix, form=form, precision=precision,
+                    endian=_get_write_endian(self._endian))
             elif isinstance(matrix, np.ndarray):
                 _write_dense_matrix_binary(
                     op4, name, matrix, form=form, precision=precision, endian=self._endian)
@@ -1426,6 +1125,154 @@ class OP4:
         op4.seek(0)
         return endian
 
+class MemmapMatrix:
+    """
+    A matrix in a binary OP4 that's read one column at a time from a
+    memory map of the file, so large matrices don't need to be loaded.
+
+    .. code-block:: python
+
+       >>> matrices = memmap_op4(op4_filename)
+       >>> kgg = matrices['KGG']
+       >>> kgg.shape
+       (2000000, 2000000)
+
+       # a dense (nrows, ) column
+       >>> column = kgg.get_column(10)
+
+       # a sparse (nrows, 2) csc_matrix
+       >>> columns = kgg.get_columns([10, 11])
+
+    """
+    def __init__(self, name: str, form: int,
+                 nrows: int, ncols: int, matrix_type: int,
+                 data: np.memmap, endian: str,
+                 record_icols: np.ndarray, record_irows: np.ndarray,
+                 record_pos: np.ndarray, record_nwords: np.ndarray,
+                 is_sparse: bool=True, is_big_mat: bool=False):
+        """
+        Creates a MemmapMatrix
+
+        Parameters
+        ----------
+        name : str
+            the name of the matrix
+        form : int
+            the matrix form
+        nrows / ncols : int
+            the size of the matrix
+        matrix_type : int
+            1/2 : real single/double precision
+            3/4 : complex single/double precision
+        data : np.memmap
+            the memory map of the file
+        endian : str
+            the endian of the file {<, >}
+        record_icols / record_irows : (nrecords, ) int ndarray
+            the 1-based column/starting row of each column record
+        record_pos / record_nwords : (nrecords, ) int ndarray
+            the byte offset of the data/number of words in each column record
+        is_sparse : bool; default=True
+            is the matrix stored as strings
+        is_big_mat : bool; default=False
+            are the strings in BIGMAT format
+
+        """
+        self.name = name
+        self.form = form
+        self.nrows = nrows
+        self.ncols = ncols
+        self.matrix_type = matrix_type
+        self.is_sparse = is_sparse
+        self.is_big_mat = is_big_mat
+        self._data = data
+        self._endian = endian
+        self._record_icols = record_icols
+        self._record_irows = record_irows
+        self._record_pos = record_pos
+        self._record_nwords = record_nwords
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return (self.nrows, self.ncols)
+
+    @property
+    def dtype(self) -> str:
+        return get_dtype(self.matrix_type)
+
+    def _get_column_values(self, icol: int) -> tuple[np.ndarray, np.ndarray]:
+        """gets the 0-based rows and the values of a 0-based column"""
+        if not 0 <= icol < self.ncols:
+            raise IndexError(f'icol={icol} is out of bounds; ncols={self.ncols}')
+        record_icols = self._record_icols
+        irecord0, irecord1 = np.searchsorted(record_icols, [icol + 1, icol + 2])
+        irecords = slice(irecord0, irecord1)
+        rows, unused_cols, values = _get_binary_values(
+            self._data, record_icols[irecords], self._record_irows[irecords],
+            self._record_pos[irecords], self._record_nwords[irecords],
+            self.matrix_type, self._endian,
+            is_sparse=self.is_sparse, is_big_mat=self.is_big_mat)
+        return rows, values
+
+    def get_column(self, icol: int) -> np.ndarray:
+        """
+        Gets a column of the matrix
+
+        Parameters
+        ----------
+        icol : int
+            the 0-based column
+
+        Returns
+        -------
+        column : (nrows, ) ndarray
+            the dense column
+
+        """
+        rows, values = self._get_column_values(icol)
+        column = np.zeros(self.nrows, dtype=self.dtype)
+        column[rows] = values
+        return column
+
+    def get_columns(self, icols: list[int]) -> csc_matrix:
+        """
+        Gets a set of columns of the matrix
+
+        Parameters
+        ----------
+        icols : list[int]
+            the 0-based columns
+
+        Returns
+        -------
+        columns : (nrows, ncolumns) csc_matrix
+            the columns in the order of icols
+
+        """
+        rows_list = []
+        cols_list = []
+        values_list = []
+        for jcol, icol in enumerate(icols):
+            rows, values = self._get_column_values(icol)
+            rows_list.append(rows)
+            cols_list.append(np.full(len(rows), jcol, dtype=rows.dtype))
+            values_list.append(values)
+        ncolumns = len(cols_list)
+        if ncolumns:
+            rows = np.hstack(rows_list)
+            cols = np.hstack(cols_list)
+            values = np.hstack(values_list)
+        else:
+            rows = cols = np.zeros(0, dtype='int64')
+            values = np.zeros(0, dtype=self.dtype)
+        return csc_matrix((values, (rows, cols)), shape=(self.nrows, ncolumns),
+                          dtype=self.dtype)
+
+    def __repr__(self) -> str:
+        return (f'MemmapMatrix(name={self.name!r}, form={self.form}, shape={self.shape}, '
+                f'dtype={self.dtype!r}, is_sparse={self.is_sparse})')
+
+
 def _save_matrix(matrices, name: str, amat: Matrix) -> None:
     """save the matrix"""
     assert isinstance(name, str), name
@@ -1600,6 +1447,172 @@ def _write_dense_matrix_binary(op4: BinaryIO, name: str, matrix: np.ndarray, for
     op4.write(msg)
 
 
+def _write_sparse_matrix_binary(op4: BinaryIO, name: str,
+                                A: Union[coo_matrix, csc_matrix, csr_matrix],
+                                form: int=2, precision: str='default',
+                                endian: str='<', ncols_per_chunk: int=10000) -> None:
+    """Writes a scipy sparse matrix as a BIGMAT sparse binary matrix"""
+    A = A.tocsc()
+    nrows, ncols = A.shape
+    column_chunks = (A[:, icol:icol + ncols_per_chunk]
+                     for icol in range(0, ncols, ncols_per_chunk))
+    _write_sparse_column_chunks_binary(op4, name, (nrows, ncols), column_chunks,
+                                       form=form, precision=precision, endian=endian)
+
+
+def _write_sparse_column_chunks_binary(op4: BinaryIO, name: str, shape: tuple[int, int],
+                                       column_chunks: Iterable[Union[csc_matrix, np.ndarray]],
+                                       form: int=2, precision: str='default',
+                                       endian: str='<') -> None:
+    """
+    Writes a BIGMAT sparse binary matrix one chunk of columns at a time
+
+    Each non-empty column is a record of strings, where a string is a run
+    of consecutive non-zero rows:
+
+    +-------------+-----------------------------------------+
+    | Word Number | Variable                                |
+    +=============+=========================================+
+    |      1      |  icol (1-based)                         |
+    +-------------+-----------------------------------------+
+    |      2      |  0 (the matrix is sparse)               |
+    +-------------+-----------------------------------------+
+    |      3      |  nwords in the strings                  |
+    +-------------+-----------------------------------------+
+    |   string    |  nwords_string + 1, irow (1-based),     |
+    |             |  values                                 |
+    +-------------+-----------------------------------------+
+
+    """
+    nrows, ncols = shape
+    name_bytes = ('%-8s' % name).encode('ascii')
+    assert len(name_bytes) == 8, 'name=%r is too long; 8 characters max' % name
+
+    # the type comes from the first chunk
+    column_chunks = iter(column_chunks)
+    chunk = next(column_chunks, None)
+    if chunk is None:
+        matrix_type = _get_type_nwv(np.zeros(0, dtype='float64'), precision)[0]
+    else:
+        matrix_type = _get_type_nwv(chunk, precision)[0]
+    nwords_per_value = _get_matrix_info(matrix_type, None, debug=False)[0]
+    file_dtype = endian + {1: 'f4', 2: 'f8', 3: 'c8', 4: 'c16'}[matrix_type]
+
+    # a negative number of rows flags the BIGMAT format
+    op4.write(pack(endian + '5i8si', 24, ncols, -nrows, form, matrix_type, name_bytes, 24))
+
+    icol0 = 0
+    while chunk is not None:
+        if isinstance(chunk, np.ndarray):
+            chunk = csc_matrix(chunk)
+        else:
+            chunk = chunk.tocsc()
+        nrowsi, ncolsi = chunk.shape
+        if nrowsi != nrows:
+            raise ValueError(f'chunk.shape={chunk.shape}; expected nrows={nrows}')
+        if icol0 + ncolsi > ncols:
+            raise ValueError(f'the chunks have more than ncols={ncols} columns')
+        words = _get_sparse_chunk_words(chunk, icol0, nwords_per_value, file_dtype, endian)
+        op4.write(memoryview(words))
+        icol0 += ncolsi
+        chunk = next(column_chunks, None)
+
+    if icol0 != ncols:
+        raise ValueError(f'the chunks have {icol0} columns; expected ncols={ncols}')
+
+    # the end of the matrix is a column of ncols+1
+    if matrix_type in [1, 3]:  # single precision
+        op4.write(pack(endian + '4ifi', 16, ncols + 1, 1, 1, 1.0, 16))
+    else:  # double precision
+        op4.write(pack(endian + '4idi', 20, ncols + 1, 1, 2, 1.0, 20))
+
+
+def _get_sparse_chunk_words(chunk: csc_matrix, icol0: int, nwords_per_value: int,
+                            file_dtype: str, endian: str) -> np.ndarray:
+    """
+    Gets the column records of a chunk of columns as words, where the
+    strings are found from the runs of consecutive rows in each column
+
+    Parameters
+    ----------
+    chunk : csc_matrix
+        the columns to write
+    icol0 : int
+        the 0-based column of the first column in the chunk
+    nwords_per_value : int
+        the number of words per value
+    file_dtype : str
+        the dtype of the values in the file (e.g., '<f8')
+    endian : str
+        the endian of the file {<, >}
+
+    Returns
+    -------
+    words : (nwords, ) int32 ndarray
+        the column records
+
+    """
+    if not chunk.has_canonical_format:
+        # sort the rows without modifying the caller's matrix
+        chunk = chunk.copy()
+        chunk.sum_duplicates()
+    nnz = chunk.nnz
+    if nnz == 0:
+        return np.zeros(0, dtype=endian + 'i4')
+    indptr = chunk.indptr
+    rows = chunk.indices
+    nvalues_per_col = np.diff(indptr)
+    cols = np.repeat(np.arange(len(nvalues_per_col)), nvalues_per_col)
+
+    # a new string starts when the row isn't the next row or the column changes
+    is_new_string = np.ones(nnz, dtype='bool')
+    is_new_string[1:] = (rows[1:] != rows[:-1] + 1) | (cols[1:] != cols[:-1])
+    istring_start = np.flatnonzero(is_new_string)
+    nvalues_string = np.diff(np.append(istring_start, nnz))
+    string_cols = cols[istring_start]
+    nwords_string = nvalues_string * nwords_per_value
+
+    # the number of words in each column record (excluding the 5 words
+    # of record markers and the column header)
+    icols = np.flatnonzero(nvalues_per_col)
+    nstrings_per_col = np.bincount(string_cols, minlength=len(nvalues_per_col))[icols]
+    nwords_col = 2 * nstrings_per_col + nvalues_per_col[icols] * nwords_per_value
+    record_start = np.cumsum(nwords_col + 5) - (nwords_col + 5)
+
+    # the start of each string in the column
+    nwords_string_total = nwords_string + 2
+    string_offset = np.cumsum(nwords_string_total) - nwords_string_total
+    istring_col0 = np.cumsum(nstrings_per_col) - nstrings_per_col
+    icol_record = np.repeat(np.arange(len(icols)), nstrings_per_col)
+    string_start = (record_start[icol_record] + 4 +
+                    string_offset - string_offset[istring_col0][icol_record])
+
+    nwords = record_start[-1] + nwords_col[-1] + 5
+    words = np.zeros(nwords, dtype=endian + 'i4')
+    record_length = 4 * (nwords_col + 3)
+    words[record_start] = record_length
+    words[record_start + 1] = icols + icol0 + 1
+    words[record_start + 3] = nwords_col
+    words[record_start + 4 + nwords_col] = record_length
+    words[string_start] = nwords_string + 1
+    words[string_start + 1] = rows[istring_start] + 1
+
+    # the values fill the rest of the strings
+    delta = np.zeros(nwords + 1, dtype='int8')
+    delta[string_start + 2] = 1
+    delta[string_start + 2 + nwords_string] = -1
+    is_value = np.cumsum(delta[:-1], dtype='int8').view('bool')
+    words[is_value] = chunk.data.astype(file_dtype).view(endian + 'i4')
+    return words
+
+
+def _get_write_endian(endian: str) -> str:
+    """the binary writers default to little endian"""
+    if endian in {'<', '>'}:
+        return endian
+    return '<'
+
+
 def _write_sparse_matrix_ascii(op4: TextIO, name: str, A: coo_matrix,
                                form: int=2, is_big_mat: bool=False,
                                precision: str='default'):
@@ -1799,6 +1812,218 @@ def get_dtype(matrix_type: int, precision: str='default') -> str:
     return dtype
 
 
+def _scan_binary_columns(data: np.memmap, n: int, ncols: int, endian: str,
+                         is_sparse: bool,
+                         is_big_mat: bool) -> tuple[np.ndarray, np.ndarray,
+                                                    np.ndarray, np.ndarray, int]:
+    """
+    Indexes the column records of a binary matrix without reading the values
+
+    A column record is:
+     - the end of the previous record, the record length, icol, irow, nwords
+     - nwords words of data
+
+    where the data is the values of a dense column (starting at irow)
+    or the strings of a sparse column.  A column of ncols+1 ends the matrix.
+
+    Parameters
+    ----------
+    data : np.memmap
+        the memory map of the file
+    n : int
+        the byte offset of the first column record
+    ncols : int
+        the number of columns
+    endian : str
+        the endian of the file {<, >}
+    is_sparse : bool
+        is the matrix stored as strings
+    is_big_mat : bool
+        are the strings in BIGMAT format
+
+    Returns
+    -------
+    record_icols / record_irows : (nrecords, ) int ndarray
+        the 1-based column/starting row of each column record
+    record_pos / record_nwords : (nrecords, ) int ndarray
+        the byte offset of the data/number of words in each column record
+    n : int
+        the byte offset of the end of the matrix
+
+    """
+    record_icols = []
+    record_irows = []
+    record_pos = []
+    record_nwords = []
+    marker = Struct(endian + '5i')
+    if is_big_mat:
+        string_header = Struct(endian + '2i')
+    else:
+        string_header = Struct(endian + 'i')
+
+    icol = -1  # dummy value so the loop starts
+    while icol < ncols + 1:
+        unused_record_length, unused_a, icol, irow, nwords = marker.unpack_from(data, n)
+        n += 20
+        if icol == ncols + 1:
+            break
+
+        if is_sparse:
+            # an empty first string ends the matrix
+            out = string_header.unpack_from(data, n)
+            if is_big_mat:
+                nwords_string = out[0] - 1
+            else:
+                nwords_string = out[0] // 65536 - 1
+            if nwords_string == -1:
+                n += string_header.size
+                break
+        elif nwords == -1:
+            break
+        record_icols.append(icol)
+        record_irows.append(irow)
+        record_pos.append(n)
+        record_nwords.append(nwords)
+        n += 4 * nwords
+    return (np.array(record_icols, dtype='int64'), np.array(record_irows, dtype='int64'),
+            np.array(record_pos, dtype='int64'), np.array(record_nwords, dtype='int64'), n)
+
+
+def _get_sparse_strings(data: np.memmap,
+                        record_icols: np.ndarray, record_pos: np.ndarray,
+                        record_nwords: np.ndarray, nwords_per_value: int,
+                        endian: str,
+                        is_big_mat: bool) -> tuple[np.ndarray, np.ndarray,
+                                                   np.ndarray, np.ndarray]:
+    """
+    Indexes the strings in the sparse column records
+
+    A string is a header followed by the values:
+     - small : IS = irow + 65536 * (nwords + 1)
+     - BIGMAT : nwords + 1, irow
+
+    Returns
+    -------
+    icols / irows : (nstrings, ) int ndarray
+        the 1-based column/starting row of each string
+    string_pos : (nstrings, ) int ndarray
+        the byte offset of the values of each string
+    nvalues : (nstrings, ) int ndarray
+        the number of values in each string
+
+    """
+    nrecords = len(record_pos)
+    if nrecords == 0:
+        empty = np.zeros(0, dtype='int64')
+        return empty, empty.copy(), empty.copy(), empty.copy()
+
+    # the strings of a column are read one after another, so the n-th
+    # string of every column is read at the same time
+    pos0 = record_pos[0]
+    iword = (record_pos - pos0) // 4
+    iword_end = iword + record_nwords
+    words = np.frombuffer(data, dtype=endian + 'i4', count=iword_end[-1], offset=pos0)
+
+    irecords_list = []
+    irows_list = []
+    iword_values_list = []
+    nvalues_list = []
+    irecords = np.arange(nrecords)
+    while len(irecords):
+        iwordi = iword[irecords]
+        if is_big_mat:
+            nwords_string = words[iwordi] - 1
+            irow = words[iwordi + 1]
+            iwordi = iwordi + 2
+        else:
+            IS = words[iwordi]
+            nwords_string = IS // 65536 - 1
+            irow = IS - 65536 * (nwords_string + 1)
+            iwordi = iwordi + 1
+        nvalue = nwords_string // nwords_per_value
+        irecords_list.append(irecords)
+        irows_list.append(irow)
+        iword_values_list.append(iwordi)
+        nvalues_list.append(nvalue)
+
+        iwordi = iwordi + nvalue * nwords_per_value
+        iword[irecords] = iwordi
+        irecords = irecords[iwordi < iword_end[irecords]]
+
+    # sort the strings by column; the strings in a column are in order
+    irecords = np.hstack(irecords_list)
+    isort = np.argsort(irecords, kind='stable')
+    icols = record_icols[irecords[isort]]
+    irows = np.hstack(irows_list)[isort].astype('int64')
+    string_pos = pos0 + 4 * np.hstack(iword_values_list)[isort]
+    nvalues = np.hstack(nvalues_list)[isort].astype('int64')
+    return icols, irows, string_pos, nvalues
+
+
+def _get_binary_values(data: np.memmap,
+                       record_icols: np.ndarray, record_irows: np.ndarray,
+                       record_pos: np.ndarray, record_nwords: np.ndarray,
+                       matrix_type: int, endian: str,
+                       is_sparse: bool,
+                       is_big_mat: bool) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Reads the values of the column records from ``_scan_binary_columns``
+
+    The values are contiguous runs of words in the file (a dense column
+    or a string), so the words between the runs (the record/string
+    headers) are masked out and the values are read with a single
+    ``np.frombuffer`` call.
+
+    Returns
+    -------
+    rows / cols : (nvalues, ) int ndarray
+        the 0-based rows/columns
+    values : (nvalues, ) float/complex ndarray
+        the values
+
+    """
+    nwords_per_value = _get_matrix_info(matrix_type, None, debug=False)[0]
+    dtype = get_dtype(matrix_type)
+    if is_sparse:
+        icols, irows, string_pos, nvalues = _get_sparse_strings(
+            data, record_icols, record_pos, record_nwords, nwords_per_value,
+            endian, is_big_mat)
+    else:
+        icols = record_icols
+        irows = record_irows
+        string_pos = record_pos
+        nvalues = record_nwords // nwords_per_value
+
+    is_values = nvalues > 0
+    icols = icols[is_values]
+    irows = irows[is_values]
+    string_pos = string_pos[is_values]
+    nvalues = nvalues[is_values]
+    nvalues_total = nvalues.sum()
+    if nvalues_total == 0:
+        rows = np.zeros(0, dtype='int64')
+        return rows, rows.copy(), np.zeros(0, dtype=dtype)
+
+    # mask out the headers between the values
+    pos0 = string_pos[0]
+    iword_start = (string_pos - pos0) // 4
+    iword_end = iword_start + nvalues * nwords_per_value
+    nwords = iword_end[-1]
+    words = np.frombuffer(data, dtype='uint32', count=nwords, offset=pos0)
+    delta = np.zeros(nwords + 1, dtype='int8')
+    delta[iword_start] = 1
+    delta[iword_end] -= 1
+    is_value = np.cumsum(delta[:-1], dtype='int8').view('bool')
+
+    file_dtype = {1: 'f4', 2: 'f8', 3: 'c8', 4: 'c16'}[matrix_type]
+    values = words[is_value].view(endian + file_dtype).astype(dtype)
+
+    ivalue0 = np.cumsum(nvalues) - nvalues
+    rows = np.repeat(irows - 1 - ivalue0, nvalues) + np.arange(nvalues_total)
+    cols = np.repeat(icols - 1, nvalues)
+    return rows, cols, values
+
+
 def _get_type_nwv(A: np.ndarray, precision: str='default') -> tuple[int, int]:
     """
     Determines the Type and number of words per value
@@ -2082,6 +2307,37 @@ def read_op4(op4_filename: Optional[PathLike]=None,
         op4_filename, matrix_names, precision)
     return matrices
 
+def memmap_op4(op4_filename: PathLike,
+               matrix_names: Optional[list[str]]=None,
+               debug: bool=False, log=None) -> dict[str, MemmapMatrix]:
+    """
+    Indexes the columns of the matrices in a binary NASTRAN OUTPUT4 file
+    without reading the values.  The columns are read on demand from a
+    memory map of the file, which is useful for very large matrices.
+
+    .. code-block:: python
+
+       >>> matrices = memmap_op4(op4_filename, matrix_names='KGG')
+       >>> kgg = matrices['KGG']
+       >>> column = kgg.get_column(10)
+
+    Parameters
+    ----------
+    op4_filename : str
+        a binary OP4 filename
+    matrix_names : list[str], str / None
+        matrix name(s) (None -> all)
+
+    Returns
+    -------
+    matrices : dict[str] = MemmapMatrix
+        dictionary of matrices where the key is the name
+
+    """
+    op4 = OP4(log=log, debug=debug)
+    matrices = op4.memmap_op4(op4_filename, matrix_names)
+    return matrices
+
 def write_op4(op4_filename: Optional[PathLike],
               matrices: dict[str, Matrix],
               name_order=None,
@@ -2091,3 +2347,47 @@ def write_op4(op4_filename: Optional[PathLike],
     op4.write_op4(op4_filename, matrices,
                   name_order=name_order, precision=precision,
                   is_binary=is_binary)
+
+def write_op4_columns(op4_filename: Union[PathLike, BinaryIO],
+                      name: str, shape: tuple[int, int],
+                      column_chunks: Iterable[Union[csc_matrix, np.ndarray]],
+                      form: int=2, precision: str='default',
+                      log: Optional[SimpleLogger]=None, debug: bool=False) -> None:
+    """
+    Writes a matrix to a binary OP4 one chunk of columns at a time, so
+    only one chunk needs to be in memory (e.g., for an out-of-core
+    reduction).  The matrix is written in the sparse BIGMAT format.
+
+    .. code-block:: python
+
+       >>> def column_chunks():
+       ...     for icol in range(0, ncols, 1000):
+       ...         yield reduce_columns(icol, icol + 1000)  # a csc_matrix
+       >>> write_op4_columns('kaa.op4', 'KAA', (nrows, ncols), column_chunks())
+
+       # multiple matrices
+       >>> with open('kaa_maa.op4', 'wb') as op4_file:
+       ...     write_op4_columns(op4_file, 'KAA', (nrows, ncols), kaa_chunks)
+       ...     write_op4_columns(op4_file, 'MAA', (nrows, ncols), maa_chunks)
+
+    Parameters
+    ----------
+    op4_filename : str / file
+        String -> opens a file (closed at the end)
+        file   -> no file is opened and it's not closed
+    name : str
+        the name of the matrix (8 characters max)
+    shape : (int, int)
+        the (nrows, ncols) of the matrix
+    column_chunks : iterable of csc_matrix / ndarray
+        the (nrows, ncols_chunk) blocks of columns in order;
+        the matrix type comes from the dtype of the first chunk
+    form : int; default=2
+        the matrix form
+    precision : str; default='default'
+        Overwrite the default precision ('single', 'double', 'default')
+
+    """
+    op4 = OP4(log=log, debug=debug)
+    op4.write_op4_columns(op4_filename, name, shape, column_chunks,
+                          form=form, precision=precision)
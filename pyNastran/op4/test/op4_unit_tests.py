@@ -9,7 +9,7 @@ import scipy
 import scipy.sparse
 from scipy.sparse import coo_matrix  # type: ignore
 
-from pyNastran.op4.op4 import OP4, read_op4, Matrix
+from pyNastran.op4.op4 import OP4, read_op4, memmap_op4, write_op4_columns, Matrix
 import pyNastran.op4.test
 
 OP4_PATH = pyNastran.op4.test.__path__[0]
@@ -340,6 +340,79 @@ class TestOP4(unittest.TestCase):
         #for line in Kgg:
             #print(line)
 
+    def test_op4_memmap(self):
+        """tests reading columns from a memory mapped binary op4"""
+        fnames = [
+            'mat_b_dn.op4',
+            'mat_b_s1.op4',
+            'mat_b_s2.op4',
+            'testplate_kgg.op4',
+        ]
+        for fname in fnames:
+            op4_filename = os.path.join(OP4_PATH, fname)
+            matrices = read_op4(op4_filename)
+            matrices_memmap = memmap_op4(op4_filename)
+            assert list(matrices) == list(matrices_memmap), fname
+            for name, matrix in matrices.items():
+                matrix_memmap = matrices_memmap[name]
+                data = matrix.data
+                if not isinstance(data, ndarray):
+                    data = data.toarray()
+                assert matrix_memmap.shape == data.shape, (fname, name)
+                assert matrix_memmap.form == matrix.form, (fname, name)
+                assert matrix_memmap.dtype == data.dtype, (fname, name)
+                for icol in range(data.shape[1]):
+                    column = matrix_memmap.get_column(icol)
+                    assert array_equal(column, data[:, icol]), (fname, name, icol)
+                icols = [data.shape[1] - 1, 0]
+                columns = matrix_memmap.get_columns(icols)
+                assert array_equal(columns.toarray(), data[:, icols]), (fname, name)
+
+        matrices_memmap = memmap_op4(op4_filename, matrix_names='KGG')
+        with self.assertRaises(IndexError):
+            matrices_memmap['KGG'].get_column(726)
+        op4_filename = os.path.join(OP4_PATH, 'mat_t_s1.op4')
+        with self.assertRaises(ValueError):
+            memmap_op4(op4_filename)
+
+    def test_op4_write_columns(self):
+        """tests writing a sparse binary op4 in column chunks"""
+        op4_filename = os.path.join(OP4_PATH, 'sparse_columns.op4')
+        strings = get_matrices()
+        nrows, ncols = strings.shape
+        for dtype, form in [('float32', 2), ('float64', 2), ('complex64', 2), ('complex128', 2)]:
+            data = strings.astype(dtype)
+            if data.dtype.kind == 'c':
+                data = data + 1j * strings[:, ::-1]
+            data[:, 5] = 0.  # a null column
+
+            # the chunks may be dense or sparse
+            column_chunks = (
+                data[:, :3],
+                coo_matrix(data[:, 3:11]),
+                scipy.sparse.csc_matrix(data[:, 11:]),
+            )
+            write_op4_columns(op4_filename, 'A', (nrows, ncols), column_chunks, form=form)
+            A = read_op4(op4_filename)['A']
+            assert A.data.dtype == data.dtype, (A.data.dtype, dtype)
+            assert array_equal(A.data.toarray(), data), dtype
+
+            # the sparse matrix path of write_op4
+            op4 = OP4()
+            op4.write_op4(op4_filename, {'A': (form, coo_matrix(data)),
+                                         'B': (form, scipy.sparse.csr_matrix(data))},
+                          is_binary=True, precision='double')
+            matrices = read_op4(op4_filename)
+            assert matrices['A'].data.dtype.name in ('float64', 'complex128'), dtype
+            assert array_equal(matrices['A'].data.toarray(), data), dtype
+            assert array_equal(matrices['B'].data.toarray(), data), dtype
+
+        with self.assertRaises(ValueError):
+            write_op4_columns(op4_filename, 'A', (nrows, ncols + 1), column_chunks)
+        with self.assertRaises(ValueError):
+            write_op4_columns(op4_filename, 'A', (nrows + 1, ncols), column_chunks)
+        os.remove(op4_filename)
+
 def get_matrices():
     """creates dummy matrices"""
     strings = np.array([